@@ -10,6 +10,8 @@ from adapters.django_api.wiring import (
     DEV_CASHIER_API_KEY,
     DEV_CASHIER_BRANCH_ID,
     build_dependencies,
+    projection_cache_metrics,
+    wait_for_projections,
 )
 
 __all__ = [
@@ -19,5 +21,7 @@ __all__ = [
     "DEV_ADMIN_BRANCH_ID",
     "DEV_CASHIER_BRANCH_ID",
     "build_dependencies",
+    "projection_cache_metrics",
+    "wait_for_projections",
 ]
 
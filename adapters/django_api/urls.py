@@ -41,4 +41,6 @@ urlpatterns = [
     path("docs/<uuid:document_id>/render-html", views.document_render_html_view),
     path("docs/<uuid:document_id>/render-pdf", views.document_render_pdf_view),
     path("docs/<uuid:document_id>/verify", views.document_verify_view),
+    # Event chain verification
+    path("events/<uuid:event_id>/proof", views.event_inclusion_proof_view),
 ]
@@ -26,6 +26,7 @@ from core.http_api.contracts import (
     DocumentTemplateDeactivateHttpRequest,
     DocumentTemplateUpsertHttpRequest,
     DocumentVerifyRequest,
+    EventProofRequest,
     FeatureFlagClearHttpRequest,
     FeatureFlagSetHttpRequest,
     IdentityBootstrapHttpRequest,
@@ -42,6 +43,7 @@ from core.http_api.handlers import (
     get_document_render_pdf,
     get_document_render_plan,
     get_document_verify,
+    get_event_inclusion_proof,
     list_api_keys,
     list_actors,
     list_compliance_profiles,
@@ -716,3 +718,30 @@ def document_verify_view(request: HttpRequest, document_id: uuid.UUID) -> JsonRe
 
     payload = get_document_verify(contract, build_dependencies(), headers=headers)
     return JsonResponse(payload)
+
+
+# ---------------------------------------------------------------------------
+# Event chain verification views
+# ---------------------------------------------------------------------------
+
+@csrf_exempt
+def event_inclusion_proof_view(request: HttpRequest, event_id: uuid.UUID) -> JsonResponse:
+    if request.method != "GET":
+        return _method_not_allowed()
+    headers = _headers_from_request(request)
+    try:
+        business_id_raw = request.GET.get("business_id")
+        if business_id_raw is None:
+            raise ValueError("business_id is required.")
+        contract = EventProofRequest(
+            business_id=_parse_uuid(business_id_raw, "business_id"),
+            event_id=event_id,
+            branch_id=_parse_optional_uuid(
+                request.GET.get("branch_id"), "branch_id"
+            ),
+        )
+    except (ValueError, KeyError) as exc:
+        return _json_error("INVALID_REQUEST", str(exc), status=400)
+
+    payload = get_event_inclusion_proof(contract, build_dependencies(), headers=headers)
+    return JsonResponse(payload)
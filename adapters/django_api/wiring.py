@@ -3,16 +3,47 @@ BOS Django Adapter Wiring
 =========================
 Constructs HttpApiDependencies for local/staging live runs.
 
-This module is adapter-only glue:
-- no core contract changes
-- no replay/event-store logic changes
+This module is adapter-only glue: it picks the projections, their
+event filters and apply functions, and wires them to the services.
+Loading a store (snapshot, tail replay, follower positions) is
+core.replay.hydration.load_projection_store(); following is
+core.replay.follower.
+
+In-memory projection stores start from their latest snapshot
+(core.replay.snapshots) and replay only the events after it, so
+start-up cost tracks recent activity, not history length.
+
+Stores are hydrated per business on first access and kept in an LRU
+(core.replay.hydration) of at most BOS_PROJECTION_CACHE_BUSINESSES
+businesses per projection; idle businesses are evicted and hydrated
+again when next read. The repositories resolve the store of each
+business they are asked about. projection_cache_metrics() reports
+residency and hit rates.
+
+Each resident store has an EventTailFollower (core.replay.follower)
+that applies events written by other processes (other gunicorn
+workers), at most every BOS_PROJECTION_POLL_SECONDS: on access for
+read-only businesses, from a background thread for the business the
+services write to (pinned, never evicted). A service's own writes
+reach its store through the same follower, right after commit, so
+every event is applied once and in chain order.
+wait_for_projections() blocks until a given chain position is applied
+(read-your-writes across workers).
+
+The services persist through persist_event() with the append retry
+policy of the BOS_APPEND_RETRY_* settings.
 """
 
 from __future__ import annotations
 
+import functools
+import logging
 import threading
+import time
 import uuid
-from typing import Any
+from typing import Any, Callable, Generic, NamedTuple, Optional, TypeVar
+
+from django.conf import settings
 
 from core.auth.provider import DbAuthProvider
 from core.auth.service import ApiKeyService, hash_api_key
@@ -28,11 +59,12 @@ from core.commands.bus import CommandBus
 from core.commands.dispatcher import CommandDispatcher
 from core.context.business_context import BusinessContext
 from core.document_issuance.projections import DocumentIssuanceProjectionStore
-from core.document_issuance.registry import is_document_issuance_event_type
+from core.document_issuance.registry import DOCUMENT_ISSUANCE_EVENT_TYPES
 from core.document_issuance.repository import DocumentIssuanceRepository
 from core.document_issuance.service import DocumentIssuanceService
 from core.event_store.persistence import (
-    load_events_for_business,
+    DEFAULT_APPEND_RETRY_POLICY,
+    AppendRetryPolicy,
     persist_event,
 )
 from core.event_store.validators.registry import EventTypeRegistry
@@ -43,6 +75,10 @@ from core.identity_store.service import (
     bootstrap_identity as bootstrap_identity_store,
 )
 from core.permissions import DbPermissionProvider
+from core.replay.follower import TAIL_POLL_SECONDS, EventTailFollower
+from core.replay.hydration import BusinessProjectionCache, load_projection_store
+
+logger = logging.getLogger("bos.replay")
 
 
 DEV_ADMIN_API_KEY = "dev-admin-key"
@@ -57,6 +93,14 @@ _DEV_CASHIER_ACTOR_ID = "live-cashier-user"
 
 _DEPENDENCIES_LOCK = threading.Lock()
 _DEPENDENCIES: HttpApiDependencies | None = None
+_PROJECTIONS: tuple["_HydratedProjections", ...] = ()
+
+PROJECTION_CACHE_BUSINESSES = 1_000
+
+ADMIN_PROJECTION_NAME = "admin_projection_store"
+DOCUMENT_ISSUANCE_PROJECTION_NAME = "document_issuance_projection_store"
+
+_Store = TypeVar("_Store")
 
 
 def _coerce_uuid_or_passthrough(value: Any) -> Any:
@@ -86,15 +130,25 @@ def _normalize_admin_event_for_projection(
     return normalized
 
 
-def _rebuild_admin_projection_store_from_events(
+def _apply_admin_event(
     projection_store: AdminProjectionStore,
-    business_id: uuid.UUID,
+    event_data: dict[str, Any],
 ) -> None:
-    for event_data in load_events_for_business(business_id):
-        event_type = event_data.get("event_type")
-        if not isinstance(event_type, str) or not event_type.startswith("admin."):
-            continue
-        projection_store.apply(_normalize_admin_event_for_projection(event_data))
+    projection_store.apply(_normalize_admin_event_for_projection(event_data))
+
+
+def _load_admin_projection_store(
+    business_id: uuid.UUID,
+    follower: Optional[EventTailFollower] = None,
+) -> AdminProjectionStore:
+    return load_projection_store(
+        AdminProjectionStore,
+        ADMIN_PROJECTION_NAME,
+        business_id,
+        _apply_admin_event,
+        event_type_prefix="admin.",
+        follower=follower,
+    )
 
 
 def _normalize_document_issuance_payload_for_projection(
@@ -116,26 +170,117 @@ def _normalize_document_issuance_payload_for_projection(
     return normalized
 
 
-def _rebuild_document_issuance_projection_store_from_events(
+def _apply_document_issuance_event(
     projection_store: DocumentIssuanceProjectionStore,
-    business_id: uuid.UUID,
+    event_data: dict[str, Any],
 ) -> None:
-    for event_data in load_events_for_business(business_id):
-        event_type = event_data.get("event_type")
-        if not isinstance(event_type, str):
-            continue
-        if not is_document_issuance_event_type(event_type):
-            continue
+    payload = event_data.get("payload")
+    if not isinstance(payload, dict):
+        return
+
+    projection_store.apply(
+        event_type=event_data["event_type"],
+        payload=_normalize_document_issuance_payload_for_projection(payload),
+    )
+
+
+def _load_document_issuance_projection_store(
+    business_id: uuid.UUID,
+    follower: Optional[EventTailFollower] = None,
+) -> DocumentIssuanceProjectionStore:
+    return load_projection_store(
+        DocumentIssuanceProjectionStore,
+        DOCUMENT_ISSUANCE_PROJECTION_NAME,
+        business_id,
+        _apply_document_issuance_event,
+        event_types=DOCUMENT_ISSUANCE_EVENT_TYPES,
+        follower=follower,
+    )
+
+
+class _FollowedProjectionStore:
+    """
+    Projection store as seen by its service when a tail follower keeps
+    it current. The service's apply() after an accepted write becomes
+    a follower sync: the committed event is read back and applied in
+    chain order, together with anything other processes wrote first.
+    Everything else is the wrapped store.
+    """
+
+    def __init__(self, projection_store: Any, follower: EventTailFollower):
+        self._projection_store = projection_store
+        self._follower = follower
+
+    def apply(self, *args: Any, **kwargs: Any) -> None:
+        try:
+            self._follower.sync()
+        except Exception as exc:
+            # The write is committed; the polling thread catches up.
+            logger.error(f"Projection sync after write failed: {exc}", exc_info=True)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._projection_store, name)
 
-        payload = event_data.get("payload")
-        if not isinstance(payload, dict):
-            continue
 
-        projection_store.apply(
-            event_type=event_type,
-            payload=_normalize_document_issuance_payload_for_projection(payload),
+class _Resident(NamedTuple):
+    """A hydrated store and the follower that keeps it current."""
+
+    projection_store: Any
+    follower: EventTailFollower
+
+
+class _HydratedProjections(Generic[_Store]):
+    """
+    Stores of one projection, hydrated per business on first access,
+    each with its own tail follower. The cache holds store and follower
+    as one entry, so they are found, and evicted, together under the
+    cache's lock. Resident stores are refreshed on access: the refresh
+    publishes a new store rather than changing the one other request
+    threads read (core.replay.hydration), and is skipped while another
+    thread syncs the same business.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        load_store: Callable[[uuid.UUID, EventTailFollower], _Store],
+        *,
+        budget: int,
+        poll_seconds: float,
+    ):
+        self._load_store = load_store
+        self._poll_seconds = poll_seconds
+        self.cache: BusinessProjectionCache[_Resident] = BusinessProjectionCache(
+            name,
+            self._hydrate,
+            budget=budget,
+            on_hit=self._refresh,
+            on_evict=self._release,
         )
 
+    def _hydrate(self, business_id: uuid.UUID) -> _Resident:
+        follower = EventTailFollower(business_id, poll_seconds=self._poll_seconds)
+        return _Resident(self._load_store(business_id, follower), follower)
+
+    def _refresh(self, business_id: uuid.UUID, resident: _Resident) -> None:
+        resident.follower.refresh(wait=False)
+
+    def _release(self, business_id: uuid.UUID, resident: _Resident) -> None:
+        resident.follower.stop()
+
+    def get(self, business_id: uuid.UUID) -> _Store:
+        return self.cache.get(business_id).projection_store
+
+    def follower(self, business_id: uuid.UUID) -> EventTailFollower:
+        """Follower of a business, hydrating it if needed."""
+        return self.cache.get(business_id).follower
+
+    def pin(self, business_id: uuid.UUID) -> tuple[_Store, EventTailFollower]:
+        """Keep a business resident, followed by a background thread."""
+        resident = self.cache.pin(business_id)
+        resident.follower.start()
+        return resident.projection_store, resident.follower
+
 
 def _build_business_context() -> BusinessContext:
     known_branches = frozenset({DEV_ADMIN_BRANCH_ID, DEV_CASHIER_BRANCH_ID})
@@ -256,23 +401,61 @@ def _build_event_factory():
     return _event_factory
 
 
+def _build_append_retry_policy() -> AppendRetryPolicy:
+    return AppendRetryPolicy(
+        max_attempts=getattr(
+            settings,
+            "BOS_APPEND_RETRY_MAX_ATTEMPTS",
+            DEFAULT_APPEND_RETRY_POLICY.max_attempts,
+        ),
+        base_delay_seconds=getattr(
+            settings,
+            "BOS_APPEND_RETRY_BASE_DELAY_SECONDS",
+            DEFAULT_APPEND_RETRY_POLICY.base_delay_seconds,
+        ),
+        max_delay_seconds=getattr(
+            settings,
+            "BOS_APPEND_RETRY_MAX_DELAY_SECONDS",
+            DEFAULT_APPEND_RETRY_POLICY.max_delay_seconds,
+        ),
+    )
+
+
 def _create_dependencies() -> HttpApiDependencies:
+    global _PROJECTIONS
     _ensure_dev_identity_records()
     _ensure_dev_api_key_credentials()
 
-    admin_projection_store = AdminProjectionStore()
-    _rebuild_admin_projection_store_from_events(
-        admin_projection_store,
-        DEV_BUSINESS_ID,
+    budget = getattr(
+        settings, "BOS_PROJECTION_CACHE_BUSINESSES", PROJECTION_CACHE_BUSINESSES
     )
-    repository = AdminRepository(admin_projection_store)
-    document_issuance_projection_store = DocumentIssuanceProjectionStore()
-    _rebuild_document_issuance_projection_store_from_events(
-        document_issuance_projection_store,
-        DEV_BUSINESS_ID,
+    poll_seconds = getattr(
+        settings, "BOS_PROJECTION_POLL_SECONDS", TAIL_POLL_SECONDS
+    )
+    admin_projections = _HydratedProjections(
+        ADMIN_PROJECTION_NAME,
+        _load_admin_projection_store,
+        budget=budget,
+        poll_seconds=poll_seconds,
     )
+    document_issuance_projections = _HydratedProjections(
+        DOCUMENT_ISSUANCE_PROJECTION_NAME,
+        _load_document_issuance_projection_store,
+        budget=budget,
+        poll_seconds=poll_seconds,
+    )
+    _PROJECTIONS = (admin_projections, document_issuance_projections)
+
+    admin_projection_store, admin_follower = admin_projections.pin(
+        DEV_BUSINESS_ID
+    )
+    repository = AdminRepository(store_for_business=admin_projections.get)
+    (
+        document_issuance_projection_store,
+        document_issuance_follower,
+    ) = document_issuance_projections.pin(DEV_BUSINESS_ID)
     document_issuance_repository = DocumentIssuanceRepository(
-        document_issuance_projection_store
+        store_for_business=document_issuance_projections.get
     )
 
     business_context = _build_business_context()
@@ -290,9 +473,12 @@ def _create_dependencies() -> HttpApiDependencies:
     )
     event_type_registry = EventTypeRegistry()
     event_factory = _build_event_factory()
+    persist = functools.partial(
+        persist_event, retry_policy=_build_append_retry_policy()
+    )
     command_bus = CommandBus(
         dispatcher=dispatcher,
-        persist_event=persist_event,
+        persist_event=persist,
         context=business_context,
         event_type_registry=event_type_registry,
     )
@@ -301,18 +487,22 @@ def _create_dependencies() -> HttpApiDependencies:
         dispatcher=dispatcher,
         command_bus=command_bus,
         event_factory=event_factory,
-        persist_event=persist_event,
+        persist_event=persist,
         event_type_registry=event_type_registry,
-        projection_store=admin_projection_store,
+        projection_store=_FollowedProjectionStore(
+            admin_projection_store, admin_follower
+        ),
     )
     document_issuance_service = DocumentIssuanceService(
         business_context=business_context,
         dispatcher=dispatcher,
         command_bus=command_bus,
         event_factory=event_factory,
-        persist_event=persist_event,
+        persist_event=persist,
         event_type_registry=event_type_registry,
-        projection_store=document_issuance_projection_store,
+        projection_store=_FollowedProjectionStore(
+            document_issuance_projection_store, document_issuance_follower
+        ),
         document_provider=document_provider,
     )
 
@@ -337,3 +527,32 @@ def build_dependencies() -> HttpApiDependencies:
         if _DEPENDENCIES is None:
             _DEPENDENCIES = _create_dependencies()
         return _DEPENDENCIES
+
+
+def wait_for_projections(
+    stream_seq: int,
+    chain_branch_id: uuid.UUID | None = None,
+    timeout: float = 5.0,
+    business_id: uuid.UUID = DEV_BUSINESS_ID,
+) -> bool:
+    """
+    Block until this process's projection stores of a business have
+    applied one of its chains up to stream_seq (e.g. a write
+    acknowledged by another worker). False if timeout elapses first.
+    """
+    build_dependencies()
+    deadline = time.monotonic() + timeout
+    for projections in _PROJECTIONS:
+        follower = projections.follower(business_id)
+        remaining = max(0.0, deadline - time.monotonic())
+        if not follower.wait_for(stream_seq, chain_branch_id, remaining):
+            return False
+    return True
+
+
+def projection_cache_metrics() -> dict[str, dict[str, float]]:
+    """Residency and hit-rate counters of each projection cache."""
+    return {
+        projections.cache.name: projections.cache.metrics()
+        for projections in _PROJECTIONS
+    }
@@ -31,6 +31,7 @@ INSTALLED_APPS = [
     "django.contrib.contenttypes",
     # ── BOS Modules (added in build order) ────────────────
     "core.event_store",
+    "core.replay",
     "core.auth.apps.CoreAuthConfig",
     "core.identity_store.apps.CoreIdentityStoreConfig",
     "core.permissions_store.apps.CorePermissionsStoreConfig",
@@ -62,6 +63,24 @@ DATABASES = {
 }
 
 
+# ── Event store ───────────────────────────────────────────────
+# Rebase-and-retry of server-linked appends whose chain head moved
+# between linking and commit (see core.event_store.persistence.retry).
+# 1 attempt disables retrying.
+BOS_APPEND_RETRY_MAX_ATTEMPTS = 3
+BOS_APPEND_RETRY_BASE_DELAY_SECONDS = 0.005
+BOS_APPEND_RETRY_MAX_DELAY_SECONDS = 0.1
+
+
+# ── Projections ───────────────────────────────────────────────
+# How often each process polls the event store for events written by
+# other processes (see core.replay.follower).
+BOS_PROJECTION_POLL_SECONDS = 1.0
+# Businesses kept in memory per projection; the least recently used
+# are evicted and hydrated again on their next read.
+BOS_PROJECTION_CACHE_BUSINESSES = 1000
+
+
 # ── Internationalization ──────────────────────────────────────
 LANGUAGE_CODE = "en-us"
 TIME_ZONE = "UTC"
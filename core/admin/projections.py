@@ -21,6 +21,14 @@ from core.documents.models import DocumentTemplate
 from core.feature_flags.models import FeatureFlag
 
 
+def _state_uuid(value: uuid.UUID | None) -> str | None:
+    return None if value is None else str(value)
+
+
+def _restore_uuid(value: str | None) -> uuid.UUID | None:
+    return None if value is None else uuid.UUID(value)
+
+
 class FeatureFlagProjection:
     def __init__(self):
         self._records: dict[tuple[uuid.UUID, uuid.UUID | None, str], str] = {}
@@ -100,6 +108,18 @@ class FeatureFlagProjection:
         rows.sort()
         return tuple(rows)
 
+    def export_state(self) -> list:
+        return [
+            [_state_uuid(business_id), _state_uuid(branch_id), flag_key, status]
+            for (business_id, branch_id, flag_key), status in self._records.items()
+        ]
+
+    def restore_state(self, state: list) -> None:
+        self._records = {
+            (_restore_uuid(business_id), _restore_uuid(branch_id), flag_key): status
+            for business_id, branch_id, flag_key, status in state
+        }
+
 
 class ComplianceProfileProjection:
     def __init__(self):
@@ -199,6 +219,18 @@ class ComplianceProfileProjection:
         rows.sort()
         return tuple(rows)
 
+    def export_state(self) -> list:
+        return [
+            [_state_uuid(business_id), _state_uuid(branch_id), version, record]
+            for (business_id, branch_id, version), record in self._records.items()
+        ]
+
+    def restore_state(self, state: list) -> None:
+        self._records = {
+            (_restore_uuid(business_id), _restore_uuid(branch_id), version): record
+            for business_id, branch_id, version, record in state
+        }
+
 
 class DocumentTemplateProjection:
     def __init__(self):
@@ -327,8 +359,35 @@ class DocumentTemplateProjection:
         rows.sort()
         return tuple(rows)
 
+    def export_state(self) -> list:
+        return [
+            [
+                _state_uuid(business_id),
+                _state_uuid(branch_id),
+                doc_type,
+                version,
+                record,
+            ]
+            for (business_id, branch_id, doc_type, version), record in self._records.items()
+        ]
+
+    def restore_state(self, state: list) -> None:
+        self._records = {
+            (
+                _restore_uuid(business_id),
+                _restore_uuid(branch_id),
+                doc_type,
+                version,
+            ): record
+            for business_id, branch_id, doc_type, version, record in state
+        }
+
 
 class AdminProjectionStore:
+    # Bump when export_state() changes shape; older snapshots are then
+    # ignored and the store is rebuilt from events.
+    SNAPSHOT_VERSION = 1
+
     def __init__(self):
         self.feature_flags = FeatureFlagProjection()
         self.compliance_profiles = ComplianceProfileProjection()
@@ -363,3 +422,14 @@ class AdminProjectionStore:
             "document_templates": self.document_templates.snapshot(),
         }
 
+    def export_state(self) -> dict:
+        return {
+            "feature_flags": self.feature_flags.export_state(),
+            "compliance_profiles": self.compliance_profiles.export_state(),
+            "document_templates": self.document_templates.export_state(),
+        }
+
+    def restore_state(self, state: dict) -> None:
+        self.feature_flags.restore_state(state["feature_flags"])
+        self.compliance_profiles.restore_state(state["compliance_profiles"])
+        self.document_templates.restore_state(state["document_templates"])
@@ -7,6 +7,7 @@ Read helpers over derived admin projections.
 from __future__ import annotations
 
 import uuid
+from typing import Callable
 
 from core.admin.projections import AdminProjectionStore
 from core.compliance.models import ComplianceProfile
@@ -15,20 +16,40 @@ from core.feature_flags.models import FeatureFlag
 
 
 class AdminRepository:
-    def __init__(self, projection_store: AdminProjectionStore):
+    """
+    Reads from one projection store, or from the store of each
+    business (store_for_business, e.g. a lazily hydrated cache).
+    """
+
+    def __init__(
+        self,
+        projection_store: AdminProjectionStore | None = None,
+        *,
+        store_for_business: (
+            Callable[[uuid.UUID], AdminProjectionStore] | None
+        ) = None,
+    ):
+        if (projection_store is None) == (store_for_business is None):
+            raise ValueError("Pass projection_store or store_for_business.")
         self._projection_store = projection_store
+        self._store_for_business = store_for_business
+
+    def _store(self, business_id: uuid.UUID) -> AdminProjectionStore:
+        if self._store_for_business is not None:
+            return self._store_for_business(business_id)
+        return self._projection_store
 
     def get_feature_flags(
         self,
         business_id: uuid.UUID,
     ) -> tuple[FeatureFlag, ...]:
-        return self._projection_store.feature_flags.get_feature_flags(business_id)
+        return self._store(business_id).feature_flags.get_feature_flags(business_id)
 
     def get_compliance_profiles(
         self,
         business_id: uuid.UUID,
     ) -> tuple[ComplianceProfile, ...]:
-        return self._projection_store.compliance_profiles.get_compliance_profiles(
+        return self._store(business_id).compliance_profiles.get_compliance_profiles(
             business_id
         )
 
@@ -36,7 +57,7 @@ class AdminRepository:
         self,
         business_id: uuid.UUID,
     ) -> tuple[DocumentTemplate, ...]:
-        return self._projection_store.document_templates.get_document_templates(
+        return self._store(business_id).document_templates.get_document_templates(
             business_id
         )
 
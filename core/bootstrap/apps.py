@@ -33,6 +33,8 @@ SKIP_COMMANDS = {
     "test",
     "collectstatic",
     "check",
+    # Runs the full version of the hash-chain check itself
+    "scan_event_chain_integrity",
 }
 
 
@@ -14,7 +14,9 @@ A vault that boots while corrupted is worse than no vault.
 """
 
 import logging
+import uuid
 
+from django.apps import apps
 from django.db import connection
 
 from core.bootstrap.errors import SystemBootstrapError
@@ -115,24 +117,247 @@ def check_immutability_guards():
 # CHECK 3: Hash-Chain Structural Integrity (Light Check)
 # ══════════════════════════════════════════════════════════════
 
-def check_hash_chain_integrity():
+# Boot must not scale with the size of the event store: it reads at
+# most BOOTSTRAP_CHAIN_SAMPLE chain heads, by the business_id leading
+# key of each head table, and at most BOOTSTRAP_TAIL_LIMIT events per
+# chain through the (business_id, [chain_branch_id,] stream_seq)
+# unique indexes. Heads are sampled by key, not by recency: an index
+# on updated_at would change on every append and turn each head update
+# into a non-HOT update paying for every head index.
+BOOTSTRAP_CHAIN_SAMPLE = 32
+BOOTSTRAP_TAIL_LIMIT = 256
+
+
+def check_hash_chain_integrity(
+    chain_sample: int = BOOTSTRAP_CHAIN_SAMPLE,
+    tail_limit: int = BOOTSTRAP_TAIL_LIMIT,
+):
     """
-    Lightweight structural integrity scan.
-    NOT a full replay — just checks for obvious corruption:
+    Bounded-time structural integrity check of a sample of chains
+    (business chains and branch sub-chains): the chain_sample chains
+    that follow a random business_id in key order, wrapping around, so
+    successive boots check different chains.
+    NOT a full replay and NOT a table scan. For each sampled chain:
+    - The head row names a stored event with exactly its hash
+    - The tail since the chain's verification watermark (at most
+      tail_limit events) is gapless, hash-linked, has no empty
+      event_hash / previous_event_hash, and starts at its genesis,
+      or at the watermarked event when the watermark is reached
+    - Branch sub-chain events sit in the sub-chain of their own branch
+
+    The whole store is checked offline by scan_hash_chain_integrity
+    (manage.py scan_event_chain_integrity) and the chain audit.
+
+    If corruption detected → refuse start.
+    """
+    EventChainHead = apps.get_model("event_store", "EventChainHead")
+    EventBranchChainHead = apps.get_model("event_store", "EventBranchChainHead")
+
+    start = uuid.uuid4()
+    heads = [
+        (business_id, None, head_hash, head_event_id, sequence)
+        for business_id, head_hash, head_event_id, sequence in _sample_heads(
+            EventChainHead.objects.filter(sequence__gt=0),
+            ("business_id",),
+            ("business_id", "head_hash", "head_event_id", "sequence"),
+            start,
+            chain_sample,
+        )
+    ] + _sample_heads(
+        EventBranchChainHead.objects.filter(sequence__gt=0),
+        ("business_id", "branch_id"),
+        ("business_id", "branch_id", "head_hash", "head_event_id", "sequence"),
+        start,
+        chain_sample,
+    )
+    if not heads:
+        logger.info("✓ Hash-chain check skipped (no events yet).")
+        return
+
+    # Both samples in one wrap-around key order from start
+    heads.sort(
+        key=lambda head: (
+            head[0] < start,
+            head[0],
+            head[1] is not None,
+            str(head[1]),
+        )
+    )
+    checked_events = 0
+    for head in heads[:chain_sample]:
+        checked_events += _check_chain_tail(*head, tail_limit=tail_limit)
+
+    logger.info(
+        f"✓ Hash-chain structural integrity OK "
+        f"({min(len(heads), chain_sample)} chains, {checked_events} "
+        f"recent events)."
+    )
+
+
+def _sample_heads(queryset, order_by, fields, start, limit) -> list[tuple]:
+    """
+    Up to limit head rows from business_id start on, in index order,
+    continued from the lowest business_id when the end is reached.
+    """
+    rows = list(
+        queryset.filter(business_id__gte=start)
+        .order_by(*order_by)
+        .values_list(*fields)[:limit]
+    )
+    if len(rows) < limit:
+        rows += queryset.filter(business_id__lt=start).order_by(
+            *order_by
+        ).values_list(*fields)[:limit - len(rows)]
+    return rows
+
+
+def _check_chain_tail(
+    business_id,
+    chain_branch_id,
+    head_hash,
+    head_event_id,
+    sequence,
+    *,
+    tail_limit,
+) -> int:
+    """Check one chain's head and unverified tail. Returns events read."""
+    from core.event_store.hashing import GENESIS_HASH, branch_genesis_hash
+
+    Event = apps.get_model("event_store", "Event")
+    ChainVerificationWatermark = apps.get_model(
+        "replay",
+        "ChainVerificationWatermark",
+    )
+
+    chain = chain_branch_id or "business chain"
+    watermark = ChainVerificationWatermark.objects.filter(
+        business_id=business_id,
+        chain_branch_id=chain_branch_id,
+    ).first()
+    verified_seq = watermark.verified_seq if watermark is not None else 0
+    # The first row read is the link: the watermarked event, or genesis.
+    first_seq = max(verified_seq, sequence - tail_limit, 1)
+    rows = list(
+        Event.objects.filter(
+            business_id=business_id,
+            chain_branch_id=chain_branch_id,
+            stream_seq__gte=first_seq,
+            stream_seq__lte=sequence,
+        )
+        .order_by("stream_seq")
+        .values_list(
+            "event_id",
+            "stream_seq",
+            "previous_event_hash",
+            "event_hash",
+            "branch_id",
+        )
+    )
+
+    if first_seq > sequence or [row[1] for row in rows] != list(
+        range(first_seq, sequence + 1)
+    ):
+        raise SystemBootstrapError(
+            invariant="HASH_CHAIN_HEAD",
+            detail=(
+                f"Business {business_id}, {chain}: head is at sequence "
+                f"{sequence} but events {first_seq}-{sequence} are not "
+                f"all stored."
+            ),
+        )
+
+    if watermark is not None and first_seq == verified_seq:
+        event_id, _, _, event_hash, _ = rows[0]
+        if (event_id, event_hash) != (
+            watermark.verified_event_id,
+            watermark.verified_hash,
+        ):
+            raise SystemBootstrapError(
+                invariant="HASH_CHAIN_WATERMARK",
+                detail=(
+                    f"Business {business_id}, {chain}: verified event at "
+                    f"sequence {verified_seq} no longer matches its "
+                    f"verification watermark."
+                ),
+            )
+
+    previous_event_hash = None
+    if first_seq == 1:
+        previous_event_hash = (
+            GENESIS_HASH
+            if chain_branch_id is None
+            else branch_genesis_hash(chain_branch_id)
+        )
+    for event_id, stream_seq, previous_hash, event_hash, branch_id in rows:
+        if event_hash == "":
+            raise SystemBootstrapError(
+                invariant="HASH_CHAIN_EMPTY_HASH",
+                detail=(
+                    f"Event {event_id} has empty event_hash. "
+                    f"Chain integrity is compromised."
+                ),
+            )
+        if previous_hash == "":
+            raise SystemBootstrapError(
+                invariant="HASH_CHAIN_EMPTY_PREVIOUS",
+                detail=f"Event {event_id} has empty previous_event_hash.",
+            )
+        if previous_event_hash is not None and previous_hash != previous_event_hash:
+            raise SystemBootstrapError(
+                invariant=(
+                    "HASH_CHAIN_GENESIS" if stream_seq == 1 else "HASH_CHAIN_LINK"
+                ),
+                detail=(
+                    f"Event {event_id} (business {business_id}, {chain}, "
+                    f"sequence {stream_seq}) links to '{previous_hash}' "
+                    f"instead of '{previous_event_hash}'."
+                ),
+            )
+        if chain_branch_id is not None and branch_id != chain_branch_id:
+            raise SystemBootstrapError(
+                invariant="HASH_CHAIN_BRANCH_SCOPE",
+                detail=(
+                    f"Event {event_id} is linked into a branch sub-chain "
+                    f"other than its own branch."
+                ),
+            )
+        previous_event_hash = event_hash
+
+    event_id, _, _, event_hash, _ = rows[-1]
+    if (event_id, event_hash) != (head_event_id, head_hash):
+        raise SystemBootstrapError(
+            invariant="HASH_CHAIN_HEAD",
+            detail=(
+                f"Business {business_id}, {chain}: head names event "
+                f"{head_event_id} with hash '{head_hash}', but sequence "
+                f"{sequence} is event {event_id} with hash '{event_hash}'."
+            ),
+        )
+    return len(rows)
+
+
+def scan_hash_chain_integrity():
+    """
+    Full structural integrity scan of the whole event table (offline).
+    Too slow for boot on a large store; run it with
+    manage.py scan_event_chain_integrity. Checks:
     - No event has NULL or empty event_hash
     - No event has NULL previous_event_hash
     - GENESIS is used correctly (only on first event per business)
+    - Branch sub-chain events (BRANCH chain mode) sit in the sub-chain
+      of their own branch
 
-    If corruption detected → refuse start.
+    Raises SystemBootstrapError on corruption. Returns the number of
+    events scanned.
     """
-    from core.event_store.models import Event
+    from django.db.models import Count, F
+
     from core.event_store.hashing import GENESIS_HASH
 
-    # Skip if no events exist (fresh system)
+    Event = apps.get_model("event_store", "Event")
     total = Event.objects.count()
     if total == 0:
-        logger.info("✓ Hash-chain check skipped (no events yet).")
-        return
+        return 0
 
     # Check for empty or null event_hash
     broken_hash = Event.objects.filter(event_hash="").count()
@@ -156,7 +381,44 @@ def check_hash_chain_integrity():
             ),
         )
 
-    logger.info(f"✓ Hash-chain structural integrity OK ({total} events).")
+    # GENESIS starts each business chain once; sub-chains use their own
+    repeated_genesis = (
+        Event.objects.filter(previous_event_hash=GENESIS_HASH)
+        .values("business_id")
+        .annotate(genesis_count=Count("event_id"))
+        .filter(genesis_count__gt=1)
+        .count()
+    )
+    branch_genesis_misuse = Event.objects.filter(
+        previous_event_hash=GENESIS_HASH,
+        chain_branch_id__isnull=False,
+    ).count()
+    if repeated_genesis > 0 or branch_genesis_misuse > 0:
+        raise SystemBootstrapError(
+            invariant="HASH_CHAIN_GENESIS",
+            detail=(
+                f"{repeated_genesis} business(es) start their chain more "
+                f"than once and {branch_genesis_misuse} branch sub-chain "
+                f"event(s) link to the business '{GENESIS_HASH}'."
+            ),
+        )
+
+    misplaced = (
+        Event.objects.filter(chain_branch_id__isnull=False)
+        .exclude(chain_branch_id=F("branch_id"))
+        .count()
+    )
+    if misplaced > 0:
+        raise SystemBootstrapError(
+            invariant="HASH_CHAIN_BRANCH_SCOPE",
+            detail=(
+                f"{misplaced} event(s) are linked into a branch sub-chain "
+                f"other than their own branch."
+            ),
+        )
+
+    logger.info(f"✓ Full hash-chain structural scan OK ({total} events).")
+    return total
 
 
 # ══════════════════════════════════════════════════════════════
@@ -0,0 +1,27 @@
+"""
+BOS Bootstrap — scan_event_chain_integrity
+============================================
+Offline, full-table version of the boot-time hash-chain check. Boot
+only checks the heads and recent tails of a sample of chains; this
+scans every event. Exits non-zero on corruption.
+
+Hash recomputation is the chain audit's job (audit_event_chains).
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.bootstrap.errors import SystemBootstrapError
+from core.bootstrap.invariants import scan_hash_chain_integrity
+
+
+class Command(BaseCommand):
+    help = "Scan the whole event table for hash-chain structural corruption."
+
+    def handle(self, *args, **options):
+        try:
+            total = scan_hash_chain_integrity()
+        except SystemBootstrapError as exc:
+            raise CommandError(str(exc))
+        self.stdout.write(
+            self.style.SUCCESS(f"Hash-chain structure OK ({total} events).")
+        )
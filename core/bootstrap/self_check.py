@@ -7,7 +7,7 @@ If any check fails → SystemBootstrapError propagates → system refuses to sta
 Check order:
 1. Event Store table exists
 2. Immutability guards active
-3. Hash-chain structural integrity
+3. Hash-chain structural integrity (recent chain tails, bounded)
 4. Registry sanity
 5. Persistence entry point
 
@@ -89,6 +89,10 @@ class IssuedDocumentRecord:
 
 
 class DocumentIssuanceProjectionStore:
+    # Bump when export_state() changes shape; older snapshots are then
+    # ignored and the store is rebuilt from events.
+    SNAPSHOT_VERSION = 1
+
     def __init__(self):
         self._records: dict[
             tuple[uuid.UUID, uuid.UUID | None, uuid.UUID],
@@ -143,3 +147,52 @@ class DocumentIssuanceProjectionStore:
             items.append(record)
         items.sort(key=lambda item: (item.issued_at, str(item.document_id)))
         return tuple(items)
+
+    def export_state(self) -> list[dict]:
+        return [
+            {
+                "business_id": str(record.business_id),
+                "branch_id": (
+                    None if record.branch_id is None else str(record.branch_id)
+                ),
+                "document_id": str(record.document_id),
+                "doc_type": record.doc_type,
+                "template_id": record.template_id,
+                "template_version": record.template_version,
+                "schema_version": record.schema_version,
+                "issued_at": record.issued_at.isoformat(),
+                "actor_id": record.actor_id,
+                "correlation_id": str(record.correlation_id),
+                "status": record.status,
+                "totals": record.totals,
+                "doc_number": record.doc_number,
+                "render_plan": record.render_plan,
+                "render_plan_hash": record.render_plan_hash,
+            }
+            for record in self._records.values()
+        ]
+
+    def restore_state(self, state: list[dict]) -> None:
+        records = {}
+        for item in state:
+            record = IssuedDocumentRecord(
+                business_id=_coerce_uuid(item["business_id"]),
+                branch_id=_coerce_optional_uuid(item["branch_id"]),
+                document_id=_coerce_uuid(item["document_id"]),
+                doc_type=item["doc_type"],
+                template_id=item["template_id"],
+                template_version=item["template_version"],
+                schema_version=item["schema_version"],
+                issued_at=_coerce_issued_at(item["issued_at"]),
+                actor_id=item["actor_id"],
+                correlation_id=_coerce_uuid(item["correlation_id"]),
+                status=item["status"],
+                totals=item["totals"],
+                doc_number=item["doc_number"],
+                render_plan=item["render_plan"],
+                render_plan_hash=item["render_plan_hash"],
+            )
+            records[
+                (record.business_id, record.branch_id, record.document_id)
+            ] = record
+        self._records = records
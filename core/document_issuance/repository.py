@@ -8,6 +8,7 @@ from __future__ import annotations
 import base64
 from datetime import datetime
 import uuid
+from typing import Callable
 
 from core.document_issuance.projections import (
     DocumentIssuanceProjectionStore,
@@ -65,15 +66,35 @@ def _decode_cursor_token(cursor: str) -> tuple[datetime, str]:
 
 
 class DocumentIssuanceRepository:
-    def __init__(self, projection_store: DocumentIssuanceProjectionStore):
+    """
+    Reads from one projection store, or from the store of each
+    business (store_for_business, e.g. a lazily hydrated cache).
+    """
+
+    def __init__(
+        self,
+        projection_store: DocumentIssuanceProjectionStore | None = None,
+        *,
+        store_for_business: (
+            Callable[[uuid.UUID], DocumentIssuanceProjectionStore] | None
+        ) = None,
+    ):
+        if (projection_store is None) == (store_for_business is None):
+            raise ValueError("Pass projection_store or store_for_business.")
         self._projection_store = projection_store
+        self._store_for_business = store_for_business
+
+    def _store(self, business_id: uuid.UUID) -> DocumentIssuanceProjectionStore:
+        if self._store_for_business is not None:
+            return self._store_for_business(business_id)
+        return self._projection_store
 
     def get_documents(
         self,
         business_id: uuid.UUID,
         branch_id: uuid.UUID | None = None,
     ) -> tuple[IssuedDocumentRecord, ...]:
-        return self._projection_store.list_documents(
+        return self._store(business_id).list_documents(
             business_id=business_id,
             branch_id=branch_id,
         )
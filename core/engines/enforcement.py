@@ -224,6 +224,7 @@ def enforced_persist_event(
     engine_registry: EngineRegistry,
     subscriber_registry: Any = None,
     scope_requirement: str = SCOPE_BUSINESS_ALLOWED,
+    use_outbox: bool = False,
 ):
     """
     Engine-contract-aware wrapper around persist_event().
@@ -241,6 +242,7 @@ def enforced_persist_event(
         event_type_registry: EventTypeRegistry (persistence gate).
         engine_registry:     Locked EngineRegistry (ownership gate).
         subscriber_registry: Optional SubscriberRegistry for dispatch.
+        use_outbox:          Queue for background delivery instead.
 
     Returns:
         ValidationResult from persist_event().
@@ -265,6 +267,7 @@ def enforced_persist_event(
         registry=event_type_registry,
         subscriber_registry=subscriber_registry,
         scope_requirement=scope_requirement,
+        use_outbox=use_outbox,
     )
 
 
@@ -279,6 +282,7 @@ def enforced_register_subscriber(
     handler: Any,
     subscriber_engine: str,
     allow_self_subscription: bool = False,
+    batch_handler: Any = None,
 ) -> None:
     """
     Engine-contract-aware wrapper around
@@ -300,6 +304,7 @@ def enforced_register_subscriber(
         handler:             Callable handler.
         subscriber_engine:   Engine registering the handler.
         allow_self_subscription: Override for engine isolation.
+        batch_handler:       Optional callable taking a list of events.
 
     Raises:
         EngineContractViolation: If subscription is not declared.
@@ -329,4 +334,5 @@ def enforced_register_subscriber(
         handler=handler,
         subscriber_engine=subscriber_engine,
         allow_self_subscription=allow_self_subscription,
+        batch_handler=batch_handler,
     )
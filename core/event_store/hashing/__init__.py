@@ -8,17 +8,39 @@ from core.event_store.hashing.errors import (
     HashViolatedRule,
 )
 from core.event_store.hashing.hasher import (
+    DEFAULT_HASH_VERSION,
     GENESIS_HASH,
+    HASH_VERSION_BLAKE2B,
+    HASH_VERSION_SHA256,
+    HASH_VERSIONS,
+    branch_genesis_hash,
     canonical_serialize,
     compute_event_hash,
+    compute_event_hash_from_canonical,
+)
+from core.event_store.hashing.merkle import (
+    merkle_inclusion_proof,
+    merkle_leaf_hash,
+    merkle_root,
+    verify_merkle_inclusion,
 )
 from core.event_store.hashing.verifier import verify_hash_chain
 
 __all__ = [
     "GENESIS_HASH",
+    "HASH_VERSION_SHA256",
+    "HASH_VERSION_BLAKE2B",
+    "HASH_VERSIONS",
+    "DEFAULT_HASH_VERSION",
+    "branch_genesis_hash",
     "canonical_serialize",
     "compute_event_hash",
+    "compute_event_hash_from_canonical",
     "verify_hash_chain",
+    "merkle_leaf_hash",
+    "merkle_root",
+    "merkle_inclusion_proof",
+    "verify_merkle_inclusion",
     "HashRejectionCode",
     "HashViolatedRule",
 ]
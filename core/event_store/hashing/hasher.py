@@ -1,10 +1,23 @@
 """
 BOS Event Store — Hash Computation
 ====================================
-Computes event_hash using SHA-256.
+Computes event_hash under a versioned scheme.
 
 Formula:
-    event_hash = SHA256(canonical_json(payload) + previous_event_hash)
+    event_hash = DIGEST_v(canonical_json(payload) + previous_event_hash)
+
+Hash versions (Event.hash_version, chosen per chain on its head row):
+    1  SHA-256              (default; every chain written before versions)
+    2  BLAKE2b, 32-byte digest (same 64-char hex length)
+
+The canonical JSON is the same for every version: an append serializes
+its payload once, before it knows which chain head it will lock, and
+stores that text (Event.payload_canonical). Versions differ in digest
+only, so an event always verifies under the version it was written with.
+
+Which digest is cheaper depends on the CPU: SHA-256 wins where OpenSSL
+uses SHA extensions, BLAKE2b elsewhere. Measure with
+scripts/bench_event_hashing.py before switching a chain.
 
 Rules:
 - Canonical JSON: sorted keys, no whitespace variability
@@ -15,9 +28,10 @@ Rules:
 This module ONLY computes. It does not verify, persist, or dispatch.
 """
 
+import functools
 import hashlib
 import json
-from typing import Any
+from typing import Any, Callable
 
 
 # ══════════════════════════════════════════════════════════════
@@ -26,11 +40,40 @@ from typing import Any
 
 GENESIS_HASH = "GENESIS"
 
+HASH_VERSION_SHA256 = 1
+HASH_VERSION_BLAKE2B = 2
+DEFAULT_HASH_VERSION = HASH_VERSION_SHA256
+
+_DIGESTS: dict[int, Callable[[bytes], Any]] = {
+    HASH_VERSION_SHA256: hashlib.sha256,
+    HASH_VERSION_BLAKE2B: functools.partial(hashlib.blake2b, digest_size=32),
+}
+HASH_VERSIONS = tuple(_DIGESTS)
+
+
+def branch_genesis_hash(branch_id: Any) -> str:
+    """
+    Genesis of a branch sub-chain (BRANCH chain mode).
+
+    Distinct per branch, so the hash links of every sub-chain of a
+    business stay distinct and uq_evt_biz_prev_hash keeps guarding
+    each sub-chain against forks.
+    """
+    return f"{GENESIS_HASH}:{branch_id}"
+
 
 # ══════════════════════════════════════════════════════════════
 # CANONICAL SERIALIZATION
 # ══════════════════════════════════════════════════════════════
 
+_CANONICAL_ENCODER = json.JSONEncoder(
+    sort_keys=True,
+    separators=(",", ":"),
+    ensure_ascii=True,
+    default=str,
+)
+
+
 def canonical_serialize(payload: Any) -> str:
     """
     Produce a deterministic JSON string from payload.
@@ -41,35 +84,61 @@ def canonical_serialize(payload: Any) -> str:
     - ensure_ascii=True for cross-platform consistency
     - Default str() for non-serializable types (UUID, datetime)
 
-    Same input ALWAYS produces same output.
+    Same input ALWAYS produces same output. Uses one shared encoder
+    (json.dumps would build a new one per call); output is identical.
     """
-    return json.dumps(
-        payload,
-        sort_keys=True,
-        separators=(",", ":"),
-        ensure_ascii=True,
-        default=str,
-    )
+    return _CANONICAL_ENCODER.encode(payload)
 
 
 # ══════════════════════════════════════════════════════════════
 # HASH COMPUTATION
 # ══════════════════════════════════════════════════════════════
 
-def compute_event_hash(payload: Any, previous_event_hash: str) -> str:
+def compute_event_hash(
+    payload: Any,
+    previous_event_hash: str,
+    hash_version: int = DEFAULT_HASH_VERSION,
+) -> str:
     """
-    Compute SHA-256 hash for an event.
+    Compute the hash of an event.
 
     Formula:
-        event_hash = SHA256(canonical_json(payload) + previous_event_hash)
+        event_hash = DIGEST_v(canonical_json(payload) + previous_event_hash)
 
     Args:
         payload:             Event payload (dict/JSON-serializable).
         previous_event_hash: Hash of the preceding event, or GENESIS_HASH.
+        hash_version:        Hash scheme (HASH_VERSIONS).
 
     Returns:
-        64-character lowercase hex SHA-256 digest.
+        64-character lowercase hex digest.
+    """
+    return compute_event_hash_from_canonical(
+        canonical_serialize(payload),
+        previous_event_hash,
+        hash_version,
+    )
+
+
+def compute_event_hash_from_canonical(
+    canonical_payload: str,
+    previous_event_hash: str,
+    hash_version: int = DEFAULT_HASH_VERSION,
+) -> str:
+    """
+    Same hash as compute_event_hash(), from an already canonical payload
+    (canonical_serialize output, e.g. Event.payload_canonical).
+
+    Lets an append serialize its payload once for every hash pass, and
+    lets verification hash stored text without decoding JSON.
+
+    Raises ValueError for an unknown hash_version.
     """
-    canonical = canonical_serialize(payload)
-    hash_input = canonical + previous_event_hash
-    return hashlib.sha256(hash_input.encode("utf-8")).hexdigest()
+    digest = _DIGESTS.get(hash_version)
+    if digest is None:
+        raise ValueError(
+            f"Unknown hash_version {hash_version!r}. "
+            f"Expected one of {HASH_VERSIONS}."
+        )
+    hash_input = canonical_payload + previous_event_hash
+    return digest(hash_input.encode("utf-8")).hexdigest()
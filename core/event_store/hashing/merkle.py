@@ -0,0 +1,121 @@
+"""
+BOS Event Store — Merkle Trees over Event Hashes
+==================================================
+Merkle tree hashing (RFC 6962 / RFC 9162 layout, SHA-256) over the
+event_hash values of one chain segment, in stream_seq order.
+
+    leaf  = SHA-256(0x00 || event_hash)
+    node  = SHA-256(0x01 || left || right)
+    root  = node over the largest power-of-two left subtree and the rest
+
+Leaf and node hashes are domain-separated, so an inner node can never
+be presented as a leaf. An inclusion proof is the list of sibling
+subtree hashes from the leaf up to the root: ceil(log2(n)) hashes for
+a segment of n events, checked without any other event of the chain.
+
+Pure functions. No I/O, no Django.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Sequence
+
+_LEAF_PREFIX = b"\x00"
+_NODE_PREFIX = b"\x01"
+
+
+def _leaf(event_hash: str) -> bytes:
+    return hashlib.sha256(_LEAF_PREFIX + event_hash.encode("ascii")).digest()
+
+
+def _node(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(_NODE_PREFIX + left + right).digest()
+
+
+def _split(size: int) -> int:
+    """Largest power of two strictly below size (size >= 2)."""
+    return 1 << ((size - 1).bit_length() - 1)
+
+
+def _subtree_root(leaves: Sequence[bytes]) -> bytes:
+    if len(leaves) == 1:
+        return leaves[0]
+    split = _split(len(leaves))
+    return _node(_subtree_root(leaves[:split]), _subtree_root(leaves[split:]))
+
+
+def _path(leaves: Sequence[bytes], index: int) -> list[bytes]:
+    if len(leaves) == 1:
+        return []
+    split = _split(len(leaves))
+    if index < split:
+        return _path(leaves[:split], index) + [_subtree_root(leaves[split:])]
+    return _path(leaves[split:], index - split) + [_subtree_root(leaves[:split])]
+
+
+def merkle_leaf_hash(event_hash: str) -> str:
+    """Leaf hash (hex) of one event."""
+    return _leaf(event_hash).hex()
+
+
+def merkle_root(event_hashes: Sequence[str]) -> str:
+    """
+    Root hash (hex) over event hashes in chain order.
+
+    Raises ValueError for an empty sequence: segments are never empty.
+    """
+    if not event_hashes:
+        raise ValueError("Merkle root of an empty segment is undefined.")
+    return _subtree_root([_leaf(event_hash) for event_hash in event_hashes]).hex()
+
+
+def merkle_inclusion_proof(event_hashes: Sequence[str], index: int) -> list[str]:
+    """
+    Sibling hashes (hex, leaf to root) proving event_hashes[index] is
+    included under merkle_root(event_hashes).
+    """
+    if not 0 <= index < len(event_hashes):
+        raise ValueError(
+            f"Leaf index {index} outside a tree of {len(event_hashes)}."
+        )
+    leaves = [_leaf(event_hash) for event_hash in event_hashes]
+    return [sibling.hex() for sibling in _path(leaves, index)]
+
+
+def verify_merkle_inclusion(
+    event_hash: str,
+    leaf_index: int,
+    tree_size: int,
+    proof: Sequence[str],
+    root_hash: str,
+) -> bool:
+    """
+    Check an inclusion proof (RFC 9162 §2.1.3.2) in O(log n) hashes.
+
+    True iff event_hash is leaf leaf_index of the tree of tree_size
+    leaves whose root is root_hash.
+    """
+    if not 0 <= leaf_index < tree_size:
+        return False
+    try:
+        siblings = [bytes.fromhex(sibling) for sibling in proof]
+    except ValueError:
+        return False
+
+    position = leaf_index
+    last = tree_size - 1
+    computed = _leaf(event_hash)
+    for sibling in siblings:
+        if last == 0:
+            return False
+        if position & 1 or position == last:
+            computed = _node(sibling, computed)
+            while not position & 1 and position != 0:
+                position >>= 1
+                last >>= 1
+        else:
+            computed = _node(computed, sibling)
+        position >>= 1
+        last >>= 1
+    return last == 0 and computed.hex() == root_hash
@@ -25,12 +25,12 @@ BOS prefers failure over silent corruption.
 import uuid
 from typing import Any
 
-from core.event_store.models import Event
 from core.event_store.hashing.errors import (
     HashRejectionCode,
     HashViolatedRule,
 )
 from core.event_store.hashing.hasher import (
+    DEFAULT_HASH_VERSION,
     GENESIS_HASH,
     compute_event_hash,
 )
@@ -46,21 +46,23 @@ def _get_last_event_hash(
     Fetch the event_hash of the most recent event for a business.
     If no events exist → return GENESIS_HASH.
 
-    Uses created_at/event_id ordering to determine the latest event.
+    Reads the business row of the chain head table (primary-key
+    lookup, independent of chain length). lock=True locks that row
+    and must be called inside transaction.atomic().
     """
-    query = (
-        Event.objects.filter(business_id=business_id)
-        .order_by("-created_at", "-event_id")
+    from core.event_store.persistence.repository import (
+        get_chain_head,
+        lock_chain_head,
     )
-    if lock:
-        query = query.select_for_update()
 
-    last_event = query.values_list("event_hash", flat=True).first()
+    if lock:
+        return lock_chain_head(business_id).head_hash
 
-    if last_event is None:
+    chain_head = get_chain_head(business_id)
+    if chain_head is None:
         return GENESIS_HASH
 
-    return last_event
+    return chain_head.head_hash
 
 
 def verify_hash_chain(
@@ -70,6 +72,7 @@ def verify_hash_chain(
     event_hash: str,
     *,
     lock: bool = False,
+    hash_version: int = DEFAULT_HASH_VERSION,
 ) -> ValidationResult:
     """
     Verify hash-chain integrity for a new event.
@@ -83,6 +86,7 @@ def verify_hash_chain(
         previous_event_hash:  Client-provided previous hash.
         payload:              Event payload for hash computation.
         event_hash:           Client-provided event hash.
+        hash_version:         Hash scheme of the chain (HASH_VERSIONS).
 
     Returns:
         ValidationResult — accepted=True or rejected with explicit reason.
@@ -111,7 +115,11 @@ def verify_hash_chain(
         )
 
     # ── 2. Hash computation check ─────────────────────────────
-    expected_hash = compute_event_hash(payload, previous_event_hash)
+    expected_hash = compute_event_hash(
+        payload,
+        previous_event_hash,
+        hash_version,
+    )
 
     if event_hash != expected_hash:
         return ValidationResult(
@@ -9,11 +9,15 @@ from core.event_store.idempotency.errors import (
 )
 from core.event_store.idempotency.guard import (
     check_idempotency,
+    check_idempotency_batch,
+    duplicate_event_rejection,
     handle_integrity_error,
 )
 
 __all__ = [
     "check_idempotency",
+    "check_idempotency_batch",
+    "duplicate_event_rejection",
     "handle_integrity_error",
     "IdempotencyRejectionCode",
     "IdempotencyViolatedRule",
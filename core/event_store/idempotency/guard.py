@@ -18,6 +18,7 @@ The Event Store is a vault, not a merge engine.
 """
 
 import uuid
+from typing import Iterable
 
 from django.db import IntegrityError
 
@@ -60,6 +61,40 @@ def check_idempotency(event_id: uuid.UUID) -> ValidationResult:
     return ValidationResult(accepted=True)
 
 
+def check_idempotency_batch(event_ids: Iterable[uuid.UUID]) -> ValidationResult:
+    """
+    Application-level idempotency check for a batch of event_ids.
+    One query for the whole batch instead of one per event.
+
+    Args:
+        event_ids: The UUIDs to check for duplicates.
+
+    Returns:
+        ValidationResult — accepted=True if none exist yet,
+        accepted=False with DUPLICATE_EVENT_ID rejection naming
+        the first existing event_id otherwise.
+
+    Same guarantees as check_idempotency(): read-only, no payload
+    comparison, no silent success on duplicate.
+    """
+    existing_event_id = (
+        Event.objects.filter(event_id__in=list(event_ids))
+        .values_list("event_id", flat=True)
+        .first()
+    )
+    if existing_event_id is not None:
+        return ValidationResult(
+            accepted=False,
+            rejection=Rejection(
+                code=IdempotencyRejectionCode.DUPLICATE_EVENT_ID,
+                message=f"Event with ID {existing_event_id} already exists.",
+                violated_rule=IdempotencyViolatedRule.EVENT_IDEMPOTENCY,
+            ),
+        )
+
+    return ValidationResult(accepted=True)
+
+
 def handle_integrity_error(event_id: uuid.UUID, exc: IntegrityError) -> ValidationResult:
     """
     Database-level fallback for race conditions.
@@ -77,6 +112,14 @@ def handle_integrity_error(event_id: uuid.UUID, exc: IntegrityError) -> Validati
 
     Raw database exceptions must NEVER propagate to callers.
     """
+    return duplicate_event_rejection(event_id)
+
+
+def duplicate_event_rejection(event_id: uuid.UUID) -> ValidationResult:
+    """
+    Deterministic DUPLICATE_EVENT_ID rejection for a duplicate detected
+    by the database itself (IntegrityError or ON CONFLICT DO NOTHING).
+    """
     return ValidationResult(
         accepted=False,
         rejection=Rejection(
@@ -0,0 +1,53 @@
+"""
+BOS Event Store — anchor_event_chains
+=======================================
+Append an anchor for every business in BRANCH chain mode (or one
+business with --business-id). Safe to run repeatedly: businesses whose
+branch heads did not move since their last anchor are skipped.
+"""
+
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.event_store.models import ChainMode, EventChainHead
+from core.event_store.persistence.branch_chains import anchor_branch_heads
+
+
+class Command(BaseCommand):
+    help = "Anchor branch sub-chain heads into each business anchor chain."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--business-id",
+            help="Anchor only this business.",
+        )
+
+    def handle(self, *args, **options):
+        if options["business_id"]:
+            try:
+                business_ids = [uuid.UUID(options["business_id"])]
+            except ValueError as exc:
+                raise CommandError(f"Invalid --business-id: {exc}")
+        else:
+            business_ids = list(
+                EventChainHead.objects.filter(chain_mode=ChainMode.BRANCH)
+                .values_list("business_id", flat=True)
+            )
+
+        anchored = 0
+        for business_id in business_ids:
+            anchor = anchor_branch_heads(business_id)
+            if anchor is None:
+                continue
+            anchored += 1
+            self.stdout.write(
+                f"{business_id}: anchor {anchor.anchor_seq} "
+                f"({len(anchor.branch_heads)} branches)"
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Anchored {anchored} of {len(business_ids)} business(es)."
+            )
+        )
@@ -0,0 +1,140 @@
+"""
+BOS Event Store — drain_event_outbox
+======================================
+Deliver queued outbox events to a subscriber registry in the
+background. Runs until interrupted, polling when the outbox is empty;
+--once drains one pass and exits (non-zero when a delivery failed).
+
+The registry is named by --registry: a dotted path to a callable that
+returns the SubscriberRegistry holding the handlers. On PostgreSQL
+several drains may run against one database: each business is drained
+by one of them at a time. Run one drain per database on other backends.
+"""
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.module_loading import import_string
+
+from core.event_store.persistence.outbox import (
+    OUTBOX_BATCH_SIZE,
+    OUTBOX_POLL_SECONDS,
+    drain_event_outbox,
+    run_outbox_worker,
+)
+from core.events.registry import SubscriberRegistry
+
+
+class Command(BaseCommand):
+    help = "Deliver outbox events to subscribers with a worker pool."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--registry",
+            required=True,
+            help=(
+                "Dotted path to a callable returning the SubscriberRegistry "
+                "to deliver to."
+            ),
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Worker threads (default: CPU count; 1 = serial).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=OUTBOX_BATCH_SIZE,
+            help="Outbox rows delivered per business round-trip.",
+        )
+        parser.add_argument(
+            "--poll-seconds",
+            type=float,
+            default=OUTBOX_POLL_SECONDS,
+            help="Wait between passes that found nothing to deliver.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Drain one pass and exit.",
+        )
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            help="Print the result of --once as JSON.",
+        )
+
+    def handle(self, *args, **options):
+        if options["workers"] is not None and options["workers"] < 1:
+            raise CommandError("--workers must be >= 1.")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be >= 1.")
+        if options["poll_seconds"] < 0:
+            raise CommandError("--poll-seconds must be >= 0.")
+
+        registry = self._load_registry(options["registry"])
+
+        if not options["once"]:
+            self.stdout.write("Draining the event outbox (Ctrl-C to stop)...")
+            try:
+                run_outbox_worker(
+                    registry,
+                    workers=options["workers"],
+                    batch_size=options["batch_size"],
+                    poll_seconds=options["poll_seconds"],
+                    on_pass=self._report_failures,
+                )
+            except KeyboardInterrupt:
+                self.stdout.write("Stopped.")
+            return
+
+        result = drain_event_outbox(
+            registry,
+            workers=options["workers"],
+            batch_size=options["batch_size"],
+        )
+        if options["json"]:
+            self.stdout.write(json.dumps({
+                "businesses": result.businesses,
+                "businesses_skipped": result.businesses_skipped,
+                "events_delivered": result.events_delivered,
+                "delivery_failures": result.delivery_failures,
+                "rows_pruned": result.rows_pruned,
+                "failures": result.failures,
+            }, indent=2))
+        else:
+            self._report_failures(result)
+            self.stdout.write(
+                f"Delivered {result.events_delivered} event(s) for "
+                f"{result.businesses} business(es), pruned "
+                f"{result.rows_pruned} outbox row(s); skipped "
+                f"{result.businesses_skipped} business(es) drained "
+                f"elsewhere."
+            )
+
+        if result.failures:
+            raise CommandError(
+                f"Outbox drain failed: {len(result.failures)} failure(s)."
+            )
+        if not options["json"]:
+            self.stdout.write(self.style.SUCCESS("Outbox drained."))
+
+    def _report_failures(self, result):
+        for failure in result.failures:
+            self.stderr.write(
+                ", ".join(f"{key}={value}" for key, value in failure.items())
+            )
+
+    def _load_registry(self, path):
+        try:
+            registry = import_string(path)()
+        except ImportError as exc:
+            raise CommandError(f"Cannot import --registry '{path}': {exc}")
+        if not isinstance(registry, SubscriberRegistry):
+            raise CommandError(
+                f"--registry '{path}' returned {type(registry).__name__}, "
+                f"not a SubscriberRegistry."
+            )
+        return registry
@@ -0,0 +1,59 @@
+"""
+BOS Event Store — event_store_partitions
+==========================================
+Report the hash partitions of bos_event_store (PostgreSQL) and, with
+--ensure, attach or create any that are missing.
+
+Hash partitions cover every business from the start, so unlike time
+ranges there is nothing to pre-create ahead of the calendar; --ensure
+repairs a layout where a partition was detached (attached again,
+rows included) or dropped (created empty).
+"""
+
+from django.core.management.base import BaseCommand
+
+from core.event_store.partitioning import (
+    EVENT_PARTITION_COUNT,
+    ensure_event_partitions,
+    is_event_store_partitioned,
+    partition_report,
+)
+
+
+class Command(BaseCommand):
+    help = "Report (and with --ensure, repair) bos_event_store partitions."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--ensure",
+            action="store_true",
+            help="Attach or create any missing hash partition.",
+        )
+
+    def handle(self, *args, **options):
+        if not is_event_store_partitioned():
+            self.stdout.write(
+                "bos_event_store is not partitioned on this database "
+                "(PostgreSQL only; run migrations to partition it)."
+            )
+            return
+
+        if options["ensure"]:
+            for name, action in ensure_event_partitions():
+                self.stdout.write(f"{action.capitalize()} partition {name}")
+
+        report = partition_report()
+        for row in report:
+            self.stdout.write(
+                f"{row['partition']}: {row['bound']} "
+                f"~{row['estimated_rows']} rows, {row['total_bytes']} bytes"
+            )
+
+        style = (
+            self.style.SUCCESS
+            if len(report) == EVENT_PARTITION_COUNT
+            else self.style.WARNING
+        )
+        self.stdout.write(
+            style(f"{len(report)} of {EVENT_PARTITION_COUNT} partitions attached.")
+        )
@@ -0,0 +1,67 @@
+"""
+BOS Event Store — merkle_checkpoint_event_chains
+==================================================
+Store a Merkle checkpoint for every completed, not yet checkpointed
+segment of every chain (or of one business with --business-id). Safe
+to run repeatedly; appends checkpoint their own segments, so this is
+for backfills and for segments whose automatic checkpoint failed.
+"""
+
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.event_store.models import EventChainHead
+from core.event_store.persistence.merkle_checkpoints import (
+    MERKLE_SEGMENT_SIZE,
+    ChainSegmentBrokenError,
+    checkpoint_business_chains,
+)
+
+
+class Command(BaseCommand):
+    help = "Checkpoint completed event chain segments into Merkle roots."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--business-id",
+            help="Checkpoint only this business.",
+        )
+
+    def handle(self, *args, **options):
+        if options["business_id"]:
+            try:
+                business_ids = [uuid.UUID(options["business_id"])]
+            except ValueError as exc:
+                raise CommandError(f"Invalid --business-id: {exc}")
+        else:
+            business_ids = list(
+                EventChainHead.objects.values_list("business_id", flat=True)
+            )
+
+        checkpointed = 0
+        broken = []
+        for business_id in business_ids:
+            try:
+                created = checkpoint_business_chains(business_id)
+            except ChainSegmentBrokenError as exc:
+                broken.append(business_id)
+                self.stderr.write(str(exc))
+                continue
+            checkpointed += len(created)
+            if created:
+                self.stdout.write(
+                    f"{business_id}: {len(created)} segment(s) of "
+                    f"{MERKLE_SEGMENT_SIZE} events"
+                )
+
+        if broken:
+            raise CommandError(
+                f"{len(broken)} business(es) have a broken chain segment."
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Stored {checkpointed} Merkle checkpoint(s) for "
+                f"{len(business_ids)} business(es)."
+            )
+        )
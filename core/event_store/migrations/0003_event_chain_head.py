@@ -0,0 +1,66 @@
+from django.db import migrations, models
+
+
+GENESIS_HASH = "GENESIS"
+
+
+def backfill_chain_heads(apps, schema_editor):
+    """
+    One head row per existing business chain.
+
+    The head is the latest event under the ordering rule that was
+    authoritative before this table existed (created_at DESC,
+    event_id DESC).
+    """
+    Event = apps.get_model("event_store", "Event")
+    EventChainHead = apps.get_model("event_store", "EventChainHead")
+
+    business_ids = (
+        Event.objects.values_list("business_id", flat=True)
+        .order_by()
+        .distinct()
+    )
+    heads = []
+    for business_id in business_ids.iterator():
+        events = Event.objects.filter(business_id=business_id)
+        latest = (
+            events.order_by("-created_at", "-event_id")
+            .values("event_id", "event_hash")
+            .first()
+        )
+        heads.append(
+            EventChainHead(
+                business_id=business_id,
+                head_hash=latest["event_hash"],
+                head_event_id=latest["event_id"],
+                sequence=events.count(),
+            )
+        )
+    EventChainHead.objects.bulk_create(heads, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("event_store", "0002_event_chain_hardening"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventChainHead",
+            fields=[
+                ("business_id", models.UUIDField(help_text="Business whose chain head this row tracks.", primary_key=True, serialize=False)),
+                ("head_hash", models.CharField(help_text="event_hash of the latest event in the chain. GENESIS while the chain is empty.", max_length=64)),
+                ("head_event_id", models.UUIDField(blank=True, help_text="event_id of the latest event. Null while empty.", null=True)),
+                ("sequence", models.BigIntegerField(default=0, help_text="Number of events appended to this chain.")),
+                ("updated_at", models.DateTimeField(auto_now=True, help_text="When the head last moved.")),
+            ],
+            options={
+                "db_table": "bos_event_chain_head",
+            },
+        ),
+        migrations.RunPython(
+            backfill_chain_heads,
+            migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,80 @@
+from django.db import migrations, models
+
+
+GENESIS_HASH = "GENESIS"
+
+
+def _chain_order(rows):
+    """
+    Order one business's events by following the hash links from
+    GENESIS. Events not reachable from GENESIS (broken chains) follow
+    in created_at, event_id order so every row still gets a position.
+    """
+    by_previous_hash = {row["previous_event_hash"]: row for row in rows}
+    ordered = []
+    seen = set()
+    cursor = by_previous_hash.get(GENESIS_HASH)
+    while cursor is not None and cursor["event_id"] not in seen:
+        ordered.append(cursor)
+        seen.add(cursor["event_id"])
+        cursor = by_previous_hash.get(cursor["event_hash"])
+
+    remaining = [row for row in rows if row["event_id"] not in seen]
+    remaining.sort(key=lambda row: (row["created_at"], str(row["event_id"])))
+    return ordered + remaining
+
+
+def backfill_stream_seq(apps, schema_editor):
+    """
+    Assign stream_seq to existing events, per business, in chain order.
+
+    Additive column backfill only: payloads, hashes and every other
+    column are untouched.
+    """
+    Event = apps.get_model("event_store", "Event")
+
+    business_ids = (
+        Event.objects.values_list("business_id", flat=True)
+        .order_by()
+        .distinct()
+    )
+    for business_id in business_ids.iterator():
+        rows = list(
+            Event.objects.filter(business_id=business_id).values(
+                "event_id",
+                "previous_event_hash",
+                "event_hash",
+                "created_at",
+            )
+        )
+        updates = [
+            Event(event_id=row["event_id"], stream_seq=position)
+            for position, row in enumerate(_chain_order(rows), start=1)
+        ]
+        Event.objects.bulk_update(updates, ["stream_seq"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("event_store", "0003_event_chain_head"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="stream_seq",
+            field=models.BigIntegerField(blank=True, help_text="Gapless 1-based position of this event in its business chain. Assigned at append time from the chain head; replay cursors and projection watermarks use it.", null=True),
+        ),
+        migrations.RunPython(
+            backfill_stream_seq,
+            migrations.RunPython.noop,
+        ),
+        migrations.AddConstraint(
+            model_name="event",
+            constraint=models.UniqueConstraint(
+                fields=("business_id", "stream_seq"),
+                name="uq_evt_biz_stream_seq",
+            ),
+        ),
+    ]
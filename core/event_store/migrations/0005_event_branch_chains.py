@@ -0,0 +1,87 @@
+import uuid
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("event_store", "0004_event_stream_seq"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventBranchChainHead",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("business_id", models.UUIDField(help_text="Business that owns the branch.")),
+                ("branch_id", models.UUIDField(help_text="Branch whose sub-chain head this row tracks.")),
+                ("head_hash", models.CharField(help_text="event_hash of the latest event in the sub-chain. Branch genesis while empty.", max_length=64)),
+                ("head_event_id", models.UUIDField(blank=True, help_text="event_id of the latest event. Null while empty.", null=True)),
+                ("sequence", models.BigIntegerField(default=0, help_text="Number of events appended to this sub-chain.")),
+                ("updated_at", models.DateTimeField(auto_now=True, help_text="When the head last moved.")),
+            ],
+            options={
+                "db_table": "bos_event_branch_chain_head",
+            },
+        ),
+        migrations.CreateModel(
+            name="EventChainAnchor",
+            fields=[
+                ("anchor_id", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("business_id", models.UUIDField(help_text="Business whose branch heads are anchored.")),
+                ("anchor_seq", models.BigIntegerField(help_text="Gapless 1-based position in the anchor chain.")),
+                ("branch_heads", models.JSONField(help_text='{branch_id: {"head_hash": ..., "sequence": ...}} for every branch sub-chain at anchor time.')),
+                ("previous_anchor_hash", models.CharField(help_text="anchor_hash of the previous anchor, or GENESIS.", max_length=64)),
+                ("anchor_hash", models.CharField(help_text="Hash of branch_heads + previous_anchor_hash.", max_length=64)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "bos_event_chain_anchor",
+            },
+        ),
+        migrations.RemoveConstraint(
+            model_name="event",
+            name="uq_evt_biz_stream_seq",
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="chain_branch_id",
+            field=models.UUIDField(blank=True, help_text="Branch sub-chain this event is linked into (BRANCH chain mode). Null for events on the business chain. When set, always equals branch_id.", null=True),
+        ),
+        migrations.AddField(
+            model_name="eventchainhead",
+            name="anchor_interval",
+            field=models.PositiveIntegerField(blank=True, help_text="BRANCH mode: anchor branch heads every N branch appends. Null disables automatic anchoring.", null=True),
+        ),
+        migrations.AddField(
+            model_name="eventchainhead",
+            name="chain_mode",
+            field=models.CharField(choices=[("BUSINESS", "Business"), ("BRANCH", "Branch")], default="BUSINESS", help_text="BUSINESS — one chain. BRANCH — sub-chain per branch.", max_length=20),
+        ),
+        migrations.AlterField(
+            model_name="event",
+            name="stream_seq",
+            field=models.BigIntegerField(blank=True, help_text="Gapless 1-based position of this event in its chain (the business chain, or its branch sub-chain). Assigned at append time from the chain head; replay cursors and projection watermarks use it.", null=True),
+        ),
+        migrations.AddConstraint(
+            model_name="event",
+            constraint=models.UniqueConstraint(condition=models.Q(("chain_branch_id__isnull", True)), fields=("business_id", "stream_seq"), name="uq_evt_biz_stream_seq"),
+        ),
+        migrations.AddConstraint(
+            model_name="event",
+            constraint=models.UniqueConstraint(condition=models.Q(("chain_branch_id__isnull", False)), fields=("business_id", "chain_branch_id", "stream_seq"), name="uq_evt_biz_branch_stream_seq"),
+        ),
+        migrations.AddConstraint(
+            model_name="eventchainanchor",
+            constraint=models.UniqueConstraint(fields=("business_id", "anchor_seq"), name="uq_anchor_biz_seq"),
+        ),
+        migrations.AddConstraint(
+            model_name="eventchainanchor",
+            constraint=models.UniqueConstraint(fields=("business_id", "previous_anchor_hash"), name="uq_anchor_biz_prev_hash"),
+        ),
+        migrations.AddConstraint(
+            model_name="eventbranchchainhead",
+            constraint=models.UniqueConstraint(fields=("business_id", "branch_id"), name="uq_branch_head_biz_branch"),
+        ),
+    ]
@@ -0,0 +1,98 @@
+from django.db import migrations
+
+
+EVENT_TABLE = "bos_event_store"
+LEGACY_TABLE = "bos_event_store_unpartitioned"
+PARTITION_COUNT = 16
+
+
+def partition_event_store(apps, schema_editor):
+    """
+    Rebuild bos_event_store as PARTITION BY HASH (business_id).
+
+    PostgreSQL only; other backends keep the plain table. Skipped when
+    the table is already partitioned.
+
+    The whole table is copied with one INSERT ... SELECT while it is
+    held under ACCESS EXCLUSIVE: every read and write of the event
+    store blocks until the migration commits. The copy is not batched
+    and cannot be resumed; if it fails, the transaction rolls back to
+    the plain table and the migration starts over from the first row.
+    On a large store run it in a maintenance window.
+
+    The new primary key no longer makes event_id globally unique;
+    0013_event_id_registry restores that guarantee.
+
+    Steps:
+        1. Rename the plain table out of the way
+        2. Create the partitioned parent (same columns, defaults and
+           checks) and its hash partitions
+        3. Copy every row, drop the plain table
+        4. Recreate the primary key as (business_id, event_id), an
+           event_id lookup index, and every model index/constraint
+           under its usual name (created on the parent, so each
+           partition gets its own)
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    quote_name = schema_editor.quote_name
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT relkind FROM pg_class "
+            "WHERE relname = %s AND pg_table_is_visible(oid)",
+            [EVENT_TABLE],
+        )
+        row = cursor.fetchone()
+    if row is None or row[0] == "p":
+        return
+
+    table = quote_name(EVENT_TABLE)
+    legacy = quote_name(LEGACY_TABLE)
+
+    schema_editor.execute(f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE")
+    schema_editor.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+    schema_editor.execute(
+        f"CREATE TABLE {table} "
+        f"(LIKE {legacy} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+        f"PARTITION BY HASH (business_id)"
+    )
+    for remainder in range(PARTITION_COUNT):
+        partition = quote_name(f"{EVENT_TABLE}_p{remainder:02d}")
+        schema_editor.execute(
+            f"CREATE TABLE {partition} PARTITION OF {table} "
+            f"FOR VALUES WITH (MODULUS {PARTITION_COUNT}, "
+            f"REMAINDER {remainder})"
+        )
+    schema_editor.execute(f"INSERT INTO {table} SELECT * FROM {legacy}")
+    schema_editor.execute(f"DROP TABLE {legacy}")
+
+    schema_editor.execute(
+        f"ALTER TABLE {table} ADD CONSTRAINT "
+        f"{quote_name(EVENT_TABLE + '_pkey')} "
+        f"PRIMARY KEY (business_id, event_id)"
+    )
+    schema_editor.execute(
+        f"CREATE INDEX {quote_name('idx_evt_event_id')} "
+        f"ON {table} (event_id)"
+    )
+
+    Event = apps.get_model("event_store", "Event")
+    for index in Event._meta.indexes:
+        schema_editor.execute(index.create_sql(Event, schema_editor))
+    for constraint in Event._meta.constraints:
+        schema_editor.execute(constraint.create_sql(Event, schema_editor))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("event_store", "0005_event_branch_chains"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            partition_event_store,
+            migrations.RunPython.noop,
+        ),
+    ]
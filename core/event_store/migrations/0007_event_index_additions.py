@@ -0,0 +1,40 @@
+"""
+Additive half of the event index rationalization: the replacement
+indexes are created first, so the read paths are covered before
+0008 drops the indexes they replace.
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("event_store", "0006_event_store_hash_partitions"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["business_id", "event_type", "received_at"],
+                name="idx_evt_biz_type_received",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                condition=~models.Q(status="FINAL"),
+                fields=["business_id", "status", "received_at"],
+                name="idx_evt_review_queue",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                condition=models.Q(correction_of__isnull=False),
+                fields=["correction_of"],
+                name="idx_evt_correction_of_set",
+            ),
+        ),
+    ]
@@ -0,0 +1,42 @@
+"""
+Drop indexes made redundant by 0007:
+
+- idx_evt_status, idx_evt_type, idx_evt_source_engine: low
+  selectivity; served by idx_evt_review_queue and
+  idx_evt_biz_type_received (or not queried at all)
+- idx_evt_biz_event_id: duplicates the primary key
+- idx_evt_correction_of: replaced by the partial
+  idx_evt_correction_of_set
+"""
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("event_store", "0007_event_index_additions"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="event",
+            name="idx_evt_status",
+        ),
+        migrations.RemoveIndex(
+            model_name="event",
+            name="idx_evt_type",
+        ),
+        migrations.RemoveIndex(
+            model_name="event",
+            name="idx_evt_source_engine",
+        ),
+        migrations.RemoveIndex(
+            model_name="event",
+            name="idx_evt_biz_event_id",
+        ),
+        migrations.RemoveIndex(
+            model_name="event",
+            name="idx_evt_correction_of",
+        ),
+    ]
@@ -0,0 +1,75 @@
+"""
+Store the canonical payload serialization next to each event.
+
+Existing rows are backfilled from their decoded payload. A payload
+that was altered after its append still fails verification: the
+backfilled text re-serializes the altered payload, which no longer
+matches the stored event_hash.
+"""
+
+import json
+
+from django.db import migrations, models
+
+
+def _canonical_serialize(payload):
+    """Same rules as core.event_store.hashing.canonical_serialize."""
+    return json.dumps(
+        payload,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=True,
+        default=str,
+    )
+
+
+def backfill_payload_canonical(apps, schema_editor):
+    """Fill payload_canonical for events persisted before this column."""
+    Event = apps.get_model("event_store", "Event")
+
+    rows = (
+        Event.objects.filter(payload_canonical__isnull=True)
+        .order_by()
+        .values_list("event_id", "payload")
+    )
+    updates = []
+    for event_id, payload in rows.iterator(chunk_size=500):
+        updates.append(
+            Event(
+                event_id=event_id,
+                payload_canonical=_canonical_serialize(payload),
+            )
+        )
+        if len(updates) >= 500:
+            Event.objects.bulk_update(updates, ["payload_canonical"])
+            updates = []
+    if updates:
+        Event.objects.bulk_update(updates, ["payload_canonical"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("event_store", "0008_event_index_removals"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="payload_canonical",
+            field=models.TextField(
+                blank=True,
+                help_text=(
+                    "canonical_serialize(payload), written once at append "
+                    "time. event_hash is computed over exactly this text, "
+                    "so chain verification hashes it directly instead of "
+                    "decoding and re-encoding payload."
+                ),
+                null=True,
+            ),
+        ),
+        migrations.RunPython(
+            backfill_payload_canonical,
+            migrations.RunPython.noop,
+        ),
+    ]
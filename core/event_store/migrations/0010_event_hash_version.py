@@ -0,0 +1,45 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("event_store", "0009_event_payload_canonical"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="hash_version",
+            field=models.PositiveSmallIntegerField(
+                default=1,
+                help_text=(
+                    "Hash scheme event_hash was computed with (1 = SHA-256, "
+                    "2 = BLAKE2b). Taken from the chain head at append time; "
+                    "verification always uses the event's own version."
+                ),
+            ),
+        ),
+        migrations.AddField(
+            model_name="eventbranchchainhead",
+            name="hash_version",
+            field=models.PositiveSmallIntegerField(
+                default=1,
+                help_text=(
+                    "Hash scheme for new appends of this sub-chain, copied "
+                    "from the business chain head."
+                ),
+            ),
+        ),
+        migrations.AddField(
+            model_name="eventchainhead",
+            name="hash_version",
+            field=models.PositiveSmallIntegerField(
+                default=1,
+                help_text=(
+                    "Hash scheme for new appends of this business (its "
+                    "branch sub-chain heads carry a copy)."
+                ),
+            ),
+        ),
+    ]
@@ -0,0 +1,36 @@
+import uuid
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("event_store", "0010_event_hash_version"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventMerkleCheckpoint",
+            fields=[
+                ("checkpoint_id", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("business_id", models.UUIDField(help_text="Business that owns the chain.")),
+                ("chain_branch_id", models.UUIDField(blank=True, help_text="Branch sub-chain. Null for the business chain.", null=True)),
+                ("first_seq", models.BigIntegerField(help_text="stream_seq of the first event in the segment.")),
+                ("last_seq", models.BigIntegerField(help_text="stream_seq of the last event in the segment.")),
+                ("root_hash", models.CharField(help_text="Merkle root over the segment's event hashes.", max_length=64)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "bos_event_merkle_checkpoint",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="eventmerklecheckpoint",
+            constraint=models.UniqueConstraint(condition=models.Q(("chain_branch_id__isnull", True)), fields=("business_id", "first_seq"), name="uq_merkle_biz_first_seq"),
+        ),
+        migrations.AddConstraint(
+            model_name="eventmerklecheckpoint",
+            constraint=models.UniqueConstraint(condition=models.Q(("chain_branch_id__isnull", False)), fields=("business_id", "chain_branch_id", "first_seq"), name="uq_merkle_biz_branch_first_seq"),
+        ),
+    ]
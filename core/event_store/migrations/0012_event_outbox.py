@@ -0,0 +1,51 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("event_store", "0011_event_merkle_checkpoint"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventOutbox",
+            fields=[
+                ("outbox_id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("event_id", models.UUIDField(help_text="Event to dispatch.")),
+                ("business_id", models.UUIDField(help_text="Business that owns the event.")),
+                ("chain_branch_id", models.UUIDField(blank=True, help_text="Branch sub-chain of the event. Null for the business chain.", null=True)),
+                ("stream_seq", models.BigIntegerField(help_text="Position of the event in its chain.")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "bos_event_outbox",
+            },
+        ),
+        migrations.CreateModel(
+            name="EventOutboxDelivery",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("subscriber", models.CharField(help_text="Subscriber key: engine and handler path.", max_length=255)),
+                ("business_id", models.UUIDField(help_text="Business that owns the chain.")),
+                ("chain_branch_id", models.UUIDField(blank=True, help_text="Branch sub-chain. Null for the business chain.", null=True)),
+                ("delivered_seq", models.BigIntegerField(help_text="stream_seq of the last event delivered on the chain.")),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "bos_event_outbox_delivery",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="eventoutboxdelivery",
+            constraint=models.UniqueConstraint(condition=models.Q(("chain_branch_id__isnull", True)), fields=("subscriber", "business_id"), name="uq_outbox_delivery_biz"),
+        ),
+        migrations.AddConstraint(
+            model_name="eventoutboxdelivery",
+            constraint=models.UniqueConstraint(condition=models.Q(("chain_branch_id__isnull", False)), fields=("subscriber", "business_id", "chain_branch_id"), name="uq_outbox_delivery_biz_branch"),
+        ),
+        migrations.AddIndex(
+            model_name="eventoutbox",
+            index=models.Index(fields=["business_id", "outbox_id"], name="idx_outbox_biz_id"),
+        ),
+    ]
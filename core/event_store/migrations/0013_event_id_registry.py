@@ -0,0 +1,62 @@
+from django.db import migrations, models
+
+
+EVENT_TABLE = "bos_event_store"
+REGISTRY_TABLE = "bos_event_id_registry"
+
+
+def backfill_event_id_registry(apps, schema_editor):
+    """
+    Claim the event_id of every event already in a partitioned table.
+
+    PostgreSQL only, and only when bos_event_store is partitioned (see
+    0006); a plain table never uses the registry. One INSERT ... SELECT
+    over the whole table: on a large store run it in a maintenance
+    window. If the same event_id was already committed under two
+    businesses (possible before this migration), the earliest row
+    claims it.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    quote_name = schema_editor.quote_name
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT relkind FROM pg_class "
+            "WHERE relname = %s AND pg_table_is_visible(oid)",
+            [EVENT_TABLE],
+        )
+        row = cursor.fetchone()
+        if row is None or row[0] != "p":
+            return
+
+        cursor.execute(
+            f"INSERT INTO {quote_name(REGISTRY_TABLE)} (event_id, business_id) "
+            f"SELECT event_id, business_id FROM {quote_name(EVENT_TABLE)} "
+            f"ORDER BY received_at, event_id "
+            f"ON CONFLICT (event_id) DO NOTHING"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("event_store", "0012_event_outbox"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventIdRegistry",
+            fields=[
+                ("event_id", models.UUIDField(help_text="Claimed event_id.", primary_key=True, serialize=False)),
+                ("business_id", models.UUIDField(help_text="Business whose event holds the event_id.")),
+            ],
+            options={
+                "db_table": "bos_event_id_registry",
+            },
+        ),
+        migrations.RunPython(
+            backfill_event_id_registry,
+            migrations.RunPython.noop,
+        ),
+    ]
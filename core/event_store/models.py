@@ -18,6 +18,30 @@ RULES (NON-NEGOTIABLE):
 
 This file contains NO business logic.
 The Event Store validates structure and persists — it never interprets.
+
+EventChainHead is NOT an event. It is an operational pointer to the
+current head of each business chain, maintained in the same transaction
+as every append.
+
+Chain modes (per business, stored on EventChainHead):
+    BUSINESS — one chain per business (default).
+    BRANCH   — events with a branch_id go to a sub-chain per
+               (business_id, branch_id), each with its own head row
+               (EventBranchChainHead) and genesis "GENESIS:<branch_id>".
+               Business-wide events stay on the business chain.
+               EventChainAnchor rows periodically commit every branch
+               head hash into one hash-linked business-level chain.
+
+EventMerkleCheckpoint rows commit each completed fixed-size segment of
+a chain to one Merkle root, so a single event can be proven part of
+its chain with a logarithmic inclusion proof.
+
+EventIdRegistry rows keep event_id globally unique once the event
+table is hash-partitioned on business_id (see partitioning).
+
+EventOutbox rows are written in the same transaction as their events
+and drained by a background worker pool (persistence.outbox), which
+records per-subscriber progress in EventOutboxDelivery.
 """
 
 import uuid
@@ -42,6 +66,17 @@ class EventStatus(models.TextChoices):
     REVIEW_REQUIRED = "REVIEW_REQUIRED", "Review Required"
 
 
+class ChainMode(models.TextChoices):
+    """
+    How the events of one business are hash-chained.
+
+    BUSINESS — single chain for the whole business.
+    BRANCH   — one sub-chain per branch, anchored at business level.
+    """
+    BUSINESS = "BUSINESS", "Business"
+    BRANCH = "BRANCH", "Branch"
+
+
 class ActorType(models.TextChoices):
     """
     Actor type enum — every event has exactly one actor.
@@ -74,6 +109,7 @@ class Event(models.Model):
         Temporal
         Status & Correction
         Integrity (Hash-Chain)
+        Stream Position
     """
 
     # ── Identity & Classification ─────────────────────────────
@@ -156,6 +192,17 @@ class Event(models.Model):
         ),
     )
 
+    payload_canonical = models.TextField(
+        null=True,
+        blank=True,
+        help_text=(
+            "canonical_serialize(payload), written once at append time. "
+            "event_hash is computed over exactly this text, so chain "
+            "verification hashes it directly instead of decoding and "
+            "re-encoding payload."
+        ),
+    )
+
     reference = models.JSONField(
         default=dict,
         blank=True,
@@ -213,6 +260,37 @@ class Event(models.Model):
         ),
     )
 
+    hash_version = models.PositiveSmallIntegerField(
+        default=1,  # hashing.DEFAULT_HASH_VERSION (SHA-256)
+        help_text=(
+            "Hash scheme event_hash was computed with (1 = SHA-256, "
+            "2 = BLAKE2b). Taken from the chain head at append time; "
+            "verification always uses the event's own version."
+        ),
+    )
+
+    # ── Stream Position ───────────────────────────────────────
+    stream_seq = models.BigIntegerField(
+        null=True,
+        blank=True,
+        help_text=(
+            "Gapless 1-based position of this event in its chain "
+            "(the business chain, or its branch sub-chain). Assigned "
+            "at append time from the chain head; replay cursors and "
+            "projection watermarks use it."
+        ),
+    )
+
+    chain_branch_id = models.UUIDField(
+        null=True,
+        blank=True,
+        help_text=(
+            "Branch sub-chain this event is linked into (BRANCH chain "
+            "mode). Null for events on the business chain. When set, "
+            "always equals branch_id."
+        ),
+    )
+
     # ══════════════════════════════════════════════════════════
     # META & INDEXING
     # ══════════════════════════════════════════════════════════
@@ -220,15 +298,15 @@ class Event(models.Model):
     class Meta:
         db_table = "bos_event_store"
         ordering = ["received_at"]
+        # Every index is paid for on each append, so each one must
+        # serve a known read path. Low-selectivity single-column
+        # indexes (status, event_type, source_engine) are replaced by
+        # business-leading composites and partial indexes.
         indexes = [
             models.Index(
                 fields=["business_id", "created_at", "event_id"],
                 name="idx_evt_biz_created_id",
             ),
-            models.Index(
-                fields=["business_id", "event_id"],
-                name="idx_evt_biz_event_id",
-            ),
             models.Index(
                 fields=["business_id", "branch_id", "created_at"],
                 name="idx_evt_biz_branch_created",
@@ -237,21 +315,22 @@ class Event(models.Model):
                 fields=["business_id", "received_at"],
                 name="idx_evt_business_time",
             ),
+            # Typed replay / projection rebuilds
             models.Index(
-                fields=["event_type"],
-                name="idx_evt_type",
+                fields=["business_id", "event_type", "received_at"],
+                name="idx_evt_biz_type_received",
             ),
+            # Review queue: only non-FINAL events are indexed
             models.Index(
-                fields=["source_engine"],
-                name="idx_evt_source_engine",
-            ),
-            models.Index(
-                fields=["status"],
-                name="idx_evt_status",
+                fields=["business_id", "status", "received_at"],
+                condition=~models.Q(status="FINAL"),
+                name="idx_evt_review_queue",
             ),
+            # Corrections are rare: only set values are indexed
             models.Index(
                 fields=["correction_of"],
-                name="idx_evt_correction_of",
+                condition=models.Q(correction_of__isnull=False),
+                name="idx_evt_correction_of_set",
             ),
             models.Index(
                 fields=["correlation_id"],
@@ -267,6 +346,16 @@ class Event(models.Model):
                 fields=["business_id", "previous_event_hash"],
                 name="uq_evt_biz_prev_hash",
             ),
+            models.UniqueConstraint(
+                fields=["business_id", "stream_seq"],
+                condition=models.Q(chain_branch_id__isnull=True),
+                name="uq_evt_biz_stream_seq",
+            ),
+            models.UniqueConstraint(
+                fields=["business_id", "chain_branch_id", "stream_seq"],
+                condition=models.Q(chain_branch_id__isnull=False),
+                name="uq_evt_biz_branch_stream_seq",
+            ),
         ]
 
     # ══════════════════════════════════════════════════════════
@@ -297,3 +386,484 @@ class Event(models.Model):
 
     def __str__(self):
         return f"[{self.event_type}] {self.event_id} ({self.status})"
+
+
+# ══════════════════════════════════════════════════════════════
+# EVENT ID REGISTRY (GLOBAL UNIQUENESS — NOT AN EVENT)
+# ══════════════════════════════════════════════════════════════
+
+class EventIdRegistry(models.Model):
+    """
+    One row per event_id ever persisted into a partitioned event table.
+
+    A hash-partitioned bos_event_store can only enforce
+    (business_id, event_id), so event_id uniqueness across businesses
+    is enforced here instead: every append claims its event_id in this
+    table, in the same transaction (and, on the fast path, the same
+    statement) as the event row. Unused on a plain table, whose primary
+    key already is event_id.
+    """
+
+    event_id = models.UUIDField(
+        primary_key=True,
+        help_text="Claimed event_id.",
+    )
+
+    business_id = models.UUIDField(
+        help_text="Business whose event holds the event_id.",
+    )
+
+    class Meta:
+        db_table = "bos_event_id_registry"
+
+    def save(self, *args, **kwargs):
+        """GUARD: claims are INSERT only."""
+        if not self._state.adding:
+            raise PermissionError(
+                "BOS DOCTRINE VIOLATION: Event id claims are immutable."
+            )
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        """GUARD: claims are NEVER deleted."""
+        raise PermissionError(
+            "BOS DOCTRINE VIOLATION: Event id claims are NEVER deleted."
+        )
+
+    def __str__(self):
+        return f"EventIdRegistry({self.event_id}: {self.business_id})"
+
+
+# ══════════════════════════════════════════════════════════════
+# CHAIN HEAD (OPERATIONAL POINTER — NOT AN EVENT)
+# ══════════════════════════════════════════════════════════════
+
+class EventChainHead(models.Model):
+    """
+    Current head of one business hash chain.
+
+    One row per business. Updated in the same transaction as every
+    append, so it always names the last persisted event of the chain.
+    The row doubles as the per-business append lock:
+    SELECT ... FOR NO KEY UPDATE on it serializes appends for one
+    business, including the very first (genesis) append. In BRANCH mode
+    branch appends hold it FOR KEY SHARE only; changing chain_mode
+    locks it FOR UPDATE.
+
+    head_hash is GENESIS_HASH while the chain is empty.
+    sequence is the number of events in the chain, i.e. the stream_seq
+    of the head event.
+
+    chain_mode selects BUSINESS or BRANCH chaining for new appends.
+    hash_version selects the hash scheme for new appends.
+    anchor_interval (BRANCH mode, optional) anchors the branch heads
+    every N appends of any branch sub-chain.
+    """
+
+    business_id = models.UUIDField(
+        primary_key=True,
+        help_text="Business whose chain head this row tracks.",
+    )
+
+    head_hash = models.CharField(
+        max_length=64,
+        help_text=(
+            "event_hash of the latest event in the chain. "
+            "GENESIS while the chain is empty."
+        ),
+    )
+
+    head_event_id = models.UUIDField(
+        null=True,
+        blank=True,
+        help_text="event_id of the latest event. Null while empty.",
+    )
+
+    sequence = models.BigIntegerField(
+        default=0,
+        help_text="Number of events appended to this chain.",
+    )
+
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text="When the head last moved.",
+    )
+
+    chain_mode = models.CharField(
+        max_length=20,
+        choices=ChainMode.choices,
+        default=ChainMode.BUSINESS,
+        help_text="BUSINESS — one chain. BRANCH — sub-chain per branch.",
+    )
+
+    anchor_interval = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text=(
+            "BRANCH mode: anchor branch heads every N branch appends. "
+            "Null disables automatic anchoring."
+        ),
+    )
+
+    hash_version = models.PositiveSmallIntegerField(
+        default=1,  # hashing.DEFAULT_HASH_VERSION (SHA-256)
+        help_text=(
+            "Hash scheme for new appends of this business (its branch "
+            "sub-chain heads carry a copy)."
+        ),
+    )
+
+    class Meta:
+        db_table = "bos_event_chain_head"
+
+    def __str__(self):
+        return (
+            f"ChainHead({self.business_id}, seq={self.sequence}, "
+            f"head={self.head_event_id})"
+        )
+
+
+class EventBranchChainHead(models.Model):
+    """
+    Current head of one branch sub-chain (BRANCH chain mode).
+
+    Same role as EventChainHead, one row per (business_id, branch_id):
+    SELECT ... FOR UPDATE on it serializes appends of ONE branch only,
+    so branches of one business append independently.
+
+    head_hash is "GENESIS:<branch_id>" while the sub-chain is empty.
+    """
+
+    business_id = models.UUIDField(
+        help_text="Business that owns the branch.",
+    )
+
+    branch_id = models.UUIDField(
+        help_text="Branch whose sub-chain head this row tracks.",
+    )
+
+    head_hash = models.CharField(
+        max_length=64,
+        help_text=(
+            "event_hash of the latest event in the sub-chain. "
+            "Branch genesis while empty."
+        ),
+    )
+
+    head_event_id = models.UUIDField(
+        null=True,
+        blank=True,
+        help_text="event_id of the latest event. Null while empty.",
+    )
+
+    sequence = models.BigIntegerField(
+        default=0,
+        help_text="Number of events appended to this sub-chain.",
+    )
+
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text="When the head last moved.",
+    )
+
+    hash_version = models.PositiveSmallIntegerField(
+        default=1,  # hashing.DEFAULT_HASH_VERSION (SHA-256)
+        help_text=(
+            "Hash scheme for new appends of this sub-chain, copied from "
+            "the business chain head."
+        ),
+    )
+
+    class Meta:
+        db_table = "bos_event_branch_chain_head"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["business_id", "branch_id"],
+                name="uq_branch_head_biz_branch",
+            ),
+        ]
+
+    def __str__(self):
+        return (
+            f"BranchChainHead({self.business_id}/{self.branch_id}, "
+            f"seq={self.sequence}, head={self.head_event_id})"
+        )
+
+
+# ══════════════════════════════════════════════════════════════
+# ANCHOR CHAIN (BRANCH MODE TAMPER EVIDENCE)
+# ══════════════════════════════════════════════════════════════
+
+class EventChainAnchor(models.Model):
+    """
+    One link of the business-level anchor chain.
+
+    Each anchor commits the head (hash + sequence) of every branch
+    sub-chain at one point in time and is hash-linked to the previous
+    anchor of the business:
+
+        anchor_hash = compute_event_hash(branch_heads, previous_anchor_hash)
+
+    Rewriting a branch's history below an anchored head breaks either
+    the sub-chain or the anchor chain. Anchors are append-only.
+    """
+
+    anchor_id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+    )
+
+    business_id = models.UUIDField(
+        help_text="Business whose branch heads are anchored.",
+    )
+
+    anchor_seq = models.BigIntegerField(
+        help_text="Gapless 1-based position in the anchor chain.",
+    )
+
+    branch_heads = models.JSONField(
+        help_text=(
+            "{branch_id: {\"head_hash\": ..., \"sequence\": ...}} "
+            "for every branch sub-chain at anchor time."
+        ),
+    )
+
+    previous_anchor_hash = models.CharField(
+        max_length=64,
+        help_text="anchor_hash of the previous anchor, or GENESIS.",
+    )
+
+    anchor_hash = models.CharField(
+        max_length=64,
+        help_text="Hash of branch_heads + previous_anchor_hash.",
+    )
+
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+    )
+
+    class Meta:
+        db_table = "bos_event_chain_anchor"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["business_id", "anchor_seq"],
+                name="uq_anchor_biz_seq",
+            ),
+            models.UniqueConstraint(
+                fields=["business_id", "previous_anchor_hash"],
+                name="uq_anchor_biz_prev_hash",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        """GUARD: anchors are INSERT only."""
+        if not self._state.adding:
+            raise PermissionError(
+                "BOS DOCTRINE VIOLATION: Chain anchors are immutable."
+            )
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        """GUARD: anchors are NEVER deleted."""
+        raise PermissionError(
+            "BOS DOCTRINE VIOLATION: Chain anchors are NEVER deleted."
+        )
+
+    def __str__(self):
+        return f"ChainAnchor({self.business_id}, seq={self.anchor_seq})"
+
+
+# ══════════════════════════════════════════════════════════════
+# MERKLE CHECKPOINTS (PER-EVENT INCLUSION PROOFS)
+# ══════════════════════════════════════════════════════════════
+
+class EventMerkleCheckpoint(models.Model):
+    """
+    Merkle root over one completed segment of a chain.
+
+    A segment is a contiguous stream_seq range [first_seq, last_seq] of
+    the business chain or of one branch sub-chain. root_hash is the
+    Merkle root (hashing.merkle) over the segment's event_hash values
+    in stream_seq order. Segments of a chain are contiguous and never
+    overlap. Checkpoints are append-only.
+    """
+
+    checkpoint_id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+    )
+
+    business_id = models.UUIDField(
+        help_text="Business that owns the chain.",
+    )
+
+    chain_branch_id = models.UUIDField(
+        null=True,
+        blank=True,
+        help_text="Branch sub-chain. Null for the business chain.",
+    )
+
+    first_seq = models.BigIntegerField(
+        help_text="stream_seq of the first event in the segment.",
+    )
+
+    last_seq = models.BigIntegerField(
+        help_text="stream_seq of the last event in the segment.",
+    )
+
+    root_hash = models.CharField(
+        max_length=64,
+        help_text="Merkle root over the segment's event hashes.",
+    )
+
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+    )
+
+    class Meta:
+        db_table = "bos_event_merkle_checkpoint"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["business_id", "first_seq"],
+                condition=models.Q(chain_branch_id__isnull=True),
+                name="uq_merkle_biz_first_seq",
+            ),
+            models.UniqueConstraint(
+                fields=["business_id", "chain_branch_id", "first_seq"],
+                condition=models.Q(chain_branch_id__isnull=False),
+                name="uq_merkle_biz_branch_first_seq",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        """GUARD: checkpoints are INSERT only."""
+        if not self._state.adding:
+            raise PermissionError(
+                "BOS DOCTRINE VIOLATION: Merkle checkpoints are immutable."
+            )
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        """GUARD: checkpoints are NEVER deleted."""
+        raise PermissionError(
+            "BOS DOCTRINE VIOLATION: Merkle checkpoints are NEVER deleted."
+        )
+
+    def __str__(self):
+        chain = self.chain_branch_id or "business chain"
+        return (
+            f"MerkleCheckpoint({self.business_id}/{chain}, "
+            f"seq {self.first_seq}-{self.last_seq})"
+        )
+
+
+# ══════════════════════════════════════════════════════════════
+# TRANSACTIONAL OUTBOX (BACKGROUND DISPATCH)
+# ══════════════════════════════════════════════════════════════
+
+class EventOutbox(models.Model):
+    """
+    One committed event waiting for background dispatch.
+
+    Written in the same transaction as the event it points to, so an
+    event is never committed without its row (and never the reverse).
+    Rows are deleted by the outbox drain once every subscriber has
+    passed them (see persistence.outbox). NOT an event: operational
+    metadata only.
+    """
+
+    outbox_id = models.BigAutoField(
+        primary_key=True,
+    )
+
+    event_id = models.UUIDField(
+        help_text="Event to dispatch.",
+    )
+
+    business_id = models.UUIDField(
+        help_text="Business that owns the event.",
+    )
+
+    chain_branch_id = models.UUIDField(
+        null=True,
+        blank=True,
+        help_text="Branch sub-chain of the event. Null for the business chain.",
+    )
+
+    stream_seq = models.BigIntegerField(
+        help_text="Position of the event in its chain.",
+    )
+
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+    )
+
+    class Meta:
+        db_table = "bos_event_outbox"
+        indexes = [
+            models.Index(
+                fields=["business_id", "outbox_id"],
+                name="idx_outbox_biz_id",
+            ),
+        ]
+
+    def __str__(self):
+        return f"Outbox({self.outbox_id}: {self.event_id})"
+
+
+class EventOutboxDelivery(models.Model):
+    """
+    Delivery checkpoint of one subscriber on one chain.
+
+    delivered_seq is the stream_seq of the last event of the chain the
+    subscriber has been given (or skipped, for event types it does not
+    handle). stream_seq is gapless and commit-ordered per chain, so the
+    drain never passes over an event that commits late.
+    """
+
+    subscriber = models.CharField(
+        max_length=255,
+        help_text="Subscriber key: engine and handler path.",
+    )
+
+    business_id = models.UUIDField(
+        help_text="Business that owns the chain.",
+    )
+
+    chain_branch_id = models.UUIDField(
+        null=True,
+        blank=True,
+        help_text="Branch sub-chain. Null for the business chain.",
+    )
+
+    delivered_seq = models.BigIntegerField(
+        help_text="stream_seq of the last event delivered on the chain.",
+    )
+
+    updated_at = models.DateTimeField(
+        auto_now=True,
+    )
+
+    class Meta:
+        db_table = "bos_event_outbox_delivery"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["subscriber", "business_id"],
+                condition=models.Q(chain_branch_id__isnull=True),
+                name="uq_outbox_delivery_biz",
+            ),
+            models.UniqueConstraint(
+                fields=["subscriber", "business_id", "chain_branch_id"],
+                condition=models.Q(chain_branch_id__isnull=False),
+                name="uq_outbox_delivery_biz_branch",
+            ),
+        ]
+
+    def __str__(self):
+        chain = self.chain_branch_id or "business chain"
+        return (
+            f"OutboxDelivery({self.subscriber}, {self.business_id}/{chain}, "
+            f"seq {self.delivered_seq})"
+        )
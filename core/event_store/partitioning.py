@@ -0,0 +1,163 @@
+"""
+BOS Event Store — Table Partitioning (PostgreSQL)
+===================================================
+Layout of bos_event_store on PostgreSQL:
+
+    bos_event_store            PARTITION BY HASH (business_id)
+      ├── bos_event_store_p00  FOR VALUES WITH (MODULUS 16, REMAINDER 0)
+      ├── ...
+      └── bos_event_store_p15  FOR VALUES WITH (MODULUS 16, REMAINDER 15)
+
+Why hash on business_id (and not ranges on received_at):
+every chain constraint is per business (uq_evt_biz_prev_hash,
+uq_evt_biz_stream_seq, uq_evt_biz_branch_stream_seq). A partitioned
+table can only enforce unique constraints that contain the partition
+key, so business_id keeps all of them enforced by the database, while
+a received_at key would lose every one. Every hot query (append, load,
+replay, verification) filters on business_id and is pruned to one
+partition: each partition carries its own, smaller indexes, and vacuum
+works per partition.
+
+Trade-off: the primary key becomes (business_id, event_id), which no
+longer makes event_id unique across businesses. Every append therefore
+also claims its event_id in bos_event_id_registry (primary key
+event_id) in the same transaction, so the database still rejects a
+second event_id of any business, even under concurrent appends.
+
+Other backends keep a plain table; every function here is a no-op or
+returns an empty result there.
+"""
+
+from __future__ import annotations
+
+import functools
+
+from django.db import connection
+
+EVENT_TABLE = "bos_event_store"
+EVENT_PARTITION_COUNT = 16
+
+
+def partition_name(remainder: int) -> str:
+    return f"{EVENT_TABLE}_p{remainder:02d}"
+
+
+@functools.lru_cache(maxsize=None)
+def is_event_store_partitioned() -> bool:
+    """True when bos_event_store is a partitioned PostgreSQL table."""
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT relkind FROM pg_class "
+            "WHERE relname = %s AND relkind IN ('r', 'p') "
+            "AND pg_table_is_visible(oid)",
+            [EVENT_TABLE],
+        )
+        row = cursor.fetchone()
+    return row is not None and row[0] == "p"
+
+
+def ensure_event_partitions() -> list[tuple[str, str]]:
+    """
+    Attach or create every missing hash partition.
+
+    The partition set of a hash layout is fixed by its modulus, so this
+    only repairs a partial layout. A partition detached for archiving
+    still exists as a plain table under its name: it is attached again,
+    rows included (PostgreSQL rejects it if a row is outside its bound
+    or its columns differ). A dropped partition is created empty.
+    Returns (name, "attached" | "created") for each partition repaired.
+    """
+    if not is_event_store_partitioned():
+        return []
+
+    existing = {row["partition"] for row in partition_report()}
+    repaired = []
+    quote_name = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        for remainder in range(EVENT_PARTITION_COUNT):
+            name = partition_name(remainder)
+            if name in existing:
+                continue
+            bound = (
+                f"FOR VALUES WITH (MODULUS {EVENT_PARTITION_COUNT}, "
+                f"REMAINDER {remainder})"
+            )
+            cursor.execute(
+                "SELECT 1 FROM pg_class "
+                "WHERE relname = %s AND relkind IN ('r', 'p') "
+                "AND pg_table_is_visible(oid)",
+                [name],
+            )
+            if cursor.fetchone() is not None:
+                cursor.execute(
+                    f"ALTER TABLE {quote_name(EVENT_TABLE)} "
+                    f"ATTACH PARTITION {quote_name(name)} {bound}"
+                )
+                repaired.append((name, "attached"))
+            else:
+                cursor.execute(
+                    f"CREATE TABLE {quote_name(name)} "
+                    f"PARTITION OF {quote_name(EVENT_TABLE)} {bound}"
+                )
+                repaired.append((name, "created"))
+    return repaired
+
+
+def partition_report() -> list[dict]:
+    """
+    One row per attached partition: name, bound, estimated rows and
+    total size in bytes (planner statistics, no table scan).
+    """
+    if not is_event_store_partitioned():
+        return []
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname, "
+            "pg_get_expr(child.relpartbound, child.oid), "
+            "child.reltuples::bigint, "
+            "pg_total_relation_size(child.oid) "
+            "FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = %s "
+            "ORDER BY child.relname",
+            [EVENT_TABLE],
+        )
+        rows = cursor.fetchall()
+
+    return [
+        {
+            "partition": name,
+            "bound": bound,
+            "estimated_rows": max(estimated_rows, 0),
+            "total_bytes": total_bytes,
+        }
+        for name, bound, estimated_rows, total_bytes in rows
+    ]
+
+
+@functools.lru_cache(maxsize=256)
+def parent_index_name(index_name: str) -> str:
+    """
+    Name of the parent-table index a partition index was created from
+    (e.g. "bos_event_store_p03_business_id_previous_event_hash_idx" ->
+    "uq_evt_biz_prev_hash"), so constraint violations on a partition
+    can be matched by the model's constraint names. Unknown names and
+    plain tables return index_name unchanged.
+    """
+    if not is_event_store_partitioned():
+        return index_name
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT parent.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE child.relname = %s AND child.relkind = 'i'",
+            [index_name],
+        )
+        row = cursor.fetchone()
+    return row[0] if row is not None else index_name
@@ -2,7 +2,58 @@
 BOS Event Store Persistence public API.
 """
 
-from core.event_store.persistence.service import persist_event
-from core.event_store.persistence.repository import load_events_for_business
+from core.event_store.persistence.service import (
+    persist_event,
+    persist_events_batch,
+)
+from core.event_store.persistence.branch_chains import (
+    anchor_branch_heads,
+    set_chain_mode,
+    set_hash_version,
+)
+from core.event_store.persistence.group_commit import GroupCommitCoordinator
+from core.event_store.persistence.merkle_checkpoints import (
+    MERKLE_SEGMENT_SIZE,
+    EventInclusionProof,
+    checkpoint_business_chains,
+    checkpoint_chain_segments,
+    event_inclusion_proof,
+)
+from core.event_store.persistence.metrics import append_retry_metrics
+from core.event_store.persistence.outbox import (
+    OutboxDrainResult,
+    drain_event_outbox,
+    run_outbox_worker,
+)
+from core.event_store.persistence.retry import (
+    DEFAULT_APPEND_RETRY_POLICY,
+    NO_APPEND_RETRY,
+    AppendRetryPolicy,
+)
+from core.event_store.persistence.repository import (
+    iter_events_for_business,
+    load_events_for_business,
+)
 
-__all__ = ["persist_event", "load_events_for_business"]
+__all__ = [
+    "persist_event",
+    "persist_events_batch",
+    "GroupCommitCoordinator",
+    "set_chain_mode",
+    "set_hash_version",
+    "anchor_branch_heads",
+    "MERKLE_SEGMENT_SIZE",
+    "EventInclusionProof",
+    "checkpoint_business_chains",
+    "checkpoint_chain_segments",
+    "event_inclusion_proof",
+    "AppendRetryPolicy",
+    "DEFAULT_APPEND_RETRY_POLICY",
+    "NO_APPEND_RETRY",
+    "append_retry_metrics",
+    "OutboxDrainResult",
+    "drain_event_outbox",
+    "run_outbox_worker",
+    "load_events_for_business",
+    "iter_events_for_business",
+]
@@ -0,0 +1,170 @@
+"""
+BOS Event Store — Branch Sub-Chains & Anchor Chain
+====================================================
+Operational controls for BRANCH chain mode.
+
+In BRANCH mode every branch of a business appends to its own hash
+sub-chain, locked by its own head row, so branches no longer serialize
+through one business-wide head. Tamper evidence across branches is kept
+by the anchor chain: each anchor commits the current head of every
+sub-chain and is hash-linked to the previous anchor.
+
+This module:
+- Switches the chain mode of a business (set_chain_mode)
+- Selects the hash scheme of a business's chains (set_hash_version)
+- Appends anchors (anchor_branch_heads)
+
+Switching mode or hash scheme never rewrites history: every event
+records the chain it was linked into (chain_branch_id) and the scheme
+it was hashed with (hash_version), so events appended before and after
+a switch each stay valid.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from typing import Optional
+
+from django.db import transaction
+
+from core.event_store.hashing.hasher import (
+    GENESIS_HASH,
+    HASH_VERSIONS,
+    compute_event_hash,
+)
+from core.event_store.models import (
+    ChainMode,
+    EventBranchChainHead,
+    EventChainAnchor,
+    EventChainHead,
+)
+from core.event_store.persistence.repository import lock_chain_head
+
+logger = logging.getLogger("bos.events")
+
+
+def set_chain_mode(
+    business_id: uuid.UUID,
+    chain_mode: str,
+    *,
+    anchor_interval: Optional[int] = None,
+) -> EventChainHead:
+    """
+    Select BUSINESS or BRANCH chaining for future appends of a business.
+
+    anchor_interval (BRANCH mode only): anchor the branch heads after
+    every N appends of a branch sub-chain. None disables automatic
+    anchoring (run anchor_branch_heads / the anchor_event_chains
+    command instead).
+    """
+    if chain_mode not in ChainMode.values:
+        raise ValueError(
+            f"Unknown chain_mode '{chain_mode}'. "
+            f"Expected one of {ChainMode.values}."
+        )
+    if anchor_interval is not None and anchor_interval < 1:
+        raise ValueError("anchor_interval must be >= 1.")
+    if chain_mode != ChainMode.BRANCH:
+        anchor_interval = None
+
+    with transaction.atomic():
+        # Exclusive: waits for BRANCH mode appends that checked the mode
+        chain_head = lock_chain_head(business_id, exclusive=True)
+        chain_head.chain_mode = chain_mode
+        chain_head.anchor_interval = anchor_interval
+        chain_head.save(
+            update_fields=["chain_mode", "anchor_interval", "updated_at"]
+        )
+    return chain_head
+
+
+def set_hash_version(
+    business_id: uuid.UUID,
+    hash_version: int,
+) -> EventChainHead:
+    """
+    Select the hash scheme (HASH_VERSIONS) for future appends of a
+    business, on its business chain and every branch sub-chain.
+
+    Already persisted events keep verifying under their own version.
+    """
+    if hash_version not in HASH_VERSIONS:
+        raise ValueError(
+            f"Unknown hash_version {hash_version!r}. "
+            f"Expected one of {HASH_VERSIONS}."
+        )
+
+    with transaction.atomic():
+        chain_head = lock_chain_head(business_id)
+        chain_head.hash_version = hash_version
+        chain_head.save(update_fields=["hash_version", "updated_at"])
+        EventBranchChainHead.objects.filter(business_id=business_id).update(
+            hash_version=hash_version,
+        )
+    return chain_head
+
+
+def anchor_branch_heads(business_id: uuid.UUID) -> Optional[EventChainAnchor]:
+    """
+    Append one anchor committing every branch sub-chain head.
+
+    Anchors of one business are serialized on the business chain head
+    row. Branch heads are read as committed; each names an event that
+    is already durable.
+
+    Returns the new anchor, or None when there is nothing new to
+    anchor (no branch events yet, or heads unchanged since the last
+    anchor).
+    """
+    with transaction.atomic():
+        lock_chain_head(business_id)
+
+        branch_heads = {
+            str(chain_head.branch_id): {
+                "head_hash": chain_head.head_hash,
+                "sequence": chain_head.sequence,
+            }
+            for chain_head in EventBranchChainHead.objects.filter(
+                business_id=business_id,
+                sequence__gt=0,
+            )
+        }
+        if not branch_heads:
+            return None
+
+        last_anchor = (
+            EventChainAnchor.objects.filter(business_id=business_id)
+            .order_by("-anchor_seq")
+            .first()
+        )
+        if last_anchor is not None and last_anchor.branch_heads == branch_heads:
+            return None
+
+        previous_anchor_hash = (
+            last_anchor.anchor_hash if last_anchor is not None else GENESIS_HASH
+        )
+        return EventChainAnchor.objects.create(
+            business_id=business_id,
+            anchor_seq=(
+                last_anchor.anchor_seq + 1 if last_anchor is not None else 1
+            ),
+            branch_heads=branch_heads,
+            previous_anchor_hash=previous_anchor_hash,
+            anchor_hash=compute_event_hash(branch_heads, previous_anchor_hash),
+        )
+
+
+def anchor_after_commit(business_id: uuid.UUID) -> None:
+    """
+    Automatic anchoring hook (transaction.on_commit).
+
+    The append is already committed; an anchoring failure is logged and
+    left for the next interval or the anchor_event_chains command.
+    """
+    try:
+        anchor_branch_heads(business_id)
+    except Exception:
+        logger.exception(
+            f"Automatic chain anchoring failed for business {business_id}."
+        )
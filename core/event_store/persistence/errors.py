@@ -9,10 +9,12 @@ class PersistenceRejectionCode:
     """Rejection codes for persistence-stage failures."""
 
     TRANSACTION_ABORTED = "TRANSACTION_ABORTED"
+    INVALID_BATCH = "INVALID_BATCH"
 
 
 class PersistenceViolatedRule:
     """Rule identifiers for audit trail during persistence failures."""
 
     ATOMIC_PERSISTENCE = "ATOMIC_PERSISTENCE"
+    ATOMIC_BATCH = "ATOMIC_BATCH"
 
@@ -0,0 +1,314 @@
+"""
+BOS Event Store — Group Commit Coordinator
+============================================
+Opt-in front for persist_event() when many writers append to the SAME
+business at once (e.g. several POS terminals of one shop).
+
+Every append of a business serializes on its chain head row lock, so
+N concurrent writers pay for N lock hand-offs and N commits. The
+coordinator queues concurrent appends per business and lets ONE
+thread (the leader) write everything queued so far in one transaction:
+
+    - one chain head lock
+    - one idempotency query
+    - one bulk INSERT
+    - one head update and one commit
+
+Queues are keyed by chain target, i.e. by the head lock the appends
+take: (business_id, None) for the business chain, which in BUSINESS
+chain mode holds every branch of the business, and (business_id,
+branch_id) for a branch sub-chain in BRANCH mode. The target is taken
+from the BRANCH mode hints of the append path (no query); the leader
+re-checks it under lock, and an append that turns out to belong to
+another chain is written on its own after the group.
+
+Followers block until the leader publishes their individual result.
+When the leader is done, leadership passes to the next queued append,
+so appends arriving during a commit form the next group. A follower
+waits at most max_follower_wait_seconds at a time: if by then no
+leader has taken it into a group, it leaves the queue and calls
+persist_event() itself; if its leader thread is gone without a
+result, it does the same (an event the dead leader did commit is then
+reported as DUPLICATE_EVENT_ID). A new append that finds a queue whose
+leader thread is gone takes over leadership. A leader writes the
+oldest max_batch_size queued appends, which need not include its own
+(it may have taken over a longer queue): it then waits for its result
+like a follower, or leads again.
+
+Guarantees (same as persist_event):
+    - Each append is validated, linked and accepted/rejected on its own
+    - Chain order = arrival order within the group
+    - Dispatch happens AFTER commit only (or via the outbox, per append)
+    - Forbidden during replay
+
+Calls made inside an outer transaction.atomic() block bypass grouping
+and go straight to persist_event(): the event must commit (or roll
+back) with the caller's transaction, not with the leader's.
+"""
+
+from __future__ import annotations
+
+import collections
+import threading
+import time
+import uuid
+from typing import Any, Optional
+
+from django.db import connection
+
+from core.context.scope import SCOPE_BUSINESS_ALLOWED
+from core.event_store.persistence.errors import (
+    PersistenceRejectionCode,
+    PersistenceViolatedRule,
+)
+from core.event_store.persistence.repository import chain_target_hint
+from core.event_store.persistence.service import (
+    _check_delivery,
+    _persist_event_group,
+    persist_event,
+)
+from core.event_store.validators.context import BusinessContextProtocol
+from core.event_store.validators.errors import Rejection, ValidationResult
+from core.event_store.validators.registry import EventTypeRegistry
+
+
+class _PendingAppend:
+    """One queued persist_event() call waiting for its group."""
+
+    __slots__ = (
+        "event_data",
+        "context",
+        "registry",
+        "subscriber_registry",
+        "scope_requirement",
+        "use_outbox",
+        "result",
+        "is_leader",
+        "wakeup",
+        "thread",
+        "leader",
+    )
+
+    def __init__(
+        self,
+        event_data: dict[str, Any],
+        context: BusinessContextProtocol,
+        registry: EventTypeRegistry,
+        subscriber_registry: Any,
+        scope_requirement: str,
+        use_outbox: bool,
+    ) -> None:
+        self.event_data = event_data
+        self.context = context
+        self.registry = registry
+        self.subscriber_registry = subscriber_registry
+        self.scope_requirement = scope_requirement
+        self.use_outbox = use_outbox
+        self.result: Optional[ValidationResult] = None
+        self.is_leader = False
+        self.wakeup = threading.Event()
+        self.thread = threading.current_thread()
+        # Thread of the leader writing this append's group, once taken.
+        self.leader: Optional[threading.Thread] = None
+
+
+class GroupCommitCoordinator:
+    """
+    Groups concurrent appends of one business into shared commits.
+
+    Usage:
+        coordinator = GroupCommitCoordinator(max_batch_size=100)
+        result = coordinator.persist_event(event_data, context, registry)
+
+    Args:
+        max_batch_size:   Upper bound on appends written per commit.
+        max_wait_seconds: Optional delay before the leader drains its
+                          queue, to let more writers join the group.
+                          0 (default) adds no latency: grouping then
+                          comes only from appends queued while the
+                          previous group was committing.
+        max_follower_wait_seconds:
+                          How long a follower waits for its result
+                          before checking on its leader (see module
+                          docstring).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_batch_size: int = 100,
+        max_wait_seconds: float = 0.0,
+        max_follower_wait_seconds: float = 5.0,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1.")
+        if max_wait_seconds < 0:
+            raise ValueError("max_wait_seconds must be >= 0.")
+        if max_follower_wait_seconds <= 0:
+            raise ValueError("max_follower_wait_seconds must be > 0.")
+
+        self._max_batch_size = max_batch_size
+        self._max_wait_seconds = max_wait_seconds
+        self._max_follower_wait_seconds = max_follower_wait_seconds
+        self._lock = threading.Lock()
+        self._queues: dict[
+            tuple[uuid.UUID, Optional[uuid.UUID]],
+            collections.deque[_PendingAppend],
+        ] = {}
+        self._leaders: dict[
+            tuple[uuid.UUID, Optional[uuid.UUID]],
+            threading.Thread,
+        ] = {}
+
+    def persist_event(
+        self,
+        event_data: dict[str, Any],
+        context: BusinessContextProtocol,
+        registry: EventTypeRegistry,
+        subscriber_registry: Any = None,
+        scope_requirement: str = SCOPE_BUSINESS_ALLOWED,
+        use_outbox: bool = False,
+    ) -> ValidationResult:
+        """
+        Drop-in replacement for persist_event() with group commit.
+
+        Returns this append's own ValidationResult.
+        """
+        from core.replay.context import is_replay_active
+        from core.replay.errors import ReplayIsolationError
+
+        if is_replay_active():
+            raise ReplayIsolationError(
+                "Persistence forbidden during replay mode."
+            )
+
+        business_id = (
+            event_data.get("business_id")
+            if isinstance(event_data, dict)
+            else None
+        )
+        if business_id is None or connection.in_atomic_block:
+            return persist_event(
+                event_data=event_data,
+                context=context,
+                registry=registry,
+                subscriber_registry=subscriber_registry,
+                scope_requirement=scope_requirement,
+                use_outbox=use_outbox,
+            )
+        _check_delivery(subscriber_registry, use_outbox)
+
+        pending = _PendingAppend(
+            event_data=event_data,
+            context=context,
+            registry=registry,
+            subscriber_registry=subscriber_registry,
+            scope_requirement=scope_requirement,
+            use_outbox=use_outbox,
+        )
+
+        queue_key = (
+            business_id,
+            chain_target_hint(business_id, event_data.get("branch_id")),
+        )
+        with self._lock:
+            queue = self._queues.get(queue_key)
+            if queue is None:
+                queue = collections.deque()
+                self._queues[queue_key] = queue
+            if not self._leaders.get(queue_key, pending.thread).is_alive():
+                # The queue's leader died without handing over.
+                del self._leaders[queue_key]
+            if queue_key not in self._leaders:
+                self._leaders[queue_key] = pending.thread
+                pending.is_leader = True
+            queue.append(pending)
+
+        while True:
+            # Woken either with a result or promoted to leader.
+            while not pending.is_leader and not pending.wakeup.wait(
+                self._max_follower_wait_seconds
+            ):
+                if self._abandon(queue_key, pending):
+                    return persist_event(
+                        event_data=event_data,
+                        context=context,
+                        registry=registry,
+                        subscriber_registry=subscriber_registry,
+                        scope_requirement=scope_requirement,
+                        use_outbox=use_outbox,
+                    )
+            if pending.result is not None:
+                return pending.result
+
+            # A leader writes the oldest queued appends; its own may be
+            # further back (a taken-over queue), so it then waits again.
+            with self._lock:
+                pending.is_leader = False
+                pending.wakeup.clear()
+            self._lead(queue_key)
+
+    def _abandon(
+        self,
+        queue_key: tuple[uuid.UUID, Optional[uuid.UUID]],
+        pending: _PendingAppend,
+    ) -> bool:
+        """
+        After a follower wait timed out: True if the follower should
+        write its append itself (it was still queued, or its leader
+        died without publishing a result); False to keep waiting.
+        """
+        with self._lock:
+            if pending.result is not None or pending.is_leader:
+                return False
+            if pending.leader is None:
+                self._queues[queue_key].remove(pending)
+                return True
+            leader = pending.leader
+        return not leader.is_alive() and pending.result is None
+
+    def _lead(self, queue_key: tuple[uuid.UUID, Optional[uuid.UUID]]) -> None:
+        """Write one group for queue_key, then hand off leadership."""
+        group: list[_PendingAppend] = []
+        try:
+            if self._max_wait_seconds:
+                time.sleep(self._max_wait_seconds)
+
+            with self._lock:
+                queue = self._queues[queue_key]
+                group = [
+                    queue.popleft()
+                    for _ in range(min(len(queue), self._max_batch_size))
+                ]
+                for pending in group:
+                    pending.leader = threading.current_thread()
+
+            results = _persist_event_group(group)
+            for pending, result in zip(group, results):
+                pending.result = result
+        except Exception as exc:
+            aborted = ValidationResult(
+                accepted=False,
+                rejection=Rejection(
+                    code=PersistenceRejectionCode.TRANSACTION_ABORTED,
+                    message=f"Transaction aborted: {str(exc)}",
+                    violated_rule=PersistenceViolatedRule.ATOMIC_PERSISTENCE,
+                ),
+            )
+            for pending in group:
+                if pending.result is None:
+                    pending.result = aborted
+        finally:
+            with self._lock:
+                queue = self._queues[queue_key]
+                if queue:
+                    successor = queue[0]
+                    successor.is_leader = True
+                    self._leaders[queue_key] = successor.thread
+                    successor.wakeup.set()
+                else:
+                    del self._queues[queue_key]
+                    del self._leaders[queue_key]
+
+            for pending in group:
+                pending.wakeup.set()
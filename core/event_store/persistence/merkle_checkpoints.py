@@ -0,0 +1,429 @@
+"""
+BOS Event Store — Merkle Checkpoints & Event Inclusion Proofs
+===============================================================
+Proves that one event belongs to its intact chain without rehashing
+the chain.
+
+Every chain (the business chain and each branch sub-chain) is cut into
+fixed-size segments of MERKLE_SEGMENT_SIZE events by stream_seq. Once a
+segment is complete, an EventMerkleCheckpoint stores the Merkle root
+over its event hashes (hashing.merkle). Checkpoints are written
+automatically after the append that completes a segment, or by the
+merkle_checkpoint_event_chains command.
+
+An inclusion proof for an event is the list of sibling hashes from its
+leaf to the segment root: log2(MERKLE_SEGMENT_SIZE) hashes. An auditor
+checks it with verify_merkle_inclusion against the stored root, plus
+the event's own event_hash against its payload — no other event of the
+chain is needed.
+
+Statuses of a proof request:
+    VALID     — event hash recomputes and the segment matches its root
+    TAMPERED  — the event or its segment no longer matches
+    PENDING   — the event's segment is not complete/checkpointed yet
+    NOT_FOUND — no such event in this business
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+from django.db import IntegrityError, transaction
+
+from core.event_store.hashing.hasher import (
+    canonical_serialize,
+    compute_event_hash_from_canonical,
+)
+from core.event_store.hashing.merkle import (
+    merkle_inclusion_proof,
+    merkle_root,
+    verify_merkle_inclusion,
+)
+from core.event_store.models import (
+    Event,
+    EventBranchChainHead,
+    EventMerkleCheckpoint,
+)
+from core.event_store.persistence.repository import (
+    genesis_hash_for,
+    get_chain_head,
+)
+
+logger = logging.getLogger("bos.events")
+
+MERKLE_SEGMENT_SIZE = 1024
+
+PROOF_VALID = "VALID"
+PROOF_TAMPERED = "TAMPERED"
+PROOF_PENDING = "PENDING"
+PROOF_NOT_FOUND = "NOT_FOUND"
+
+
+class ChainSegmentBrokenError(Exception):
+    """A segment to checkpoint is not an intact piece of its chain."""
+
+    def __init__(self, business_id, chain_branch_id, detail: str):
+        self.business_id = business_id
+        self.chain_branch_id = chain_branch_id
+        self.detail = detail
+        chain = chain_branch_id or "business chain"
+        super().__init__(
+            f"Cannot checkpoint {chain} of business {business_id}: {detail}"
+        )
+
+
+# ══════════════════════════════════════════════════════════════
+# CHECKPOINTS
+# ══════════════════════════════════════════════════════════════
+
+def checkpoint_chain_segments(
+    business_id: uuid.UUID,
+    chain_branch_id: Optional[uuid.UUID] = None,
+    *,
+    segment_size: int = MERKLE_SEGMENT_SIZE,
+) -> list[EventMerkleCheckpoint]:
+    """
+    Checkpoint every completed, not yet checkpointed segment of a chain.
+
+    Segments continue from the last checkpoint of the chain. Only
+    events up to the committed chain head are read, so an in-flight
+    append never ends up in a root. Each segment's linkage is checked
+    before its root is stored; a broken segment raises
+    ChainSegmentBrokenError and is not checkpointed.
+
+    Safe to run concurrently: a segment checkpointed by another process
+    meanwhile ends this run.
+
+    Returns the new checkpoints, oldest first.
+    """
+    if segment_size < 1:
+        raise ValueError("segment_size must be >= 1.")
+
+    chain_head = get_chain_head(business_id, chain_branch_id)
+    head_seq = chain_head.sequence if chain_head is not None else 0
+    last_checkpoint = (
+        EventMerkleCheckpoint.objects.filter(
+            business_id=business_id,
+            chain_branch_id=chain_branch_id,
+        )
+        .order_by("-first_seq")
+        .first()
+    )
+    first_seq = last_checkpoint.last_seq + 1 if last_checkpoint is not None else 1
+
+    created: list[EventMerkleCheckpoint] = []
+    while first_seq + segment_size - 1 <= head_seq:
+        last_seq = first_seq + segment_size - 1
+        event_hashes = _linked_segment_hashes(
+            business_id,
+            chain_branch_id,
+            first_seq,
+            last_seq,
+        )
+        try:
+            with transaction.atomic():
+                checkpoint = EventMerkleCheckpoint.objects.create(
+                    business_id=business_id,
+                    chain_branch_id=chain_branch_id,
+                    first_seq=first_seq,
+                    last_seq=last_seq,
+                    root_hash=merkle_root(event_hashes),
+                )
+        except IntegrityError:
+            break
+        created.append(checkpoint)
+        first_seq = last_seq + 1
+    return created
+
+
+def checkpoint_business_chains(
+    business_id: uuid.UUID,
+    *,
+    segment_size: int = MERKLE_SEGMENT_SIZE,
+) -> list[EventMerkleCheckpoint]:
+    """Checkpoint the business chain and every branch sub-chain."""
+    chain_ids = [None] + list(
+        EventBranchChainHead.objects.filter(business_id=business_id)
+        .order_by("branch_id")
+        .values_list("branch_id", flat=True)
+    )
+    created: list[EventMerkleCheckpoint] = []
+    for chain_branch_id in chain_ids:
+        created.extend(
+            checkpoint_chain_segments(
+                business_id,
+                chain_branch_id,
+                segment_size=segment_size,
+            )
+        )
+    return created
+
+
+def checkpoint_after_commit(
+    business_id: uuid.UUID,
+    chain_branch_id: Optional[uuid.UUID] = None,
+) -> None:
+    """
+    Automatic checkpoint hook (transaction.on_commit).
+
+    The append is already committed; a checkpoint failure is logged and
+    left for the next segment or the merkle_checkpoint_event_chains
+    command.
+    """
+    try:
+        checkpoint_chain_segments(business_id, chain_branch_id)
+    except Exception:
+        logger.exception(
+            f"Automatic Merkle checkpoint failed for business {business_id}."
+        )
+
+
+def _linked_segment_hashes(
+    business_id: uuid.UUID,
+    chain_branch_id: Optional[uuid.UUID],
+    first_seq: int,
+    last_seq: int,
+) -> list[str]:
+    """event_hash values of one segment, after checking its linkage."""
+    rows = (
+        Event.objects.filter(
+            business_id=business_id,
+            chain_branch_id=chain_branch_id,
+            stream_seq__gte=max(first_seq - 1, 1),
+            stream_seq__lte=last_seq,
+        )
+        .order_by("stream_seq")
+        .values_list("stream_seq", "previous_event_hash", "event_hash")
+    )
+
+    expected_previous_hash = (
+        genesis_hash_for(chain_branch_id) if first_seq == 1 else None
+    )
+    expected_seq = first_seq if first_seq == 1 else first_seq - 1
+    event_hashes: list[str] = []
+    for stream_seq, previous_hash, event_hash in rows:
+        if stream_seq != expected_seq:
+            raise ChainSegmentBrokenError(
+                business_id,
+                chain_branch_id,
+                f"stream_seq {stream_seq} where {expected_seq} was expected.",
+            )
+        if expected_previous_hash is not None and previous_hash != expected_previous_hash:
+            raise ChainSegmentBrokenError(
+                business_id,
+                chain_branch_id,
+                f"event at stream_seq {stream_seq} does not link to its "
+                f"predecessor.",
+            )
+        if stream_seq >= first_seq:
+            event_hashes.append(event_hash)
+        expected_previous_hash = event_hash
+        expected_seq += 1
+
+    if expected_seq != last_seq + 1:
+        raise ChainSegmentBrokenError(
+            business_id,
+            chain_branch_id,
+            f"segment {first_seq}-{last_seq} ends at stream_seq "
+            f"{expected_seq - 1}.",
+        )
+    return event_hashes
+
+
+# ══════════════════════════════════════════════════════════════
+# INCLUSION PROOFS
+# ══════════════════════════════════════════════════════════════
+
+@dataclass(frozen=True)
+class EventInclusionProof:
+    status: str                            # VALID | TAMPERED | PENDING | NOT_FOUND
+    business_id: uuid.UUID
+    event_id: uuid.UUID
+    chain_branch_id: Optional[uuid.UUID] = None
+    stream_seq: Optional[int] = None
+    event_hash: Optional[str] = None
+    checkpoint_id: Optional[uuid.UUID] = None
+    first_seq: Optional[int] = None
+    last_seq: Optional[int] = None
+    root_hash: Optional[str] = None
+    proof: tuple[str, ...] = ()            # sibling hashes, leaf to root
+    message: str = ""
+
+    @property
+    def leaf_index(self) -> Optional[int]:
+        if self.stream_seq is None or self.first_seq is None:
+            return None
+        return self.stream_seq - self.first_seq
+
+    @property
+    def tree_size(self) -> Optional[int]:
+        if self.first_seq is None or self.last_seq is None:
+            return None
+        return self.last_seq - self.first_seq + 1
+
+    def is_valid(self) -> bool:
+        return self.status == PROOF_VALID
+
+    def verify(self) -> bool:
+        """Re-check the proof against root_hash (what an auditor runs)."""
+        if not self.is_valid():
+            return False
+        return verify_merkle_inclusion(
+            self.event_hash,
+            self.leaf_index,
+            self.tree_size,
+            self.proof,
+            self.root_hash,
+        )
+
+    def as_dict(self) -> dict:
+        def text(value):
+            return str(value) if value is not None else None
+
+        return {
+            "status": self.status,
+            "business_id": text(self.business_id),
+            "event_id": text(self.event_id),
+            "chain_branch_id": text(self.chain_branch_id),
+            "stream_seq": self.stream_seq,
+            "event_hash": self.event_hash,
+            "checkpoint_id": text(self.checkpoint_id),
+            "first_seq": self.first_seq,
+            "last_seq": self.last_seq,
+            "leaf_index": self.leaf_index,
+            "tree_size": self.tree_size,
+            "root_hash": self.root_hash,
+            "proof": list(self.proof),
+            "message": self.message,
+        }
+
+
+def event_inclusion_proof(
+    business_id: uuid.UUID,
+    event_id: uuid.UUID,
+    branch_id: Optional[uuid.UUID] = None,
+) -> EventInclusionProof:
+    """
+    Build the inclusion proof of one event against its segment root.
+
+    Reads the event and its (bounded) segment only. The event's hash is
+    recomputed from its stored payload, and the segment root from the
+    stored hashes, so a proof is only VALID while both still match.
+    With a branch_id, an event of another branch (or of none) is
+    NOT_FOUND, as for a caller scoped to that branch.
+    """
+    events = Event.objects.filter(business_id=business_id, event_id=event_id)
+    if branch_id is not None:
+        events = events.filter(branch_id=branch_id)
+    row = events.values_list(
+        "chain_branch_id",
+        "stream_seq",
+        "previous_event_hash",
+        "event_hash",
+        "hash_version",
+        "payload_canonical",
+    ).first()
+    if row is None:
+        return EventInclusionProof(
+            status=PROOF_NOT_FOUND,
+            business_id=business_id,
+            event_id=event_id,
+            message=(
+                "No such event in this business."
+                if branch_id is None
+                else "No such event in this branch."
+            ),
+        )
+
+    (
+        chain_branch_id,
+        stream_seq,
+        previous_hash,
+        event_hash,
+        hash_version,
+        payload_canonical,
+    ) = row
+    located = dict(
+        business_id=business_id,
+        event_id=event_id,
+        chain_branch_id=chain_branch_id,
+        stream_seq=stream_seq,
+        event_hash=event_hash,
+    )
+
+    if payload_canonical is None:
+        payload_canonical = canonical_serialize(
+            Event.objects.values_list("payload", flat=True).get(
+                business_id=business_id,
+                event_id=event_id,
+            )
+        )
+    try:
+        recomputed = compute_event_hash_from_canonical(
+            payload_canonical,
+            previous_hash,
+            hash_version,
+        )
+    except ValueError:
+        recomputed = None
+    if recomputed != event_hash:
+        return EventInclusionProof(
+            status=PROOF_TAMPERED,
+            **located,
+            message="Event hash no longer matches the stored payload.",
+        )
+
+    checkpoint = EventMerkleCheckpoint.objects.filter(
+        business_id=business_id,
+        chain_branch_id=chain_branch_id,
+        first_seq__lte=stream_seq,
+        last_seq__gte=stream_seq,
+    ).first()
+    if checkpoint is None:
+        return EventInclusionProof(
+            status=PROOF_PENDING,
+            **located,
+            message="Event is not covered by a Merkle checkpoint yet.",
+        )
+
+    checkpointed = dict(
+        checkpoint_id=checkpoint.checkpoint_id,
+        first_seq=checkpoint.first_seq,
+        last_seq=checkpoint.last_seq,
+        root_hash=checkpoint.root_hash,
+    )
+    segment_hashes = list(
+        Event.objects.filter(
+            business_id=business_id,
+            chain_branch_id=chain_branch_id,
+            stream_seq__gte=checkpoint.first_seq,
+            stream_seq__lte=checkpoint.last_seq,
+        )
+        .order_by("stream_seq")
+        .values_list("event_hash", flat=True)
+    )
+    if (
+        len(segment_hashes) != checkpoint.last_seq - checkpoint.first_seq + 1
+        or merkle_root(segment_hashes) != checkpoint.root_hash
+    ):
+        return EventInclusionProof(
+            status=PROOF_TAMPERED,
+            **located,
+            **checkpointed,
+            message="Segment no longer matches its Merkle checkpoint root.",
+        )
+
+    return EventInclusionProof(
+        status=PROOF_VALID,
+        **located,
+        **checkpointed,
+        proof=tuple(
+            merkle_inclusion_proof(
+                segment_hashes,
+                stream_seq - checkpoint.first_seq,
+            )
+        ),
+    )
@@ -0,0 +1,63 @@
+"""
+BOS Event Store — Persistence Metrics
+=======================================
+In-process counters for the append path.
+
+Counters are cumulative for the process lifetime and thread-safe.
+Exporters (logs, health endpoints) read them with snapshot().
+"""
+
+from __future__ import annotations
+
+from threading import Lock
+
+
+class AppendRetryMetrics:
+    """
+    Counts server-linked append retries and their latency cost.
+
+    - retries:               rebase attempts after a chain conflict
+    - retry_latency_seconds: time lost to retries (failed attempt
+                             duration + backoff sleep)
+    - retried_accepted:      appends accepted after >= 1 retry
+    - retries_exhausted:     appends rejected after the attempt cap
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._retries = 0
+        self._retry_latency_seconds = 0.0
+        self._retried_accepted = 0
+        self._retries_exhausted = 0
+
+    def record_retry(self, latency_seconds: float) -> None:
+        with self._lock:
+            self._retries += 1
+            self._retry_latency_seconds += latency_seconds
+
+    def record_retried_accepted(self) -> None:
+        with self._lock:
+            self._retried_accepted += 1
+
+    def record_exhausted(self) -> None:
+        with self._lock:
+            self._retries_exhausted += 1
+
+    def snapshot(self) -> dict[str, float]:
+        with self._lock:
+            return {
+                "retries": self._retries,
+                "retry_latency_seconds": self._retry_latency_seconds,
+                "retried_accepted": self._retried_accepted,
+                "retries_exhausted": self._retries_exhausted,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._retries = 0
+            self._retry_latency_seconds = 0.0
+            self._retried_accepted = 0
+            self._retries_exhausted = 0
+
+
+append_retry_metrics = AppendRetryMetrics()
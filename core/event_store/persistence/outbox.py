@@ -0,0 +1,447 @@
+"""
+BOS Event Store — Transactional Outbox Drain
+==============================================
+Background delivery of committed events to SubscriberRegistry handlers.
+
+An append made with use_outbox=True (persist_event,
+persist_events_batch, GroupCommitCoordinator) writes an EventOutbox row
+in the same transaction as its event, so the committed event is always
+queued, even if the process dies right after the commit. Such an
+append cannot also take a subscriber_registry, so an event is either
+dispatched in-process or drained here, never both. Appends made
+without use_outbox queue nothing, so the table only grows for callers
+that rely on a running drain. The drain reads those rows and calls the
+handlers off the request path:
+
+    - At-least-once: a subscriber's progress (EventOutboxDelivery) is
+      saved after each batch, so a crash re-delivers at most one batch
+    - Per-business order: events of a business reach each subscriber in
+      outbox order, which is chain order on every chain
+    - A failing handler stops for that business only: its checkpoint
+      stays before the failed event, which is retried on the next pass;
+      other subscribers and other businesses continue
+    - Rows are deleted once every subscriber has passed them
+
+Progress is kept per (subscriber, business, chain) on stream_seq, not
+on outbox_id: stream_seq is gapless and commit-ordered per chain, while
+outbox ids of concurrent branch sub-chains may commit out of order.
+
+A subscriber is identified by its engine and handler path
+(subscriber_key); two handlers of one registry must not share a path
+(e.g. two lambdas of one function). A subscriber added later starts
+with the rows still queued; use replay for older history.
+
+Workers are threads, each draining whole businesses. On PostgreSQL a
+business is drained under a session advisory lock (pg_try_advisory_lock
+on OUTBOX_LOCK_NAMESPACE and the business id): a business another
+drain holds is skipped for this pass, so one business is never
+delivered by two threads or processes at once, and several drains
+(management command drain_event_outbox) may run against one database.
+Checkpoints only move forward (the upsert keeps the greater
+delivered_seq), so a late write from a drain cannot rewind one. Other
+backends take no lock: run ONE drain per database there. Handlers must
+be idempotent and thread-safe across businesses.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import logging
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from django.db import connection, connections, transaction
+from django.utils import timezone
+
+from core.event_store.models import Event, EventOutbox, EventOutboxDelivery
+from core.events.errors import EventBusError
+from core.events.registry import SubscriberRegistry
+
+logger = logging.getLogger("bos.events")
+
+OUTBOX_BATCH_SIZE = 500
+OUTBOX_POLL_SECONDS = 1.0
+# First key of the drain's advisory locks ("BOS" 0x01); the second key
+# is hashtext() of the business id
+OUTBOX_LOCK_NAMESPACE = 0x424F5301
+
+
+@dataclass
+class OutboxDrainResult:
+    """Outcome of one or more drain passes."""
+
+    businesses: int = 0
+    businesses_skipped: int = 0
+    events_delivered: int = 0
+    delivery_failures: int = 0
+    rows_pruned: int = 0
+    failures: list[dict] = field(default_factory=list)
+
+    def add(self, other: "OutboxDrainResult") -> None:
+        self.businesses += other.businesses
+        self.businesses_skipped += other.businesses_skipped
+        self.events_delivered += other.events_delivered
+        self.delivery_failures += other.delivery_failures
+        self.rows_pruned += other.rows_pruned
+        self.failures.extend(other.failures)
+
+
+@dataclass(frozen=True)
+class _Subscriber:
+    key: str
+    handler: Callable
+    engine: str
+
+
+def subscriber_key(handler: Callable, subscriber_engine: str) -> str:
+    """Stable name of a subscriber across processes: engine:module.qualname."""
+    qualname = getattr(handler, "__qualname__", None)
+    if not qualname:
+        raise EventBusError(
+            f"Outbox subscribers must be functions or methods, "
+            f"got {handler!r}."
+        )
+    return f"{subscriber_engine}:{handler.__module__}.{qualname}"
+
+
+def _collect_subscribers(registry: SubscriberRegistry) -> list[_Subscriber]:
+    """One entry per (handler, engine), exact and pattern subscriptions alike."""
+    found: dict[str, _Subscriber] = {}
+    for handler, engine in registry.get_all_subscribers():
+        key = subscriber_key(handler, engine)
+        existing = found.setdefault(key, _Subscriber(key, handler, engine))
+        if existing.handler != handler:
+            raise EventBusError(
+                f"Two outbox subscribers share the key '{key}'."
+            )
+    return list(found.values())
+
+
+def _routed_keys(
+    registry: SubscriberRegistry,
+    event_type: str,
+) -> frozenset[str]:
+    """Keys of the subscribers an event type is routed to."""
+    return frozenset(
+        subscriber_key(handler, engine)
+        for handler, engine in registry.get_subscribers(event_type)
+    )
+
+
+_DELIVERY_FIELDS = (
+    "subscriber",
+    "business_id",
+    "chain_branch_id",
+    "delivered_seq",
+    "updated_at",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _delivery_upsert_statement(business_chain: bool) -> str:
+    """
+    SQL text for the checkpoint upsert, built once per process.
+
+    The conflict target names the partial unique index of the chain
+    kind; on conflict delivered_seq keeps the greater of the two.
+    """
+    quote_name = connection.ops.quote_name
+    table = quote_name(EventOutboxDelivery._meta.db_table)
+    columns = [
+        quote_name(EventOutboxDelivery._meta.get_field(name).column)
+        for name in _DELIVERY_FIELDS
+    ]
+    subscriber, business_id, chain_branch_id, delivered_seq, updated_at = columns
+    conflict = (
+        f"({subscriber}, {business_id}) WHERE {chain_branch_id} IS NULL"
+        if business_chain
+        else (
+            f"({subscriber}, {business_id}, {chain_branch_id}) "
+            f"WHERE {chain_branch_id} IS NOT NULL"
+        )
+    )
+    # GREATEST(), spelled portably
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join(['%s'] * len(columns))}) "
+        f"ON CONFLICT {conflict} DO UPDATE SET "
+        f"{delivered_seq} = CASE "
+        f"WHEN EXCLUDED.{delivered_seq} > {table}.{delivered_seq} "
+        f"THEN EXCLUDED.{delivered_seq} ELSE {table}.{delivered_seq} END, "
+        f"{updated_at} = EXCLUDED.{updated_at}"
+    )
+
+
+def _save_delivery(
+    subscriber: str,
+    business_id: uuid.UUID,
+    chain_branch_id: Optional[uuid.UUID],
+    delivered_seq: int,
+) -> None:
+    values = {
+        "subscriber": subscriber,
+        "business_id": business_id,
+        "chain_branch_id": chain_branch_id,
+        "delivered_seq": delivered_seq,
+        "updated_at": timezone.now(),
+    }
+    params = [
+        EventOutboxDelivery._meta.get_field(name).get_db_prep_save(
+            values[name], connection,
+        )
+        for name in _DELIVERY_FIELDS
+    ]
+    with connection.cursor() as cursor:
+        cursor.execute(_delivery_upsert_statement(chain_branch_id is None), params)
+
+
+@contextlib.contextmanager
+def _business_drain_lock(business_id: uuid.UUID) -> Iterator[bool]:
+    """
+    Hold the drain lock of a business (PostgreSQL session advisory
+    lock) for the block. Yields False, without waiting, when another
+    drain holds it; other backends always yield True.
+    """
+    if connection.vendor != "postgresql":
+        yield True
+        return
+
+    keys = [OUTBOX_LOCK_NAMESPACE, str(business_id)]
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_try_advisory_lock(%s, hashtext(%s))", keys)
+        acquired = cursor.fetchone()[0]
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT pg_advisory_unlock(%s, hashtext(%s))", keys,
+                )
+
+
+def drain_business_outbox(
+    business_id: uuid.UUID,
+    subscriber_registry: SubscriberRegistry,
+    *,
+    batch_size: int = OUTBOX_BATCH_SIZE,
+) -> OutboxDrainResult:
+    """
+    Deliver the queued events of one business, batch by batch. A
+    subscriber that fails gets nothing more of this business in this
+    pass; the others continue to the end of the outbox. A business
+    another drain holds is skipped (businesses_skipped).
+    """
+    with _business_drain_lock(business_id) as acquired:
+        if not acquired:
+            logger.debug(
+                f"Outbox of business {business_id} is being drained "
+                f"elsewhere; skipped this pass"
+            )
+            return OutboxDrainResult(businesses_skipped=1)
+        return _drain_business(
+            business_id,
+            subscriber_registry,
+            batch_size=batch_size,
+        )
+
+
+def _drain_business(
+    business_id: uuid.UUID,
+    subscriber_registry: SubscriberRegistry,
+    *,
+    batch_size: int,
+) -> OutboxDrainResult:
+    subscribers = _collect_subscribers(subscriber_registry)
+    result = OutboxDrainResult(businesses=1)
+    delivered: dict[tuple[str, Optional[uuid.UUID]], int] = {
+        (row.subscriber, row.chain_branch_id): row.delivered_seq
+        for row in EventOutboxDelivery.objects.filter(
+            business_id=business_id,
+            subscriber__in=[subscriber.key for subscriber in subscribers],
+        )
+    }
+    routed: dict[str, frozenset[str]] = {}
+    blocked: set[str] = set()
+    after_outbox_id = 0
+
+    while True:
+        rows = list(
+            EventOutbox.objects.filter(
+                business_id=business_id,
+                outbox_id__gt=after_outbox_id,
+            ).order_by("outbox_id")[:batch_size]
+        )
+        if not rows:
+            break
+        events = Event.objects.filter(
+            business_id=business_id,
+            event_id__in=[row.event_id for row in rows],
+        ).in_bulk(field_name="event_id")
+
+        advanced: set[tuple[str, Optional[uuid.UUID]]] = set()
+        for row in rows:
+            event = events.get(row.event_id)
+            keys = frozenset()
+            if event is not None:
+                keys = routed.get(event.event_type)
+                if keys is None:
+                    keys = _routed_keys(subscriber_registry, event.event_type)
+                    routed[event.event_type] = keys
+            for subscriber in subscribers:
+                position = (subscriber.key, row.chain_branch_id)
+                if subscriber.key in blocked:
+                    continue
+                if row.stream_seq <= delivered.get(position, 0):
+                    continue
+                if subscriber.key in keys:
+                    try:
+                        subscriber.handler(event)
+                    except Exception as exc:
+                        blocked.add(subscriber.key)
+                        result.delivery_failures += 1
+                        result.failures.append({
+                            "business_id": str(business_id),
+                            "event_id": str(row.event_id),
+                            "subscriber": subscriber.key,
+                            "error": str(exc),
+                            "error_type": type(exc).__name__,
+                        })
+                        logger.error(
+                            f"Outbox delivery failed: {subscriber.key} for "
+                            f"event {row.event_id} (business {business_id}); "
+                            f"retried on the next pass: {exc}",
+                            exc_info=True,
+                        )
+                        continue
+                    result.events_delivered += 1
+                delivered[position] = row.stream_seq
+                advanced.add(position)
+
+        done = [
+            row.outbox_id
+            for row in rows
+            if all(
+                row.stream_seq <= delivered.get(
+                    (subscriber.key, row.chain_branch_id), 0
+                )
+                for subscriber in subscribers
+            )
+        ]
+        with transaction.atomic():
+            for subscriber, chain_branch_id in advanced:
+                _save_delivery(
+                    subscriber,
+                    business_id,
+                    chain_branch_id,
+                    delivered[(subscriber, chain_branch_id)],
+                )
+            if done:
+                EventOutbox.objects.filter(outbox_id__in=done).delete()
+        result.rows_pruned += len(done)
+
+        after_outbox_id = rows[-1].outbox_id
+        if len(rows) < batch_size or len(blocked) == len(subscribers):
+            break
+
+    return result
+
+
+def drain_event_outbox(
+    subscriber_registry: SubscriberRegistry,
+    business_ids: Optional[Iterable[uuid.UUID]] = None,
+    *,
+    workers: Optional[int] = None,
+    batch_size: int = OUTBOX_BATCH_SIZE,
+) -> OutboxDrainResult:
+    """
+    One drain pass over every business with queued events (or the
+    given ones), one business per task on a worker pool.
+    """
+    if business_ids is None:
+        business_ids = list(
+            EventOutbox.objects.order_by("business_id")
+            .values_list("business_id", flat=True)
+            .distinct()
+        )
+    else:
+        business_ids = list(business_ids)
+    if not business_ids:
+        return OutboxDrainResult()
+
+    # Fail fast on unnamed handlers, before any business is touched.
+    _collect_subscribers(subscriber_registry)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(business_ids)))
+
+    def drain_one(business_id: uuid.UUID) -> OutboxDrainResult:
+        try:
+            return drain_business_outbox(
+                business_id,
+                subscriber_registry,
+                batch_size=batch_size,
+            )
+        except Exception as exc:
+            logger.error(
+                f"Outbox drain of business {business_id} failed: {exc}",
+                exc_info=True,
+            )
+            return OutboxDrainResult(
+                businesses=1,
+                failures=[{
+                    "business_id": str(business_id),
+                    "error": str(exc),
+                    "error_type": type(exc).__name__,
+                }],
+            )
+        finally:
+            if workers > 1:
+                connections.close_all()
+
+    if workers == 1:
+        results = [drain_one(business_id) for business_id in business_ids]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="bos-outbox",
+        ) as pool:
+            results = list(pool.map(drain_one, business_ids))
+
+    merged = OutboxDrainResult()
+    for result in results:
+        merged.add(result)
+    return merged
+
+
+def run_outbox_worker(
+    subscriber_registry: SubscriberRegistry,
+    *,
+    workers: Optional[int] = None,
+    batch_size: int = OUTBOX_BATCH_SIZE,
+    poll_seconds: float = OUTBOX_POLL_SECONDS,
+    stop: Optional[threading.Event] = None,
+    on_pass: Optional[Callable[[OutboxDrainResult], Any]] = None,
+) -> OutboxDrainResult:
+    """
+    Drain the outbox repeatedly until stop is set, waiting poll_seconds
+    after a pass that found nothing to do (or only failures).
+    Returns the totals of all passes.
+    """
+    stop = stop or threading.Event()
+    totals = OutboxDrainResult()
+    while not stop.is_set():
+        result = drain_event_outbox(
+            subscriber_registry,
+            workers=workers,
+            batch_size=batch_size,
+        )
+        totals.add(result)
+        if on_pass is not None:
+            on_pass(result)
+        if not result.rows_pruned:
+            stop.wait(poll_seconds)
+    return totals
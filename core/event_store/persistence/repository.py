@@ -1,14 +1,62 @@
 """
 BOS Event Store - Persistence Repository
 =======================================
-Single low-level save helper used by persistence service.
+Low-level save and load helpers used by persistence service.
+
+PostgreSQL fast path:
+    insert_event_advancing_head() writes the event row and moves the
+    chain head in ONE statement (INSERT ... ON CONFLICT (event_id) DO
+    NOTHING RETURNING, chained into the outbox INSERT and the head
+    UPDATE), after lock_append_chain_head() picked and locked the
+    chain head. Other backends use the ORM helpers.
+
+Event id registry:
+    on a hash-partitioned table every saved event also claims its
+    event_id in EventIdRegistry, in the same transaction
+    (claim_event_ids(), or the fast-path statement itself).
+
+Outbox:
+    a saved event whose caller asked for outbox delivery gets its
+    EventOutbox row in the same transaction (enqueue_outbox(), or the
+    fast-path statement itself).
+
+Partition pruning (see core.event_store.partitioning):
+    every per-business read filters on business_id first, so on a
+    partitioned table it touches one partition.
+
+Chain heads:
+    chain_branch_id=None addresses the business chain head
+    (EventChainHead); a branch_id addresses that branch's sub-chain
+    head (EventBranchChainHead, BRANCH chain mode). Both expose
+    head_hash / head_event_id / sequence, so callers treat them alike.
 """
 
 from __future__ import annotations
 
+import functools
 import uuid
+from typing import Iterable, Iterator, Optional, Sequence
+
+from django.db import connection
+from django.db.models import BooleanField, Exists, F, Max, OuterRef, Q, Subquery
+from django.db.models.expressions import RawSQL
+from django.utils import timezone
 
-from core.event_store.models import Event
+from core.event_store.hashing.hasher import (
+    DEFAULT_HASH_VERSION,
+    GENESIS_HASH,
+    branch_genesis_hash,
+    canonical_serialize,
+)
+from core.event_store.models import (
+    ChainMode,
+    Event,
+    EventBranchChainHead,
+    EventChainHead,
+    EventIdRegistry,
+    EventOutbox,
+)
+from core.event_store.partitioning import is_event_store_partitioned
 
 
 def save_event(event_data: dict) -> Event:
@@ -20,26 +68,548 @@ def save_event(event_data: dict) -> Event:
     return Event.objects.create(**event_data)
 
 
-def get_latest_event_for_business(
+def save_events(events_data: Sequence[dict]) -> list[Event]:
+    """
+    Persist several event rows with a single bulk INSERT.
+
+    Rows are inserted in the given order. The caller (persistence
+    service) owns validation, hash linking and the transaction.
+    """
+    return Event.objects.bulk_create(
+        [Event(**event_data) for event_data in events_data]
+    )
+
+
+def claim_event_ids(events: Sequence[Event]) -> None:
+    """
+    Claim the event_ids of saved events in bos_event_id_registry (one
+    bulk INSERT) when the event table is partitioned; no-op otherwise.
+
+    Called inside the transaction that saved the events: an event_id
+    already claimed by any business raises IntegrityError and rolls
+    the whole append back.
+    """
+    if not is_event_store_partitioned():
+        return
+    EventIdRegistry.objects.bulk_create([
+        EventIdRegistry(event_id=event.event_id, business_id=event.business_id)
+        for event in events
+    ])
+
+
+def enqueue_outbox(events: Sequence[Event]) -> None:
+    """
+    Queue saved events for background dispatch (one bulk INSERT).
+
+    The caller (persistence service) calls this inside the transaction
+    that saved the events, so rows commit or roll back with them.
+    """
+    EventOutbox.objects.bulk_create([
+        EventOutbox(
+            event_id=event.event_id,
+            business_id=event.business_id,
+            chain_branch_id=event.chain_branch_id,
+            stream_seq=event.stream_seq,
+        )
+        for event in events
+    ])
+
+
+def find_existing_event_ids(event_ids: Sequence[uuid.UUID]) -> set[uuid.UUID]:
+    """Return the subset of event_ids already persisted (one query)."""
+    return set(
+        Event.objects.filter(event_id__in=list(event_ids)).values_list(
+            "event_id",
+            flat=True,
+        )
+    )
+
+
+def chain_business_ids() -> list[uuid.UUID]:
+    """
+    Every business that has a chain, from the head table (one row per
+    business) instead of a DISTINCT scan over all event partitions.
+    """
+    return list(
+        EventChainHead.objects.order_by("business_id").values_list(
+            "business_id",
+            flat=True,
+        )
+    )
+
+
+def find_payload_canonical_mismatch(
+    business_id: uuid.UUID,
+    *,
+    within: Q | None = None,
+) -> uuid.UUID | None:
+    """
+    First event of a business whose payload no longer matches its
+    stored payload_canonical (e.g. payload edited in place), or None.
+
+    Hash verification hashes payload_canonical, so this is the check
+    that ties the decoded payload column to the hashed text. PostgreSQL
+    compares both as jsonb in one query; other backends re-serialize.
+    within restricts the check to matching events (e.g. the unverified
+    tail of incremental verification).
+    """
+    rows = Event.objects.filter(
+        business_id=business_id,
+        payload_canonical__isnull=False,
+    ).order_by()
+    if within is not None:
+        rows = rows.filter(within)
+
+    if connection.vendor == "postgresql":
+        return (
+            rows.alias(
+                drifted=RawSQL(
+                    "payload <> payload_canonical::jsonb",
+                    [],
+                    output_field=BooleanField(),
+                ),
+            )
+            .filter(drifted=True)
+            .values_list("event_id", flat=True)
+            .first()
+        )
+
+    rows = rows.values_list("event_id", "payload", "payload_canonical")
+    for event_id, payload, payload_canonical in rows.iterator(chunk_size=500):
+        if canonical_serialize(payload) != payload_canonical:
+            return event_id
+    return None
+
+
+def get_chain_head(
+    business_id: uuid.UUID,
+    chain_branch_id: uuid.UUID | None = None,
+) -> EventChainHead | EventBranchChainHead | None:
+    """
+    Read a chain head row without locking.
+
+    Single unique-key lookup, independent of chain length.
+    Returns None if the chain has never been appended to.
+    """
+    if chain_branch_id is not None:
+        return EventBranchChainHead.objects.filter(
+            business_id=business_id,
+            branch_id=chain_branch_id,
+        ).first()
+    return EventChainHead.objects.filter(business_id=business_id).first()
+
+
+def genesis_hash_for(chain_branch_id: uuid.UUID | None) -> str:
+    """Genesis previous_event_hash of the business chain or a sub-chain."""
+    if chain_branch_id is None:
+        return GENESIS_HASH
+    return branch_genesis_hash(chain_branch_id)
+
+
+def lock_chain_head(
     business_id: uuid.UUID,
+    chain_branch_id: uuid.UUID | None = None,
     *,
-    lock: bool = False,
+    exclusive: bool = False,
+) -> EventChainHead | EventBranchChainHead:
+    """
+    Lock a chain head row (SELECT ... FOR UPDATE).
+
+    Must be called inside transaction.atomic(). One statement when the
+    row exists. For the first append of a chain the row is created
+    (INSERT ... ON CONFLICT DO NOTHING) and then locked, so two genesis
+    appends serialize here instead of racing on an empty chain.
+
+    A branch sub-chain lock covers that branch only; it never touches
+    the business chain head row.
+
+    The business chain head is locked FOR NO KEY UPDATE, which does
+    not block BRANCH mode appends holding it FOR KEY SHARE (see
+    lock_append_chain_head()). exclusive=True locks it FOR UPDATE
+    instead, waiting for those appends: for changes they depend on,
+    such as the chain mode.
+    """
+    if chain_branch_id is not None:
+        return _lock_branch_chain_head(business_id, chain_branch_id)
+
+    no_key = not exclusive
+    chain_head = (
+        EventChainHead.objects.select_for_update(no_key=no_key)
+        .filter(business_id=business_id)
+        .first()
+    )
+    if chain_head is not None:
+        return chain_head
+
+    EventChainHead.objects.bulk_create(
+        [
+            EventChainHead(
+                business_id=business_id,
+                head_hash=GENESIS_HASH,
+                head_event_id=None,
+                sequence=0,
+            )
+        ],
+        ignore_conflicts=True,
+    )
+    return EventChainHead.objects.select_for_update(no_key=no_key).get(
+        business_id=business_id,
+    )
+
+
+def _lock_branch_chain_head(
+    business_id: uuid.UUID,
+    branch_id: uuid.UUID,
+) -> EventBranchChainHead:
+    chain_head = (
+        EventBranchChainHead.objects.select_for_update()
+        .filter(business_id=business_id, branch_id=branch_id)
+        .first()
+    )
+    if chain_head is not None:
+        return chain_head
+
+    business_hash_version = (
+        EventChainHead.objects.filter(business_id=business_id)
+        .values_list("hash_version", flat=True)
+        .first()
+    )
+    EventBranchChainHead.objects.bulk_create(
+        [
+            EventBranchChainHead(
+                business_id=business_id,
+                branch_id=branch_id,
+                head_hash=branch_genesis_hash(branch_id),
+                head_event_id=None,
+                sequence=0,
+                hash_version=business_hash_version or DEFAULT_HASH_VERSION,
+            )
+        ],
+        ignore_conflicts=True,
+    )
+    return EventBranchChainHead.objects.select_for_update().get(
+        business_id=business_id,
+        branch_id=branch_id,
+    )
+
+
+# Businesses last seen in BRANCH chain mode by this process. Only a
+# hint for lock_append_chain_head(), which checks the mode on the
+# business head row it locks FOR KEY SHARE.
+_BRANCH_MODE_HINTS: set[uuid.UUID] = set()
+
+
+@functools.lru_cache(maxsize=None)
+def _hinted_branch_head_statement() -> str:
+    """
+    SQL text of the BRANCH mode append lock: the branch head FOR
+    UPDATE and the business head FOR KEY SHARE, if it is in BRANCH
+    mode. Built once per process.
+    """
+    quote_name = connection.ops.quote_name
+    columns = ", ".join(
+        f"branch_head.{quote_name(field.column)}"
+        for field in EventBranchChainHead._meta.concrete_fields
+    )
+    return (
+        f"SELECT {columns}, head.anchor_interval AS business_anchor_interval "
+        f"FROM {quote_name(EventBranchChainHead._meta.db_table)} AS branch_head "
+        f"JOIN {quote_name(EventChainHead._meta.db_table)} AS head "
+        f"ON head.business_id = branch_head.business_id "
+        f"WHERE branch_head.business_id = %s AND branch_head.branch_id = %s "
+        f"AND head.chain_mode = %s "
+        f"FOR UPDATE OF branch_head FOR KEY SHARE OF head"
+    )
+
+
+def _lock_hinted_branch_chain_head(
+    business_id: uuid.UUID,
+    branch_id: uuid.UUID,
+) -> Optional[EventBranchChainHead]:
+    """
+    Lock the branch head of a business in BRANCH mode, or None (no
+    head yet, or not in BRANCH mode). One statement.
+    """
+    if connection.vendor == "postgresql":
+        return next(
+            iter(
+                EventBranchChainHead.objects.raw(
+                    _hinted_branch_head_statement(),
+                    [business_id, branch_id, ChainMode.BRANCH],
+                )
+            ),
+            None,
+        )
+
+    # Other backends have no FOR KEY SHARE: the branch head only.
+    branch_mode = EventChainHead.objects.filter(
+        business_id=OuterRef("business_id"),
+        chain_mode=ChainMode.BRANCH,
+    )
+    return (
+        EventBranchChainHead.objects.select_for_update(of=("self",))
+        .filter(business_id=business_id, branch_id=branch_id)
+        .filter(Exists(branch_mode))
+        .annotate(
+            business_anchor_interval=Subquery(
+                branch_mode.values("anchor_interval")[:1]
+            )
+        )
+        .first()
+    )
+
+
+def lock_append_chain_head(
+    business_id: uuid.UUID,
+    branch_id: uuid.UUID | None,
+) -> tuple[EventChainHead | EventBranchChainHead, Optional[int]]:
+    """
+    Lock the chain head an event of branch_id appends to, choosing the
+    chain from the locked rows themselves (no separate mode lookup).
+
+    Returns (chain_head, anchor_interval); anchor_interval is set only
+    for a branch sub-chain in BRANCH mode.
+
+    Business-wide events and businesses in BUSINESS mode lock the
+    business head, which carries the authoritative chain_mode. For a
+    business hinted to be in BRANCH mode one statement locks the branch
+    head FOR UPDATE and the business head FOR KEY SHARE, checking the
+    mode on it. KEY SHARE does not block other appends (they lock the
+    business head FOR NO KEY UPDATE), but set_chain_mode() locks it FOR
+    UPDATE: a mode switch waits for such appends to commit, and an
+    append that waited on a switch re-checks the committed mode. A
+    miss (first append of a branch, or the mode changed) falls back to
+    the business head and then, in BRANCH mode, locks the branch head
+    as well.
+
+    Must be called inside transaction.atomic().
+    """
+    if branch_id is None:
+        return lock_chain_head(business_id), None
+
+    if business_id in _BRANCH_MODE_HINTS:
+        chain_head = _lock_hinted_branch_chain_head(business_id, branch_id)
+        if chain_head is not None:
+            return chain_head, chain_head.business_anchor_interval
+
+    business_head = lock_chain_head(business_id)
+    if business_head.chain_mode != ChainMode.BRANCH:
+        _BRANCH_MODE_HINTS.discard(business_id)
+        return business_head, None
+    _BRANCH_MODE_HINTS.add(business_id)
+    return (
+        _lock_branch_chain_head(business_id, branch_id),
+        business_head.anchor_interval,
+    )
+
+
+def chain_target_hint(
+    business_id: uuid.UUID,
+    branch_id: uuid.UUID | None,
+) -> uuid.UUID | None:
+    """
+    Best guess, without a query, of the chain an event of branch_id
+    appends to: branch_id for a business last seen in BRANCH mode, None
+    (the business chain) otherwise. Callers must re-check under lock.
+    """
+    if business_id in _BRANCH_MODE_HINTS:
+        return branch_id
+    return None
+
+
+def has_branch_chains(business_id: uuid.UUID) -> bool:
+    """True once any branch sub-chain of the business has been opened."""
+    return EventBranchChainHead.objects.filter(
+        business_id=business_id,
+    ).exists()
+
+
+def advance_chain_head(
+    chain_head: EventChainHead | EventBranchChainHead,
+    *,
+    head_event_id: uuid.UUID,
+    head_hash: str,
+    appended: int = 1,
+) -> EventChainHead | EventBranchChainHead:
+    """
+    Move a locked chain head to the newest appended event.
+
+    The caller owns the transaction and must hold the row lock
+    (see lock_chain_head).
+    """
+    chain_head.head_event_id = head_event_id
+    chain_head.head_hash = head_hash
+    chain_head.sequence += appended
+    chain_head.save(
+        update_fields=["head_event_id", "head_hash", "sequence", "updated_at"]
+    )
+    return chain_head
+
+
+def supports_fast_append() -> bool:
+    """True when the single-statement append path is available."""
+    return connection.vendor == "postgresql"
+
+
+@functools.lru_cache(maxsize=None)
+def _fast_append_statement(
+    branch_chain: bool = False,
+    partitioned: bool = False,
+    queue_outbox: bool = False,
+) -> str:
+    """
+    SQL text for the single-statement append, built once per process
+    (one variant per head table, event table layout and outbox use).
+
+    Plain table: the INSERT skips silently on a duplicate event_id
+    only (ON CONFLICT (event_id) DO NOTHING); the outbox INSERT (if
+    any) then queues nothing, the head UPDATE matches no row and
+    RETURNING is empty. Any other unique conflict (e.g. a chain link
+    taken concurrently) raises IntegrityError.
+
+    Partitioned table: the event_id is first claimed in
+    bos_event_id_registry (ON CONFLICT (event_id) DO NOTHING) and the
+    event row is only inserted from a successful claim, so a duplicate
+    event_id of any business also returns nothing. Any other conflict
+    raises and rolls the claim back with the statement.
+    """
+    quote_name = connection.ops.quote_name
+    head_model = EventBranchChainHead if branch_chain else EventChainHead
+    head_filter = (
+        "head.business_id = %s AND head.branch_id = %s"
+        if branch_chain
+        else "head.business_id = %s"
+    )
+    columns = ", ".join(
+        quote_name(field.column) for field in Event._meta.concrete_fields
+    )
+    placeholders = ", ".join(["%s"] * len(Event._meta.concrete_fields))
+    if partitioned:
+        insert_event = (
+            f"WITH claimed AS ("
+            f"INSERT INTO {quote_name(EventIdRegistry._meta.db_table)} "
+            f"(event_id, business_id) VALUES (%s, %s) "
+            f"ON CONFLICT (event_id) DO NOTHING "
+            f"RETURNING event_id"
+            f"), inserted AS ("
+            f"INSERT INTO {quote_name(Event._meta.db_table)} ({columns}) "
+            f"SELECT {placeholders} FROM claimed "
+        )
+    else:
+        insert_event = (
+            f"WITH inserted AS ("
+            f"INSERT INTO {quote_name(Event._meta.db_table)} ({columns}) "
+            f"VALUES ({placeholders}) "
+            f"ON CONFLICT (event_id) DO NOTHING "
+        )
+    outbox_columns = "event_id, business_id, chain_branch_id, stream_seq"
+    queue_event = (
+        f", queued AS ("
+        f"INSERT INTO {quote_name(EventOutbox._meta.db_table)} "
+        f"({outbox_columns}, created_at) "
+        f"SELECT {outbox_columns}, %s FROM inserted"
+        f")"
+        if queue_outbox
+        else ""
+    )
+    return (
+        f"{insert_event}"
+        f"RETURNING event_id, event_hash, business_id, chain_branch_id, "
+        f"stream_seq"
+        f"){queue_event} "
+        f"UPDATE {quote_name(head_model._meta.db_table)} AS head "
+        f"SET head_event_id = inserted.event_id, "
+        f"head_hash = inserted.event_hash, "
+        f"sequence = head.sequence + 1, "
+        f"updated_at = %s "
+        f"FROM inserted "
+        f"WHERE {head_filter} "
+        f"RETURNING head.sequence"
+    )
+
+
+def insert_event_advancing_head(
+    event_data: dict,
+    chain_head: EventChainHead | EventBranchChainHead,
+    *,
+    queue_outbox: bool = False,
 ) -> Event | None:
     """
-    Fetch the latest event for a business using deterministic ordering.
+    PostgreSQL fast path: insert one event, optionally queue it in the
+    outbox, and advance its locked chain head in a single round-trip
+    (claiming the event_id first on a partitioned table).
 
-    Ordering rule:
-        created_at DESC, event_id DESC
+    Returns the persisted Event, or None if its event_id already
+    exists (in any business). Other conflicts raise IntegrityError.
+    Field values are prepared exactly
+    as the ORM would prepare them (auto_now_add, JSON adaptation, ...).
 
-    lock=True enables row-level lock for transactional chain checks.
+    The caller owns validation, hash linking, the transaction and the
+    head row lock (lock_append_chain_head).
     """
-    query = (
-        Event.objects.filter(business_id=business_id)
-        .order_by("-created_at", "-event_id")
+    event = Event(**event_data)
+    uuid_field = EventChainHead._meta.get_field("business_id")
+    partitioned = is_event_store_partitioned()
+    params = []
+    if partitioned:
+        params.append(uuid_field.get_db_prep_save(event.event_id, connection))
+        params.append(uuid_field.get_db_prep_save(event.business_id, connection))
+    params.extend(
+        field.get_db_prep_save(field.pre_save(event, add=True), connection)
+        for field in Event._meta.concrete_fields
     )
-    if lock:
-        query = query.select_for_update()
-    return query.first()
+    branch_chain = isinstance(chain_head, EventBranchChainHead)
+    now = timezone.now()
+    if queue_outbox:
+        params.append(now)
+    params.append(now)
+    params.append(uuid_field.get_db_prep_save(event.business_id, connection))
+    if branch_chain:
+        params.append(
+            uuid_field.get_db_prep_save(chain_head.branch_id, connection)
+        )
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            _fast_append_statement(branch_chain, partitioned, queue_outbox),
+            params,
+        )
+        row = cursor.fetchone()
+
+    if row is None:
+        return None
+
+    event._state.adding = False
+    event._state.db = connection.alias
+    chain_head.head_event_id = event.event_id
+    chain_head.head_hash = event.event_hash
+    chain_head.sequence = row[0]
+    return event
+
+
+EVENT_ENVELOPE_FIELDS = (
+    "event_id",
+    "event_type",
+    "event_version",
+    "business_id",
+    "branch_id",
+    "source_engine",
+    "actor_type",
+    "actor_id",
+    "correlation_id",
+    "causation_id",
+    "payload",
+    "reference",
+    "created_at",
+    "status",
+    "correction_of",
+    "previous_event_hash",
+    "event_hash",
+    "stream_seq",
+    "chain_branch_id",
+)
+
+DEFAULT_LOAD_CHUNK_SIZE = 500
 
 
 def load_events_for_business(
@@ -48,31 +618,269 @@ def load_events_for_business(
     """
     Load event envelopes for one business in deterministic replay order.
 
-    Ordering rule:
-        created_at ASC, event_id ASC
-    """
-    fields = (
-        "event_id",
-        "event_type",
-        "event_version",
-        "business_id",
-        "branch_id",
-        "source_engine",
-        "actor_type",
-        "actor_id",
-        "correlation_id",
-        "causation_id",
-        "payload",
-        "reference",
-        "created_at",
-        "status",
-        "correction_of",
-        "previous_event_hash",
-        "event_hash",
-    )
-    rows = (
-        Event.objects.filter(business_id=business_id)
-        .order_by("created_at", "event_id")
-        .values(*fields)
-    )
-    return tuple(dict(row) for row in rows)
+    Materializes the whole history; prefer iter_events_for_business()
+    for large tenants.
+
+    Ordering rule: chain order, see business_replay_order().
+    """
+    return tuple(iter_events_for_business(business_id))
+
+
+def iter_events_for_business(
+    business_id: uuid.UUID,
+    *,
+    event_types: Optional[Iterable[str]] = None,
+    event_type_prefix: Optional[str] = None,
+    chunk_size: int = DEFAULT_LOAD_CHUNK_SIZE,
+    after_event_id: Optional[uuid.UUID] = None,
+    after_positions: Optional[dict[uuid.UUID | None, int]] = None,
+) -> Iterator[dict]:
+    """
+    Stream event envelopes for one business in replay order.
+
+    Reads chunk_size rows at a time with keyset pagination on the
+    replay order (no OFFSET, no open server-side cursor), so memory
+    stays bounded by one chunk whatever the size of the tenant.
+
+    Filters are applied in SQL:
+        event_types:       only these exact event types
+        event_type_prefix: only event types starting with this prefix
+
+    after_positions resumes after per-chain positions (chain_branch_id
+    -> last stream_seq consumed; chains missing from it are read from
+    the start). after_event_id resumes strictly after that event in
+    replay order; ValueError if the business has no such event. With
+    branch sub-chains only after_positions is append-safe: events
+    appended later to a chain that sorts before after_event_id's chain
+    would be skipped.
+
+    The ordering is resolved once, when iteration starts. Events
+    appended while iterating may or may not be yielded.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1.")
+
+    ordering = business_replay_order(business_id)
+    queryset = Event.objects.filter(business_id=business_id)
+    if after_positions is not None:
+        queryset = queryset.filter(chain_positions_filter(after_positions))
+    if event_types is not None:
+        event_types = list(event_types)
+        if not event_types:
+            return
+        queryset = queryset.filter(event_type__in=event_types)
+    if event_type_prefix:
+        queryset = queryset.filter(event_type__startswith=event_type_prefix)
+
+    key_only_fields = tuple(
+        field for field in ordering if field not in EVENT_ENVELOPE_FIELDS
+    )
+    queryset = queryset.order_by(*replay_order_by(ordering)).values(
+        *EVENT_ENVELOPE_FIELDS,
+        *key_only_fields,
+    )
+
+    last_key = None
+    if after_event_id is not None:
+        after_row = (
+            Event.objects.filter(business_id=business_id, event_id=after_event_id)
+            .values(*ordering)
+            .first()
+        )
+        if after_row is None:
+            raise ValueError(
+                f"Event {after_event_id} not found for business {business_id}."
+            )
+        last_key = tuple(after_row[field] for field in ordering)
+
+    while True:
+        page = queryset
+        if last_key is not None:
+            page = page.filter(_after_key(ordering, last_key))
+        rows = list(page[:chunk_size])
+        if not rows:
+            return
+
+        last_key = tuple(rows[-1][field] for field in ordering)
+        for row in rows:
+            for field in key_only_fields:
+                del row[field]
+            yield row
+
+        if len(rows) < chunk_size:
+            return
+
+
+def chain_head_positions(
+    business_id: uuid.UUID,
+) -> dict[uuid.UUID | None, int]:
+    """
+    Committed length of every chain of a business, keyed by
+    chain_branch_id (None = business chain). One indexed lookup, plus
+    one for the branch heads in BRANCH chain mode.
+    """
+    head = (
+        EventChainHead.objects.filter(business_id=business_id)
+        .values_list("sequence", "chain_mode")
+        .first()
+    )
+    if head is None:
+        return {}
+    positions: dict[uuid.UUID | None, int] = {None: head[0]}
+    if head[1] == ChainMode.BRANCH:
+        positions.update(
+            EventBranchChainHead.objects.filter(business_id=business_id)
+            .values_list("branch_id", "sequence")
+        )
+    return positions
+
+
+def chain_positions_filter(positions: dict[uuid.UUID | None, int]) -> Q:
+    """
+    Event filter for what follows per-chain positions: events above
+    the position of their chain, plus every event of other chains.
+    """
+    after = Q(pk__in=[])
+    covered = Q(pk__in=[])
+    for chain_branch_id, position in positions.items():
+        chain = (
+            Q(chain_branch_id__isnull=True)
+            if chain_branch_id is None
+            else Q(chain_branch_id=chain_branch_id)
+        )
+        after |= chain & Q(stream_seq__gt=position)
+        covered |= chain
+    return after | ~covered
+
+
+def encode_chain_positions(
+    positions: dict[uuid.UUID | None, int],
+) -> dict[str, int]:
+    """JSON form of per-chain positions ("" = business chain)."""
+    return {
+        "" if chain_branch_id is None else str(chain_branch_id): position
+        for chain_branch_id, position in positions.items()
+    }
+
+
+def decode_chain_positions(
+    encoded: dict[str, int],
+) -> dict[uuid.UUID | None, int]:
+    """Inverse of encode_chain_positions()."""
+    return {
+        uuid.UUID(key) if key else None: int(position)
+        for key, position in encoded.items()
+    }
+
+
+def chain_positions_through(
+    business_id: uuid.UUID,
+    event_id: uuid.UUID | None,
+) -> dict[uuid.UUID | None, int]:
+    """
+    Per chain, the last stream_seq at or before event_id in replay
+    order (see business_replay_order): where a reader that consumed
+    the business up to that event stands on each chain. Empty for
+    event_id None. Only stable for a single chain: with branch
+    sub-chains, chains sorting before event_id's chain count whatever
+    they hold now.
+    """
+    if event_id is None:
+        return {}
+    ordering = business_replay_order(business_id)
+    key_row = (
+        Event.objects.filter(business_id=business_id, event_id=event_id)
+        .values(*ordering)
+        .first()
+    )
+    if key_row is None:
+        raise ValueError(
+            f"Event {event_id} not found for business {business_id}."
+        )
+    key = tuple(key_row[field] for field in ordering)
+    return dict(
+        Event.objects.filter(business_id=business_id, stream_seq__isnull=False)
+        .exclude(_after_key(ordering, key))
+        .order_by()
+        .values("chain_branch_id")
+        .annotate(position=Max("stream_seq"))
+        .values_list("chain_branch_id", "position")
+    )
+
+
+def iter_chain_events(
+    business_id: uuid.UUID,
+    chain_branch_id: uuid.UUID | None,
+    *,
+    after_seq: int,
+    through_seq: int,
+    event_types: Optional[Iterable[str]] = None,
+    event_type_prefix: Optional[str] = None,
+    chunk_size: int = DEFAULT_LOAD_CHUNK_SIZE,
+) -> Iterator[dict]:
+    """
+    Stream the envelopes of one chain with after_seq < stream_seq <=
+    through_seq, in stream_seq order, with the same SQL filters as
+    iter_events_for_business().
+    """
+    queryset = Event.objects.filter(
+        business_id=business_id,
+        chain_branch_id=chain_branch_id,
+        stream_seq__lte=through_seq,
+    )
+    if event_types is not None:
+        queryset = queryset.filter(event_type__in=list(event_types))
+    if event_type_prefix:
+        queryset = queryset.filter(event_type__startswith=event_type_prefix)
+    queryset = queryset.order_by("stream_seq").values(*EVENT_ENVELOPE_FIELDS)
+
+    while True:
+        rows = list(queryset.filter(stream_seq__gt=after_seq)[:chunk_size])
+        yield from rows
+        if len(rows) < chunk_size:
+            return
+        after_seq = rows[-1]["stream_seq"]
+
+
+def _after_key(ordering: Sequence[str], key: Sequence) -> Q:
+    """
+    Rows strictly after key in (ascending) lexicographic ordering, with
+    NULLs first (see replay_order_by).
+    """
+    condition = Q()
+    for position, field in enumerate(ordering):
+        if key[position] is None:
+            step = Q(**{f"{field}__isnull": False})
+        else:
+            step = Q(**{f"{field}__gt": key[position]})
+        for previous_field, previous_value in zip(
+            ordering[:position], key[:position]
+        ):
+            step &= Q(**{previous_field: previous_value})
+        condition |= step
+    return condition
+
+
+def business_replay_order(business_id: uuid.UUID) -> tuple[str, ...]:
+    """
+    ORDER BY fields that replay one business deterministically.
+
+    One chain: stream_seq is a total order. With branch sub-chains,
+    stream_seq restarts per sub-chain, so events are replayed chain by
+    chain: the business chain first, then each branch sub-chain in
+    branch_id order, each in stream_seq order. No clock is involved;
+    events of different chains are not interleaved, so a resumable
+    reader must keep one position per chain (chain_positions_filter).
+    Pass the result through replay_order_by() for order_by().
+    """
+    if has_branch_chains(business_id):
+        return ("chain_branch_id", "stream_seq")
+    return ("stream_seq",)
+
+
+def replay_order_by(ordering: Sequence[str]) -> list:
+    """order_by() arguments for ordering, NULLs (business chain) first."""
+    return [
+        F(field).asc(nulls_first=True) if field == "chain_branch_id" else field
+        for field in ordering
+    ]
@@ -0,0 +1,70 @@
+"""
+BOS Event Store — Append Retry Policy
+=======================================
+Bounded rebase-and-retry for SERVER-LINKED appends.
+
+An append is server-linked when the caller leaves both
+previous_event_hash and event_hash unset: persist_event() links it to
+the chain head itself. If another writer advances the head between
+linking and commit, the link is stale through no fault of the caller,
+so persist_event() clears the hashes, waits a jittered backoff and
+links again against the new head.
+
+Appends carrying client-supplied hashes are NEVER retried: the client
+asserted a chain position and must be told it is wrong.
+
+Which paths can hit a retry:
+    - persist_event() off PostgreSQL (no fast append): the append is
+      linked before the head lock and re-checked under it, so a head
+      moved in between is the conflict this policy exists for
+    - persist_event() on PostgreSQL (fast append): the append is
+      linked under the head lock, so the head cannot move first; a
+      conflict there means the head row disagrees with the stored
+      chain, and the retry is only a safety net
+    - persist_events_batch() and group commit groups: never retried
+      (an append a group defers to another chain goes through
+      persist_event() and retries there)
+
+Deployments set the policy through the BOS_APPEND_RETRY_* settings
+(see adapters.django_api.wiring); direct callers pass retry_policy.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class AppendRetryPolicy:
+    """
+    Attempt cap and backoff for server-linked append conflicts.
+
+    max_attempts counts the first try: 1 disables retrying.
+    Delay before retry N (1-based) is drawn uniformly from
+    [0, min(max_delay_seconds, base_delay_seconds * 2 ** (N - 1))]
+    ("full jitter"), so colliding writers spread out instead of
+    colliding again in lockstep.
+    """
+
+    max_attempts: int = 3
+    base_delay_seconds: float = 0.005
+    max_delay_seconds: float = 0.1
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1.")
+        if self.base_delay_seconds < 0 or self.max_delay_seconds < 0:
+            raise ValueError("Retry delays must be >= 0.")
+
+    def delay_for(self, retry_number: int) -> float:
+        """Jittered delay before the given retry (1 = first retry)."""
+        ceiling = min(
+            self.max_delay_seconds,
+            self.base_delay_seconds * (2 ** (retry_number - 1)),
+        )
+        return random.uniform(0.0, ceiling)
+
+
+DEFAULT_APPEND_RETRY_POLICY = AppendRetryPolicy()
+NO_APPEND_RETRY = AppendRetryPolicy(max_attempts=1)
@@ -6,50 +6,117 @@ The single controlled write path for persisting events.
 After Task 0.6, there is exactly ONE lawful way to write an event:
     persist_event(event_data, context, registry)
 
+Several events of one business (e.g. the lines of one POS sale) may
+be written together through the same flow:
+    persist_events_batch(events, context, registry)
+
 Write flow (NON-NEGOTIABLE):
     1. Validate event structure      (Task 0.3)
     2. Check idempotency             (Task 0.4)
     3. Verify hash-chain             (Task 0.5)
-    4. Atomic DB save                (Task 0.6)
+    4. Atomic DB save                (Task 0.6, + outbox row if asked)
     5. Dispatch to subscribers       (Event Bus — AFTER commit only)
     6. Return success or rejection
 
 If ANY step fails → deterministic rejection. No partial state.
 
+On PostgreSQL, steps 2-4 collapse into two statements inside one
+transaction: lock the chain head row (choosing the chain from the
+locked rows), then one INSERT ... ON CONFLICT (event_id) DO NOTHING
+RETURNING that also advances the head. Duplicates and chain
+conflicts are detected by the database and mapped to the same
+rejection codes (DUPLICATE_EVENT_ID, HASH_CHAIN_BROKEN). When the event
+table is hash-partitioned on business_id, the same statement claims
+the event_id in the event_id registry, which keeps it unique across
+businesses (every other path claims it in the same transaction).
+
+In BRANCH chain mode (see persistence.branch_chains) an event with a
+branch_id is linked into its branch sub-chain and locks only that
+sub-chain's head; business-wide events stay on the business chain.
+
+Server-linked appends (both hash fields left unset by the caller) are
+re-linked and retried when a concurrent writer moved the chain head
+first, within an AppendRetryPolicy. Only the non-PostgreSQL path links
+before taking the head lock and so really meets such conflicts; the
+fast path links under the lock (see persistence.retry). Appends with
+client-supplied hashes are never retried.
+
+Delivery to subscribers is chosen per call, one way or the other:
+    - subscriber_registry: in-process dispatch right after commit
+    - use_outbox=True: the event is queued in the transactional outbox
+      (EventOutbox) in the same transaction, for at-least-once
+      background delivery by the outbox drain (persistence.outbox)
+Passing both raises ValueError, so no event is delivered both ways.
+With neither, nothing is dispatched and nothing is queued.
+
 This service does NOT:
 - Dispatch before commit (dispatch is AFTER commit via on_commit)
 - Touch projections
 - Interpret payload meaning
 - Auto-generate missing non-hash fields
-- Retry on failure
+- Retry anything except server-linked chain conflicts
 - Swallow errors silently
 """
 
 from __future__ import annotations
 
+import functools
 import logging
+import time
 import uuid
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 from django.db import IntegrityError, transaction
 
 from core.context.scope import SCOPE_BUSINESS_ALLOWED
 from core.event_store.idempotency.guard import (
     check_idempotency,
+    check_idempotency_batch,
+    duplicate_event_rejection,
     handle_integrity_error,
 )
+from core.event_store.idempotency.errors import (
+    IdempotencyRejectionCode,
+    IdempotencyViolatedRule,
+)
 from core.event_store.hashing.errors import (
     HashRejectionCode,
     HashViolatedRule,
 )
-from core.event_store.hashing.hasher import GENESIS_HASH, compute_event_hash
+from core.event_store.hashing.hasher import (
+    DEFAULT_HASH_VERSION,
+    canonical_serialize,
+    compute_event_hash_from_canonical,
+)
+from core.event_store.models import ChainMode, EventBranchChainHead
+from core.event_store.partitioning import parent_index_name
+from core.event_store.persistence.branch_chains import anchor_after_commit
 from core.event_store.persistence.errors import (
     PersistenceRejectionCode,
     PersistenceViolatedRule,
 )
+from core.event_store.persistence.merkle_checkpoints import (
+    MERKLE_SEGMENT_SIZE,
+    checkpoint_after_commit,
+)
+from core.event_store.persistence.metrics import append_retry_metrics
 from core.event_store.persistence.repository import (
-    get_latest_event_for_business,
+    advance_chain_head,
+    claim_event_ids,
+    enqueue_outbox,
+    find_existing_event_ids,
+    genesis_hash_for,
+    get_chain_head,
+    insert_event_advancing_head,
+    lock_append_chain_head,
+    lock_chain_head,
     save_event,
+    save_events,
+    supports_fast_append,
+)
+from core.event_store.persistence.retry import (
+    DEFAULT_APPEND_RETRY_POLICY,
+    AppendRetryPolicy,
 )
 from core.event_store.validators.context import BusinessContextProtocol
 from core.event_store.validators.errors import Rejection, ValidationResult
@@ -95,30 +162,119 @@ def _build_hash_mismatch_rejection(
     )
 
 
-def _expected_previous_hash(
+def _resolve_chain_target(
+    business_id: uuid.UUID,
+    branch_id: Optional[uuid.UUID],
+) -> tuple[Optional[uuid.UUID], Optional[int]]:
+    """
+    Pick the chain an event is linked into.
+
+    Returns (chain_branch_id, anchor_interval): chain_branch_id is the
+    branch sub-chain in BRANCH mode, None for the business chain.
+    Business-wide events never need the lookup.
+    """
+    if branch_id is None:
+        return None, None
+    business_head = get_chain_head(business_id)
+    if business_head is None or business_head.chain_mode != ChainMode.BRANCH:
+        return None, None
+    return branch_id, business_head.anchor_interval
+
+
+def _schedule_auto_anchor(
+    chain_head: Any,
     *,
+    appended: int,
+    anchor_interval: Optional[int],
+) -> None:
+    """
+    After commit: checkpoint the Merkle segment an append completed, and
+    anchor branch heads when a sub-chain crosses N appends.
+    """
+    is_branch_chain = isinstance(chain_head, EventBranchChainHead)
+    before = (chain_head.sequence - appended) // MERKLE_SEGMENT_SIZE
+    if chain_head.sequence // MERKLE_SEGMENT_SIZE != before:
+        transaction.on_commit(
+            functools.partial(
+                checkpoint_after_commit,
+                chain_head.business_id,
+                chain_head.branch_id if is_branch_chain else None,
+            )
+        )
+
+    if not anchor_interval or not is_branch_chain:
+        return
+    before = (chain_head.sequence - appended) // anchor_interval
+    if chain_head.sequence // anchor_interval != before:
+        transaction.on_commit(
+            functools.partial(anchor_after_commit, chain_head.business_id)
+        )
+
+
+def _expected_chain_link(
     business_id: uuid.UUID,
-    lock_latest: bool,
-) -> str:
-    latest = get_latest_event_for_business(
-        business_id,
-        lock=lock_latest,
+    chain_branch_id: Optional[uuid.UUID] = None,
+) -> tuple[str, int]:
+    """
+    Unlocked read of the chain head (fast pre-check outside the
+    transaction): (head hash, hash_version). The authoritative check
+    runs under lock_chain_head().
+    """
+    chain_head = get_chain_head(business_id, chain_branch_id)
+    if chain_head is not None:
+        return chain_head.head_hash, chain_head.hash_version
+
+    # A new branch sub-chain inherits the business chain's version.
+    business_head = (
+        get_chain_head(business_id) if chain_branch_id is not None else None
+    )
+    return genesis_hash_for(chain_branch_id), (
+        business_head.hash_version
+        if business_head is not None
+        else DEFAULT_HASH_VERSION
     )
-    if latest is None:
-        return GENESIS_HASH
-    return latest.event_hash
 
 
 def _resolve_and_validate_hash_fields(
     event_data: dict[str, Any],
-    *,
-    lock_latest: bool,
 ) -> ValidationResult | None:
-    expected_previous_hash = _expected_previous_hash(
-        business_id=event_data["business_id"],
-        lock_latest=lock_latest,
+    expected_previous_hash, hash_version = _expected_chain_link(
+        event_data["business_id"],
+        event_data.get("chain_branch_id"),
     )
+    return _link_hash_fields(
+        event_data,
+        expected_previous_hash=expected_previous_hash,
+        hash_version=hash_version,
+    )
+
+
+def _store_canonical_payload(event_data: dict[str, Any]) -> None:
+    """
+    Serialize the payload once per append.
+
+    Every hash pass of the append (pre-check, locked re-check, rebased
+    retries) hashes this text, and it is persisted as
+    Event.payload_canonical for verification. Always recomputed, never
+    taken from the caller.
+    """
+    event_data["payload_canonical"] = canonical_serialize(event_data["payload"])
+
+
+def _link_hash_fields(
+    event_data: dict[str, Any],
+    *,
+    expected_previous_hash: str,
+    hash_version: int,
+) -> ValidationResult | None:
+    """
+    Link one event onto a known chain head.
 
+    Missing hash fields are filled in; provided ones must match.
+    The event is hashed with (and records) the chain's hash_version.
+    Requires event_data["payload_canonical"] (_store_canonical_payload).
+    """
+    event_data["hash_version"] = hash_version
     provided_previous_hash = event_data.get("previous_event_hash")
     if provided_previous_hash is None:
         event_data["previous_event_hash"] = expected_previous_hash
@@ -128,9 +284,10 @@ def _resolve_and_validate_hash_fields(
             expected_previous_hash=expected_previous_hash,
         )
 
-    expected_event_hash = compute_event_hash(
-        event_data["payload"],
+    expected_event_hash = compute_event_hash_from_canonical(
+        event_data["payload_canonical"],
         event_data["previous_event_hash"],
+        hash_version,
     )
 
     provided_event_hash = event_data.get("event_hash")
@@ -146,11 +303,16 @@ def _resolve_and_validate_hash_fields(
 
 
 def _extract_constraint_name(exc: IntegrityError) -> str | None:
+    """
+    Violated constraint, by its model name: a violation on a partition
+    of the event table names the partition's own index, which is mapped
+    back to the parent index (see partitioning.parent_index_name).
+    """
     cause = getattr(exc, "__cause__", None)
     diag = getattr(cause, "diag", None)
     constraint_name = getattr(diag, "constraint_name", None)
     if isinstance(constraint_name, str) and constraint_name:
-        return constraint_name
+        return parent_index_name(constraint_name)
     return None
 
 
@@ -177,12 +339,26 @@ def _build_chain_conflict_rejection(event_data: dict[str, Any]) -> ValidationRes
     )
 
 
+def _check_delivery(
+    subscriber_registry: Optional["SubscriberRegistry"],
+    use_outbox: bool,
+) -> None:
+    """One delivery path per call: in-process dispatch or the outbox."""
+    if subscriber_registry is not None and use_outbox:
+        raise ValueError(
+            "Pass either subscriber_registry (in-process dispatch) or "
+            "use_outbox=True (background delivery), not both."
+        )
+
+
 def persist_event(
     event_data: dict[str, Any],
     context: BusinessContextProtocol,
     registry: EventTypeRegistry,
     subscriber_registry: Optional["SubscriberRegistry"] = None,
     scope_requirement: str = SCOPE_BUSINESS_ALLOWED,
+    retry_policy: Optional[AppendRetryPolicy] = None,
+    use_outbox: bool = False,
 ) -> ValidationResult:
     """
     The ONE lawful entry point for persisting events into BOS.
@@ -193,6 +369,7 @@ def persist_event(
         3. Hash-chain verification
         4. Atomic database save with race-condition safety
         5. Dispatch to subscribers AFTER commit (if registry provided)
+           or queue in the outbox with the event (if use_outbox)
         6. Deterministic result (accepted or rejected)
 
     Args:
@@ -202,6 +379,14 @@ def persist_event(
         subscriber_registry:  Optional subscriber registry for dispatch.
         scope_requirement:    Command-owned scope requirement used for
                               branch scope enforcement.
+        retry_policy:         Attempt cap and backoff for server-linked
+                              chain conflicts (default:
+                              DEFAULT_APPEND_RETRY_POLICY).
+        use_outbox:           Queue the event for background delivery
+                              instead of dispatching it in-process.
+
+    Raises:
+        ValueError: subscriber_registry and use_outbox both given.
 
     Returns:
         ValidationResult — accepted=True with advisory_actor flag,
@@ -209,8 +394,9 @@ def persist_event(
 
     This function NEVER:
     - Partially writes
-    - Silently retries
-    - Auto-corrects hashes
+    - Retries appends with client-supplied hashes
+    - Retries uncounted (see persistence.metrics)
+    - Auto-corrects client-supplied hashes
     - Swallows exceptions
     - Dispatches before commit
     - Persists during replay mode
@@ -224,6 +410,7 @@ def persist_event(
         raise ReplayIsolationError(
             "Persistence forbidden during replay mode."
         )
+    _check_delivery(subscriber_registry, use_outbox)
 
     # ── Step 1: Validate event structure ──────────────────────
     validation_result = validate_event(
@@ -235,16 +422,87 @@ def persist_event(
     if not validation_result.accepted:
         return validation_result
 
+    _store_canonical_payload(event_data)
+
+    server_linked = (
+        event_data.get("previous_event_hash") is None
+        and event_data.get("event_hash") is None
+    )
+    policy = retry_policy or DEFAULT_APPEND_RETRY_POLICY
+    attempt = 1
+    while True:
+        attempt_started = time.monotonic()
+        result = _persist_validated_event(
+            event_data,
+            advisory_actor=validation_result.advisory_actor,
+            subscriber_registry=subscriber_registry,
+            use_outbox=use_outbox,
+        )
+        if result.accepted:
+            if attempt > 1:
+                append_retry_metrics.record_retried_accepted()
+            return result
+        if not (server_linked and _is_rebasable_conflict(result)):
+            return result
+        if attempt >= policy.max_attempts:
+            append_retry_metrics.record_exhausted()
+            return result
+
+        # ── Rebase: drop the stale link, back off, link again ──
+        event_data["previous_event_hash"] = None
+        event_data["event_hash"] = None
+        event_data.pop("stream_seq", None)
+        delay = policy.delay_for(attempt)
+        if delay:
+            time.sleep(delay)
+        append_retry_metrics.record_retry(time.monotonic() - attempt_started)
+        attempt += 1
+
+
+def _is_rebasable_conflict(result: ValidationResult) -> bool:
+    """
+    A server-linked append was linked against a stale chain head: the
+    head moved (HASH_CHAIN_BROKEN) or the chain switched hash_version
+    (HASH_COMPUTATION_MISMATCH) between the pre-check and the lock.
+    """
+    return result.rejection is not None and result.rejection.code in (
+        HashRejectionCode.HASH_CHAIN_BROKEN,
+        HashRejectionCode.HASH_COMPUTATION_MISMATCH,
+    )
+
+
+def _persist_validated_event(
+    event_data: dict[str, Any],
+    *,
+    advisory_actor: bool,
+    subscriber_registry: Optional["SubscriberRegistry"],
+    use_outbox: bool = False,
+) -> ValidationResult:
+    """
+    Steps 2-6 of persist_event() for one validated event (one attempt).
+    Sets event_data["chain_branch_id"] to the chain it is linked into.
+    """
+    if supports_fast_append():
+        return _persist_event_fast(
+            event_data,
+            advisory_actor=advisory_actor,
+            subscriber_registry=subscriber_registry,
+            use_outbox=use_outbox,
+        )
+
+    chain_branch_id, anchor_interval = _resolve_chain_target(
+        event_data["business_id"],
+        event_data.get("branch_id"),
+    )
+    event_data["chain_branch_id"] = chain_branch_id
+
     # ── Step 2: Idempotency check (application level) ─────────
     idempotency_result = check_idempotency(event_data["event_id"])
     if not idempotency_result.accepted:
         return idempotency_result
 
     # ── Step 3: Hash-chain verification ───────────────────────
-    hash_resolution = _resolve_and_validate_hash_fields(
-        event_data,
-        lock_latest=False,
-    )
+    hash_resolution = _resolve_and_validate_hash_fields(event_data)
     if hash_resolution is not None:
         return hash_resolution
 
@@ -256,14 +514,33 @@ def persist_event(
             if not idempotency_recheck.accepted:
                 return idempotency_recheck
 
-            hash_recheck = _resolve_and_validate_hash_fields(
+            chain_head = lock_chain_head(
+                event_data["business_id"],
+                event_data["chain_branch_id"],
+            )
+            hash_recheck = _link_hash_fields(
                 event_data,
-                lock_latest=True,
+                expected_previous_hash=chain_head.head_hash,
+                hash_version=chain_head.hash_version,
             )
             if hash_recheck is not None:
                 return hash_recheck
 
+            event_data["stream_seq"] = chain_head.sequence + 1
             persisted_event = save_event(event_data)
+            claim_event_ids([persisted_event])
+            if use_outbox:
+                enqueue_outbox([persisted_event])
+            advance_chain_head(
+                chain_head,
+                head_event_id=persisted_event.event_id,
+                head_hash=persisted_event.event_hash,
+            )
+            _schedule_auto_anchor(
+                chain_head,
+                appended=1,
+                anchor_interval=anchor_interval,
+            )
 
             # ── Step 5: Schedule dispatch AFTER commit ────────
             if subscriber_registry is not None:
@@ -291,10 +568,516 @@ def persist_event(
     # ── Step 6: Success ───────────────────────────────────────
     return ValidationResult(
         accepted=True,
-        advisory_actor=validation_result.advisory_actor,
+        advisory_actor=advisory_actor,
+    )
+
+
+def _persist_event_fast(
+    event_data: dict[str, Any],
+    *,
+    advisory_actor: bool,
+    subscriber_registry: Optional["SubscriberRegistry"],
+    use_outbox: bool = False,
+) -> ValidationResult:
+    """
+    PostgreSQL write path for an already validated event: two
+    statements in one transaction.
+
+        1. lock_append_chain_head() picks the chain (business chain or
+           branch sub-chain) from the rows it locks: no separate mode
+           lookup
+        2. insert_event_advancing_head(): INSERT ... ON CONFLICT
+           (event_id) DO NOTHING RETURNING, which also advances the head
+
+    No pre-check SELECTs: the database enforces idempotency (the
+    event_id key, or the event_id registry on a partitioned table), so
+    an empty RETURNING means exactly DUPLICATE_EVENT_ID. Chain
+    uniqueness conflicts raise and become HASH_CHAIN_BROKEN. Idempotency
+    is only queried when linking or inserting fails otherwise, so a
+    re-sent event is still reported as DUPLICATE_EVENT_ID rather than
+    as a chain mismatch.
+    """
+    event_id = event_data["event_id"]
+    try:
+        with transaction.atomic():
+            chain_head, anchor_interval = lock_append_chain_head(
+                event_data["business_id"],
+                event_data.get("branch_id"),
+            )
+            event_data["chain_branch_id"] = (
+                chain_head.branch_id
+                if isinstance(chain_head, EventBranchChainHead)
+                else None
+            )
+            link_rejection = _link_hash_fields(
+                event_data,
+                expected_previous_hash=chain_head.head_hash,
+                hash_version=chain_head.hash_version,
+            )
+            if link_rejection is not None:
+                idempotency_result = check_idempotency(event_id)
+                if not idempotency_result.accepted:
+                    return idempotency_result
+                return link_rejection
+
+            event_data["stream_seq"] = chain_head.sequence + 1
+            persisted_event = insert_event_advancing_head(
+                event_data,
+                chain_head,
+                queue_outbox=use_outbox,
+            )
+            if persisted_event is None:
+                return duplicate_event_rejection(event_id)
+            _schedule_auto_anchor(
+                chain_head,
+                appended=1,
+                anchor_interval=anchor_interval,
+            )
+
+            if subscriber_registry is not None:
+                transaction.on_commit(
+                    lambda: _dispatch_after_commit(
+                        persisted_event, subscriber_registry
+                    )
+                )
+
+    except IntegrityError as exc:
+        if _is_chain_uniqueness_conflict(exc):
+            return _build_chain_conflict_rejection(event_data)
+        # Only map the error to a duplicate if the event_id really is
+        # taken; any other constraint keeps its own message.
+        if not check_idempotency(event_id).accepted:
+            return duplicate_event_rejection(event_id)
+        return _build_transaction_aborted_rejection(exc)
+
+    except Exception as exc:
+        return _build_transaction_aborted_rejection(exc)
+
+    return ValidationResult(
+        accepted=True,
+        advisory_actor=advisory_actor,
+    )
+
+
+def _build_transaction_aborted_rejection(exc: Exception) -> ValidationResult:
+    return ValidationResult(
+        accepted=False,
+        rejection=Rejection(
+            code=PersistenceRejectionCode.TRANSACTION_ABORTED,
+            message=f"Transaction aborted: {str(exc)}",
+            violated_rule=PersistenceViolatedRule.ATOMIC_PERSISTENCE,
+        ),
+    )
+
+
+def _build_invalid_batch_rejection(message: str) -> ValidationResult:
+    return ValidationResult(
+        accepted=False,
+        rejection=Rejection(
+            code=PersistenceRejectionCode.INVALID_BATCH,
+            message=message,
+            violated_rule=PersistenceViolatedRule.ATOMIC_BATCH,
+        ),
     )
 
 
+def _validate_batch_shape(
+    events: Sequence[dict[str, Any]],
+) -> ValidationResult | None:
+    """
+    Batch-level rules on top of per-event validation:
+    - one business per batch
+    - no event_id repeated inside the batch
+    - one chain per batch (BRANCH mode: one branch, or business-wide
+      only), so a batch locks exactly one chain head
+
+    Batch order is chain order: events receive consecutive stream_seq
+    values in the order given.
+    """
+    business_ids = {event_data["business_id"] for event_data in events}
+    if len(business_ids) != 1:
+        return _build_invalid_batch_rejection(
+            "All events in a batch must belong to one business. "
+            f"Got {len(business_ids)} business_ids."
+        )
+
+    seen_event_ids: set = set()
+    for event_data in events:
+        event_id = event_data["event_id"]
+        if event_id in seen_event_ids:
+            return ValidationResult(
+                accepted=False,
+                rejection=Rejection(
+                    code=IdempotencyRejectionCode.DUPLICATE_EVENT_ID,
+                    message=(
+                        f"Event with ID {event_id} appears more than "
+                        "once in the batch."
+                    ),
+                    violated_rule=IdempotencyViolatedRule.EVENT_IDEMPOTENCY,
+                ),
+            )
+        seen_event_ids.add(event_id)
+
+    return None
+
+
+def persist_events_batch(
+    events: Sequence[dict[str, Any]],
+    context: BusinessContextProtocol,
+    registry: EventTypeRegistry,
+    subscriber_registry: Optional["SubscriberRegistry"] = None,
+    scope_requirement: str = SCOPE_BUSINESS_ALLOWED,
+    use_outbox: bool = False,
+) -> ValidationResult:
+    """
+    Persist several events of ONE business atomically.
+
+    Same law as persist_event(), applied to a whole batch:
+        1. Every event validated (schema, actor, context, type, ...)
+        2. Idempotency checked for all event_ids in one query
+        3. Chain head row locked ONCE, events linked in memory
+        4. One bulk INSERT inside one transaction
+        5. Dispatch each event to subscribers AFTER commit (or queue
+           every event in the outbox, if use_outbox)
+        6. Deterministic result
+
+    All-or-nothing: if any event is rejected, nothing is written and
+    the first rejection is returned.
+
+    Args:
+        events:               Event data dicts, in the chain order they
+                              should receive (stream_seq order).
+        context:              Active business context (dependency injection).
+        registry:             Event type registry (dependency injection).
+        subscriber_registry:  Optional subscriber registry for dispatch.
+        scope_requirement:    Command-owned scope requirement used for
+                              branch scope enforcement.
+        use_outbox:           Queue the events for background delivery
+                              instead of dispatching them in-process.
+
+    Returns:
+        ValidationResult — accepted=True (advisory_actor set if any
+        event has an AI actor), or accepted=False with explicit Rejection.
+
+    Caller dicts are not mutated; hash fields are linked on copies.
+    """
+
+    # ── Step 0: Replay isolation guard (HARD BLOCK) ─────────
+    from core.replay.context import is_replay_active
+    from core.replay.errors import ReplayIsolationError
+
+    if is_replay_active():
+        raise ReplayIsolationError(
+            "Persistence forbidden during replay mode."
+        )
+    _check_delivery(subscriber_registry, use_outbox)
+
+    if not events:
+        return _build_invalid_batch_rejection(
+            "Batch must contain at least one event."
+        )
+
+    # ── Step 1: Validate every event ──────────────────────────
+    advisory_actor = False
+    for event_data in events:
+        validation_result = validate_event(
+            event_data=event_data,
+            context=context,
+            registry=registry,
+            scope_requirement=scope_requirement,
+        )
+        if not validation_result.accepted:
+            return validation_result
+        advisory_actor = advisory_actor or validation_result.advisory_actor
+
+    batch_rejection = _validate_batch_shape(events)
+    if batch_rejection is not None:
+        return batch_rejection
+
+    linked_events = [dict(event_data) for event_data in events]
+    for event_data in linked_events:
+        _store_canonical_payload(event_data)
+    business_id = linked_events[0]["business_id"]
+    event_ids = [event_data["event_id"] for event_data in linked_events]
+
+    chain_targets = {
+        _resolve_chain_target(business_id, branch_id)
+        for branch_id in {
+            event_data.get("branch_id") for event_data in linked_events
+        }
+    }
+    if len(chain_targets) != 1:
+        return _build_invalid_batch_rejection(
+            "In BRANCH chain mode all events in a batch must belong to "
+            "one branch (or all be business-wide)."
+        )
+    chain_branch_id, anchor_interval = chain_targets.pop()
+    for event_data in linked_events:
+        event_data["chain_branch_id"] = chain_branch_id
+
+    # ── Step 2: Idempotency check (one query) ─────────────────
+    idempotency_result = check_idempotency_batch(event_ids)
+    if not idempotency_result.accepted:
+        return idempotency_result
+
+    # ── Step 3 + 4: Link once, save once, atomically ──────────
+    try:
+        with transaction.atomic():
+            idempotency_recheck = check_idempotency_batch(event_ids)
+            if not idempotency_recheck.accepted:
+                return idempotency_recheck
+
+            chain_head = lock_chain_head(business_id, chain_branch_id)
+            expected_previous_hash = chain_head.head_hash
+            for position, event_data in enumerate(linked_events, start=1):
+                link_rejection = _link_hash_fields(
+                    event_data,
+                    expected_previous_hash=expected_previous_hash,
+                    hash_version=chain_head.hash_version,
+                )
+                if link_rejection is not None:
+                    return link_rejection
+                event_data["stream_seq"] = chain_head.sequence + position
+                expected_previous_hash = event_data["event_hash"]
+
+            persisted_events = save_events(linked_events)
+            claim_event_ids(persisted_events)
+            if use_outbox:
+                enqueue_outbox(persisted_events)
+            advance_chain_head(
+                chain_head,
+                head_event_id=linked_events[-1]["event_id"],
+                head_hash=linked_events[-1]["event_hash"],
+                appended=len(linked_events),
+            )
+            _schedule_auto_anchor(
+                chain_head,
+                appended=len(linked_events),
+                anchor_interval=anchor_interval,
+            )
+
+            # ── Step 5: Schedule dispatch AFTER commit ────────
+            if subscriber_registry is not None:
+                transaction.on_commit(
+                    lambda: _dispatch_batch_after_commit(
+                        persisted_events, subscriber_registry
+                    )
+                )
+
+    except IntegrityError as exc:
+        if _is_chain_uniqueness_conflict(exc):
+            return _build_chain_conflict_rejection(linked_events[0])
+        duplicate_result = check_idempotency_batch(event_ids)
+        if not duplicate_result.accepted:
+            return duplicate_result
+        return handle_integrity_error(event_ids[0], exc)
+
+    except Exception as exc:
+        return ValidationResult(
+            accepted=False,
+            rejection=Rejection(
+                code=PersistenceRejectionCode.TRANSACTION_ABORTED,
+                message=f"Transaction aborted: {str(exc)}",
+                violated_rule=PersistenceViolatedRule.ATOMIC_PERSISTENCE,
+            ),
+        )
+
+    # ── Step 6: Success ───────────────────────────────────────
+    return ValidationResult(
+        accepted=True,
+        advisory_actor=advisory_actor,
+    )
+
+
+def _persist_event_group(pending_appends: Sequence[Any]) -> list[ValidationResult]:
+    """
+    Persist independent appends of ONE business in one transaction.
+
+    Used by GroupCommitCoordinator. Unlike persist_events_batch, every
+    append is judged on its own: a rejected append gets its own
+    rejection and the others are still written. Accepted appends are
+    linked in arrival order under one chain head lock and written with
+    one bulk INSERT.
+
+    Each item carries the persist_event() arguments as attributes:
+    event_data, context, registry, subscriber_registry,
+    scope_requirement, use_outbox. All items share business_id. The
+    chain is chosen under lock from the first item; items whose chain
+    turns out to differ (another branch sub-chain in BRANCH mode) are
+    left out of the group and resolved through persist_event() after
+    the commit.
+
+    If the group write hits a database conflict (e.g. the same event_id
+    written concurrently from another process), every append is
+    resolved individually through persist_event() so each caller still
+    gets an exact result.
+
+    Returns one ValidationResult per item, in the same order.
+    """
+    results: list[Optional[ValidationResult]] = [None] * len(pending_appends)
+    candidates: list[tuple[int, Any, bool]] = []
+    seen_event_ids: set = set()
+
+    # ── Step 1: Validate each append on its own ───────────────
+    for index, pending in enumerate(pending_appends):
+        validation_result = validate_event(
+            event_data=pending.event_data,
+            context=pending.context,
+            registry=pending.registry,
+            scope_requirement=pending.scope_requirement,
+        )
+        if not validation_result.accepted:
+            results[index] = validation_result
+            continue
+
+        event_id = pending.event_data["event_id"]
+        if event_id in seen_event_ids:
+            results[index] = duplicate_event_rejection(event_id)
+            continue
+        seen_event_ids.add(event_id)
+        _store_canonical_payload(pending.event_data)
+        candidates.append((index, pending, validation_result.advisory_actor))
+
+    if not candidates:
+        return results
+
+    # ── Step 2: Idempotency (one query for the group) ─────────
+    existing_event_ids = find_existing_event_ids(
+        [pending.event_data["event_id"] for _, pending, _ in candidates]
+    )
+    if existing_event_ids:
+        remaining = []
+        for index, pending, advisory_actor in candidates:
+            event_id = pending.event_data["event_id"]
+            if event_id in existing_event_ids:
+                results[index] = check_idempotency(event_id)
+            else:
+                remaining.append((index, pending, advisory_actor))
+        candidates = remaining
+        if not candidates:
+            return results
+
+    business_id = candidates[0][1].event_data["business_id"]
+    linked: list[tuple[int, Any, bool, dict[str, Any]]] = []
+    deferred: list[tuple[int, Any]] = []
+
+    # ── Step 3 + 4: Link in arrival order, save once ──────────
+    try:
+        with transaction.atomic():
+            chain_head, anchor_interval = lock_append_chain_head(
+                business_id,
+                candidates[0][1].event_data.get("branch_id"),
+            )
+            if isinstance(chain_head, EventBranchChainHead):
+                chain_branch_id = chain_head.branch_id
+                branch_mode = True
+            else:
+                chain_branch_id = None
+                branch_mode = chain_head.chain_mode == ChainMode.BRANCH
+            expected_previous_hash = chain_head.head_hash
+            for index, pending, advisory_actor in candidates:
+                branch_id = pending.event_data.get("branch_id")
+                if (branch_id if branch_mode else None) != chain_branch_id:
+                    deferred.append((index, pending))
+                    continue
+                event_data = dict(pending.event_data)
+                event_data["chain_branch_id"] = chain_branch_id
+                link_rejection = _link_hash_fields(
+                    event_data,
+                    expected_previous_hash=expected_previous_hash,
+                    hash_version=chain_head.hash_version,
+                )
+                if link_rejection is not None:
+                    results[index] = link_rejection
+                    continue
+                event_data["stream_seq"] = chain_head.sequence + len(linked) + 1
+                expected_previous_hash = event_data["event_hash"]
+                linked.append((index, pending, advisory_actor, event_data))
+
+            if linked:
+                persisted_events = save_events(
+                    [event_data for _, _, _, event_data in linked]
+                )
+                claim_event_ids(persisted_events)
+                enqueue_outbox([
+                    persisted_event
+                    for (_, pending, _, _), persisted_event in zip(
+                        linked,
+                        persisted_events,
+                    )
+                    if pending.use_outbox
+                ])
+                advance_chain_head(
+                    chain_head,
+                    head_event_id=linked[-1][3]["event_id"],
+                    head_hash=linked[-1][3]["event_hash"],
+                    appended=len(linked),
+                )
+                _schedule_auto_anchor(
+                    chain_head,
+                    appended=len(linked),
+                    anchor_interval=anchor_interval,
+                )
+
+                # ── Step 5: Schedule dispatch AFTER commit ────
+                for (_, pending, _, _), persisted_event in zip(
+                    linked,
+                    persisted_events,
+                ):
+                    if pending.subscriber_registry is not None:
+                        transaction.on_commit(
+                            functools.partial(
+                                _dispatch_after_commit,
+                                persisted_event,
+                                pending.subscriber_registry,
+                            )
+                        )
+
+    except IntegrityError:
+        for index, pending, _ in candidates:
+            results[index] = persist_event(
+                event_data=pending.event_data,
+                context=pending.context,
+                registry=pending.registry,
+                subscriber_registry=pending.subscriber_registry,
+                scope_requirement=pending.scope_requirement,
+                use_outbox=pending.use_outbox,
+            )
+        return results
+
+    except Exception as exc:
+        aborted = ValidationResult(
+            accepted=False,
+            rejection=Rejection(
+                code=PersistenceRejectionCode.TRANSACTION_ABORTED,
+                message=f"Transaction aborted: {str(exc)}",
+                violated_rule=PersistenceViolatedRule.ATOMIC_PERSISTENCE,
+            ),
+        )
+        for index, _, _ in candidates:
+            results[index] = aborted
+        return results
+
+    # ── Step 6: Per-append success ────────────────────────────
+    for index, _, advisory_actor, _ in linked:
+        results[index] = ValidationResult(
+            accepted=True,
+            advisory_actor=advisory_actor,
+        )
+
+    # ── Step 7: Appends of another chain, one by one ──────────
+    for index, pending in deferred:
+        results[index] = persist_event(
+            event_data=pending.event_data,
+            context=pending.context,
+            registry=pending.registry,
+            subscriber_registry=pending.subscriber_registry,
+            scope_requirement=pending.scope_requirement,
+            use_outbox=pending.use_outbox,
+        )
+    return results
+
+
 logger = logging.getLogger("bos.events")
 
 
@@ -315,3 +1098,12 @@ def _dispatch_after_commit(event, subscriber_registry) -> None:
             f"{event.event_id}: {exc}",
             exc_info=True,
         )
+
+
+def _dispatch_batch_after_commit(events, subscriber_registry) -> None:
+    """
+    Dispatch a committed batch in chain order.
+    Each event is isolated exactly like a single post-commit dispatch.
+    """
+    for event in events:
+        _dispatch_after_commit(event, subscriber_registry)
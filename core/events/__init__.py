@@ -5,7 +5,7 @@ Event Store seals truth. Event Bus distributes truth.
 Truth must exist before it is heard.
 """
 
-from core.events.dispatcher import dispatch
+from core.events.dispatcher import dispatch, dispatch_batch
 from core.events.errors import (
     DuplicateSubscriberError,
     EventBusError,
@@ -16,6 +16,7 @@ from core.events.registry import SubscriberRegistry
 
 __all__ = [
     "dispatch",
+    "dispatch_batch",
     "SubscriberRegistry",
     "EventBusError",
     "InvalidEventTypeFormat",
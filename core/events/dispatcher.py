@@ -11,6 +11,27 @@ Dispatch behavior:
 5. Continue to next subscriber
 6. NEVER rollback event persistence
 
+Batch dispatch (dispatch_batch) routes a list of events at once.
+Subscribers without a batch handler are served event by event, as
+dispatch() serves them. Then each subscriber that opted in with a
+batch handler receives its events of the list in one call, in list
+order; batch handlers are called in registration order. A batch
+handler applies all of its list or none of it: if the call raises,
+the failure is recorded against every event of the call and nothing
+is re-sent (a retry could apply events twice).
+
+Parallel mode (registry created with a dispatch_executor):
+dispatch() groups subscribers by subscriber engine into lanes and runs
+the lanes concurrently on the executor, waiting for all of them. Each
+lane calls its engine's handlers one after another in registration
+order, so an engine sees events in the order they are dispatched, and
+the result (counts, failures in registration order) is the one a
+sequential dispatch returns. A dispatch made from inside a handler
+runs sequentially, so lanes never wait on their own pool. A lane run
+on a pool thread closes that thread's stale DB connections before
+and after it (close_old_connections, so CONN_MAX_AGE applies; with the
+default of 0 a handler's connection is closed when its lane ends).
+
 Subscriber failure must NOT:
 - Break dispatch of other subscribers
 - Break the Event Store
@@ -27,12 +48,154 @@ It only routes. Truth must exist before it is heard.
 """
 
 import logging
-from typing import Any
+import threading
+from typing import Any, Callable, Optional, Sequence
+
+from django.db import close_old_connections
 
 from core.events.registry import SubscriberRegistry
 
 logger = logging.getLogger("bos.events")
 
+# Set while a thread runs a dispatch lane (nested dispatch = sequential)
+_lane_state = threading.local()
+
+
+def _new_result(event: Any) -> dict:
+    return {
+        "event_type": event.event_type,
+        "event_id": str(event.event_id),
+        "subscribers_notified": 0,
+        "subscribers_failed": 0,
+        "failures": [],
+    }
+
+
+def _record_failure(
+    result: dict,
+    handler_name: str,
+    subscriber_engine: str,
+    exc: Exception,
+) -> None:
+    result["subscribers_failed"] += 1
+    result["failures"].append({
+        "handler": handler_name,
+        "engine": subscriber_engine,
+        "error": str(exc),
+        "error_type": type(exc).__name__,
+    })
+    logger.error(
+        f"Subscriber failed: {handler_name} for "
+        f"{result['event_type']} (event_id: {result['event_id']}): {exc}",
+        exc_info=True,
+    )
+
+
+def _call_subscribers(
+    event: Any,
+    subscribers: Sequence[tuple[Callable, str]],
+) -> list[Optional[Exception]]:
+    """Call handlers in order; one outcome (None or the error) each."""
+    outcomes: list[Optional[Exception]] = []
+    for handler, _ in subscribers:
+        try:
+            handler(event)
+            outcomes.append(None)
+        except Exception as exc:
+            outcomes.append(exc)
+    return outcomes
+
+
+def _run_lane(
+    event: Any,
+    lane: Sequence[tuple[Callable, str]],
+) -> list[Optional[Exception]]:
+    previous = getattr(_lane_state, "active", False)
+    _lane_state.active = True
+    try:
+        return _call_subscribers(event, lane)
+    finally:
+        _lane_state.active = previous
+
+
+def _run_pooled_lane(
+    event: Any,
+    lane: Sequence[tuple[Callable, str]],
+) -> list[Optional[Exception]]:
+    """
+    _run_lane() on an executor thread. Pool threads outlive requests,
+    so nothing else would ever release the connections handlers open
+    there.
+    """
+    close_old_connections()
+    try:
+        return _run_lane(event, lane)
+    finally:
+        close_old_connections()
+
+
+def _call_engine_lanes(
+    event: Any,
+    subscribers: Sequence[tuple[Callable, str]],
+    executor: Any,
+) -> list[Optional[Exception]]:
+    """
+    Run each engine's handlers as one ordered lane, lanes concurrently.
+    Outcomes are returned in the order of subscribers.
+    """
+    lanes: dict[str, list[int]] = {}
+    for position, (_, subscriber_engine) in enumerate(subscribers):
+        lanes.setdefault(subscriber_engine, []).append(position)
+    if len(lanes) == 1:
+        return _run_lane(event, subscribers)
+
+    lane_positions = list(lanes.values())
+    # The calling thread runs the first lane itself instead of idling
+    futures = [
+        executor.submit(
+            _run_pooled_lane,
+            event,
+            [subscribers[position] for position in positions],
+        )
+        for positions in lane_positions[1:]
+    ]
+    lane_outcomes = [
+        _run_lane(event, [subscribers[position] for position in lane_positions[0]])
+    ]
+    lane_outcomes.extend(future.result() for future in futures)
+
+    outcomes: list[Optional[Exception]] = [None] * len(subscribers)
+    for positions, results in zip(lane_positions, lane_outcomes):
+        for position, outcome in zip(positions, results):
+            outcomes[position] = outcome
+    return outcomes
+
+
+def _deliver(
+    event: Any,
+    subscribers: Sequence[tuple[Callable, str]],
+    executor: Any,
+    result: dict,
+) -> None:
+    """Call the handlers of one event and fold the outcomes into result."""
+    if executor is not None and not getattr(_lane_state, "active", False):
+        outcomes = _call_engine_lanes(event, subscribers, executor)
+    else:
+        outcomes = _call_subscribers(event, subscribers)
+
+    for (handler, subscriber_engine), error in zip(subscribers, outcomes):
+        handler_name = getattr(handler, "__qualname__", str(handler))
+
+        if error is None:
+            result["subscribers_notified"] += 1
+            logger.debug(
+                f"Dispatched {result['event_type']} → {handler_name} "
+                f"(engine: {subscriber_engine})"
+            )
+        else:
+            _record_failure(result, handler_name, subscriber_engine, error)
+            # Continue to next subscriber — NEVER break dispatch
+
 
 def dispatch(event: Any, registry: SubscriberRegistry) -> dict:
     """
@@ -55,19 +218,12 @@ def dispatch(event: Any, registry: SubscriberRegistry) -> dict:
     This function NEVER raises exceptions.
     All handler failures are caught, logged, and reported.
     """
-    event_type = event.event_type
-    event_id = str(event.event_id)
+    result = _new_result(event)
+    event_type = result["event_type"]
+    event_id = result["event_id"]
 
     subscribers = registry.get_subscribers(event_type)
 
-    result = {
-        "event_type": event_type,
-        "event_id": event_id,
-        "subscribers_notified": 0,
-        "subscribers_failed": 0,
-        "failures": [],
-    }
-
     if not subscribers:
         logger.debug(
             f"No subscribers for event type '{event_type}' "
@@ -75,33 +231,7 @@ def dispatch(event: Any, registry: SubscriberRegistry) -> dict:
         )
         return result
 
-    for handler, subscriber_engine in subscribers:
-        handler_name = getattr(handler, "__qualname__", str(handler))
-
-        try:
-            handler(event)
-            result["subscribers_notified"] += 1
-            logger.debug(
-                f"Dispatched {event_type} → {handler_name} "
-                f"(engine: {subscriber_engine})"
-            )
-
-        except Exception as exc:
-            result["subscribers_failed"] += 1
-            failure_info = {
-                "handler": handler_name,
-                "engine": subscriber_engine,
-                "error": str(exc),
-                "error_type": type(exc).__name__,
-            }
-            result["failures"].append(failure_info)
-
-            logger.error(
-                f"Subscriber failed: {handler_name} for "
-                f"{event_type} (event_id: {event_id}): {exc}",
-                exc_info=True,
-            )
-            # Continue to next subscriber — NEVER break dispatch
+    _deliver(event, subscribers, registry.dispatch_executor, result)
 
     logger.info(
         f"Dispatch complete: {event_type} (event_id: {event_id}) — "
@@ -110,3 +240,77 @@ def dispatch(event: Any, registry: SubscriberRegistry) -> dict:
     )
 
     return result
+
+
+def dispatch_batch(events: Sequence[Any], registry: SubscriberRegistry) -> list[dict]:
+    """
+    Dispatch a list of persisted events, in order, to all subscribers.
+
+    Subscribers without a batch handler get one call per event, event
+    by event, as dispatch() makes them. Then each batch handler gets
+    one call with every event of the list it subscribes to. A failed
+    batch call counts as a failure of each of its events.
+
+    Args:
+        events:   Persisted Event model instances (read-only), in order.
+        registry: SubscriberRegistry with registered handlers.
+
+    Returns:
+        One dispatch result per event, in list order, shaped as
+        dispatch() returns it.
+
+    This function NEVER raises exceptions.
+    """
+    results = [_new_result(event) for event in events]
+    executor = registry.dispatch_executor
+    # event type -> (per-event subscribers, batch subscribers)
+    routes: dict[str, tuple[list, list]] = {}
+    # batch handler -> (order, handler, batch handler, engine, indexes
+    # into events); keyed by identity, one call per batch handler
+    batches: dict[int, tuple[int, Callable, Callable, str, list[int]]] = {}
+
+    for index, event in enumerate(events):
+        route = routes.get(event.event_type)
+        if route is None:
+            route = ([], [])
+            for subscriber in registry.get_batch_subscribers(event.event_type):
+                handler, batch_handler, subscriber_engine, _ = subscriber
+                if batch_handler is None:
+                    route[0].append((handler, subscriber_engine))
+                else:
+                    route[1].append(subscriber)
+            routes[event.event_type] = route
+        per_event, batch_subscribers = route
+
+        for handler, batch_handler, subscriber_engine, order in batch_subscribers:
+            batches.setdefault(
+                id(batch_handler),
+                (order, handler, batch_handler, subscriber_engine, []),
+            )[4].append(index)
+
+        if per_event:
+            _deliver(event, per_event, executor, results[index])
+
+    for _, handler, batch_handler, subscriber_engine, indexes in sorted(
+        batches.values(),
+        key=lambda batch: batch[0],
+    ):
+        handler_name = getattr(handler, "__qualname__", str(handler))
+        try:
+            batch_handler([events[index] for index in indexes])
+        except Exception as exc:
+            # All or none: the call applied none of its events
+            for index in indexes:
+                _record_failure(results[index], handler_name, subscriber_engine, exc)
+        else:
+            for index in indexes:
+                results[index]["subscribers_notified"] += 1
+
+    logger.info(
+        f"Batch dispatch complete: {len(events)} events — "
+        f"{sum(result['subscribers_notified'] for result in results)} "
+        f"notified, "
+        f"{sum(result['subscribers_failed'] for result in results)} failed"
+    )
+
+    return results
@@ -9,17 +9,39 @@ This registry controls which handlers LISTEN to dispatched events.
 
 Rules:
 - Event types must follow engine.domain.action format
+- A subscription may be a pattern instead of one event type (below)
 - Multiple subscribers per event type allowed
 - Duplicate handler for same event type forbidden
 - Self-subscription (engine listens to own events) blocked unless explicit
+- A subscriber may add a batch handler (events in bulk, used by replay)
+- An optional dispatch executor runs engines' handlers in parallel
+  (see dispatcher)
 - In-memory only (no DB, no files)
 - Thread-safe
 - No dynamic eval, no string-based imports
+
+Patterns:
+    A '*' segment matches any one segment; a '*' as the LAST segment
+    matches all remaining segments. 'retail.*' receives every retail
+    event, 'retail.sale.*' every sale event, '*.*.rejected' every
+    rejection. A pattern subscriber does not receive its own engine's
+    events unless registered with allow_self_subscription.
+
+Routing:
+    Patterns are kept in a segment trie. The subscribers of an event
+    type (exact ones and matching patterns, in registration order, each
+    handler once) are resolved on its first lookup and cached as
+    tuples. Lookups read the cache without taking the lock; a
+    registration replaces the cache, so routing is resolved once per
+    event type after bootstrap. get_subscribers() returns a new list
+    from the cached route, so callers may change it freely.
 """
 
+
 import logging
+from concurrent.futures import Executor
 from threading import Lock
-from typing import Callable
+from typing import Callable, NamedTuple, Optional
 
 from core.events.errors import (
     DuplicateSubscriberError,
@@ -31,26 +53,82 @@ from core.events.errors import (
 logger = logging.getLogger("bos.events")
 
 
+WILDCARD = "*"
+
+
+class _Subscription(NamedTuple):
+    order: int
+    handler: Callable
+    batch_handler: Optional[Callable]
+    subscriber_engine: str
+    allow_self_subscription: bool
+
+
+class _PatternNode:
+    """One segment of the pattern trie."""
+
+    __slots__ = ("children", "subscriptions", "rest_subscriptions")
+
+    def __init__(self):
+        self.children: dict[str, _PatternNode] = {}
+        # Patterns ending at this node
+        self.subscriptions: list[_Subscription] = []
+        # Patterns ending in '*' after this node (one or more segments)
+        self.rest_subscriptions: list[_Subscription] = []
+
+
+class _Route(NamedTuple):
+    subscribers: tuple[tuple[Callable, str], ...]
+    batch_subscribers: tuple[tuple[Callable, Optional[Callable], str, int], ...]
+
+
 class SubscriberRegistry:
     """
     In-memory registry of event subscribers.
 
-    Each entry maps an event_type to a list of
-    (handler, subscriber_engine) tuples.
+    Exact subscriptions map an event_type to a list of subscriptions;
+    patterns live in a segment trie. Both are resolved per event type
+    into a cached route of (handler, subscriber_engine) tuples, with
+    the batch handlers beside them.
     """
 
-    def __init__(self):
-        self._subscribers: dict[str, list[tuple[Callable, str]]] = {}
+    def __init__(self, dispatch_executor: Optional[Executor] = None):
+        """
+        Args:
+            dispatch_executor: Optional executor (e.g. a
+                               ThreadPoolExecutor) on which dispatch()
+                               runs different subscriber engines
+                               concurrently. Owned by the caller.
+        """
+        self._subscribers: dict[str, list[_Subscription]] = {}
+        self._patterns: dict[str, list[_Subscription]] = {}
+        self._pattern_trie = _PatternNode()
+        self._registrations: list[_Subscription] = []
+        # Read without the lock; replaced (never cleared) on registration
+        self._routes: dict[str, _Route] = {}
         self._lock = Lock()
+        self.dispatch_executor = dispatch_executor
 
     @staticmethod
     def _validate_event_type_format(event_type: str) -> None:
-        """Validate engine.domain.action format."""
+        """Validate engine.domain.action format (or a pattern of it)."""
         if not event_type or not isinstance(event_type, str):
             raise InvalidEventTypeFormat(event_type or "")
 
         parts = event_type.strip().split(".")
-        if len(parts) < 3:
+        if WILDCARD not in event_type:
+            if len(parts) < 3:
+                raise InvalidEventTypeFormat(event_type)
+            return
+
+        # Pattern: '*' only as a whole segment; a trailing '*' stands
+        # for the rest of the type, so 'engine.*' is long enough.
+        if any(
+            not part or (WILDCARD in part and part != WILDCARD)
+            for part in parts
+        ):
+            raise InvalidEventTypeFormat(event_type)
+        if len(parts) < 3 and not (len(parts) == 2 and parts[-1] == WILDCARD):
             raise InvalidEventTypeFormat(event_type)
 
     @staticmethod
@@ -58,21 +136,32 @@ class SubscriberRegistry:
         """Extract engine name from event_type (first segment)."""
         return event_type.split(".")[0]
 
+    @staticmethod
+    def is_pattern(event_type: str) -> bool:
+        """True if a subscription is a pattern, not one event type."""
+        return WILDCARD in event_type
+
     def register_subscriber(
         self,
         event_type: str,
         handler: Callable,
         subscriber_engine: str,
         allow_self_subscription: bool = False,
+        batch_handler: Optional[Callable] = None,
     ) -> None:
         """
-        Register a handler for an event type.
+        Register a handler for an event type or pattern.
 
         Args:
-            event_type:             e.g. 'inventory.stock.moved'
+            event_type:             e.g. 'inventory.stock.moved', or a
+                                    pattern such as 'inventory.*'
             handler:                Callable to invoke on dispatch
             subscriber_engine:      Engine registering this handler
             allow_self_subscription: Explicit override for engine isolation
+            batch_handler:          Optional callable taking a list of
+                                    events, used instead of handler by
+                                    batch dispatch (replay). It must
+                                    apply all of the list or none of it.
 
         Raises:
             InvalidEventTypeFormat:  Bad event type format
@@ -85,51 +174,188 @@ class SubscriberRegistry:
             raise EventBusError(
                 f"Handler must be callable, got {type(handler)}."
             )
+        if batch_handler is not None and not callable(batch_handler):
+            raise EventBusError(
+                f"Batch handler must be callable, got {type(batch_handler)}."
+            )
 
-        # Engine isolation check
+        # Engine isolation check ('*.x.y' patterns are filtered per
+        # event type when resolved)
         source_engine = self._extract_source_engine(event_type)
         if source_engine == subscriber_engine and not allow_self_subscription:
             raise SelfSubscriptionError(subscriber_engine, event_type)
 
         handler_name = getattr(handler, "__qualname__", str(handler))
+        pattern = self.is_pattern(event_type)
+        table = self._patterns if pattern else self._subscribers
 
         with self._lock:
-            if event_type not in self._subscribers:
-                self._subscribers[event_type] = []
-
             # Check for duplicate handler
-            for existing_handler, _ in self._subscribers[event_type]:
-                if existing_handler is handler:
+            for existing in table.get(event_type, []):
+                if existing.handler is handler:
                     raise DuplicateSubscriberError(event_type, handler_name)
 
-            self._subscribers[event_type].append(
-                (handler, subscriber_engine)
+            subscription = _Subscription(
+                order=len(self._registrations),
+                handler=handler,
+                batch_handler=batch_handler,
+                subscriber_engine=subscriber_engine,
+                allow_self_subscription=allow_self_subscription,
             )
+            table.setdefault(event_type, []).append(subscription)
+            if pattern:
+                self._insert_pattern(event_type, subscription)
+            self._registrations.append(subscription)
+            self._routes = {}
 
         logger.info(
             f"Subscriber registered: {handler_name} → {event_type} "
             f"(from engine: {subscriber_engine})"
         )
 
+    # ══════════════════════════════════════════════════════════
+    # ROUTING
+    # ══════════════════════════════════════════════════════════
+
+    def _insert_pattern(self, pattern: str, subscription: _Subscription) -> None:
+        """Add a pattern to the trie. Caller holds the lock."""
+        parts = pattern.split(".")
+        rest = parts[-1] == WILDCARD
+        node = self._pattern_trie
+        for part in parts[:-1] if rest else parts:
+            node = node.children.setdefault(part, _PatternNode())
+        if rest:
+            node.rest_subscriptions.append(subscription)
+        else:
+            node.subscriptions.append(subscription)
+
+    def _match_patterns(
+        self,
+        node: _PatternNode,
+        parts: list[str],
+        index: int,
+        found: list[_Subscription],
+    ) -> None:
+        if index < len(parts):
+            found.extend(node.rest_subscriptions)
+        else:
+            found.extend(node.subscriptions)
+            return
+        for key in (parts[index], WILDCARD):
+            child = node.children.get(key)
+            if child is not None:
+                self._match_patterns(child, parts, index + 1, found)
+
+    def _build_route(self, event_type: str) -> _Route:
+        """Resolve the subscribers of an event type. Caller holds the lock."""
+        matched: list[_Subscription] = []
+        if self._patterns:
+            self._match_patterns(
+                self._pattern_trie, event_type.split("."), 0, matched
+            )
+            source_engine = self._extract_source_engine(event_type)
+            matched = [
+                subscription
+                for subscription in matched
+                if subscription.allow_self_subscription
+                or subscription.subscriber_engine != source_engine
+            ]
+        matched.extend(self._subscribers.get(event_type, []))
+        matched.sort(key=lambda subscription: subscription.order)
+
+        seen: set[int] = set()
+        subscriptions = []
+        for subscription in matched:
+            # A handler matched by several subscriptions is called once
+            if id(subscription.handler) in seen:
+                continue
+            seen.add(id(subscription.handler))
+            subscriptions.append(subscription)
+
+        return _Route(
+            subscribers=tuple(
+                (subscription.handler, subscription.subscriber_engine)
+                for subscription in subscriptions
+            ),
+            batch_subscribers=tuple(
+                (
+                    subscription.handler,
+                    subscription.batch_handler,
+                    subscription.subscriber_engine,
+                    subscription.order,
+                )
+                for subscription in subscriptions
+            ),
+        )
+
+    def _route(self, event_type: str) -> _Route:
+        route = self._routes.get(event_type)
+        if route is not None:
+            return route
+        with self._lock:
+            route = self._routes.get(event_type)
+            if route is None:
+                route = self._build_route(event_type)
+                self._routes[event_type] = route
+            return route
+
     def get_subscribers(self, event_type: str) -> list[tuple[Callable, str]]:
         """
-        Get all subscribers for an event type.
-        Returns empty list if no subscribers (not an error).
+        Get all subscribers for an event type, exact and by pattern,
+        in registration order. Returns empty list if no subscribers
+        (not an error).
         """
-        with self._lock:
-            return list(self._subscribers.get(event_type, []))
+        return list(self._route(event_type).subscribers)
+
+    def get_batch_subscribers(
+        self,
+        event_type: str,
+    ) -> tuple[tuple[Callable, Optional[Callable], str, int], ...]:
+        """
+        Get all subscribers for an event type as
+        (handler, batch_handler, subscriber_engine, order) tuples, in
+        registration order. batch_handler is None for subscribers
+        without one; order is the registration position, comparable
+        across event types.
+        """
+        return self._route(event_type).batch_subscribers
 
     def has_subscribers(self, event_type: str) -> bool:
         """Check if any subscribers exist for an event type."""
-        with self._lock:
-            return bool(self._subscribers.get(event_type))
+        return bool(self._route(event_type).subscribers)
 
     def get_all_event_types(self) -> frozenset[str]:
-        """Return all event types with registered subscribers."""
+        """
+        Return all event types with exact subscriptions (patterns are
+        not expanded; see get_all_patterns).
+        """
         with self._lock:
             return frozenset(self._subscribers.keys())
 
+    def get_all_patterns(self) -> frozenset[str]:
+        """Return all subscribed patterns."""
+        with self._lock:
+            return frozenset(self._patterns.keys())
+
+    def get_all_subscribers(self) -> list[tuple[Callable, str]]:
+        """
+        Every (handler, subscriber_engine) pair registered, once each,
+        in order of first registration.
+        """
+        with self._lock:
+            registrations = list(self._registrations)
+        seen: set[tuple[int, str]] = set()
+        subscribers = []
+        for subscription in registrations:
+            key = (id(subscription.handler), subscription.subscriber_engine)
+            if key in seen:
+                continue
+            seen.add(key)
+            subscribers.append(
+                (subscription.handler, subscription.subscriber_engine)
+            )
+        return subscribers
+
     def subscriber_count(self, event_type: str) -> int:
         """Count subscribers for an event type."""
-        with self._lock:
-            return len(self._subscribers.get(event_type, []))
+        return len(self._route(event_type).subscribers)
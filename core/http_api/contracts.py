@@ -434,6 +434,25 @@ class DocumentVerifyRequest:
             raise ValueError("branch_id must be UUID or None.")
 
 
+@dataclass(frozen=True)
+class EventProofRequest:
+    """Request a Merkle inclusion proof for one event by event_id."""
+    business_id: uuid.UUID
+    event_id: uuid.UUID
+    actor: ActorMetadata | None = None
+    branch_id: Optional[uuid.UUID] = None
+
+    def __post_init__(self):
+        if not isinstance(self.business_id, uuid.UUID):
+            raise ValueError("business_id must be UUID.")
+        if not isinstance(self.event_id, uuid.UUID):
+            raise ValueError("event_id must be UUID.")
+        if self.actor is not None and not isinstance(self.actor, ActorMetadata):
+            raise ValueError("actor must be ActorMetadata.")
+        if self.branch_id is not None and not isinstance(self.branch_id, uuid.UUID):
+            raise ValueError("branch_id must be UUID or None.")
+
+
 @dataclass(frozen=True)
 class HttpApiErrorBody:
     code: str
@@ -45,6 +45,7 @@ from core.http_api.contracts import (
     DocumentTemplateDeactivateHttpRequest,
     DocumentTemplateUpsertHttpRequest,
     DocumentVerifyRequest,
+    EventProofRequest,
     FeatureFlagClearHttpRequest,
     FeatureFlagSetHttpRequest,
     IdentityBootstrapHttpRequest,
@@ -1711,3 +1712,43 @@ def get_document_verify(
         )
 
     return success_response(result.as_dict())
+
+
+def get_event_inclusion_proof(
+    request: EventProofRequest,
+    dependencies,
+    headers: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """
+    GET /v1/events/<event_id>/proof
+    Merkle inclusion proof of one event against its chain checkpoint.
+    A branch-scoped request only proves events of its branch.
+    Returns VALID (with proof) | TAMPERED | PENDING | NOT_FOUND.
+    """
+    resolved_context = _resolve_handler_context(
+        request=request,
+        dependencies=dependencies,
+        headers=headers,
+        require_actor=False,
+    )
+    if isinstance(resolved_context, RejectionReason):
+        return rejection_response(resolved_context)
+    _, business_context = resolved_context
+
+    try:
+        from core.event_store.persistence.merkle_checkpoints import (
+            event_inclusion_proof,
+        )
+        result = event_inclusion_proof(
+            business_id=business_context.business_id,
+            event_id=request.event_id,
+            branch_id=business_context.branch_id,
+        )
+    except Exception as exc:
+        return error_response(
+            code="VERIFICATION_FAILED",
+            message="Inclusion proof could not be built.",
+            details={"error_type": type(exc).__name__, "error": str(exc)},
+        )
+
+    return success_response(result.as_dict())
@@ -0,0 +1,483 @@
+"""
+BOS Replay Engine — Parallel Chain Audit
+==========================================
+Tamper audit of the event store, sharded by business.
+
+The chains of one business share nothing with other businesses, so
+businesses are audited independently and spread across worker
+processes (ProcessPoolExecutor), largest chains first. Per business,
+one worker:
+
+    1. Reads the chain head rows, BEFORE any event: the audit covers
+       each chain up to its head as read here, so events appended
+       while the audit runs are left to the next one instead of
+       being reported as a head mismatch
+    2. Checks each chain's verification watermark (see
+       core.replay.verification) still names its verified event
+    3. Streams the events above the watermarks, up to the heads, in
+       chain order (chain_branch_id, stream_seq) as plain tuples
+       (values_list; no model instances, no payload decoding: hashes
+       are recomputed from payload_canonical)
+    4. Checks linkage: the first streamed event of each (sub-)chain
+       links to its watermark hash (or genesis), every other to the
+       previous event's event_hash, and stream_seq is gapless
+    5. Recomputes every event_hash under the event's hash_version
+    6. Checks payload against payload_canonical
+    7. Checks the heads read in step 1 name the last event of each
+       chain (catches truncated chains, which linkage alone cannot),
+       and that no stored event belongs to a chain without a head
+    8. Verifies the anchor chain (BRANCH chain mode)
+    9. Advances the watermarks to the verified chain ends
+
+So a routine audit costs the events written since the previous one.
+full=True ignores the watermarks and re-verifies every chain from
+genesis (and re-seeds the watermarks).
+
+Failures are reported, not raised: every business is audited and gets
+one BusinessChainAudit in the ChainAuditReport.
+
+Usage:
+    report = audit_event_chains(workers=8)
+    if not report.ok:
+        ...
+
+Command line: python manage.py audit_event_chains --workers 8 [--full]
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import os
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from typing import Iterable, Optional
+
+from django.db import connections
+from django.db.models import Q
+
+from core.event_store.hashing import canonical_serialize
+from core.event_store.models import Event, EventBranchChainHead, EventChainHead
+from core.event_store.persistence.repository import (
+    find_payload_canonical_mismatch,
+    genesis_hash_for,
+)
+from core.replay.errors import ReplayChainBrokenError
+from core.replay.event_replayer import (
+    _recompute_event_hash,
+    _verify_anchor_chain,
+)
+from core.replay.verification import (
+    advance_watermarks,
+    load_watermarks,
+    unverified_events_filter,
+    watermark_mismatch,
+)
+
+logger = logging.getLogger("bos.replay")
+
+DEFAULT_AUDIT_CHUNK_SIZE = 2000
+
+
+class AuditFailureCode:
+    """Why a business failed the audit (first failure found)."""
+
+    GENESIS_MISMATCH = "GENESIS_MISMATCH"
+    LINK_BROKEN = "LINK_BROKEN"
+    SEQUENCE_GAP = "SEQUENCE_GAP"
+    HASH_MISMATCH = "HASH_MISMATCH"
+    PAYLOAD_DRIFT = "PAYLOAD_DRIFT"
+    HEAD_MISMATCH = "HEAD_MISMATCH"
+    ANCHOR_CHAIN_BROKEN = "ANCHOR_CHAIN_BROKEN"
+    WATERMARK_MISMATCH = "WATERMARK_MISMATCH"
+    AUDIT_ERROR = "AUDIT_ERROR"
+
+
+# ══════════════════════════════════════════════════════════════
+# REPORT
+# ══════════════════════════════════════════════════════════════
+
+@dataclass(frozen=True)
+class BusinessChainAudit:
+    """Audit outcome of one business (all of its chains)."""
+
+    business_id: uuid.UUID
+    events_checked: int = 0
+    failure: Optional[str] = None
+    event_id: Optional[uuid.UUID] = None
+    detail: str = ""
+    duration_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.failure is None
+
+
+@dataclass
+class ChainAuditReport:
+    """Structured result of an audit run."""
+
+    businesses: list[BusinessChainAudit] = field(default_factory=list)
+    workers: int = 1
+    full: bool = False
+    duration_seconds: float = 0.0
+
+    @property
+    def events_checked(self) -> int:
+        return sum(audit.events_checked for audit in self.businesses)
+
+    @property
+    def failures(self) -> list[BusinessChainAudit]:
+        return [audit for audit in self.businesses if not audit.ok]
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+    def as_dict(self) -> dict:
+        """JSON-ready form (UUIDs as strings)."""
+        return {
+            "ok": self.ok,
+            "workers": self.workers,
+            "full": self.full,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "businesses_checked": len(self.businesses),
+            "events_checked": self.events_checked,
+            "failures": [
+                {
+                    **asdict(audit),
+                    "business_id": str(audit.business_id),
+                    "event_id": (
+                        str(audit.event_id) if audit.event_id is not None else None
+                    ),
+                }
+                for audit in self.failures
+            ],
+        }
+
+
+# ══════════════════════════════════════════════════════════════
+# AUDIT
+# ══════════════════════════════════════════════════════════════
+
+def audit_event_chains(
+    business_ids: Optional[Iterable[uuid.UUID]] = None,
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_AUDIT_CHUNK_SIZE,
+    full: bool = False,
+) -> ChainAuditReport:
+    """
+    Audit every business (or the given ones), sharded across processes.
+
+    Args:
+        business_ids: Businesses to audit. Default: every business with
+                      a chain, largest chain first.
+        workers:      Worker processes (default: CPU count). 1 audits
+                      in this process.
+        chunk_size:   Rows fetched per round-trip while streaming.
+        full:         Re-verify every chain from genesis instead of
+                      from its verification watermark.
+
+    Returns:
+        ChainAuditReport with one BusinessChainAudit per business,
+        in audit order.
+    """
+    started = time.monotonic()
+    if business_ids is None:
+        business_ids = list(
+            EventChainHead.objects.order_by("-sequence", "business_id")
+            .values_list("business_id", flat=True)
+        )
+    else:
+        business_ids = list(business_ids)
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(business_ids) or 1))
+    audit_one = functools.partial(
+        audit_business_chain,
+        chunk_size=chunk_size,
+        full=full,
+    )
+
+    if workers == 1:
+        results = [audit_one(business_id) for business_id in business_ids]
+    else:
+        # Forked workers must not inherit (and later close) open sockets.
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_audit_worker,
+        ) as pool:
+            results = list(pool.map(audit_one, business_ids))
+
+    report = ChainAuditReport(
+        businesses=results,
+        workers=workers,
+        full=full,
+        duration_seconds=time.monotonic() - started,
+    )
+    logger.info(
+        f"{'Full' if full else 'Incremental'} chain audit: {len(results)} business(es), "
+        f"{report.events_checked} events, {len(report.failures)} failure(s) "
+        f"in {report.duration_seconds:.1f}s on {workers} worker(s)."
+    )
+    return report
+
+
+def _init_audit_worker() -> None:
+    """Worker start-up: Django ready, no inherited DB connections."""
+    from django.apps import apps
+
+    if not apps.ready:
+        import django
+
+        django.setup()
+    connections.close_all()
+
+
+def audit_business_chain(
+    business_id: uuid.UUID,
+    *,
+    chunk_size: int = DEFAULT_AUDIT_CHUNK_SIZE,
+    full: bool = False,
+) -> BusinessChainAudit:
+    """Audit every chain of one business. Never raises."""
+    started = time.monotonic()
+    try:
+        audit = _audit_business_chain(
+            business_id,
+            chunk_size=chunk_size,
+            full=full,
+        )
+    except Exception as exc:
+        logger.exception(f"Chain audit of business {business_id} failed.")
+        audit = BusinessChainAudit(
+            business_id=business_id,
+            failure=AuditFailureCode.AUDIT_ERROR,
+            detail=str(exc),
+        )
+    return replace(audit, duration_seconds=time.monotonic() - started)
+
+
+def _audit_business_chain(
+    business_id: uuid.UUID,
+    *,
+    chunk_size: int,
+    full: bool,
+) -> BusinessChainAudit:
+    def failed(code: str, event_id=None, detail: str = "") -> BusinessChainAudit:
+        return BusinessChainAudit(
+            business_id=business_id,
+            events_checked=checked,
+            failure=code,
+            event_id=event_id,
+            detail=detail,
+        )
+
+    checked = 0
+    # Heads first: a head row and the events below it commit together,
+    # so every event up to the heads read here is already visible.
+    heads = _chain_heads(business_id)
+    watermarks = {} if full else load_watermarks(business_id)
+    stale_watermark = watermark_mismatch(business_id, watermarks)
+    if stale_watermark is not None:
+        return failed(AuditFailureCode.WATERMARK_MISMATCH, detail=stale_watermark)
+
+    unverified = unverified_events_filter(watermarks) & _through_heads(heads)
+    rows = (
+        Event.objects.filter(unverified, business_id=business_id)
+        .order_by("chain_branch_id", "stream_seq")
+        .values_list(
+            "event_id",
+            "chain_branch_id",
+            "stream_seq",
+            "previous_event_hash",
+            "event_hash",
+            "hash_version",
+            "payload_canonical",
+        )
+    )
+
+    # chain_branch_id -> (event_id, stream_seq, event_hash) of its end
+    chain_tails: dict[Optional[uuid.UUID], tuple[uuid.UUID, int, str]] = {
+        chain_branch_id: (
+            watermark.verified_event_id,
+            watermark.verified_seq,
+            watermark.verified_hash,
+        )
+        for chain_branch_id, watermark in watermarks.items()
+    }
+    current_chain: object = object()
+    expected_previous_hash = ""
+    expected_seq = 0
+
+    for row in rows.iterator(chunk_size=chunk_size):
+        (
+            event_id,
+            chain_branch_id,
+            stream_seq,
+            previous_hash,
+            event_hash,
+            hash_version,
+            payload_canonical,
+        ) = row
+        if chain_branch_id != current_chain:
+            current_chain = chain_branch_id
+            watermark = watermarks.get(chain_branch_id)
+            if watermark is None:
+                expected_previous_hash = genesis_hash_for(chain_branch_id)
+                expected_seq = 1
+            else:
+                expected_previous_hash = watermark.verified_hash
+                expected_seq = watermark.verified_seq + 1
+        checked += 1
+
+        if previous_hash != expected_previous_hash:
+            return failed(
+                AuditFailureCode.GENESIS_MISMATCH
+                if expected_seq == 1
+                else AuditFailureCode.LINK_BROKEN,
+                event_id,
+                f"previous_event_hash '{previous_hash}' != "
+                f"expected '{expected_previous_hash}'.",
+            )
+        if stream_seq != expected_seq:
+            return failed(
+                AuditFailureCode.SEQUENCE_GAP,
+                event_id,
+                f"stream_seq {stream_seq} != expected {expected_seq}.",
+            )
+
+        if payload_canonical is None:
+            # Written outside persist_event(): hash the decoded payload.
+            payload_canonical = canonical_serialize(
+                Event.objects.values_list("payload", flat=True).get(
+                    business_id=business_id,
+                    event_id=event_id,
+                )
+            )
+        recomputed = _recompute_event_hash(
+            payload_canonical,
+            previous_hash,
+            hash_version,
+        )
+        if recomputed != event_hash:
+            return failed(
+                AuditFailureCode.HASH_MISMATCH,
+                event_id,
+                f"stored hash '{event_hash}' != recomputed '{recomputed}'.",
+            )
+
+        expected_previous_hash = event_hash
+        chain_tails[chain_branch_id] = (event_id, expected_seq, event_hash)
+        expected_seq += 1
+
+    drifted_event_id = find_payload_canonical_mismatch(
+        business_id,
+        within=unverified,
+    )
+    if drifted_event_id is not None:
+        return failed(
+            AuditFailureCode.PAYLOAD_DRIFT,
+            drifted_event_id,
+            "payload no longer matches payload_canonical.",
+        )
+
+    head_detail = _head_mismatch(business_id, heads, chain_tails)
+    if head_detail is not None:
+        return failed(AuditFailureCode.HEAD_MISMATCH, detail=head_detail)
+
+    try:
+        _verify_anchor_chain(business_id)
+    except ReplayChainBrokenError as exc:
+        return failed(AuditFailureCode.ANCHOR_CHAIN_BROKEN, detail=exc.detail)
+
+    advance_watermarks(
+        business_id,
+        {
+            chain_branch_id: tail
+            for chain_branch_id, tail in chain_tails.items()
+            if chain_branch_id not in watermarks
+            or watermarks[chain_branch_id].verified_seq != tail[1]
+        },
+    )
+    return BusinessChainAudit(business_id=business_id, events_checked=checked)
+
+
+def _chain_filter(chain_branch_id: Optional[uuid.UUID]) -> Q:
+    if chain_branch_id is None:
+        return Q(chain_branch_id__isnull=True)
+    return Q(chain_branch_id=chain_branch_id)
+
+
+def _chain_heads(
+    business_id: uuid.UUID,
+) -> dict[Optional[uuid.UUID], tuple[str, int]]:
+    """(head_hash, sequence) of every chain head row, by chain_branch_id."""
+    heads: dict[Optional[uuid.UUID], tuple[str, int]] = {
+        None: head
+        for head in EventChainHead.objects.filter(
+            business_id=business_id,
+        ).values_list("head_hash", "sequence")
+    }
+    heads.update(
+        (branch_id, (head_hash, sequence))
+        for branch_id, head_hash, sequence in EventBranchChainHead.objects.filter(
+            business_id=business_id,
+        ).values_list("branch_id", "head_hash", "sequence")
+    )
+    return heads
+
+
+def _through_heads(heads: dict[Optional[uuid.UUID], tuple[str, int]]) -> Q:
+    """Event filter: events of the given chains at or below their heads."""
+    through = Q(pk__in=[])
+    for chain_branch_id, (_, sequence) in heads.items():
+        through |= _chain_filter(chain_branch_id) & ~Q(stream_seq__gt=sequence)
+    return through
+
+
+def _head_mismatch(
+    business_id: uuid.UUID,
+    heads: dict[Optional[uuid.UUID], tuple[str, int]],
+    chain_tails: dict[Optional[uuid.UUID], tuple[uuid.UUID, int, str]],
+) -> Optional[str]:
+    """
+    Compare each chain head (as read before streaming) with the last
+    audited event, and look for events of chains that have no head.
+    """
+    for chain_branch_id in set(heads) | set(chain_tails):
+        head_hash, sequence = heads.get(chain_branch_id, (None, 0))
+        _, tail_seq, tail_hash = chain_tails.get(
+            chain_branch_id,
+            (None, 0, genesis_hash_for(chain_branch_id)),
+        )
+        if sequence != tail_seq or (sequence and head_hash != tail_hash):
+            chain = chain_branch_id or "business chain"
+            return (
+                f"Head of {chain} (sequence {sequence}, hash '{head_hash}') "
+                f"does not match the stored chain end (sequence "
+                f"{tail_seq}, hash '{tail_hash}')."
+            )
+
+    # Chains first seen after the heads were read: events of a chain
+    # appended concurrently have a head by now (they commit together).
+    known_chains = Q(pk__in=[])
+    for chain_branch_id in heads:
+        known_chains |= _chain_filter(chain_branch_id)
+    headless = set(
+        Event.objects.filter(business_id=business_id)
+        .exclude(known_chains)
+        .order_by()
+        .values_list("chain_branch_id", flat=True)
+        .distinct()
+    )
+    if not headless:
+        return None
+    headless -= set(_chain_heads(business_id))
+    if headless:
+        chain = next(iter(headless)) or "business chain"
+        return f"Events of {chain} are stored without a chain head."
+    return None
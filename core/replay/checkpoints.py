@@ -9,17 +9,32 @@ Fields:
 - business_id: nullable (null = full system replay)
 - last_event_id: last successfully processed event
 - last_received_at: timestamp of last processed event (for ordering)
+- last_stream_seq: stream_seq of last processed event (business scope)
+- last_chain_positions: stream_seq of the last processed event of
+  each chain (business scope, business with branch sub-chains)
 - updated_at: when checkpoint was saved
 
+A replay saves its checkpoint every CHECKPOINT_EVERY_EVENTS events or
+CHECKPOINT_EVERY_SECONDS seconds, whichever comes first, and at the
+end. Each save is one INSERT ... ON CONFLICT DO UPDATE statement.
+
 Checkpoints are NOT events. They are operational metadata.
 They can be deleted, updated, or reset safely.
 """
 
+import functools
 import uuid
+from typing import Optional
 
-from django.db import models
+from django.db import connection, models
+from django.db.models import Q
 from django.utils import timezone
 
+from core.event_store.persistence.repository import encode_chain_positions
+
+CHECKPOINT_EVERY_EVENTS = 10_000
+CHECKPOINT_EVERY_SECONDS = 30.0
+
 
 class ReplayCheckpoint(models.Model):
     """
@@ -41,6 +56,24 @@ class ReplayCheckpoint(models.Model):
     last_received_at = models.DateTimeField(
         help_text="received_at of last processed event (for ordering).",
     )
+    last_stream_seq = models.BigIntegerField(
+        null=True,
+        blank=True,
+        help_text=(
+            "stream_seq of last processed event. Business-scoped "
+            "replay resumes with stream_seq > last_stream_seq."
+        ),
+    )
+    last_chain_positions = models.JSONField(
+        null=True,
+        blank=True,
+        help_text=(
+            "stream_seq of the last processed event per chain, keyed "
+            "by chain_branch_id ('' = business chain). Business-scoped "
+            "replay of a business with branch sub-chains resumes after "
+            "these positions."
+        ),
+    )
     updated_at = models.DateTimeField(
         auto_now=True,
         help_text="When this checkpoint was last saved.",
@@ -49,6 +82,15 @@ class ReplayCheckpoint(models.Model):
     class Meta:
         db_table = "replay_checkpoints"
         unique_together = [("projection_name", "business_id")]
+        constraints = [
+            # NULLs are distinct in unique_together: one row per
+            # projection for full-system replay needs its own index
+            models.UniqueConstraint(
+                fields=["projection_name"],
+                condition=Q(business_id__isnull=True),
+                name="uq_replay_ckpt_full",
+            ),
+        ]
         indexes = [
             models.Index(
                 fields=["projection_name", "business_id"],
@@ -69,24 +111,82 @@ class ReplayCheckpoint(models.Model):
 # CHECKPOINT OPERATIONS
 # ══════════════════════════════════════════════════════════════
 
+_UPSERT_FIELDS = (
+    "projection_name",
+    "business_id",
+    "last_event_id",
+    "last_received_at",
+    "last_stream_seq",
+    "last_chain_positions",
+    "updated_at",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _upsert_statement(full_replay: bool) -> str:
+    """
+    SQL text for the checkpoint upsert, built once per process.
+
+    The conflict target names the unique index of the scope: the
+    partial one on projection_name for full-system replay, the
+    (projection_name, business_id) pair otherwise.
+    """
+    quote_name = connection.ops.quote_name
+    columns = [
+        quote_name(ReplayCheckpoint._meta.get_field(name).column)
+        for name in _UPSERT_FIELDS
+    ]
+    conflict = (
+        f"({columns[0]}) WHERE {columns[1]} IS NULL"
+        if full_replay
+        else f"({columns[0]}, {columns[1]})"
+    )
+    updates = ", ".join(
+        f"{column} = EXCLUDED.{column}" for column in columns[2:]
+    )
+    return (
+        f"INSERT INTO {quote_name(ReplayCheckpoint._meta.db_table)} "
+        f"({', '.join(columns)}) "
+        f"VALUES ({', '.join(['%s'] * len(columns))}) "
+        f"ON CONFLICT {conflict} DO UPDATE SET {updates}"
+    )
+
+
 def save_checkpoint(
     projection_name: str,
     last_event_id: uuid.UUID,
     last_received_at,
     business_id: uuid.UUID = None,
-) -> ReplayCheckpoint:
+    last_stream_seq: int = None,
+    last_chain_positions: Optional[dict] = None,
+) -> None:
     """
-    Save or update a replay checkpoint.
+    Save or update a replay checkpoint in one statement.
+
+    Inside transaction.atomic() the checkpoint commits (or rolls back)
+    together with whatever else the transaction wrote.
     """
-    checkpoint, _ = ReplayCheckpoint.objects.update_or_create(
-        projection_name=projection_name,
-        business_id=business_id,
-        defaults={
-            "last_event_id": last_event_id,
-            "last_received_at": last_received_at,
-        },
-    )
-    return checkpoint
+    values = {
+        "projection_name": projection_name,
+        "business_id": business_id,
+        "last_event_id": last_event_id,
+        "last_received_at": last_received_at,
+        "last_stream_seq": last_stream_seq,
+        "last_chain_positions": (
+            encode_chain_positions(last_chain_positions)
+            if last_chain_positions is not None
+            else None
+        ),
+        "updated_at": timezone.now(),
+    }
+    params = [
+        ReplayCheckpoint._meta.get_field(name).get_db_prep_save(
+            values[name], connection,
+        )
+        for name in _UPSERT_FIELDS
+    ]
+    with connection.cursor() as cursor:
+        cursor.execute(_upsert_statement(business_id is None), params)
 
 
 def load_checkpoint(
@@ -44,3 +44,8 @@ class ReplayIntegrityError(ReplayError):
             f"stored hash '{expected_hash}' != "
             f"recomputed hash '{actual_hash}'."
         )
+
+
+class SnapshotFormatError(ReplayError):
+    """Projection snapshot bytes are foreign, newer or corrupt."""
+    pass
@@ -6,11 +6,15 @@ Reads historical events and replays them through the Event Bus.
 Replay doctrine:
 - READ events only â€” never write to Event Store
 - Never modify events
-- Deterministic order: received_at ASC
+- Deterministic order: stream_seq ASC per business
+  (received_at ASC, event_id ASC across businesses, and within a
+  business once it has branch sub-chains)
 - Verify hash-chain before replay
 - Support full, business-scoped, and time-scoped modes
 - Support checkpoint resume
-- Dispatch through bus (same path as live events)
+- Dispatch through bus (same path as live events), batch_size events
+  at a time: subscribers with a batch handler get each chunk in one
+  call, the others one call per event
 - Block persistence during replay (isolation)
 
 Event Store = truth archive
@@ -19,18 +23,37 @@ Time machine must never change history.
 """
 
 import logging
+import time
 import uuid
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
-
-from django.db.models import QuerySet, Q
-
-from core.event_store.models import Event
-from core.event_store.hashing import GENESIS_HASH, compute_event_hash
-from core.events.dispatcher import dispatch as bus_dispatch
+from itertools import islice
+from typing import Iterable, Optional
+
+from django.db import transaction
+from django.db.models import F, Max, QuerySet, Q
+
+from core.event_store.models import Event, EventChainAnchor
+from core.event_store.hashing import (
+    GENESIS_HASH,
+    canonical_serialize,
+    compute_event_hash,
+    compute_event_hash_from_canonical,
+)
+from core.event_store.persistence.repository import (
+    business_replay_order,
+    chain_business_ids,
+    chain_positions_filter,
+    decode_chain_positions,
+    genesis_hash_for,
+    replay_order_by,
+)
+from core.events.dispatcher import dispatch_batch as bus_dispatch_batch
 from core.events.registry import SubscriberRegistry
 from core.replay.checkpoints import (
+    CHECKPOINT_EVERY_EVENTS,
+    CHECKPOINT_EVERY_SECONDS,
     load_checkpoint,
     save_checkpoint,
     clear_checkpoint,
@@ -38,6 +61,11 @@ from core.replay.checkpoints import (
 from core.replay.context import ReplayContext, is_replay_active
 from core.replay.errors import ReplayChainBrokenError
 from core.replay.scope import ReplayScope, validate_replay_scope
+from core.replay.verification import (
+    load_watermarks,
+    unverified_events_filter,
+    watermark_mismatch,
+)
 
 logger = logging.getLogger("bos.replay")
 
@@ -65,6 +93,26 @@ class ReplayResult:
     def success(self) -> bool:
         return self.chain_verified and self.dispatch_failures == 0
 
+    @classmethod
+    def merge(cls, results: "Iterable[ReplayResult]") -> "ReplayResult":
+        """
+        Combine the results of independent replays (e.g. one per
+        business) into one: counts add up, errors concatenate, the
+        chain counts as verified only if every part verified it.
+        """
+        results = list(results)
+        merged = cls(
+            chain_verified=all(result.chain_verified for result in results),
+            checkpoint_saved=any(result.checkpoint_saved for result in results),
+            dry_run=all(result.dry_run for result in results),
+        )
+        for result in results:
+            merged.events_processed += result.events_processed
+            merged.events_dispatched += result.events_dispatched
+            merged.dispatch_failures += result.dispatch_failures
+            merged.errors.extend(result.errors)
+        return merged
+
 
 # â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•
 # EVENT QUERY BUILDER
@@ -75,23 +123,40 @@ def _build_event_queryset(
     until: Optional[datetime] = None,
     after_received_at: Optional[datetime] = None,
     after_event_id: Optional[uuid.UUID] = None,
+    after_stream_seq: Optional[int] = None,
+    after_chain_positions: Optional[dict] = None,
 ) -> QuerySet:
     """
     Build deterministic event queryset.
-    Always ordered by received_at ASC, event_id ASC (composite cursor).
 
-    Resume uses composite cursor to prevent skipping same-timestamp events:
+    Business-scoped (single business chain): ordered by stream_seq ASC
+    (chain order). Resume uses the integer cursor
+    stream_seq > after_stream_seq, a plain range scan on
+    (business_id, stream_seq).
+
+    Business-scoped with branch sub-chains: chain by chain, each in
+    stream_seq order (see business_replay_order). Resume keeps one
+    position per chain (after_chain_positions).
+
+    Unscoped: ordered by received_at ASC, event_id ASC. Resume uses the
+    composite cursor that prevents skipping same-timestamp events:
         (received_at > last) OR (received_at == last AND event_id > last_id)
     """
     qs = Event.objects.all()
+    ordering = ("received_at", "event_id")
 
     if business_id is not None:
         qs = qs.filter(business_id=business_id)
+        ordering = business_replay_order(business_id)
 
     if until is not None:
         qs = qs.filter(received_at__lte=until)
 
-    if after_received_at is not None and after_event_id is not None:
+    if ordering == ("stream_seq",) and after_stream_seq is not None:
+        qs = qs.filter(stream_seq__gt=after_stream_seq)
+    elif "chain_branch_id" in ordering and after_chain_positions is not None:
+        qs = qs.filter(chain_positions_filter(after_chain_positions))
+    elif after_received_at is not None and after_event_id is not None:
         # Composite cursor: skip past checkpoint precisely
         qs = qs.filter(
             Q(received_at__gt=after_received_at)
@@ -101,7 +166,30 @@ def _build_event_queryset(
         # Fallback: timestamp only (backward compat)
         qs = qs.filter(received_at__gt=after_received_at)
 
-    return qs.order_by("received_at", "event_id")
+    return qs.order_by(*replay_order_by(ordering))
+
+
+def _chain_positions_at_cursor(
+    business_id: uuid.UUID,
+    after_received_at: datetime,
+    after_event_id: uuid.UUID,
+) -> dict[Optional[uuid.UUID], int]:
+    """
+    Per-chain positions of a checkpoint saved before chain positions
+    were recorded: the last stream_seq of each chain at or before its
+    (received_at, event_id) cursor, i.e. what it had processed.
+    """
+    return dict(
+        Event.objects.filter(business_id=business_id, stream_seq__isnull=False)
+        .filter(
+            Q(received_at__lt=after_received_at)
+            | Q(received_at=after_received_at, event_id__lte=after_event_id)
+        )
+        .order_by()
+        .values("chain_branch_id")
+        .annotate(position=Max("stream_seq"))
+        .values_list("chain_branch_id", "position")
+    )
 
 
 
@@ -111,6 +199,8 @@ def _build_event_queryset(
 
 def verify_chain_before_replay(
     business_id: Optional[uuid.UUID] = None,
+    *,
+    full: bool = False,
 ) -> bool:
     """
     Lightweight chain verification before replay starts.
@@ -119,7 +209,14 @@ def verify_chain_before_replay(
     Verifies:
     - No empty event_hash
     - No empty previous_event_hash
-    - GENESIS used correctly for first event per business
+    - GENESIS used correctly for first event per business chain
+    - Branch genesis used correctly for first event per branch
+      sub-chain, and sub-chain events carry their own branch_id
+
+    Chains with a verification watermark (core.replay.verification)
+    are only checked above it: the watermark must still name its
+    verified event, and the first newer event must link to it.
+    full=True ignores the watermarks and checks every event.
 
     Raises ReplayChainBrokenError if corruption detected.
     Returns True if chain is structurally sound.
@@ -127,31 +224,68 @@ def verify_chain_before_replay(
     if business_id is not None:
         businesses = [business_id]
     else:
-        businesses = (
-            Event.objects
-            .values_list("business_id", flat=True)
-            .distinct()
-        )
+        businesses = chain_business_ids()
 
     for biz_id in businesses:
-        events = (
-            Event.objects
-            .filter(business_id=biz_id)
-            .order_by("received_at")
+        watermarks = {} if full else load_watermarks(biz_id)
+        stale_watermark = watermark_mismatch(biz_id, watermarks)
+        if stale_watermark is not None:
+            raise ReplayChainBrokenError(
+                business_id=biz_id,
+                detail=stale_watermark,
+            )
+
+        events = Event.objects.filter(
+            unverified_events_filter(watermarks),
+            business_id=biz_id,
         )
 
         if not events.exists():
             continue
 
-        # Check first event has GENESIS
-        first_event = events.first()
-        if first_event.previous_event_hash != GENESIS_HASH:
+        # Check first event of every chain links to its genesis, or to
+        # the verified event below it
+        chain_ids = {None} | set(
+            events.filter(chain_branch_id__isnull=False)
+            .values_list("chain_branch_id", flat=True)
+            .distinct()
+        )
+        for chain_branch_id in chain_ids:
+            first_event = (
+                events.filter(chain_branch_id=chain_branch_id)
+                .order_by("stream_seq")
+                .first()
+            )
+            if first_event is None:
+                continue
+            watermark = watermarks.get(chain_branch_id)
+            expected_hash = (
+                watermark.verified_hash
+                if watermark is not None
+                else genesis_hash_for(chain_branch_id)
+            )
+            if first_event.previous_event_hash != expected_hash:
+                raise ReplayChainBrokenError(
+                    business_id=biz_id,
+                    detail=(
+                        f"First event {first_event.event_id} has "
+                        f"previous_event_hash="
+                        f"'{first_event.previous_event_hash}'"
+                        f" instead of '{expected_hash}'."
+                    ),
+                )
+
+        misplaced = (
+            events.filter(chain_branch_id__isnull=False)
+            .exclude(chain_branch_id=F("branch_id"))
+            .count()
+        )
+        if misplaced > 0:
             raise ReplayChainBrokenError(
                 business_id=biz_id,
                 detail=(
-                    f"First event {first_event.event_id} has "
-                    f"previous_event_hash='{first_event.previous_event_hash}'"
-                    f" instead of '{GENESIS_HASH}'."
+                    f"{misplaced} event(s) linked into a branch sub-chain "
+                    f"other than their own branch."
                 ),
             )
 
@@ -179,51 +313,191 @@ def verify_chain_before_replay(
 
 def _verify_full_hash_chain(
     business_id: Optional[uuid.UUID] = None,
+    *,
+    full: bool = True,
 ) -> bool:
     """
-    Full hash recomputation â€” verifies every event's hash by recomputing.
+    Hash recomputation â€” verifies every event's hash by recomputing.
 
-    For each event:
-    - Recompute: compute_event_hash(payload, previous_event_hash)
-    - Compare with stored event_hash
-    - If mismatch â†’ raise ReplayIntegrityError
+    Runs the chain audit (core.replay.chain_audit) in this process:
+    - Linkage and gapless stream_seq of every (sub-)chain
+    - Recompute the hash from the stored payload_canonical (no JSON
+      decode/re-encode), or from payload for rows without it, under
+      the event's own hash_version, and compare with event_hash
+    - Check that payload still matches payload_canonical
+    - Chain head rows and the anchor chain (BRANCH chain mode)
+
+    Hash or payload mismatches raise ReplayIntegrityError, any other
+    break ReplayChainBrokenError.
+
+    full=True (default) walks every chain from genesis. full=False only
+    walks the events above each chain's verification watermark. Both
+    advance the watermarks on success.
 
     This is expensive. Use only when tamper detection is needed.
     """
-    from core.replay.errors import ReplayIntegrityError
+    from core.replay.chain_audit import AuditFailureCode, audit_business_chain
+    from core.replay.errors import ReplayError, ReplayIntegrityError
 
     if business_id is not None:
         businesses = [business_id]
     else:
-        businesses = list(
-            Event.objects
-            .values_list("business_id", flat=True)
-            .distinct()
-        )
+        businesses = chain_business_ids()
 
     for biz_id in businesses:
-        events = (
-            Event.objects
-            .filter(business_id=biz_id)
-            .order_by("received_at", "event_id")
+        audit = audit_business_chain(biz_id, full=full)
+        if audit.ok:
+            continue
+
+        if audit.failure in (
+            AuditFailureCode.HASH_MISMATCH,
+            AuditFailureCode.PAYLOAD_DRIFT,
+        ):
+            event = Event.objects.get(business_id=biz_id, event_id=audit.event_id)
+            # Hash mismatch: the hashed text; drift: the decoded payload.
+            hashed_text = (
+                event.payload_canonical
+                if audit.failure == AuditFailureCode.HASH_MISMATCH
+                and event.payload_canonical is not None
+                else canonical_serialize(event.payload)
+            )
+            raise ReplayIntegrityError(
+                event_id=event.event_id,
+                expected_hash=event.event_hash,
+                actual_hash=_recompute_event_hash(
+                    hashed_text,
+                    event.previous_event_hash,
+                    event.hash_version,
+                ),
+            )
+        if audit.failure == AuditFailureCode.AUDIT_ERROR:
+            raise ReplayError(
+                f"Hash verification of business {biz_id} could not run: "
+                f"{audit.detail}"
+            )
+        raise ReplayChainBrokenError(
+            business_id=biz_id,
+            detail=(
+                f"{audit.failure}"
+                + (f" at event {audit.event_id}" if audit.event_id else "")
+                + f": {audit.detail}"
+            ),
+        )
+
+    logger.info("Full hash recomputation passed â€” no tampering detected.")
+    return True
+
+
+def _recompute_event_hash(
+    payload_canonical: str,
+    previous_event_hash: str,
+    hash_version: int,
+) -> str:
+    """Recompute under the event's hash_version; an unknown version never matches."""
+    try:
+        return compute_event_hash_from_canonical(
+            payload_canonical,
+            previous_event_hash,
+            hash_version,
         )
+    except ValueError:
+        return f"UNKNOWN_HASH_VERSION:{hash_version}"
+
+
+def _verify_anchor_chain(business_id: uuid.UUID) -> bool:
+    """
+    Verify the business-level anchor chain (BRANCH chain mode).
 
-        for event in events.iterator(chunk_size=500):
-            recomputed = compute_event_hash(
-                event.payload,
-                event.previous_event_hash,
+    - Anchors are gapless and hash-linked from GENESIS
+    - Every anchor_hash recomputes from its branch_heads
+    - Every anchored branch head names a stored event at exactly that
+      sub-chain position with exactly that hash
+
+    Raises ReplayChainBrokenError on any mismatch.
+    """
+    expected_previous_hash = GENESIS_HASH
+    expected_seq = 1
+    anchors = (
+        EventChainAnchor.objects
+        .filter(business_id=business_id)
+        .order_by("anchor_seq")
+    )
+
+    for anchor in anchors.iterator(chunk_size=500):
+        if (
+            anchor.anchor_seq != expected_seq
+            or anchor.previous_anchor_hash != expected_previous_hash
+            or anchor.anchor_hash != compute_event_hash(
+                anchor.branch_heads,
+                anchor.previous_anchor_hash,
             )
-            if recomputed != event.event_hash:
-                raise ReplayIntegrityError(
-                    event_id=event.event_id,
-                    expected_hash=event.event_hash,
-                    actual_hash=recomputed,
+        ):
+            raise ReplayChainBrokenError(
+                business_id=business_id,
+                detail=f"Anchor chain broken at anchor {anchor.anchor_seq}.",
+            )
+
+        for branch_id, head in anchor.branch_heads.items():
+            anchored = Event.objects.filter(
+                business_id=business_id,
+                chain_branch_id=branch_id,
+                stream_seq=head["sequence"],
+                event_hash=head["head_hash"],
+            ).exists()
+            if not anchored:
+                raise ReplayChainBrokenError(
+                    business_id=business_id,
+                    detail=(
+                        f"Anchor {anchor.anchor_seq} commits head "
+                        f"{head['sequence']} of branch {branch_id}, which "
+                        f"no longer matches the stored sub-chain."
+                    ),
                 )
 
-    logger.info("Full hash recomputation passed â€” no tampering detected.")
+        expected_previous_hash = anchor.anchor_hash
+        expected_seq += 1
+
     return True
 
 
+def _dispatch_chunk(
+    chunk: list[Event],
+    subscriber_registry: SubscriberRegistry,
+    result: ReplayResult,
+) -> None:
+    """Dispatch one chunk of events and fold the outcome into result."""
+    result.events_processed += len(chunk)
+
+    try:
+        dispatch_results = bus_dispatch_batch(chunk, subscriber_registry)
+    except Exception as exc:
+        result.dispatch_failures += len(chunk)
+        result.errors.extend(
+            {
+                "event_id": str(event.event_id),
+                "error": str(exc),
+                "error_type": type(exc).__name__,
+            }
+            for event in chunk
+        )
+        logger.error(
+            f"Replay dispatch failed for events "
+            f"{chunk[0].event_id}..{chunk[-1].event_id}: {exc}",
+            exc_info=True,
+        )
+        return
+
+    for dispatch_result in dispatch_results:
+        result.events_dispatched += 1
+        if dispatch_result["subscribers_failed"] > 0:
+            result.dispatch_failures += dispatch_result["subscribers_failed"]
+            # A chunk holds many events: tag each failure with its own
+            result.errors.extend(
+                {"event_id": dispatch_result["event_id"], **failure}
+                for failure in dispatch_result["failures"]
+            )
+
+
 # â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•
 # CORE REPLAY FUNCTION
 # â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•
@@ -238,6 +512,9 @@ def replay_events(
     dry_run: bool = False,
     full_hash_verify: bool = False,
     batch_size: int = 500,
+    checkpoint_every: int = CHECKPOINT_EVERY_EVENTS,
+    checkpoint_seconds: float = CHECKPOINT_EVERY_SECONDS,
+    transactional_checkpoints: bool = False,
 ) -> ReplayResult:
     """
     Replay historical events through the Event Bus.
@@ -245,9 +522,12 @@ def replay_events(
     This is the core replay function. It:
     1. Verifies hash-chain integrity (structural or full recompute)
     2. Builds event queryset (scoped by business/time)
-    3. Optionally resumes from checkpoint (composite cursor)
+    3. Optionally resumes from checkpoint (stream_seq cursor when
+       business-scoped, composite cursor when unscoped)
     4. Dispatches each event through the bus
-    5. Saves checkpoint progress
+    5. Saves checkpoint progress every checkpoint_every events or
+       checkpoint_seconds seconds (checked between batches) and at
+       the end, so a resumed run repeats at most one interval
     6. Returns structured result
 
     Args:
@@ -259,7 +539,18 @@ def replay_events(
         use_checkpoint:      Resume from last checkpoint if available.
         dry_run:             Verify chain and count events, skip dispatch.
         full_hash_verify:    Recompute ALL hashes before replay (optional).
-        batch_size:          Events per batch for memory efficiency.
+        batch_size:          Events fetched and dispatched per batch.
+        checkpoint_every:    Save the checkpoint after this many events.
+        checkpoint_seconds:  ...or after this many seconds.
+        transactional_checkpoints:
+                             Commit each interval's dispatch and its
+                             checkpoint in one transaction, so the
+                             projection's own writes (same database,
+                             same thread) are applied exactly once
+                             across a crash and resume. Handlers must
+                             guard their writes with a savepoint
+                             (transaction.atomic()) so a failed write
+                             does not abort the interval.
 
     Returns:
         ReplayResult with counts and status.
@@ -289,6 +580,15 @@ def replay_events(
     # â”€â”€ Step 2: Determine resume point (composite cursor) â”€â”€â”€â”€â”€
     after_received_at = None
     after_event_id = None
+    after_stream_seq = None
+    ordering = (
+        business_replay_order(scoped_business_id)
+        if scoped_business_id is not None
+        else ("received_at", "event_id")
+    )
+    # Branch sub-chains: one position per chain, advanced as events
+    # are dispatched (None: a single cursor is enough).
+    chain_positions = {} if "chain_branch_id" in ordering else None
 
     if use_checkpoint and projection_name:
         checkpoint = load_checkpoint(
@@ -298,9 +598,21 @@ def replay_events(
         if checkpoint is not None:
             after_received_at = checkpoint.last_received_at
             after_event_id = checkpoint.last_event_id
+            after_stream_seq = checkpoint.last_stream_seq
+            if chain_positions is not None:
+                chain_positions = (
+                    decode_chain_positions(checkpoint.last_chain_positions)
+                    if checkpoint.last_chain_positions is not None
+                    else _chain_positions_at_cursor(
+                        scoped_business_id,
+                        after_received_at,
+                        after_event_id,
+                    )
+                )
             logger.info(
                 f"Resuming from checkpoint: {projection_name} "
-                f"(after {after_received_at}, event {after_event_id})"
+                f"(after {after_received_at}, event {after_event_id}, "
+                f"stream_seq {after_stream_seq})"
             )
 
     # â”€â”€ Step 3: Build queryset â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
@@ -309,6 +621,8 @@ def replay_events(
         until=until,
         after_received_at=after_received_at,
         after_event_id=after_event_id,
+        after_stream_seq=after_stream_seq,
+        after_chain_positions=chain_positions,
     )
 
     total = events_qs.count()
@@ -322,46 +636,55 @@ def replay_events(
         return result
 
     # â”€â”€ Step 4: Replay with isolation â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
-    last_event = None
-
-    with ReplayContext():
-        for event in events_qs.iterator(chunk_size=batch_size):
-            result.events_processed += 1
-
-            try:
-                dispatch_result = bus_dispatch(event, subscriber_registry)
-                result.events_dispatched += 1
-
-                if dispatch_result["subscribers_failed"] > 0:
-                    result.dispatch_failures += dispatch_result[
-                        "subscribers_failed"
-                    ]
-                    result.errors.extend(dispatch_result["failures"])
-
-            except Exception as exc:
-                result.dispatch_failures += 1
-                result.errors.append({
-                    "event_id": str(event.event_id),
-                    "error": str(exc),
-                    "error_type": type(exc).__name__,
-                })
-                logger.error(
-                    f"Replay dispatch failed for event "
-                    f"{event.event_id}: {exc}",
-                    exc_info=True,
-                )
-
-            last_event = event
+    checkpoint_stream_seq = (
+        scoped_business_id is not None and ordering == ("stream_seq",)
+    )
+    transactional = transactional_checkpoints and projection_name is not None
 
-    # â”€â”€ Step 5: Save checkpoint â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
-    if last_event is not None and projection_name:
+    def checkpoint(event) -> None:
         save_checkpoint(
             projection_name=projection_name,
-            last_event_id=last_event.event_id,
-            last_received_at=last_event.received_at,
+            last_event_id=event.event_id,
+            last_received_at=event.received_at,
             business_id=scoped_business_id,
+            last_stream_seq=event.stream_seq if checkpoint_stream_seq else None,
+            last_chain_positions=chain_positions,
         )
         result.checkpoint_saved = True
+        logger.debug(f"Checkpoint saved: {projection_name} -> {event.event_id}")
+
+    last_event = None
+    events_since_checkpoint = 0
+    checkpointed_at = time.monotonic()
+
+    with ReplayContext():
+        events = events_qs.iterator(chunk_size=batch_size)
+        # The first fetch opens the cursor outside any transaction, so
+        # it survives the commit at each checkpoint
+        chunk = list(islice(events, batch_size))
+        while chunk:
+            with transaction.atomic() if transactional else nullcontext():
+                while chunk:
+                    _dispatch_chunk(chunk, subscriber_registry, result)
+                    last_event = chunk[-1]
+                    if chain_positions is not None:
+                        for event in chunk:
+                            chain_positions[event.chain_branch_id] = event.stream_seq
+                    events_since_checkpoint += len(chunk)
+
+                    chunk = list(islice(events, batch_size))
+                    if projection_name and (
+                        not chunk
+                        or events_since_checkpoint >= checkpoint_every
+                        or time.monotonic() - checkpointed_at
+                        >= checkpoint_seconds
+                    ):
+                        checkpoint(last_event)
+                        events_since_checkpoint = 0
+                        checkpointed_at = time.monotonic()
+                        break
+
+    if result.checkpoint_saved:
         logger.info(
             f"Checkpoint saved: {projection_name} â†’ "
             f"{last_event.event_id}"
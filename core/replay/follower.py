@@ -0,0 +1,243 @@
+"""
+BOS Replay Engine — Event Tail Follower
+=========================================
+Keeps the in-memory projections of one process current with events
+written by other processes (e.g. the other gunicorn workers).
+
+Each poll reads the chain heads of the business (one indexed lookup,
+two in BRANCH chain mode). Only when a head moved past a projection's
+position are the new events of that chain read, in stream_seq order,
+with the projection's event type filter applied in SQL. stream_seq is
+gapless and commit-ordered per chain, and a head only shows committed
+appends, so a follower never skips an event that commits late.
+
+Positions are kept per projection and per chain (None = business
+chain). A projection loaded from a snapshot plus replay joins at the
+chain heads read before it loaded, or at the last event it applied
+on each chain where that is further.
+
+A background thread polls every poll_seconds. sync() polls at once,
+so a process can apply its own write right after it commits;
+refresh() polls only if the last poll is older than poll_seconds, for
+followers without a thread (polled on access instead); it can skip
+the poll when another thread is already syncing, so readers on the
+access path do not queue behind each other.
+wait_for() gives read-your-writes across processes: it returns once
+every projection has applied a chain up to a given stream_seq.
+
+Each projection's apply function receives the new events of one
+sync as a list, in chain order, under the follower lock; its positions
+move only once the call returns, so a failed apply is retried whole
+on the next sync. This is NOT replay: the replay guard is not
+entered, and followed projections must be in-memory only.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Optional
+
+from django.db import close_old_connections, connection
+
+from core.event_store.persistence.repository import (
+    DEFAULT_LOAD_CHUNK_SIZE,
+    chain_head_positions,
+    iter_chain_events,
+)
+
+logger = logging.getLogger("bos.replay")
+
+TAIL_POLL_SECONDS = 1.0
+
+
+@dataclass
+class _FollowedProjection:
+    name: str
+    apply_events: Callable[[list[dict]], None]
+    event_types: Optional[frozenset[str]]
+    event_type_prefix: Optional[str]
+    positions: dict[Optional[uuid.UUID], int] = field(default_factory=dict)
+
+
+class EventTailFollower:
+    """
+    Applies the new events of one business to in-process projections.
+    """
+
+    def __init__(
+        self,
+        business_id: uuid.UUID,
+        *,
+        poll_seconds: float = TAIL_POLL_SECONDS,
+        chunk_size: int = DEFAULT_LOAD_CHUNK_SIZE,
+    ):
+        if poll_seconds <= 0:
+            raise ValueError("poll_seconds must be > 0.")
+        self.business_id = business_id
+        self.poll_seconds = poll_seconds
+        self.chunk_size = chunk_size
+        self._projections: list[_FollowedProjection] = []
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._synced_at: Optional[float] = None
+
+    def follow(
+        self,
+        name: str,
+        apply_events: Callable[[list[dict]], None],
+        *,
+        event_types: Optional[Iterable[str]] = None,
+        event_type_prefix: Optional[str] = None,
+        positions: Optional[dict[Optional[uuid.UUID], int]] = None,
+    ) -> None:
+        """
+        Follow a projection from positions (per chain; default: the
+        start of every chain). apply_events receives the event
+        envelopes of one sync, as iter_events_for_business() yields
+        them.
+        """
+        with self._lock:
+            self._projections.append(
+                _FollowedProjection(
+                    name=name,
+                    apply_events=apply_events,
+                    event_types=(
+                        None if event_types is None else frozenset(event_types)
+                    ),
+                    event_type_prefix=event_type_prefix,
+                    positions=dict(positions or {}),
+                )
+            )
+
+    def position(self, chain_branch_id: Optional[uuid.UUID] = None) -> int:
+        """stream_seq every followed projection has applied on a chain."""
+        with self._lock:
+            return min(
+                (
+                    projection.positions.get(chain_branch_id, 0)
+                    for projection in self._projections
+                ),
+                default=0,
+            )
+
+    def sync(self) -> int:
+        """
+        Apply every committed event past the followed positions.
+        Returns the number of events applied.
+        """
+        with self._lock:
+            self._synced_at = time.monotonic()
+            heads = chain_head_positions(self.business_id)
+            applied = 0
+            for projection in self._projections:
+                events: list[dict] = []
+                moved: dict[Optional[uuid.UUID], int] = {}
+                for chain_branch_id, head_seq in heads.items():
+                    after_seq = projection.positions.get(chain_branch_id, 0)
+                    if head_seq <= after_seq:
+                        continue
+                    events.extend(
+                        iter_chain_events(
+                            self.business_id,
+                            chain_branch_id,
+                            after_seq=after_seq,
+                            through_seq=head_seq,
+                            event_types=projection.event_types,
+                            event_type_prefix=projection.event_type_prefix,
+                            chunk_size=self.chunk_size,
+                        )
+                    )
+                    moved[chain_branch_id] = head_seq
+                if events:
+                    projection.apply_events(events)
+                    applied += len(events)
+                projection.positions.update(moved)
+            return applied
+
+    def refresh(self, *, wait: bool = True) -> int:
+        """
+        sync() unless the last one is less than poll_seconds old. With
+        wait=False, returns 0 at once while another thread syncs.
+        """
+        if not self._lock.acquire(blocking=wait):
+            return 0
+        try:
+            synced_at = self._synced_at
+            if (
+                synced_at is not None
+                and time.monotonic() - synced_at < self.poll_seconds
+            ):
+                return 0
+            return self.sync()
+        finally:
+            self._lock.release()
+
+    def wait_for(
+        self,
+        stream_seq: int,
+        chain_branch_id: Optional[uuid.UUID] = None,
+        timeout: float = 5.0,
+    ) -> bool:
+        """
+        Block until a chain is applied up to stream_seq (read-your-
+        writes). Returns False if timeout elapses first.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            if self.position(chain_branch_id) >= stream_seq:
+                return True
+            self.sync()
+            if self.position(chain_branch_id) >= stream_seq:
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(remaining, self.poll_seconds))
+
+    # ══════════════════════════════════════════════════════════
+    # BACKGROUND POLLING
+    # ══════════════════════════════════════════════════════════
+
+    def start(self) -> None:
+        """Start the polling thread (daemon). No-op if running."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"bos-tail-{self.business_id}",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the polling thread and wait for it to finish."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.poll_seconds):
+            close_old_connections()
+            try:
+                applied = self.sync()
+            except Exception as exc:
+                logger.error(
+                    f"Tail follower of business {self.business_id} failed: "
+                    f"{exc}",
+                    exc_info=True,
+                )
+                continue
+            if applied:
+                logger.debug(
+                    f"Tail follower of business {self.business_id} applied "
+                    f"{applied} event(s)"
+                )
+        connection.close()
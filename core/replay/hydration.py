@@ -0,0 +1,350 @@
+"""
+BOS Replay Engine — Lazy Projection Hydration
+===============================================
+Keeps in-memory projection stores for the businesses in use only.
+
+A BusinessProjectionCache holds one store per business. A store is
+hydrated on first access by the load callable (usually built on
+load_projection_store(): snapshot plus tail replay) and then served
+from memory. When the
+resident stores exceed the budget, the least recently used ones are
+evicted; the next access hydrates them again. Memory therefore tracks
+the active tenant set, not the number of tenants.
+
+Budget:
+    Each store is weighed once, when hydrated (weigh(store), default 1,
+    i.e. the budget counts businesses). Pinned businesses are never
+    evicted and count against the budget like the others.
+
+Concurrency:
+    Lookups take one short lock. A business is hydrated by exactly one
+    thread; concurrent first accesses wait for that load. Loads of
+    different businesses run in parallel.
+
+Metrics (metrics()): resident businesses and weight, budget, hits,
+misses, evictions, failed loads and the hit rate. Counters are
+cumulative for the cache lifetime.
+
+Loading (load_projection_store()):
+    A store starts from its latest snapshot (core.replay.snapshots)
+    and replays the events after its chain positions. A load that
+    replayed SNAPSHOT_EVERY_EVENTS or more events saves a new snapshot.
+    With an EventTailFollower, the store is then followed from the
+    chain heads read before loading, or from the last event applied on
+    each chain where that is further.
+
+Followed stores (PublishedProjectionStore):
+    Request threads read a followed store while its follower applies
+    new events, so the follower never changes a store readers can
+    see. It applies each sync to a copy (export_state() /
+    restore_state()) and publishes the copy with one reference
+    assignment: a read sees the store before or after a sync, never
+    one half applied. The copy shares records with the published
+    store, so apply functions replace the records they change instead
+    of mutating them.
+"""
+
+from __future__ import annotations
+
+import collections
+import logging
+import threading
+import uuid
+from concurrent.futures import Future
+from typing import Callable, Generic, Iterable, Optional, TypeVar
+
+from core.event_store.persistence.repository import (
+    business_replay_order,
+    chain_head_positions,
+    chain_positions_through,
+    iter_events_for_business,
+)
+from core.replay.follower import EventTailFollower
+from core.replay.snapshots import (
+    SNAPSHOT_EVERY_EVENTS,
+    load_projection_snapshot,
+    save_projection_snapshot,
+)
+
+logger = logging.getLogger("bos.replay")
+
+_Store = TypeVar("_Store")
+
+
+class BusinessProjectionCache(Generic[_Store]):
+    """
+    LRU of per-business projection stores, hydrated on demand.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        load: Callable[[uuid.UUID], _Store],
+        *,
+        budget: int,
+        weigh: Optional[Callable[[_Store], int]] = None,
+        on_hit: Optional[Callable[[uuid.UUID, _Store], None]] = None,
+        on_evict: Optional[Callable[[uuid.UUID, _Store], None]] = None,
+    ):
+        if budget < 1:
+            raise ValueError("budget must be >= 1.")
+        self.name = name
+        self.budget = budget
+        self._load = load
+        self._weigh = weigh or (lambda store: 1)
+        self._on_hit = on_hit
+        self._on_evict = on_evict
+        self._lock = threading.Lock()
+        self._resident: collections.OrderedDict[
+            uuid.UUID, tuple[_Store, int]
+        ] = collections.OrderedDict()
+        self._loading: dict[uuid.UUID, Future] = {}
+        self._pinned: set[uuid.UUID] = set()
+        self._weight = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._load_failures = 0
+
+    def get(self, business_id: uuid.UUID) -> _Store:
+        """The store of a business, hydrating it on first access."""
+        with self._lock:
+            entry = self._resident.get(business_id)
+            if entry is not None:
+                self._resident.move_to_end(business_id)
+                self._hits += 1
+            else:
+                self._misses += 1
+                pending = self._loading.get(business_id)
+                loader = pending is None
+                if loader:
+                    pending = Future()
+                    self._loading[business_id] = pending
+
+        if entry is not None:
+            if self._on_hit is not None:
+                self._on_hit(business_id, entry[0])
+            return entry[0]
+        if not loader:
+            return pending.result()
+        return self._hydrate(business_id, pending)
+
+    def _hydrate(self, business_id: uuid.UUID, pending: Future) -> _Store:
+        try:
+            store = self._load(business_id)
+            weight = self._weigh(store)
+        except BaseException as exc:
+            with self._lock:
+                self._load_failures += 1
+                del self._loading[business_id]
+            pending.set_exception(exc)
+            raise
+
+        with self._lock:
+            del self._loading[business_id]
+            self._resident[business_id] = (store, weight)
+            self._weight += weight
+            evicted = self._evict_over_budget()
+        pending.set_result(store)
+
+        for evicted_id, evicted_store in evicted:
+            if self._on_evict is not None:
+                self._on_evict(evicted_id, evicted_store)
+        if evicted:
+            logger.debug(
+                f"Projection cache {self.name}: evicted {len(evicted)} "
+                f"business(es) to stay within budget {self.budget}"
+            )
+        return store
+
+    def _evict_over_budget(self) -> list[tuple[uuid.UUID, _Store]]:
+        """Drop least recently used, unpinned stores. Caller holds the lock."""
+        evicted = []
+        for business_id in list(self._resident):
+            if self._weight <= self.budget:
+                break
+            if business_id in self._pinned:
+                continue
+            store, weight = self._resident.pop(business_id)
+            self._weight -= weight
+            self._evictions += 1
+            evicted.append((business_id, store))
+        return evicted
+
+    def pin(self, business_id: uuid.UUID) -> _Store:
+        """Hydrate a business and keep it resident until unpinned."""
+        with self._lock:
+            self._pinned.add(business_id)
+        return self.get(business_id)
+
+    def unpin(self, business_id: uuid.UUID) -> None:
+        with self._lock:
+            self._pinned.discard(business_id)
+
+    def evict(self, business_id: uuid.UUID) -> bool:
+        """Drop one business (e.g. after a projection reset)."""
+        with self._lock:
+            entry = self._resident.pop(business_id, None)
+            if entry is None:
+                return False
+            self._weight -= entry[1]
+        if self._on_evict is not None:
+            self._on_evict(business_id, entry[0])
+        return True
+
+    def __contains__(self, business_id: uuid.UUID) -> bool:
+        with self._lock:
+            return business_id in self._resident
+
+    def metrics(self) -> dict[str, float]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "resident_businesses": len(self._resident),
+                "resident_weight": self._weight,
+                "budget": self.budget,
+                "pinned": len(self._pinned),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "load_failures": self._load_failures,
+                "hit_rate": (self._hits / lookups) if lookups else 0.0,
+            }
+
+
+class PublishedProjectionStore(Generic[_Store]):
+    """
+    A followed projection store, published copy-on-write (see module
+    docstring). Attribute reads go to the published store.
+    """
+
+    def __init__(
+        self,
+        projection_store: _Store,
+        apply_event: Callable[[_Store, dict], None],
+    ):
+        self._published = projection_store
+        self._apply_event = apply_event
+
+    @property
+    def published(self) -> _Store:
+        """The current store; never changed once published."""
+        return self._published
+
+    def apply_events(self, events: list[dict]) -> None:
+        """Apply events to a copy of the store, then publish the copy."""
+        published = self._published
+        projection_store = type(published)()
+        projection_store.restore_state(published.export_state())
+        for event_data in events:
+            self._apply_event(projection_store, event_data)
+        self._published = projection_store
+
+    def __getattr__(self, name: str):
+        return getattr(self._published, name)
+
+
+def load_projection_store(
+    store_class: type[_Store],
+    projection_name: str,
+    business_id: uuid.UUID,
+    apply_event: Callable[[_Store, dict], None],
+    *,
+    event_types: Optional[Iterable[str]] = None,
+    event_type_prefix: Optional[str] = None,
+    follower: Optional[EventTailFollower] = None,
+) -> _Store:
+    """
+    Build a projection store from its snapshot plus the events after
+    it (or from all events without a usable snapshot).
+
+    store_class() builds an empty store; it provides SNAPSHOT_VERSION,
+    export_state() and restore_state(). event_types / event_type_prefix
+    select the projection's events; apply_event(store, event_data)
+    applies one of them. With a follower, the store is then followed
+    from where the load left each chain, and is returned as a
+    PublishedProjectionStore.
+    """
+    projection_store = store_class()
+    last_event_id = None
+    events_applied = 0
+    positions: dict[Optional[uuid.UUID], int] = {}
+    # Read first: every event up to these heads is reflected once the
+    # store is loaded, whether or not it matched the projection.
+    heads = chain_head_positions(business_id) if follower is not None else {}
+
+    snapshot = load_projection_snapshot(
+        projection_name,
+        business_id,
+        store_class.SNAPSHOT_VERSION,
+    )
+    if snapshot is not None:
+        snapshot_positions = snapshot.chain_positions
+        if (
+            snapshot_positions is None
+            and business_replay_order(business_id) == ("stream_seq",)
+        ):
+            snapshot_positions = chain_positions_through(
+                business_id,
+                snapshot.last_event_id,
+            )
+        if snapshot_positions is None:
+            logger.warning(
+                f"Snapshot of {projection_name} for business {business_id} "
+                f"has no chain positions for its branch sub-chains; "
+                f"replaying all events."
+            )
+        else:
+            try:
+                projection_store.restore_state(snapshot.state)
+            except (KeyError, TypeError, ValueError) as exc:
+                logger.warning(
+                    f"Snapshot of {projection_name} for business {business_id} "
+                    f"not restorable ({exc}); replaying all events."
+                )
+                projection_store = store_class()
+            else:
+                last_event_id = snapshot.last_event_id
+                events_applied = snapshot.events_applied
+                positions = dict(snapshot_positions)
+
+    replayed = 0
+    for event_data in iter_events_for_business(
+        business_id,
+        event_types=event_types,
+        event_type_prefix=event_type_prefix,
+        after_positions=positions or None,
+    ):
+        apply_event(projection_store, event_data)
+        last_event_id = event_data["event_id"]
+        if event_data["stream_seq"] is not None:
+            positions[event_data["chain_branch_id"]] = event_data["stream_seq"]
+        replayed += 1
+
+    for chain_branch_id, head_seq in heads.items():
+        positions[chain_branch_id] = max(
+            positions.get(chain_branch_id, 0),
+            head_seq,
+        )
+
+    if replayed >= SNAPSHOT_EVERY_EVENTS:
+        save_projection_snapshot(
+            projection_name,
+            business_id,
+            projection_store.export_state(),
+            store_class.SNAPSHOT_VERSION,
+            last_event_id,
+            events_applied + replayed,
+            chain_positions=positions,
+        )
+
+    if follower is not None:
+        projection_store = PublishedProjectionStore(projection_store, apply_event)
+        follower.follow(
+            projection_name,
+            projection_store.apply_events,
+            event_types=event_types,
+            event_type_prefix=event_type_prefix,
+            positions=positions,
+        )
+    return projection_store
@@ -0,0 +1,88 @@
+"""
+BOS Replay Engine — audit_event_chains
+========================================
+Tamper audit of every business chain (or the given businesses),
+sharded by business across worker processes. Verifies the events
+appended since the last run; --full re-verifies from genesis. Exits
+non-zero when any business fails, so it can gate a nightly job.
+"""
+
+import json
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.replay.chain_audit import DEFAULT_AUDIT_CHUNK_SIZE, audit_event_chains
+
+
+class Command(BaseCommand):
+    help = "Verify hashes, linkage, heads and anchors of every event chain."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--business-id",
+            action="append",
+            default=[],
+            help="Audit only this business (repeatable).",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Worker processes (default: CPU count; 1 = in-process).",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_AUDIT_CHUNK_SIZE,
+            help="Rows fetched per round-trip while streaming.",
+        )
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Ignore verification watermarks; re-verify from genesis.",
+        )
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            help="Print the report as JSON.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            business_ids = [
+                uuid.UUID(business_id) for business_id in options["business_id"]
+            ] or None
+        except ValueError as exc:
+            raise CommandError(f"Invalid --business-id: {exc}")
+        if options["workers"] is not None and options["workers"] < 1:
+            raise CommandError("--workers must be >= 1.")
+
+        report = audit_event_chains(
+            business_ids,
+            workers=options["workers"],
+            chunk_size=options["chunk_size"],
+            full=options["full"],
+        )
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report.as_dict(), indent=2))
+        else:
+            for audit in report.failures:
+                self.stdout.write(
+                    f"{audit.business_id}: {audit.failure}"
+                    + (f" at event {audit.event_id}" if audit.event_id else "")
+                    + (f" — {audit.detail}" if audit.detail else "")
+                )
+            self.stdout.write(
+                f"Audited {len(report.businesses)} business(es), "
+                f"{report.events_checked} events in "
+                f"{report.duration_seconds:.1f}s on {report.workers} worker(s)."
+            )
+
+        if not report.ok:
+            raise CommandError(
+                f"{len(report.failures)} business(es) failed the chain audit."
+            )
+        if not options["json"]:
+            self.stdout.write(self.style.SUCCESS("All chains verified."))
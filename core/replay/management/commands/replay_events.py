@@ -0,0 +1,199 @@
+"""
+BOS Replay Engine — replay_events
+===================================
+Replays event history through a subscriber registry, one business per
+worker. --all replays every business; --business-id limits the run to
+the given ones. --resume continues each business from its checkpoint;
+--dry-run verifies and counts without dispatching. Exits non-zero when
+any business fails.
+
+The registry is named by --registry: a dotted path to a callable that
+returns the SubscriberRegistry holding the projection handlers.
+"""
+
+import json
+import uuid
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.module_loading import import_string
+
+from core.events.registry import SubscriberRegistry
+from core.replay.checkpoints import (
+    CHECKPOINT_EVERY_EVENTS,
+    CHECKPOINT_EVERY_SECONDS,
+)
+from core.replay.parallel import replay_businesses_parallel
+
+
+class Command(BaseCommand):
+    help = "Replay events of every business (or the given ones) in parallel."
+
+    def add_arguments(self, parser):
+        scope = parser.add_mutually_exclusive_group(required=True)
+        scope.add_argument(
+            "--business-id",
+            action="append",
+            default=[],
+            help="Replay only this business (repeatable).",
+        )
+        scope.add_argument(
+            "--all",
+            action="store_true",
+            help="Replay every business.",
+        )
+        parser.add_argument(
+            "--registry",
+            default=None,
+            help=(
+                "Dotted path to a callable returning the SubscriberRegistry "
+                "to dispatch to. Required unless --dry-run."
+            ),
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Worker threads (default: CPU count; 1 = serial).",
+        )
+        parser.add_argument(
+            "--until",
+            default=None,
+            help="Replay events received up to this ISO 8601 timestamp.",
+        )
+        parser.add_argument(
+            "--projection-name",
+            default=None,
+            help="Projection whose per-business checkpoints are kept.",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue each business from its checkpoint.",
+        )
+        parser.add_argument(
+            "--checkpoint-every",
+            type=int,
+            default=CHECKPOINT_EVERY_EVENTS,
+            help="Save each business's checkpoint after this many events.",
+        )
+        parser.add_argument(
+            "--checkpoint-seconds",
+            type=float,
+            default=CHECKPOINT_EVERY_SECONDS,
+            help="...or after this many seconds.",
+        )
+        parser.add_argument(
+            "--transactional-checkpoints",
+            action="store_true",
+            help=(
+                "Commit each checkpoint interval together with the "
+                "projection's writes (exactly-once on resume)."
+            ),
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Verify chains and count events without dispatching.",
+        )
+        parser.add_argument(
+            "--full-hash-verify",
+            action="store_true",
+            help="Recompute every event hash before replaying.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Events fetched per round-trip.",
+        )
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            help="Print the result as JSON.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            business_ids = [
+                uuid.UUID(business_id) for business_id in options["business_id"]
+            ] or None
+        except ValueError as exc:
+            raise CommandError(f"Invalid --business-id: {exc}")
+        if options["workers"] is not None and options["workers"] < 1:
+            raise CommandError("--workers must be >= 1.")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be >= 1.")
+        if options["checkpoint_every"] < 1:
+            raise CommandError("--checkpoint-every must be >= 1.")
+        if options["resume"] and not options["projection_name"]:
+            raise CommandError("--resume requires --projection-name.")
+
+        until = None
+        if options["until"]:
+            try:
+                until = datetime.fromisoformat(options["until"])
+            except ValueError as exc:
+                raise CommandError(f"Invalid --until: {exc}")
+
+        registry = self._load_registry(options["registry"], options["dry_run"])
+
+        result = replay_businesses_parallel(
+            registry,
+            business_ids,
+            workers=options["workers"],
+            until=until,
+            projection_name=options["projection_name"],
+            use_checkpoint=options["resume"],
+            dry_run=options["dry_run"],
+            full_hash_verify=options["full_hash_verify"],
+            batch_size=options["batch_size"],
+            checkpoint_every=options["checkpoint_every"],
+            checkpoint_seconds=options["checkpoint_seconds"],
+            transactional_checkpoints=options["transactional_checkpoints"],
+        )
+
+        if options["json"]:
+            self.stdout.write(json.dumps({
+                "success": result.success,
+                "events_processed": result.events_processed,
+                "events_dispatched": result.events_dispatched,
+                "dispatch_failures": result.dispatch_failures,
+                "chain_verified": result.chain_verified,
+                "checkpoint_saved": result.checkpoint_saved,
+                "dry_run": result.dry_run,
+                "errors": result.errors,
+            }, indent=2, default=str))
+        else:
+            for error in result.errors:
+                self.stdout.write(
+                    ", ".join(f"{key}={value}" for key, value in error.items())
+                )
+            self.stdout.write(
+                f"Processed {result.events_processed} events, dispatched "
+                f"{result.events_dispatched}, {result.dispatch_failures} "
+                f"failure(s)" + (" (dry run)." if result.dry_run else ".")
+            )
+
+        if not result.success:
+            raise CommandError(
+                f"Replay failed: {len(result.errors)} error(s)."
+            )
+        if not options["json"]:
+            self.stdout.write(self.style.SUCCESS("Replay complete."))
+
+    def _load_registry(self, path, dry_run):
+        if path is None:
+            if dry_run:
+                return SubscriberRegistry()
+            raise CommandError("--registry is required unless --dry-run.")
+        try:
+            registry = import_string(path)()
+        except ImportError as exc:
+            raise CommandError(f"Cannot import --registry '{path}': {exc}")
+        if not isinstance(registry, SubscriberRegistry):
+            raise CommandError(
+                f"--registry '{path}' returned {type(registry).__name__}, "
+                f"not a SubscriberRegistry."
+            )
+        return registry
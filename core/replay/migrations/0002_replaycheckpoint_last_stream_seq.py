@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("replay", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="replaycheckpoint",
+            name="last_stream_seq",
+            field=models.BigIntegerField(blank=True, help_text="stream_seq of last processed event. Business-scoped replay resumes with stream_seq > last_stream_seq.", null=True),
+        ),
+    ]
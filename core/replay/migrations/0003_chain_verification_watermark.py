@@ -0,0 +1,34 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("replay", "0002_replaycheckpoint_last_stream_seq"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChainVerificationWatermark",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("business_id", models.UUIDField(help_text="Business that owns the chain.")),
+                ("chain_branch_id", models.UUIDField(blank=True, help_text="Branch sub-chain. Null = the business chain.", null=True)),
+                ("verified_seq", models.BigIntegerField(help_text="stream_seq of the last verified event.")),
+                ("verified_hash", models.CharField(help_text="event_hash of the last verified event.", max_length=64)),
+                ("verified_event_id", models.UUIDField(help_text="event_id of the last verified event.")),
+                ("verified_at", models.DateTimeField(auto_now=True, help_text="When this watermark last moved.")),
+            ],
+            options={
+                "db_table": "replay_chain_verification_watermarks",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="chainverificationwatermark",
+            constraint=models.UniqueConstraint(condition=models.Q(("chain_branch_id__isnull", True)), fields=("business_id",), name="uq_verify_wm_biz_chain"),
+        ),
+        migrations.AddConstraint(
+            model_name="chainverificationwatermark",
+            constraint=models.UniqueConstraint(condition=models.Q(("chain_branch_id__isnull", False)), fields=("business_id", "chain_branch_id"), name="uq_verify_wm_biz_branch"),
+        ),
+    ]
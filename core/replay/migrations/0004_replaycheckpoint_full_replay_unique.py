@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("replay", "0003_chain_verification_watermark"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="replaycheckpoint",
+            constraint=models.UniqueConstraint(condition=models.Q(("business_id__isnull", True)), fields=("projection_name",), name="uq_replay_ckpt_full"),
+        ),
+    ]
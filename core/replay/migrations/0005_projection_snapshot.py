@@ -0,0 +1,28 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("replay", "0004_replaycheckpoint_full_replay_unique"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProjectionSnapshot",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("projection_name", models.CharField(help_text="Name of the projection.", max_length=255)),
+                ("business_id", models.UUIDField(help_text="Business whose events the state reflects.")),
+                ("state_version", models.PositiveIntegerField(help_text="Projection state layout version.")),
+                ("last_event_id", models.UUIDField(help_text="Last event applied to the state.")),
+                ("events_applied", models.BigIntegerField(help_text="Number of events the state reflects.")),
+                ("state", models.BinaryField(help_text="Encoded projection state.")),
+                ("taken_at", models.DateTimeField(auto_now=True, help_text="When this snapshot was saved.")),
+            ],
+            options={
+                "db_table": "replay_projection_snapshots",
+                "unique_together": {("projection_name", "business_id")},
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("replay", "0005_projection_snapshot"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="projectionsnapshot",
+            name="chain_positions",
+            field=models.JSONField(blank=True, help_text="stream_seq the state reflects per chain, keyed by chain_branch_id ('' = business chain).", null=True),
+        ),
+        migrations.AddField(
+            model_name="replaycheckpoint",
+            name="last_chain_positions",
+            field=models.JSONField(blank=True, help_text="stream_seq of the last processed event per chain, keyed by chain_branch_id ('' = business chain). Business-scoped replay of a business with branch sub-chains resumes after these positions.", null=True),
+        ),
+    ]
@@ -1,9 +1,16 @@
 """
 BOS Replay — Models (Django Discovery)
 ========================================
-Re-exports model from checkpoints module for Django migration discovery.
+Re-exports models from the checkpoints, snapshots and verification
+modules for Django migration discovery.
 """
 
 from core.replay.checkpoints import ReplayCheckpoint
+from core.replay.snapshots import ProjectionSnapshot
+from core.replay.verification import ChainVerificationWatermark
 
-__all__ = ["ReplayCheckpoint"]
+__all__ = [
+    "ChainVerificationWatermark",
+    "ProjectionSnapshot",
+    "ReplayCheckpoint",
+]
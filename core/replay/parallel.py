@@ -0,0 +1,150 @@
+"""
+BOS Replay Engine — Parallel Per-Business Replay
+==================================================
+Replays many businesses at once, one business per task.
+
+Businesses share no events and no chain, so an unscoped replay splits
+cleanly by business_id. Each task is an ordinary business-scoped
+replay_events() call, which keeps every guarantee of a serial replay
+for that business:
+- Events in stream_seq (chain) order
+- Chain verified before dispatch
+- Its own ReplayContext: the replay flag is thread-local, so every
+  worker thread blocks persistence for itself
+- Its own checkpoint (projection_name, business_id), so a resumed run
+  (use_checkpoint=True) continues each business where it stopped
+
+Workers are threads. Replay handlers mostly wait on the database,
+where threads run concurrently; each worker closes its own database
+connection when its tasks are done. Handlers must therefore be
+thread-safe across businesses (they never see two events of the same
+business concurrently).
+
+Largest businesses are scheduled first so one long chain does not
+start last. The per-business ReplayResults are merged into one;
+a business whose replay raised (e.g. broken chain) is reported in
+errors and makes the merged result unsuccessful, without stopping the
+other businesses.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Iterable, Optional
+
+from django.db import connections
+
+from core.event_store.models import EventChainHead
+from core.events.registry import SubscriberRegistry
+from core.replay.checkpoints import (
+    CHECKPOINT_EVERY_EVENTS,
+    CHECKPOINT_EVERY_SECONDS,
+)
+from core.replay.event_replayer import ReplayResult, replay_events
+from core.replay.scope import ReplayScope
+
+logger = logging.getLogger("bos.replay")
+
+
+def replay_businesses_parallel(
+    subscriber_registry: SubscriberRegistry,
+    business_ids: Optional[Iterable[uuid.UUID]] = None,
+    *,
+    workers: Optional[int] = None,
+    until: Optional[datetime] = None,
+    projection_name: Optional[str] = None,
+    use_checkpoint: bool = False,
+    dry_run: bool = False,
+    full_hash_verify: bool = False,
+    batch_size: int = 500,
+    checkpoint_every: int = CHECKPOINT_EVERY_EVENTS,
+    checkpoint_seconds: float = CHECKPOINT_EVERY_SECONDS,
+    transactional_checkpoints: bool = False,
+) -> ReplayResult:
+    """
+    Replay every business (or the given ones) across a worker pool.
+
+    Args:
+        subscriber_registry: Bus registry with handlers for replay.
+        business_ids:        Businesses to replay. Default: every
+                             business with a chain, largest first.
+        workers:             Worker threads (default: CPU count).
+        until, projection_name, use_checkpoint, dry_run,
+        full_hash_verify, batch_size, checkpoint_every,
+        checkpoint_seconds, transactional_checkpoints:
+                             As for replay_events(), applied to each
+                             business.
+
+    Returns:
+        The merged ReplayResult of all businesses.
+    """
+    if business_ids is None:
+        business_ids = list(
+            EventChainHead.objects.order_by("-sequence", "business_id")
+            .values_list("business_id", flat=True)
+        )
+    else:
+        business_ids = list(business_ids)
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(business_ids) or 1))
+
+    def replay_one(business_id: uuid.UUID) -> ReplayResult:
+        try:
+            return replay_events(
+                subscriber_registry=subscriber_registry,
+                business_id=business_id,
+                replay_scope=ReplayScope.BUSINESS,
+                until=until,
+                projection_name=projection_name,
+                use_checkpoint=use_checkpoint,
+                dry_run=dry_run,
+                full_hash_verify=full_hash_verify,
+                batch_size=batch_size,
+                checkpoint_every=checkpoint_every,
+                checkpoint_seconds=checkpoint_seconds,
+                transactional_checkpoints=transactional_checkpoints,
+            )
+        except Exception as exc:
+            logger.error(
+                f"Replay of business {business_id} failed: {exc}",
+                exc_info=True,
+            )
+            return ReplayResult(
+                dry_run=dry_run,
+                errors=[{
+                    "business_id": str(business_id),
+                    "error": str(exc),
+                    "error_type": type(exc).__name__,
+                }],
+            )
+        finally:
+            # Worker threads open their own connections; the pool does
+            # not outlive this call, so neither should they.
+            connections.close_all()
+
+    logger.info(
+        f"Parallel replay starting: {len(business_ids)} business(es) "
+        f"on {workers} worker(s) (dry_run={dry_run})"
+    )
+    if workers == 1:
+        results = [replay_one(business_id) for business_id in business_ids]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="bos-replay",
+        ) as pool:
+            results = list(pool.map(replay_one, business_ids))
+
+    merged = ReplayResult.merge(results)
+    merged.dry_run = dry_run
+    logger.info(
+        f"Parallel replay complete: {len(business_ids)} business(es), "
+        f"{merged.events_processed} processed, "
+        f"{merged.events_dispatched} dispatched, "
+        f"{merged.dispatch_failures} failures"
+    )
+    return merged
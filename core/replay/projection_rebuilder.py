@@ -45,6 +45,12 @@ class ProjectionProtocol(Protocol):
 
     projection_name: Unique identifier (used for checkpoints).
     truncate():      Clear projection data (scoped by business if given).
+
+    Optional:
+    transactional_checkpoints: True when the projection writes to the
+                     default database from its handlers; the rebuild
+                     then commits each checkpoint interval with its
+                     writes, so a resumed rebuild applies no event twice.
     """
 
     @property
@@ -90,6 +96,7 @@ def rebuild_projection(
     business_id: Optional[uuid.UUID] = None,
     until: Optional[datetime] = None,
     dry_run: bool = False,
+    batch_size: int = 500,
 ) -> RebuildResult:
     """
     Full projection rebuild: truncate → replay → checkpoint.
@@ -100,6 +107,8 @@ def rebuild_projection(
         business_id:         Scope rebuild to single business (optional).
         until:               Replay events up to this timestamp (optional).
         dry_run:             Verify and count only, no truncation or dispatch.
+        batch_size:          Events per dispatch batch; subscribers with a
+                             batch handler receive each batch in one call.
 
     Returns:
         RebuildResult with truncation and replay status.
@@ -141,6 +150,10 @@ def rebuild_projection(
         projection_name=projection.projection_name,
         use_checkpoint=False,  # Full rebuild — start from beginning
         dry_run=dry_run,
+        batch_size=batch_size,
+        transactional_checkpoints=getattr(
+            projection, "transactional_checkpoints", False,
+        ),
     )
     result.replay = replay_result
 
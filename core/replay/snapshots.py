@@ -0,0 +1,288 @@
+"""
+BOS Replay Engine — Projection Snapshots
+==========================================
+Saved projection state, so a process rebuilds an in-memory projection
+from its latest snapshot plus the events after it instead of from the
+whole history.
+
+Table: replay_projection_snapshots
+Fields:
+- projection_name: which projection the state belongs to
+- business_id: business whose events the state reflects
+- state_version: the projection's own state layout version
+- last_event_id: last event applied to the state
+- chain_positions: per-chain stream_seq the state reflects (the
+  resume point; null for snapshots taken before it was recorded)
+- events_applied: number of events the state reflects
+- state: encoded state (see encode_snapshot)
+- taken_at: when the snapshot was saved
+
+Encoding (SNAPSHOT_FORMAT_VERSION 1):
+
+    b"BOSP" | format version (u8) | state_version (u16) | zlib(JSON)
+
+The projection supplies its state as JSON-compatible data and decides
+its own state_version; a snapshot written under another state_version
+is ignored, so changing a projection's layout only costs one full
+replay. A snapshot is taken when a rebuild replayed at least
+SNAPSHOT_EVERY_EVENTS events past the previous one.
+
+Snapshots are NOT events. They are operational metadata.
+They can be deleted or reset safely (the next start is then a full
+replay).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import struct
+import uuid
+import zlib
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from django.db import models
+
+from core.event_store.models import Event
+from core.event_store.persistence.repository import (
+    decode_chain_positions,
+    encode_chain_positions,
+)
+from core.replay.errors import SnapshotFormatError
+
+logger = logging.getLogger("bos.replay")
+
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_EVERY_EVENTS = 1_000
+
+_MAGIC = b"BOSP"
+_HEADER = struct.Struct(">4sBH")
+
+
+class ProjectionSnapshot(models.Model):
+    """
+    Latest saved state of one projection for one business.
+    """
+
+    projection_name = models.CharField(
+        max_length=255,
+        help_text="Name of the projection.",
+    )
+    business_id = models.UUIDField(
+        help_text="Business whose events the state reflects.",
+    )
+    state_version = models.PositiveIntegerField(
+        help_text="Projection state layout version.",
+    )
+    last_event_id = models.UUIDField(
+        help_text="Last event applied to the state.",
+    )
+    events_applied = models.BigIntegerField(
+        help_text="Number of events the state reflects.",
+    )
+    chain_positions = models.JSONField(
+        null=True,
+        blank=True,
+        help_text=(
+            "stream_seq the state reflects per chain, keyed by "
+            "chain_branch_id ('' = business chain)."
+        ),
+    )
+    state = models.BinaryField(
+        help_text="Encoded projection state.",
+    )
+    taken_at = models.DateTimeField(
+        auto_now=True,
+        help_text="When this snapshot was saved.",
+    )
+
+    class Meta:
+        db_table = "replay_projection_snapshots"
+        unique_together = [("projection_name", "business_id")]
+
+    def __str__(self):
+        return (
+            f"Snapshot({self.projection_name}, {self.business_id}, "
+            f"last={self.last_event_id})"
+        )
+
+
+@dataclass(frozen=True)
+class LoadedSnapshot:
+    """A decoded snapshot and the position it was taken at."""
+
+    state: Any
+    last_event_id: uuid.UUID
+    events_applied: int
+    chain_positions: Optional[dict[Optional[uuid.UUID], int]] = None
+
+
+# ══════════════════════════════════════════════════════════════
+# ENCODING
+# ══════════════════════════════════════════════════════════════
+
+def encode_snapshot(state: Any, state_version: int) -> bytes:
+    """
+    Encode JSON-compatible state. Raises TypeError for anything JSON
+    cannot represent exactly.
+    """
+    body = json.dumps(
+        state,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        allow_nan=False,
+    ).encode("utf-8")
+    header = _HEADER.pack(_MAGIC, SNAPSHOT_FORMAT_VERSION, state_version)
+    return header + zlib.compress(body)
+
+
+def decode_snapshot(data: bytes) -> tuple[int, Any]:
+    """
+    Decode snapshot bytes into (state_version, state).
+    Raises SnapshotFormatError for foreign, newer or corrupt data.
+    """
+    data = bytes(data)
+    if len(data) < _HEADER.size:
+        raise SnapshotFormatError("Snapshot is truncated.")
+    magic, format_version, state_version = _HEADER.unpack_from(data)
+    if magic != _MAGIC:
+        raise SnapshotFormatError("Not a projection snapshot.")
+    if format_version != SNAPSHOT_FORMAT_VERSION:
+        raise SnapshotFormatError(
+            f"Unsupported snapshot format version {format_version}."
+        )
+    try:
+        body = zlib.decompress(data[_HEADER.size:])
+        return state_version, json.loads(body)
+    except (zlib.error, ValueError) as exc:
+        raise SnapshotFormatError(f"Corrupt snapshot: {exc}") from exc
+
+
+# ══════════════════════════════════════════════════════════════
+# SNAPSHOT OPERATIONS
+# ══════════════════════════════════════════════════════════════
+
+def save_projection_snapshot(
+    projection_name: str,
+    business_id: uuid.UUID,
+    state: Any,
+    state_version: int,
+    last_event_id: uuid.UUID,
+    events_applied: int,
+    chain_positions: Optional[dict[Optional[uuid.UUID], int]] = None,
+) -> bool:
+    """
+    Replace the snapshot of a projection for a business.
+    Returns False (and keeps the previous one) when the state cannot
+    be encoded.
+    """
+    try:
+        encoded = encode_snapshot(state, state_version)
+    except (TypeError, ValueError) as exc:
+        logger.warning(
+            f"Snapshot of {projection_name} for business {business_id} "
+            f"skipped: state is not encodable ({exc})."
+        )
+        return False
+
+    ProjectionSnapshot.objects.update_or_create(
+        projection_name=projection_name,
+        business_id=business_id,
+        defaults={
+            "state_version": state_version,
+            "last_event_id": last_event_id,
+            "events_applied": events_applied,
+            "chain_positions": (
+                encode_chain_positions(chain_positions)
+                if chain_positions is not None
+                else None
+            ),
+            "state": encoded,
+        },
+    )
+    logger.info(
+        f"Snapshot saved: {projection_name} for business {business_id} "
+        f"({events_applied} events, {len(encoded)} bytes)"
+    )
+    return True
+
+
+def load_projection_snapshot(
+    projection_name: str,
+    business_id: uuid.UUID,
+    state_version: int,
+) -> Optional[LoadedSnapshot]:
+    """
+    Load the snapshot of a projection for a business.
+
+    Returns None when there is none, or when it cannot be used: a
+    different state_version, unreadable bytes, or a resume event the
+    business no longer has.
+    """
+    snapshot = ProjectionSnapshot.objects.filter(
+        projection_name=projection_name,
+        business_id=business_id,
+    ).first()
+    if snapshot is None:
+        return None
+    if snapshot.state_version != state_version:
+        logger.info(
+            f"Snapshot of {projection_name} for business {business_id} "
+            f"ignored: state version {snapshot.state_version}, "
+            f"expected {state_version}."
+        )
+        return None
+
+    try:
+        encoded_version, state = decode_snapshot(snapshot.state)
+        if encoded_version != state_version:
+            raise SnapshotFormatError(
+                f"Encoded state version {encoded_version} does not match "
+                f"the stored {state_version}."
+            )
+    except SnapshotFormatError as exc:
+        logger.warning(
+            f"Snapshot of {projection_name} for business {business_id} "
+            f"ignored: {exc}"
+        )
+        return None
+
+    if not Event.objects.filter(
+        business_id=business_id,
+        event_id=snapshot.last_event_id,
+    ).exists():
+        logger.warning(
+            f"Snapshot of {projection_name} for business {business_id} "
+            f"ignored: event {snapshot.last_event_id} not found."
+        )
+        return None
+
+    return LoadedSnapshot(
+        state=state,
+        last_event_id=snapshot.last_event_id,
+        events_applied=snapshot.events_applied,
+        chain_positions=(
+            decode_chain_positions(snapshot.chain_positions)
+            if snapshot.chain_positions is not None
+            else None
+        ),
+    )
+
+
+def clear_projection_snapshots(
+    projection_name: Optional[str] = None,
+    business_id: Optional[uuid.UUID] = None,
+) -> int:
+    """
+    Delete snapshots (of one projection and/or business, or all).
+    Returns the number deleted.
+    """
+    snapshots = ProjectionSnapshot.objects.all()
+    if projection_name is not None:
+        snapshots = snapshots.filter(projection_name=projection_name)
+    if business_id is not None:
+        snapshots = snapshots.filter(business_id=business_id)
+    deleted, _ = snapshots.delete()
+    return deleted
@@ -0,0 +1,185 @@
+"""
+BOS Replay Engine — Chain Verification Watermarks
+===================================================
+Remembers how far each hash chain has already been verified, so the
+next verification only walks the events appended since.
+
+Table: replay_chain_verification_watermarks
+Fields:
+- business_id: business that owns the chain
+- chain_branch_id: branch sub-chain (BRANCH chain mode), null for the
+  business chain
+- verified_seq: stream_seq of the last verified event
+- verified_hash: event_hash of that event
+- verified_event_id: event_id of that event
+- verified_at: when the watermark last moved
+
+A watermark is only advanced by a hash-recomputing verification (the
+chain audit) that found the whole chain sound up to verified_seq.
+Incremental verification anchors on it: the event at verified_seq must
+still carry verified_hash, and the first unverified event must link to
+it. Events at or below the watermark are re-verified only in full mode.
+
+Watermarks are NOT events. They are operational metadata.
+They can be deleted or reset safely (the next run is then a full one).
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import Optional
+
+from django.db import models
+from django.db.models import Q
+
+from core.event_store.models import Event
+
+
+class ChainVerificationWatermark(models.Model):
+    """
+    Last verified position of one hash chain.
+    """
+
+    business_id = models.UUIDField(
+        help_text="Business that owns the chain.",
+    )
+    chain_branch_id = models.UUIDField(
+        null=True,
+        blank=True,
+        help_text="Branch sub-chain. Null = the business chain.",
+    )
+    verified_seq = models.BigIntegerField(
+        help_text="stream_seq of the last verified event.",
+    )
+    verified_hash = models.CharField(
+        max_length=64,
+        help_text="event_hash of the last verified event.",
+    )
+    verified_event_id = models.UUIDField(
+        help_text="event_id of the last verified event.",
+    )
+    verified_at = models.DateTimeField(
+        auto_now=True,
+        help_text="When this watermark last moved.",
+    )
+
+    class Meta:
+        db_table = "replay_chain_verification_watermarks"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["business_id"],
+                condition=Q(chain_branch_id__isnull=True),
+                name="uq_verify_wm_biz_chain",
+            ),
+            models.UniqueConstraint(
+                fields=["business_id", "chain_branch_id"],
+                condition=Q(chain_branch_id__isnull=False),
+                name="uq_verify_wm_biz_branch",
+            ),
+        ]
+
+    def __str__(self):
+        chain = self.chain_branch_id or "business chain"
+        return (
+            f"VerificationWatermark({self.business_id}/{chain}, "
+            f"seq={self.verified_seq})"
+        )
+
+
+# ══════════════════════════════════════════════════════════════
+# WATERMARK OPERATIONS
+# ══════════════════════════════════════════════════════════════
+
+def load_watermarks(
+    business_id: uuid.UUID,
+) -> dict[Optional[uuid.UUID], ChainVerificationWatermark]:
+    """Watermarks of every chain of a business, keyed by chain_branch_id."""
+    return {
+        watermark.chain_branch_id: watermark
+        for watermark in ChainVerificationWatermark.objects.filter(
+            business_id=business_id,
+        )
+    }
+
+
+def advance_watermarks(
+    business_id: uuid.UUID,
+    chain_tails: dict[Optional[uuid.UUID], tuple[uuid.UUID, int, str]],
+) -> None:
+    """
+    Move the watermarks of a business to freshly verified chain ends.
+
+    chain_tails maps chain_branch_id to (event_id, stream_seq,
+    event_hash) of the last verified event of that chain.
+    """
+    for chain_branch_id, (event_id, stream_seq, event_hash) in chain_tails.items():
+        ChainVerificationWatermark.objects.update_or_create(
+            business_id=business_id,
+            chain_branch_id=chain_branch_id,
+            defaults={
+                "verified_seq": stream_seq,
+                "verified_hash": event_hash,
+                "verified_event_id": event_id,
+            },
+        )
+
+
+def reset_watermarks(business_id: Optional[uuid.UUID] = None) -> int:
+    """
+    Forget verification progress (of one business, or all).
+    Returns the number of watermarks deleted.
+    """
+    watermarks = ChainVerificationWatermark.objects.all()
+    if business_id is not None:
+        watermarks = watermarks.filter(business_id=business_id)
+    deleted, _ = watermarks.delete()
+    return deleted
+
+
+def unverified_events_filter(
+    watermarks: dict[Optional[uuid.UUID], ChainVerificationWatermark],
+) -> Q:
+    """
+    Event filter for the tail still to verify: events above the
+    watermark of their chain, plus every event of chains without one.
+    """
+    if not watermarks:
+        return Q()
+
+    tail = Q(pk__in=[])
+    covered = Q(pk__in=[])
+    for chain_branch_id, watermark in watermarks.items():
+        chain = (
+            Q(chain_branch_id__isnull=True)
+            if chain_branch_id is None
+            else Q(chain_branch_id=chain_branch_id)
+        )
+        tail |= chain & Q(stream_seq__gt=watermark.verified_seq)
+        covered |= chain
+    return tail | ~covered
+
+
+def watermark_mismatch(
+    business_id: uuid.UUID,
+    watermarks: dict[Optional[uuid.UUID], ChainVerificationWatermark],
+) -> Optional[str]:
+    """
+    Check every watermark still names a stored event with the verified
+    hash. Returns a description of the first mismatch, or None.
+    """
+    for chain_branch_id, watermark in watermarks.items():
+        anchored = Event.objects.filter(
+            business_id=business_id,
+            chain_branch_id=chain_branch_id,
+            stream_seq=watermark.verified_seq,
+            event_id=watermark.verified_event_id,
+            event_hash=watermark.verified_hash,
+        ).exists()
+        if not anchored:
+            chain = chain_branch_id or "business chain"
+            return (
+                f"Verified event {watermark.verified_event_id} (sequence "
+                f"{watermark.verified_seq}) of {chain} no longer has "
+                f"hash '{watermark.verified_hash}'."
+            )
+    return None
@@ -0,0 +1,94 @@
+"""
+Event hash scheme benchmark (CPU only, no database).
+
+Times each hash version (core.event_store.hashing.HASH_VERSIONS) on
+this machine, for typical and large canonical payloads, plus the
+canonical serialization that every version shares. Use it to decide
+whether switching a chain to another version (set_hash_version) saves
+CPU on this hardware: SHA-256 is usually faster where OpenSSL uses the
+CPU's SHA extensions, BLAKE2b elsewhere.
+
+Usage:
+    python scripts/bench_event_hashing.py
+    python scripts/bench_event_hashing.py --iterations 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import timeit
+from pathlib import Path
+
+HASHER_PATH = (
+    Path(__file__).resolve().parents[1]
+    / "core" / "event_store" / "hashing" / "hasher.py"
+)
+
+
+def _payloads() -> dict[str, dict]:
+    line_items = [
+        {"sku": f"SKU-{index:05d}", "qty": index % 7 + 1, "unit_price": "12.50"}
+        for index in range(200)
+    ]
+    return {
+        "small": {"flag_key": "ENABLE_DOCUMENT_DESIGNER", "status": "ENABLED"},
+        "typical": {"receipt_no": "R-000123", "lines": line_items[:10], "total": "125.00"},
+        "large": {"receipt_no": "R-000124", "lines": line_items, "total": "2500.00"},
+    }
+
+
+def _load_hasher():
+    """
+    Load hasher.py on its own: it is pure Python, while importing the
+    hashing package pulls in the Django models.
+    """
+    spec = importlib.util.spec_from_file_location("bos_event_hasher", HASHER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run(iterations: int) -> dict:
+    hasher = _load_hasher()
+    canonical_serialize = hasher.canonical_serialize
+    compute_event_hash_from_canonical = hasher.compute_event_hash_from_canonical
+
+    report: dict = {"iterations": iterations, "payloads": {}}
+    for name, payload in _payloads().items():
+        canonical = canonical_serialize(payload)
+        timings = {
+            "canonical_serialize_us": timeit.timeit(
+                lambda: canonical_serialize(payload),
+                number=iterations,
+            ),
+        }
+        for hash_version in hasher.HASH_VERSIONS:
+            timings[f"hash_v{hash_version}_us"] = timeit.timeit(
+                lambda: compute_event_hash_from_canonical(
+                    canonical,
+                    hasher.GENESIS_HASH,
+                    hash_version,
+                ),
+                number=iterations,
+            )
+        report["payloads"][name] = {
+            "canonical_bytes": len(canonical),
+            **{
+                key: round(total / iterations * 1_000_000, 3)
+                for key, total in timings.items()
+            },
+        }
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=50_000)
+    args = parser.parse_args()
+    print(json.dumps(run(args.iterations), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""
+Event table index benchmark (PostgreSQL).
+
+Compares the event table index set before and after the index
+rationalization (event_store migrations 0007/0008):
+    - insert throughput (rows/s, batched multi-row INSERTs)
+    - key read queries (median ms over repeated runs)
+
+Each index set is built on its own scratch copy of bos_event_store
+(CREATE TABLE ... LIKE), filled with the same seeded synthetic events,
+measured, and dropped. The real event table is never touched.
+
+Usage:
+    python scripts/bench_event_indexes.py
+    python scripts/bench_event_indexes.py --rows 500000 --businesses 200 --seed 7
+
+Requires DJANGO_SETTINGS_MODULE pointing at a PostgreSQL database with
+migrations applied (default: config.settings).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+
+COMMON_DDL = [
+    "ALTER TABLE {table} ADD PRIMARY KEY (event_id)",
+    "CREATE UNIQUE INDEX {table}_uq_prev ON {table} "
+    "(business_id, previous_event_hash)",
+    "CREATE UNIQUE INDEX {table}_uq_seq ON {table} (business_id, stream_seq) "
+    "WHERE chain_branch_id IS NULL",
+]
+
+INDEX_SETS = {
+    "before": [
+        "CREATE INDEX {table}_i1 ON {table} (business_id, created_at, event_id)",
+        "CREATE INDEX {table}_i2 ON {table} (business_id, event_id)",
+        "CREATE INDEX {table}_i3 ON {table} (business_id, branch_id, created_at)",
+        "CREATE INDEX {table}_i4 ON {table} (business_id, received_at)",
+        "CREATE INDEX {table}_i5 ON {table} (event_type)",
+        "CREATE INDEX {table}_i6 ON {table} (source_engine)",
+        "CREATE INDEX {table}_i7 ON {table} (status)",
+        "CREATE INDEX {table}_i8 ON {table} (correction_of)",
+        "CREATE INDEX {table}_i9 ON {table} (correlation_id)",
+        "CREATE INDEX {table}_i10 ON {table} (causation_id)",
+    ],
+    "after": [
+        "CREATE INDEX {table}_i1 ON {table} (business_id, created_at, event_id)",
+        "CREATE INDEX {table}_i3 ON {table} (business_id, branch_id, created_at)",
+        "CREATE INDEX {table}_i4 ON {table} (business_id, received_at)",
+        "CREATE INDEX {table}_i11 ON {table} "
+        "(business_id, event_type, received_at)",
+        "CREATE INDEX {table}_i12 ON {table} "
+        "(business_id, status, received_at) WHERE status <> 'FINAL'",
+        "CREATE INDEX {table}_i13 ON {table} (correction_of) "
+        "WHERE correction_of IS NOT NULL",
+        "CREATE INDEX {table}_i9 ON {table} (correlation_id)",
+        "CREATE INDEX {table}_i10 ON {table} (causation_id)",
+    ],
+}
+
+READ_QUERIES = {
+    "review_queue": (
+        "SELECT event_id FROM {table} "
+        "WHERE business_id = %(business_id)s AND status <> 'FINAL' "
+        "ORDER BY received_at LIMIT 100"
+    ),
+    "typed_replay": (
+        "SELECT event_id FROM {table} "
+        "WHERE business_id = %(business_id)s AND event_type = %(event_type)s "
+        "ORDER BY received_at"
+    ),
+    "business_replay_page": (
+        "SELECT event_id FROM {table} "
+        "WHERE business_id = %(business_id)s "
+        "ORDER BY received_at LIMIT 1000"
+    ),
+    "correction_lookup": (
+        "SELECT event_id FROM {table} WHERE correction_of = %(event_id)s"
+    ),
+}
+
+COLUMNS = (
+    "event_id, event_type, event_version, business_id, branch_id, "
+    "source_engine, actor_type, actor_id, correlation_id, causation_id, "
+    "payload, reference, created_at, received_at, status, correction_of, "
+    "previous_event_hash, event_hash, stream_seq, chain_branch_id"
+)
+
+ENGINES = ("admin", "cash", "inventory", "procurement", "retail", "hr", "accounting", "documents")
+ACTIONS = ("created", "updated", "approved", "rejected", "closed")
+
+
+def _setup_django() -> None:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    import django
+
+    django.setup()
+
+
+def _uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def _hex64(rng: random.Random) -> str:
+    return f"{rng.getrandbits(256):064x}"
+
+
+def generate_rows(*, rows: int, businesses: int, seed: int) -> list[tuple]:
+    """Deterministic synthetic events (same seed → same rows)."""
+    rng = random.Random(seed)
+    business_ids = [_uuid(rng) for _ in range(businesses)]
+    sequences = {business_id: 0 for business_id in business_ids}
+    event_types = [
+        f"{engine}.record.{action}.v1" for engine in ENGINES for action in ACTIONS
+    ]
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    produced: list[tuple] = []
+
+    for position in range(rows):
+        business_id = rng.choice(business_ids)
+        sequences[business_id] += 1
+        event_type = rng.choice(event_types)
+        roll = rng.random()
+        status = "FINAL" if roll < 0.97 else ("PROVISIONAL" if roll < 0.99 else "REVIEW_REQUIRED")
+        correction_of = (
+            produced[rng.randrange(len(produced))][0]
+            if produced and rng.random() < 0.01
+            else None
+        )
+        timestamp = t0 + timedelta(milliseconds=position * 10)
+        produced.append(
+            (
+                _uuid(rng),
+                event_type,
+                1,
+                business_id,
+                None,
+                event_type.split(".", 1)[0],
+                "HUMAN",
+                f"user-{rng.randrange(500)}",
+                _uuid(rng),
+                _uuid(rng) if rng.random() < 0.6 else None,
+                json.dumps({"amount": rng.randrange(100000), "note": "bench"}),
+                "{}",
+                timestamp,
+                timestamp,
+                status,
+                correction_of,
+                _hex64(rng),
+                _hex64(rng),
+                sequences[business_id],
+                None,
+            )
+        )
+    return produced
+
+
+def _insert(cursor, table: str, rows: list[tuple], batch_size: int) -> float:
+    placeholders = "(" + ", ".join(["%s"] * len(rows[0])) + ")"
+    started = time.perf_counter()
+    for offset in range(0, len(rows), batch_size):
+        batch = rows[offset:offset + batch_size]
+        cursor.execute(
+            f"INSERT INTO {table} ({COLUMNS}) VALUES "
+            + ", ".join([placeholders] * len(batch)),
+            [value for row in batch for value in row],
+        )
+    return time.perf_counter() - started
+
+
+def _time_query(cursor, sql: str, params: dict, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        cursor.execute(sql, params)
+        cursor.fetchall()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def run_index_set(connection, name: str, rows: list[tuple], *, batch_size: int, repeats: int) -> dict:
+    table = f"bench_evt_{name}"
+    results: dict = {"index_set": name}
+    with connection.cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {table}")
+        cursor.execute(
+            f"CREATE UNLOGGED TABLE {table} "
+            f"(LIKE bos_event_store INCLUDING DEFAULTS)"
+        )
+        for ddl in COMMON_DDL + INDEX_SETS[name]:
+            cursor.execute(ddl.format(table=table))
+
+        elapsed = _insert(cursor, table, rows, batch_size)
+        results["insert_rows_per_s"] = round(len(rows) / elapsed)
+        cursor.execute(f"ANALYZE {table}")
+        cursor.execute(
+            "SELECT pg_indexes_size(%s::regclass), pg_relation_size(%s::regclass)",
+            [table, table],
+        )
+        results["index_bytes"], results["heap_bytes"] = cursor.fetchone()
+
+        sample = rows[len(rows) // 2]
+        correction_target = next(
+            (row[15] for row in rows if row[15] is not None),
+            sample[0],
+        )
+        params = {
+            "business_id": sample[3],
+            "event_type": sample[1],
+            "event_id": correction_target,
+        }
+        for query_name, sql in READ_QUERIES.items():
+            results[f"{query_name}_ms"] = round(
+                _time_query(cursor, sql.format(table=table), params, repeats),
+                3,
+            )
+        cursor.execute(f"DROP TABLE {table}")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--businesses", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=1_000)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    _setup_django()
+    from django.db import connection
+
+    if connection.vendor != "postgresql":
+        raise SystemExit("This benchmark requires PostgreSQL.")
+
+    rows = generate_rows(rows=args.rows, businesses=args.businesses, seed=args.seed)
+    report = [
+        run_index_set(
+            connection,
+            name,
+            rows,
+            batch_size=args.batch_size,
+            repeats=args.repeats,
+        )
+        for name in INDEX_SETS
+    ]
+
+    print(json.dumps(
+        {
+            "rows": args.rows,
+            "businesses": args.businesses,
+            "batch_size": args.batch_size,
+            "seed": args.seed,
+            "results": report,
+        },
+        indent=2,
+    ))
+
+
+if __name__ == "__main__":
+    main()
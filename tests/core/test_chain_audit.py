@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from django.db import connection
+
+from core.bootstrap import invariants
+from core.bootstrap.errors import SystemBootstrapError
+from core.bootstrap.invariants import (
+    check_hash_chain_integrity,
+    scan_hash_chain_integrity,
+)
+from core.context.business_context import BusinessContext
+from core.event_store.hashing.hasher import canonical_serialize
+from core.event_store.models import (
+    ChainMode,
+    Event,
+    EventBranchChainHead,
+    EventChainHead,
+)
+from core.event_store.persistence import (
+    persist_event,
+    set_chain_mode,
+)
+from core.event_store.validators.registry import EventTypeRegistry
+from core.replay.chain_audit import AuditFailureCode, audit_event_chains
+from core.replay.errors import ReplayChainBrokenError, ReplayIntegrityError
+from core.replay.event_replayer import (
+    _verify_full_hash_chain,
+    verify_chain_before_replay,
+)
+from core.replay.verification import load_watermarks, reset_watermarks
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+EVENT_TYPE = "admin.feature_flag.set.v1"
+
+
+def _build_registry() -> EventTypeRegistry:
+    registry = EventTypeRegistry()
+    registry.register(EVENT_TYPE)
+    return registry
+
+
+def _build_event(
+    *,
+    event_id: uuid.UUID,
+    business_id: uuid.UUID,
+    correlation_id: uuid.UUID,
+    created_at: datetime,
+    payload: dict | None = None,
+) -> dict:
+    return {
+        "event_id": event_id,
+        "event_type": EVENT_TYPE,
+        "event_version": 1,
+        "business_id": business_id,
+        "branch_id": None,
+        "source_engine": "admin",
+        "actor_type": "SYSTEM",
+        "actor_id": "test-system",
+        "correlation_id": correlation_id,
+        "causation_id": None,
+        "payload": payload or {"flag_key": "ENABLE_DOCUMENT_DESIGNER", "status": "ENABLED"},
+        "reference": {},
+        "created_at": created_at,
+        "status": "FINAL",
+        "correction_of": None,
+    }
+
+
+def _append_chain(
+    business_id: uuid.UUID,
+    count: int,
+    *,
+    use_outbox: bool = False,
+) -> list[dict]:
+    registry = _build_registry()
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    events = []
+    for step in range(count):
+        event = _build_event(
+            event_id=uuid.uuid4(),
+            business_id=business_id,
+            correlation_id=uuid.uuid4(),
+            created_at=t0 + timedelta(seconds=step),
+            payload={"step": step},
+        )
+        assert persist_event(
+            event_data=event,
+            context=BusinessContext(business_id=business_id),
+            registry=registry,
+            use_outbox=use_outbox,
+        ).accepted
+        events.append(event)
+    return events
+
+
+def test_chain_audit_reports_each_business_with_its_first_failure() -> None:
+    healthy = uuid.uuid4()
+    relinked = uuid.uuid4()
+    truncated = uuid.uuid4()
+    _append_chain(healthy, 3)
+    relinked_events = _append_chain(relinked, 3)
+    _append_chain(truncated, 2)
+
+    Event.objects.filter(event_id=relinked_events[2]["event_id"]).update(
+        previous_event_hash="f" * 64
+    )
+    EventChainHead.objects.filter(business_id=truncated).update(sequence=3)
+
+    report = audit_event_chains([healthy, relinked, truncated], workers=1)
+
+    by_business = {audit.business_id: audit for audit in report.businesses}
+    assert by_business[healthy].ok
+    assert by_business[healthy].events_checked == 3
+    assert by_business[relinked].failure == AuditFailureCode.LINK_BROKEN
+    assert by_business[relinked].event_id == relinked_events[2]["event_id"]
+    assert by_business[truncated].failure == AuditFailureCode.HEAD_MISMATCH
+    assert not report.ok
+    assert report.as_dict()["businesses_checked"] == 3
+    assert len(report.as_dict()["failures"]) == 2
+
+
+def test_chain_audit_leaves_events_appended_mid_audit_to_the_next_run(monkeypatch) -> None:
+    from core.replay import chain_audit
+
+    business_id = uuid.uuid4()
+    _append_chain(business_id, 2)
+    real_recompute = chain_audit._recompute_event_hash
+    appended = []
+
+    def _recompute_then_append(*args):
+        if not appended:
+            # Another writer commits while the audit streams the chain.
+            writer = threading.Thread(
+                target=lambda: appended.append(_append_chain(business_id, 1))
+            )
+            writer.start()
+            writer.join()
+        return real_recompute(*args)
+
+    monkeypatch.setattr(chain_audit, "_recompute_event_hash", _recompute_then_append)
+    report = audit_event_chains([business_id], workers=1)
+    monkeypatch.undo()
+
+    assert appended
+    assert report.ok, report.as_dict()
+    assert report.events_checked == 2
+    assert load_watermarks(business_id)[None].verified_seq == 2
+
+    report = audit_event_chains([business_id], workers=1)
+    assert report.ok
+    assert report.events_checked == 1
+
+
+def test_chain_audit_reports_events_of_a_chain_without_head() -> None:
+    business_id = uuid.uuid4()
+    branch_id = uuid.uuid4()
+    set_chain_mode(business_id, ChainMode.BRANCH)
+    event = _build_event(
+        event_id=uuid.uuid4(),
+        business_id=business_id,
+        correlation_id=uuid.uuid4(),
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+    event["branch_id"] = branch_id
+    assert persist_event(
+        event_data=event,
+        context=BusinessContext(business_id=business_id),
+        registry=_build_registry(),
+    ).accepted
+
+    EventBranchChainHead.objects.filter(business_id=business_id).delete()
+
+    report = audit_event_chains([business_id], workers=1, full=True)
+    assert report.failures[0].failure == AuditFailureCode.HEAD_MISMATCH
+
+
+@pytest.mark.skipif(
+    connection.vendor != "postgresql",
+    reason="worker processes need a server database",
+)
+def test_chain_audit_shards_businesses_across_worker_processes() -> None:
+    business_ids = [uuid.uuid4() for _ in range(4)]
+    for business_id in business_ids:
+        _append_chain(business_id, 2)
+
+    report = audit_event_chains(business_ids, workers=2)
+
+    assert report.workers == 2
+    assert report.ok
+    assert [audit.business_id for audit in report.businesses] == business_ids
+    assert report.events_checked == 8
+
+
+def test_chain_verification_resumes_from_persisted_watermarks() -> None:
+    business_id = uuid.uuid4()
+    first_run = _append_chain(business_id, 3)
+
+    report = audit_event_chains([business_id], workers=1)
+    assert report.ok
+    assert report.events_checked == 3
+    watermark = load_watermarks(business_id)[None]
+    assert watermark.verified_seq == 3
+    assert watermark.verified_event_id == first_run[2]["event_id"]
+
+    second_run = _append_chain(business_id, 2)
+    report = audit_event_chains([business_id], workers=1)
+    assert report.ok
+    assert report.events_checked == 2
+    assert load_watermarks(business_id)[None].verified_seq == 5
+
+    # Tampering below the watermark is only caught by a full run.
+    Event.objects.filter(event_id=first_run[0]["event_id"]).update(
+        payload={"step": 99},
+        payload_canonical=canonical_serialize({"step": 99}),
+    )
+    assert audit_event_chains([business_id], workers=1).events_checked == 0
+    assert verify_chain_before_replay(business_id=business_id) is True
+    full_report = audit_event_chains([business_id], workers=1, full=True)
+    assert full_report.failures[0].failure == AuditFailureCode.HASH_MISMATCH
+    with pytest.raises(ReplayIntegrityError):
+        _verify_full_hash_chain(business_id=business_id)
+
+    # Rewriting the verified event itself breaks the watermark anchor.
+    Event.objects.filter(event_id=second_run[1]["event_id"]).update(
+        event_hash="f" * 64
+    )
+    report = audit_event_chains([business_id], workers=1)
+    assert report.failures[0].failure == AuditFailureCode.WATERMARK_MISMATCH
+    with pytest.raises(ReplayChainBrokenError):
+        verify_chain_before_replay(business_id=business_id)
+    with pytest.raises(ReplayChainBrokenError):
+        _verify_full_hash_chain(business_id=business_id, full=False)
+
+    assert reset_watermarks(business_id) == 1
+    assert load_watermarks(business_id) == {}
+
+
+def test_bootstrap_chain_check_reads_only_heads_and_unverified_tails() -> None:
+    business_id = uuid.uuid4()
+    verified = _append_chain(business_id, 4)
+    check_hash_chain_integrity()
+    assert audit_event_chains([business_id], workers=1).ok
+    recent = _append_chain(business_id, 2)
+
+    # Below the watermark: left to the offline scan.
+    Event.objects.filter(event_id=verified[1]["event_id"]).update(event_hash="")
+    check_hash_chain_integrity()
+    with pytest.raises(SystemBootstrapError) as scanned:
+        scan_hash_chain_integrity()
+    assert scanned.value.invariant == "HASH_CHAIN_EMPTY_HASH"
+
+    Event.objects.filter(event_id=recent[1]["event_id"]).update(
+        previous_event_hash="f" * 64
+    )
+    with pytest.raises(SystemBootstrapError) as booted:
+        check_hash_chain_integrity()
+    assert booted.value.invariant == "HASH_CHAIN_LINK"
+
+    EventChainHead.objects.filter(business_id=business_id).update(sequence=7)
+    with pytest.raises(SystemBootstrapError) as truncated:
+        check_hash_chain_integrity()
+    assert truncated.value.invariant == "HASH_CHAIN_HEAD"
+
+
+def test_bootstrap_chain_check_samples_heads_by_key_from_a_random_start(
+    monkeypatch,
+) -> None:
+    corrupted, intact = sorted([uuid.uuid4(), uuid.uuid4()])
+    corrupted_events = _append_chain(corrupted, 3)
+    _append_chain(intact, 3)
+    Event.objects.filter(event_id=corrupted_events[2]["event_id"]).update(
+        previous_event_hash="f" * 64
+    )
+
+    def boot_from(start: uuid.UUID) -> None:
+        monkeypatch.setattr(invariants.uuid, "uuid4", lambda: start)
+        check_hash_chain_integrity(chain_sample=1)
+
+    boot_from(intact)
+    with pytest.raises(SystemBootstrapError) as booted:
+        boot_from(corrupted)
+    assert booted.value.invariant == "HASH_CHAIN_LINK"
+    # Past the last business_id, the sample wraps to the first one
+    with pytest.raises(SystemBootstrapError):
+        boot_from(uuid.UUID(int=(1 << 128) - 1))
@@ -39,6 +39,7 @@ from core.permissions import (
     Role,
     ScopeGrant,
 )
+from core.replay.snapshots import decode_snapshot, encode_snapshot
 
 
 BUSINESS_ID = uuid.uuid5(uuid.NAMESPACE_URL, "bos-doc-issuance-business")
@@ -476,6 +477,41 @@ def test_projection_list_ordering_is_stable():
     assert ordered_ids == expected_ids
 
 
+
+def test_projection_state_survives_a_snapshot_round_trip():
+    store = DocumentIssuanceProjectionStore()
+    for index, branch_id in enumerate((None, BRANCH_ID)):
+        store.apply(
+            event_type=DOC_RECEIPT_ISSUED_V1,
+            payload={
+                "business_id": BUSINESS_ID,
+                "branch_id": branch_id,
+                "document_id": uuid.uuid5(uuid.NAMESPACE_URL, f"snapshot-doc-{index}"),
+                "doc_type": DOCUMENT_RECEIPT,
+                "template_id": "tpl",
+                "template_version": 1,
+                "schema_version": 1,
+                "issued_at": ISSUED_AT + timedelta(minutes=index),
+                "actor_id": ACTOR_ID,
+                "correlation_id": "external-correlation",
+                "status": "ISSUED",
+                "doc_number": f"R-{index}",
+                "render_plan": {"totals": {"grand_total": "10.00", "currency": "USD"}},
+                "render_plan_hash": "abc",
+            },
+        )
+
+    encoded = encode_snapshot(store.export_state(), store.SNAPSHOT_VERSION)
+    state_version, state = decode_snapshot(encoded)
+    restored = DocumentIssuanceProjectionStore()
+    restored.restore_state(state)
+
+    assert state_version == DocumentIssuanceProjectionStore.SNAPSHOT_VERSION
+    assert restored.list_documents(BUSINESS_ID) == store.list_documents(BUSINESS_ID)
+    assert restored.list_documents(BUSINESS_ID, BRANCH_ID) == store.list_documents(
+        BUSINESS_ID, BRANCH_ID
+    )
+
 def test_replay_module_has_no_document_issuance_references():
     source = Path("core/replay/event_replayer.py").read_text(encoding="utf-8").lower()
     assert "document_issuance" not in source
@@ -0,0 +1,328 @@
+"""
+BOS Event Bus — Dispatch Tests
+================================
+Tests for sequential and parallel (per-engine lane) dispatch, and
+for pattern subscriptions.
+
+Covers:
+- Same result shape and failure isolation in both modes
+- Engines run concurrently in parallel mode
+- Each engine's handlers keep registration and event order
+- Nested dispatch from a handler runs sequentially
+- Pool threads release their DB connections after a lane
+- Patterns route by segment, in registration order, once per handler
+- Routes are cached until the next registration
+"""
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from django.db import connection, connections
+
+from core.events.dispatcher import dispatch
+from core.events.errors import InvalidEventTypeFormat, SelfSubscriptionError
+from core.events.registry import SubscriberRegistry
+
+EVENT_TYPE = "retail.sale.completed"
+
+
+def _event(sequence: int = 1):
+    return SimpleNamespace(
+        event_id=uuid.uuid4(),
+        event_type=EVENT_TYPE,
+        sequence=sequence,
+    )
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        yield pool
+
+
+def _register_mixed_subscribers(registry, calls):
+    def inventory_reserve(event):
+        calls.append(("inventory", "reserve", event.sequence))
+
+    def inventory_fail(event):
+        raise RuntimeError("stock ledger offline")
+
+    def accounting_post(event):
+        calls.append(("accounting", "post", event.sequence))
+
+    def audit_fail(event):
+        raise ValueError("bad payload")
+
+    registry.register_subscriber(EVENT_TYPE, inventory_reserve, "inventory")
+    registry.register_subscriber(EVENT_TYPE, inventory_fail, "inventory")
+    registry.register_subscriber(EVENT_TYPE, accounting_post, "accounting")
+    registry.register_subscriber(EVENT_TYPE, audit_fail, "audit")
+
+
+# ══════════════════════════════════════════════════════════════
+# RESULT SHAPE AND FAILURE ISOLATION
+# ══════════════════════════════════════════════════════════════
+
+class TestParallelDispatchResult:
+    """Parallel dispatch reports exactly what sequential dispatch does."""
+
+    def test_result_matches_sequential_dispatch(self, executor):
+        event = _event()
+        sequential_calls: list = []
+        sequential = SubscriberRegistry()
+        _register_mixed_subscribers(sequential, sequential_calls)
+        parallel_calls: list = []
+        parallel = SubscriberRegistry(dispatch_executor=executor)
+        _register_mixed_subscribers(parallel, parallel_calls)
+
+        expected = dispatch(event, sequential)
+        result = dispatch(event, parallel)
+
+        assert result == expected
+        assert result["subscribers_notified"] == 2
+        assert result["subscribers_failed"] == 2
+        assert [failure["engine"] for failure in result["failures"]] == [
+            "inventory",
+            "audit",
+        ]
+        assert sorted(parallel_calls) == sorted(sequential_calls)
+
+    def test_no_subscribers_returns_empty_result(self, executor):
+        result = dispatch(_event(), SubscriberRegistry(dispatch_executor=executor))
+
+        assert result["subscribers_notified"] == 0
+        assert result["failures"] == []
+
+
+# ══════════════════════════════════════════════════════════════
+# CONCURRENCY AND ORDERING
+# ══════════════════════════════════════════════════════════════
+
+class TestEngineLanes:
+    """Engines run side by side; each engine stays ordered."""
+
+    def test_engines_run_concurrently(self, executor):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def inventory_handler(event):
+            barrier.wait()
+
+        def accounting_handler(event):
+            barrier.wait()
+
+        registry = SubscriberRegistry(dispatch_executor=executor)
+        registry.register_subscriber(EVENT_TYPE, inventory_handler, "inventory")
+        registry.register_subscriber(EVENT_TYPE, accounting_handler, "accounting")
+
+        # Sequential handlers would break the barrier (timeout)
+        result = dispatch(_event(), registry)
+
+        assert result["subscribers_notified"] == 2
+
+    def test_each_engine_sees_its_handlers_and_events_in_order(self, executor):
+        seen: dict[str, list] = {"inventory": [], "accounting": []}
+
+        def make_handler(engine, step, delay):
+            def handler(event):
+                time.sleep(delay)
+                seen[engine].append((event.sequence, step))
+            handler.__qualname__ = f"{engine}_{step}"
+            return handler
+
+        registry = SubscriberRegistry(dispatch_executor=executor)
+        registry.register_subscriber(
+            EVENT_TYPE, make_handler("inventory", "a", 0.01), "inventory",
+        )
+        registry.register_subscriber(
+            EVENT_TYPE, make_handler("accounting", "a", 0.0), "accounting",
+        )
+        registry.register_subscriber(
+            EVENT_TYPE, make_handler("inventory", "b", 0.0), "inventory",
+        )
+
+        for sequence in range(1, 4):
+            dispatch(_event(sequence), registry)
+
+        assert seen["inventory"] == [
+            (1, "a"), (1, "b"), (2, "a"), (2, "b"), (3, "a"), (3, "b"),
+        ]
+        assert seen["accounting"] == [(1, "a"), (2, "a"), (3, "a")]
+
+    def test_nested_dispatch_from_a_handler_runs_sequentially(self):
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            registry = SubscriberRegistry(dispatch_executor=pool)
+            nested_results: list = []
+            follow_up = "retail.sale.followed_up"
+
+            def inventory_handler(event):
+                if event.event_type == EVENT_TYPE:
+                    nested_results.append(
+                        dispatch(
+                            SimpleNamespace(
+                                event_id=uuid.uuid4(),
+                                event_type=follow_up,
+                                sequence=0,
+                            ),
+                            registry,
+                        )
+                    )
+
+            def accounting_handler(event):
+                pass
+
+            registry.register_subscriber(EVENT_TYPE, inventory_handler, "inventory")
+            registry.register_subscriber(EVENT_TYPE, accounting_handler, "accounting")
+            registry.register_subscriber(follow_up, inventory_handler, "inventory")
+            registry.register_subscriber(follow_up, accounting_handler, "accounting")
+
+            # With one pool worker busy, a nested parallel dispatch
+            # submitted to the same pool could never finish.
+            result = dispatch(_event(), registry)
+
+        assert result["subscribers_notified"] == 2
+        assert nested_results[0]["subscribers_notified"] == 2
+
+    @pytest.mark.django_db(transaction=True)
+    def test_pool_lanes_release_their_db_connections(self, executor):
+        lane_threads: list = []
+        lane_connections: list = []
+
+        def inventory_handler(event):
+            pass
+
+        def accounting_handler(event):
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            lane_threads.append(threading.current_thread())
+            lane_connections.append(connections["default"])
+
+        registry = SubscriberRegistry(dispatch_executor=executor)
+        registry.register_subscriber(EVENT_TYPE, inventory_handler, "inventory")
+        registry.register_subscriber(EVENT_TYPE, accounting_handler, "accounting")
+
+        for sequence in range(1, 4):
+            result = dispatch(_event(sequence), registry)
+            assert result["subscribers_notified"] == 2
+
+        assert threading.current_thread() not in lane_threads
+        assert [
+            lane_connection.connection for lane_connection in lane_connections
+        ] == [None, None, None]
+
+
+# ══════════════════════════════════════════════════════════════
+# PATTERN SUBSCRIPTIONS
+# ══════════════════════════════════════════════════════════════
+
+def _handler(name):
+    def handler(event):
+        pass
+    handler.__qualname__ = name
+    return handler
+
+
+class TestPatternSubscriptions:
+    """engine.*, engine.domain.* and *.x.y subscriptions."""
+
+    def test_patterns_route_by_segment(self):
+        registry = SubscriberRegistry()
+        retail_all = _handler("retail_all")
+        sales = _handler("sales")
+        rejections = _handler("rejections")
+        registry.register_subscriber("retail.*", retail_all, "bi")
+        registry.register_subscriber("retail.sale.*", sales, "bi")
+        registry.register_subscriber("*.*.rejected", rejections, "audit")
+
+        def handlers(event_type):
+            return [handler for handler, _ in registry.get_subscribers(event_type)]
+
+        assert handlers("retail.sale.completed") == [retail_all, sales]
+        assert handlers("retail.refund.rejected") == [retail_all, rejections]
+        assert handlers("retail.sale.line.voided") == [retail_all, sales]
+        assert handlers("inventory.stock.rejected") == [rejections]
+        assert handlers("inventory.stock.moved") == []
+        assert handlers("inventory.stock.line.rejected") == []
+
+    def test_exact_and_pattern_subscribers_keep_registration_order(self):
+        registry = SubscriberRegistry()
+        first = _handler("first")
+        second = _handler("second")
+        third = _handler("third")
+        registry.register_subscriber("retail.*", first, "bi")
+        registry.register_subscriber(EVENT_TYPE, second, "accounting")
+        registry.register_subscriber("*.sale.*", third, "audit")
+
+        assert registry.get_subscribers(EVENT_TYPE) == [
+            (first, "bi"),
+            (second, "accounting"),
+            (third, "audit"),
+        ]
+        assert registry.subscriber_count(EVENT_TYPE) == 3
+        assert registry.get_all_event_types() == frozenset({EVENT_TYPE})
+        assert registry.get_all_patterns() == frozenset({"retail.*", "*.sale.*"})
+
+    def test_handler_matched_twice_is_called_once(self):
+        registry = SubscriberRegistry()
+        calls = []
+
+        def audit_handler(event):
+            calls.append(event.event_type)
+
+        registry.register_subscriber("retail.*", audit_handler, "audit")
+        registry.register_subscriber("*.*.completed", audit_handler, "audit")
+        registry.register_subscriber(EVENT_TYPE, audit_handler, "audit")
+
+        result = dispatch(_event(), registry)
+
+        assert result["subscribers_notified"] == 1
+        assert calls == [EVENT_TYPE]
+        assert registry.get_all_subscribers() == [(audit_handler, "audit")]
+
+    def test_pattern_skips_own_engine_unless_allowed(self):
+        registry = SubscriberRegistry()
+        audit_own = _handler("audit_own")
+        audit_others = _handler("audit_others")
+        registry.register_subscriber(
+            "*.*.rejected", audit_own, "audit", allow_self_subscription=True,
+        )
+        registry.register_subscriber("*.*.rejected", audit_others, "audit")
+
+        assert registry.get_subscribers("audit.entry.rejected") == [
+            (audit_own, "audit"),
+        ]
+        with pytest.raises(SelfSubscriptionError):
+            registry.register_subscriber("audit.*", _handler("x"), "audit")
+
+    @pytest.mark.parametrize(
+        "pattern",
+        ["*", "retail", "retail.sale", "retail.sale*", "retail..*", "*.sale"],
+    )
+    def test_invalid_patterns_rejected(self, pattern):
+        with pytest.raises(InvalidEventTypeFormat):
+            SubscriberRegistry().register_subscriber(
+                pattern, _handler("h"), "bi",
+            )
+
+    def test_route_is_cached_until_next_registration(self):
+        registry = SubscriberRegistry()
+        first = _handler("first")
+        registry.register_subscriber("retail.*", first, "bi")
+
+        route = registry.get_batch_subscribers(EVENT_TYPE)
+        assert registry.get_batch_subscribers(EVENT_TYPE) is route
+        # Callers get their own list, never the cached route
+        registry.get_subscribers(EVENT_TYPE).clear()
+        assert registry.get_subscribers(EVENT_TYPE) == [(first, "bi")]
+
+        second = _handler("second")
+        registry.register_subscriber("retail.sale.*", second, "audit")
+
+        assert registry.get_subscribers(EVENT_TYPE) == [
+            (first, "bi"),
+            (second, "audit"),
+        ]
@@ -1,15 +1,79 @@
 from __future__ import annotations
 
+import collections
+import threading
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
 
 import pytest
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from adapters.django_api import wiring
 
 from core.context.business_context import BusinessContext
-from core.event_store.hashing.hasher import GENESIS_HASH, compute_event_hash
-from core.event_store.models import Event
-from core.event_store.persistence import load_events_for_business, persist_event
+from core.event_store.hashing.hasher import (
+    GENESIS_HASH,
+    HASH_VERSION_BLAKE2B,
+    HASH_VERSION_SHA256,
+    branch_genesis_hash,
+    canonical_serialize,
+    compute_event_hash,
+)
+from core.event_store.hashing.merkle import verify_merkle_inclusion
+from core.event_store.models import (
+    ChainMode,
+    Event,
+    EventBranchChainHead,
+    EventChainAnchor,
+    EventChainHead,
+    EventIdRegistry,
+    EventMerkleCheckpoint,
+    EventOutbox,
+    EventOutboxDelivery,
+)
+from core.event_store.persistence import (
+    AppendRetryPolicy,
+    DEFAULT_APPEND_RETRY_POLICY,
+    GroupCommitCoordinator,
+    NO_APPEND_RETRY,
+    anchor_branch_heads,
+    append_retry_metrics,
+    checkpoint_chain_segments,
+    drain_event_outbox,
+    event_inclusion_proof,
+    iter_events_for_business,
+    load_events_for_business,
+    persist_event,
+    persist_events_batch,
+    set_chain_mode,
+    set_hash_version,
+)
+from core.event_store.partitioning import (
+    EVENT_PARTITION_COUNT,
+    ensure_event_partitions,
+    is_event_store_partitioned,
+    partition_name,
+    partition_report,
+)
+from core.event_store.persistence import group_commit
+from core.event_store.persistence import outbox
+from core.event_store.persistence import service as persistence_service
+from core.event_store.persistence.repository import (
+    insert_event_advancing_head,
+    lock_chain_head,
+    supports_fast_append,
+)
 from core.event_store.validators.registry import EventTypeRegistry
+from core.events.registry import SubscriberRegistry
+from core.http_api.contracts import EventProofRequest
+from core.http_api.handlers import get_event_inclusion_proof
+from core.replay.errors import ReplayChainBrokenError, ReplayIntegrityError
+from core.replay.event_replayer import (
+    _verify_full_hash_chain,
+    verify_chain_before_replay,
+)
 
 pytestmark = pytest.mark.django_db(transaction=True)
 
@@ -223,3 +287,1536 @@ def test_db_row_contains_expected_envelope_fields() -> None:
         "event_hash",
     }
     assert set(row.keys()) == expected_fields
+
+
+def test_batch_persists_all_events_linked_in_order() -> None:
+    business_id = uuid.uuid4()
+    context = BusinessContext(business_id=business_id)
+    registry = _build_registry()
+    correlation_id = uuid.uuid4()
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    head_event = _build_event(
+        event_id=uuid.uuid4(),
+        business_id=business_id,
+        correlation_id=correlation_id,
+        created_at=t0,
+        payload={"step": 0},
+    )
+    assert persist_event(
+        event_data=head_event,
+        context=context,
+        registry=registry,
+    ).accepted
+
+    batch = [
+        _build_event(
+            event_id=uuid.UUID(f"20000000-0000-0000-0000-00000000000{line}"),
+            business_id=business_id,
+            correlation_id=correlation_id,
+            created_at=t0 + timedelta(seconds=1),
+            payload={"line": line},
+        )
+        for line in range(1, 4)
+    ]
+
+    result = persist_events_batch(
+        events=batch,
+        context=context,
+        registry=registry,
+    )
+
+    assert result.accepted
+    rows = [Event.objects.get(event_id=item["event_id"]) for item in batch]
+    expected_previous = Event.objects.get(event_id=head_event["event_id"]).event_hash
+    for row in rows:
+        assert row.previous_event_hash == expected_previous
+        assert row.event_hash == compute_event_hash(row.payload, expected_previous)
+        expected_previous = row.event_hash
+    assert "previous_event_hash" not in batch[0]
+
+
+def test_batch_is_all_or_nothing_on_duplicate_event_id() -> None:
+    business_id = uuid.uuid4()
+    context = BusinessContext(business_id=business_id)
+    registry = _build_registry()
+    correlation_id = uuid.uuid4()
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    existing = _build_event(
+        event_id=uuid.UUID("30000000-0000-0000-0000-000000000002"),
+        business_id=business_id,
+        correlation_id=correlation_id,
+        created_at=t0,
+    )
+    assert persist_event(
+        event_data=existing,
+        context=context,
+        registry=registry,
+    ).accepted
+
+    fresh = _build_event(
+        event_id=uuid.UUID("30000000-0000-0000-0000-000000000001"),
+        business_id=business_id,
+        correlation_id=correlation_id,
+        created_at=t0 + timedelta(seconds=1),
+    )
+    duplicate = dict(existing, created_at=t0 + timedelta(seconds=2))
+
+    result = persist_events_batch(
+        events=[fresh, duplicate],
+        context=context,
+        registry=registry,
+    )
+
+    assert not result.accepted
+    assert result.rejection.code == "DUPLICATE_EVENT_ID"
+    assert not Event.objects.filter(event_id=fresh["event_id"]).exists()
+
+
+def test_batch_order_defines_stream_seq_regardless_of_created_at() -> None:
+    business_id = uuid.uuid4()
+    context = BusinessContext(business_id=business_id)
+    registry = _build_registry()
+    correlation_id = uuid.uuid4()
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    later = _build_event(
+        event_id=uuid.UUID("40000000-0000-0000-0000-000000000002"),
+        business_id=business_id,
+        correlation_id=correlation_id,
+        created_at=t0 + timedelta(seconds=1),
+    )
+    earlier = _build_event(
+        event_id=uuid.UUID("40000000-0000-0000-0000-000000000001"),
+        business_id=business_id,
+        correlation_id=correlation_id,
+        created_at=t0,
+    )
+
+    result = persist_events_batch(
+        events=[later, earlier],
+        context=context,
+        registry=registry,
+    )
+
+    assert result.accepted
+    loaded = load_events_for_business(business_id)
+    assert [item["event_id"] for item in loaded] == [
+        later["event_id"],
+        earlier["event_id"],
+    ]
+    assert [item["stream_seq"] for item in loaded] == [1, 2]
+
+
+def test_chain_head_row_tracks_latest_event_and_sequence() -> None:
+    business_id = uuid.uuid4()
+    context = BusinessContext(business_id=business_id)
+    registry = _build_registry()
+    correlation_id = uuid.uuid4()
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    events = [
+        _build_event(
+            event_id=uuid.uuid4(),
+            business_id=business_id,
+            correlation_id=correlation_id,
+            created_at=t0 + timedelta(seconds=step),
+            payload={"step": step},
+        )
+        for step in range(3)
+    ]
+    assert persist_event(
+        event_data=events[0],
+        context=context,
+        registry=registry,
+    ).accepted
+    assert persist_events_batch(
+        events=events[1:],
+        context=context,
+        registry=registry,
+    ).accepted
+
+    head = EventChainHead.objects.get(business_id=business_id)
+    last_row = Event.objects.get(event_id=events[-1]["event_id"])
+    assert head.head_event_id == last_row.event_id
+    assert head.head_hash == last_row.event_hash
+    assert head.sequence == 3
+
+
+def test_rejected_append_does_not_move_chain_head() -> None:
+    business_id = uuid.uuid4()
+    context = BusinessContext(business_id=business_id)
+    registry = _build_registry()
+    event = _build_event(
+        event_id=uuid.uuid4(),
+        business_id=business_id,
+        correlation_id=uuid.uuid4(),
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+    event["previous_event_hash"] = "not-the-head"
+
+    result = persist_event(
+        event_data=event,
+        context=context,
+        registry=registry,
+    )
+
+    assert not result.accepted
+    assert result.rejection.code == "HASH_CHAIN_BROKEN"
+    head = EventChainHead.objects.filter(business_id=business_id).first()
+    assert head is None or head.sequence == 0
+
+
+def test_resent_event_is_rejected_as_duplicate_not_chain_break() -> None:
+    business_id = uuid.uuid4()
+    context = BusinessContext(business_id=business_id)
+    registry = _build_registry()
+    correlation_id = uuid.uuid4()
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    first_event = _build_event(
+        event_id=uuid.uuid4(),
+        business_id=business_id,
+        correlation_id=correlation_id,
+        created_at=t0,
+    )
+    assert persist_event(
+        event_data=first_event,
+        context=context,
+        registry=registry,
+    ).accepted
+    second_event = _build_event(
+        event_id=uuid.uuid4(),
+        business_id=business_id,
+        correlation_id=correlation_id,
+        created_at=t0 + timedelta(seconds=1),
+        payload={"step": 2},
+    )
+    assert persist_event(
+        event_data=second_event,
+        context=context,
+        registry=registry,
+    ).accepted
+
+    # Client retry carrying the hashes it was linked with the first time.
+    resent_with_stale_link = dict(first_event)
+    server_linked_resend = _build_event(
+        event_id=second_event["event_id"],
+        business_id=business_id,
+        correlation_id=correlation_id,
+        created_at=t0 + timedelta(seconds=1),
+        payload={"step": 2},
+    )
+
+    for resend in (resent_with_stale_link, server_linked_resend):
+        result = persist_event(
+            event_data=resend,
+            context=context,
+            registry=registry,
+        )
+        assert not result.accepted
+        assert result.rejection.code == "DUPLICATE_EVENT_ID"
+
+    assert Event.objects.filter(business_id=business_id).count() == 2
+    assert EventChainHead.objects.get(business_id=business_id).sequence == 2
+
+
+def test_stream_seq_is_gapless_per_business_and_exposed_by_loader() -> None:
+    registry = _build_registry()
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    business_a = uuid.uuid4()
+    business_b = uuid.uuid4()
+
+    for step in range(3):
+        for business_id in (business_a, business_b):
+            assert persist_event(
+                event_data=_build_event(
+                    event_id=uuid.uuid4(),
+                    business_id=business_id,
+                    correlation_id=uuid.uuid4(),
+                    created_at=t0 + timedelta(seconds=step),
+                    payload={"step": step},
+                ),
+                context=BusinessContext(business_id=business_id),
+                registry=registry,
+            ).accepted
+
+    for business_id in (business_a, business_b):
+        loaded = load_events_for_business(business_id)
+        assert [item["stream_seq"] for item in loaded] == [1, 2, 3]
+        assert EventChainHead.objects.get(business_id=business_id).sequence == 3
+
+
+def test_group_commit_links_concurrent_appends_into_one_gapless_chain() -> None:
+    registry = _build_registry()
+    coordinator = GroupCommitCoordinator(max_batch_size=8, max_wait_seconds=0.01)
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    business_id = uuid.uuid4()
+    results = []
+    results_lock = threading.Lock()
+
+    def _append(step: int) -> None:
+        try:
+            result = coordinator.persist_event(
+                event_data=_build_event(
+                    event_id=uuid.uuid4(),
+                    business_id=business_id,
+                    correlation_id=uuid.uuid4(),
+                    created_at=t0 + timedelta(seconds=step),
+                    payload={"step": step},
+                ),
+                context=BusinessContext(business_id=business_id),
+                registry=registry,
+            )
+            with results_lock:
+                results.append(result)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=_append, args=(step,)) for step in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 12
+    assert all(result.accepted for result in results)
+
+    loaded = load_events_for_business(business_id)
+    assert [item["stream_seq"] for item in loaded] == list(range(1, 13))
+    previous_hash = GENESIS_HASH
+    for item in loaded:
+        assert item["previous_event_hash"] == previous_hash
+        previous_hash = item["event_hash"]
+    assert EventChainHead.objects.get(business_id=business_id).head_hash == previous_hash
+
+
+def test_group_commit_rejects_one_append_without_failing_the_group() -> None:
+    registry = _build_registry()
+    coordinator = GroupCommitCoordinator(max_wait_seconds=0.05)
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    business_id = uuid.uuid4()
+    existing_id = uuid.uuid4()
+
+    assert persist_event(
+        event_data=_build_event(
+            event_id=existing_id,
+            business_id=business_id,
+            correlation_id=uuid.uuid4(),
+            created_at=t0,
+        ),
+        context=BusinessContext(business_id=business_id),
+        registry=registry,
+    ).accepted
+
+    event_ids = [existing_id, uuid.uuid4(), uuid.uuid4()]
+    results = {}
+
+    def _append(event_id: uuid.UUID) -> None:
+        try:
+            results[event_id] = coordinator.persist_event(
+                event_data=_build_event(
+                    event_id=event_id,
+                    business_id=business_id,
+                    correlation_id=uuid.uuid4(),
+                    created_at=t0 + timedelta(seconds=1),
+                ),
+                context=BusinessContext(business_id=business_id),
+                registry=registry,
+            )
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=_append, args=(event_id,)) for event_id in event_ids]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results[existing_id].accepted is False
+    assert results[existing_id].rejection.code == "DUPLICATE_EVENT_ID"
+    assert results[event_ids[1]].accepted is True
+    assert results[event_ids[2]].accepted is True
+    assert EventChainHead.objects.get(business_id=business_id).sequence == 3
+
+
+def test_group_commit_follower_writes_itself_when_no_leader_takes_it() -> None:
+    registry = _build_registry()
+    coordinator = GroupCommitCoordinator(
+        max_wait_seconds=2.0,
+        max_follower_wait_seconds=0.05,
+    )
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    business_id = uuid.uuid4()
+    results = []
+
+    def _lead() -> None:
+        try:
+            results.append(
+                coordinator.persist_event(
+                    event_data=_build_event(
+                        event_id=uuid.uuid4(),
+                        business_id=business_id,
+                        correlation_id=uuid.uuid4(),
+                        created_at=t0,
+                    ),
+                    context=BusinessContext(business_id=business_id),
+                    registry=registry,
+                )
+            )
+        finally:
+            connection.close()
+
+    leader = threading.Thread(target=_lead)
+    leader.start()
+    while (business_id, None) not in coordinator._queues:
+        time.sleep(0.001)
+
+    # The leader is still waiting for its group to fill: the follower
+    # must not wait for it.
+    started = time.monotonic()
+    follower_result = coordinator.persist_event(
+        event_data=_build_event(
+            event_id=uuid.uuid4(),
+            business_id=business_id,
+            correlation_id=uuid.uuid4(),
+            created_at=t0 + timedelta(seconds=1),
+        ),
+        context=BusinessContext(business_id=business_id),
+        registry=registry,
+    )
+    assert follower_result.accepted is True
+    assert time.monotonic() - started < 1.5
+    assert leader.is_alive()
+
+    leader.join()
+    assert results[0].accepted is True
+    assert EventChainHead.objects.get(business_id=business_id).sequence == 2
+    assert coordinator._queues == {}
+
+
+def test_group_commit_takes_over_a_queue_whose_leader_died() -> None:
+    registry = _build_registry()
+    coordinator = GroupCommitCoordinator(max_follower_wait_seconds=0.05)
+    business_id = uuid.uuid4()
+
+    dead_leader = threading.Thread(target=lambda: None)
+    dead_leader.start()
+    dead_leader.join()
+    coordinator._queues[(business_id, None)] = collections.deque()
+    coordinator._leaders[(business_id, None)] = dead_leader
+
+    result = coordinator.persist_event(
+        event_data=_build_event(
+            event_id=uuid.uuid4(),
+            business_id=business_id,
+            correlation_id=uuid.uuid4(),
+            created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        ),
+        context=BusinessContext(business_id=business_id),
+        registry=registry,
+    )
+
+    assert result.accepted is True
+    assert coordinator._queues == {}
+    assert coordinator._leaders == {}
+
+
+def test_group_commit_leader_behind_a_full_group_still_gets_its_result() -> None:
+    registry = _build_registry()
+    coordinator = GroupCommitCoordinator(
+        max_batch_size=2,
+        max_follower_wait_seconds=5.0,
+    )
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    business_id = uuid.uuid4()
+    queue_key = (business_id, None)
+    results = {}
+
+    def _append(step: int) -> None:
+        try:
+            results[step] = coordinator.persist_event(
+                event_data=_build_event(
+                    event_id=uuid.uuid4(),
+                    business_id=business_id,
+                    correlation_id=uuid.uuid4(),
+                    created_at=t0 + timedelta(seconds=step),
+                    payload={"step": step},
+                ),
+                context=BusinessContext(business_id=business_id),
+                registry=registry,
+            )
+        finally:
+            connection.close()
+
+    # A leader that dies with three appends queued behind it
+    leader_done = threading.Event()
+    leader = threading.Thread(target=leader_done.wait)
+    leader.start()
+    coordinator._queues[queue_key] = collections.deque()
+    coordinator._leaders[queue_key] = leader
+    followers = [threading.Thread(target=_append, args=(step,)) for step in range(3)]
+    for step, follower in enumerate(followers):
+        follower.start()
+        while len(coordinator._queues[queue_key]) <= step:
+            time.sleep(0.001)
+    leader_done.set()
+    leader.join()
+
+    # Takes over, writes the first group of two, and is not in it
+    _append(3)
+    for follower in followers:
+        follower.join(10)
+
+    assert sorted(results) == [0, 1, 2, 3]
+    assert all(result.accepted for result in results.values())
+    assert [
+        event["payload"]["step"] for event in load_events_for_business(business_id)
+    ] == [0, 1, 2, 3]
+    assert EventChainHead.objects.get(business_id=business_id).sequence == 4
+    assert coordinator._queues == {}
+    assert coordinator._leaders == {}
+
+
+@pytest.mark.parametrize("chain_mode", [ChainMode.BUSINESS, ChainMode.BRANCH])
+def test_group_commit_groups_appends_by_chain_target(monkeypatch, chain_mode) -> None:
+    registry = _build_registry()
+    coordinator = GroupCommitCoordinator(max_wait_seconds=0.3)
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    business_id = uuid.uuid4()
+    branch_ids = [uuid.uuid4(), uuid.uuid4()]
+    set_chain_mode(business_id, chain_mode)
+
+    group_sizes = []
+    real_persist_event_group = group_commit._persist_event_group
+
+    def _counting_persist_event_group(pending_appends):
+        group_sizes.append(len(pending_appends))
+        return real_persist_event_group(pending_appends)
+
+    monkeypatch.setattr(
+        group_commit,
+        "_persist_event_group",
+        _counting_persist_event_group,
+    )
+    results = []
+
+    def _append(step: int, branch_id: uuid.UUID) -> None:
+        try:
+            event = _build_event(
+                event_id=uuid.uuid4(),
+                business_id=business_id,
+                correlation_id=uuid.uuid4(),
+                created_at=t0 + timedelta(seconds=step),
+            )
+            event["branch_id"] = branch_id
+            results.append(
+                coordinator.persist_event(
+                    event_data=event,
+                    context=BusinessContext(business_id=business_id),
+                    registry=registry,
+                )
+            )
+        finally:
+            connection.close()
+
+    threads = [
+        threading.Thread(target=_append, args=(step, branch_id))
+        for step, branch_id in enumerate(branch_ids)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 2
+    assert all(result.accepted for result in results)
+    # Both branches share one queue: in BUSINESS mode they are written
+    # together; in BRANCH mode the leader writes its own sub-chain and
+    # the other branch on its own.
+    assert group_sizes == [2]
+    if chain_mode == ChainMode.BUSINESS:
+        assert EventChainHead.objects.get(business_id=business_id).sequence == 2
+    else:
+        for branch_id in branch_ids:
+            head = EventBranchChainHead.objects.get(
+                business_id=business_id,
+                branch_id=branch_id,
+            )
+            assert head.sequence == 1
+        assert EventChainHead.objects.get(business_id=business_id).sequence == 0
+
+
+def _race_one_competing_append(monkeypatch, *, business_id: uuid.UUID, registry) -> None:
+    """
+    Make the next chain head lock see a head advanced by another writer
+    after the append under test was linked (non-fast path, so linking
+    happens before the lock on every backend).
+    """
+    real_lock_chain_head = persistence_service.lock_chain_head
+    raced = []
+
+    def _lock_after_competitor(locked_business_id, *args):
+        if not raced:
+            raced.append(True)
+            assert persist_event(
+                event_data=_build_event(
+                    event_id=uuid.uuid4(),
+                    business_id=business_id,
+                    correlation_id=uuid.uuid4(),
+                    created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+                    payload={"writer": "competitor"},
+                ),
+                context=BusinessContext(business_id=business_id),
+                registry=registry,
+            ).accepted
+        return real_lock_chain_head(locked_business_id, *args)
+
+    monkeypatch.setattr(persistence_service, "supports_fast_append", lambda: False)
+    monkeypatch.setattr(persistence_service, "lock_chain_head", _lock_after_competitor)
+
+
+def test_server_linked_append_is_rebased_and_retried_after_conflict(monkeypatch) -> None:
+    registry = _build_registry()
+    business_id = uuid.uuid4()
+    _race_one_competing_append(monkeypatch, business_id=business_id, registry=registry)
+    append_retry_metrics.reset()
+
+    result = persist_event(
+        event_data=_build_event(
+            event_id=uuid.uuid4(),
+            business_id=business_id,
+            correlation_id=uuid.uuid4(),
+            created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        ),
+        context=BusinessContext(business_id=business_id),
+        registry=registry,
+        retry_policy=AppendRetryPolicy(max_attempts=2, base_delay_seconds=0.0),
+    )
+
+    assert result.accepted is True
+    loaded = load_events_for_business(business_id)
+    assert [item["stream_seq"] for item in loaded] == [1, 2]
+    assert loaded[1]["previous_event_hash"] == loaded[0]["event_hash"]
+    metrics = append_retry_metrics.snapshot()
+    assert metrics["retries"] == 1
+    assert metrics["retried_accepted"] == 1
+    assert metrics["retries_exhausted"] == 0
+
+
+def test_server_linked_conflict_is_rejected_when_retries_disabled(monkeypatch) -> None:
+    registry = _build_registry()
+    business_id = uuid.uuid4()
+    _race_one_competing_append(monkeypatch, business_id=business_id, registry=registry)
+    append_retry_metrics.reset()
+
+    result = persist_event(
+        event_data=_build_event(
+            event_id=uuid.uuid4(),
+            business_id=business_id,
+            correlation_id=uuid.uuid4(),
+            created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        ),
+        context=BusinessContext(business_id=business_id),
+        registry=registry,
+        retry_policy=NO_APPEND_RETRY,
+    )
+
+    assert result.accepted is False
+    assert result.rejection.code == "HASH_CHAIN_BROKEN"
+    assert append_retry_metrics.snapshot()["retries_exhausted"] == 1
+
+
+def test_client_linked_append_is_never_retried(monkeypatch) -> None:
+    registry = _build_registry()
+    business_id = uuid.uuid4()
+    _race_one_competing_append(monkeypatch, business_id=business_id, registry=registry)
+    append_retry_metrics.reset()
+
+    event = _build_event(
+        event_id=uuid.uuid4(),
+        business_id=business_id,
+        correlation_id=uuid.uuid4(),
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+    event["previous_event_hash"] = GENESIS_HASH
+    event["event_hash"] = compute_event_hash(event["payload"], GENESIS_HASH)
+
+    result = persist_event(
+        event_data=event,
+        context=BusinessContext(business_id=business_id),
+        registry=registry,
+        retry_policy=AppendRetryPolicy(max_attempts=5, base_delay_seconds=0.0),
+    )
+
+    assert result.accepted is False
+    assert result.rejection.code == "HASH_CHAIN_BROKEN"
+    assert append_retry_metrics.snapshot()["retries"] == 0
+
+
+def test_append_retry_delay_is_jittered_within_exponential_ceiling() -> None:
+    policy = AppendRetryPolicy(base_delay_seconds=0.01, max_delay_seconds=0.03)
+
+    for _ in range(50):
+        assert 0.0 <= policy.delay_for(1) <= 0.01
+        assert 0.0 <= policy.delay_for(2) <= 0.02
+        assert 0.0 <= policy.delay_for(5) <= 0.03
+
+
+def test_wiring_builds_append_retry_policy_from_settings(settings) -> None:
+    assert wiring._build_append_retry_policy() == DEFAULT_APPEND_RETRY_POLICY
+
+    settings.BOS_APPEND_RETRY_MAX_ATTEMPTS = 1
+    assert wiring._build_append_retry_policy() == AppendRetryPolicy(max_attempts=1)
+
+    del settings.BOS_APPEND_RETRY_MAX_ATTEMPTS
+    del settings.BOS_APPEND_RETRY_BASE_DELAY_SECONDS
+    assert wiring._build_append_retry_policy() == DEFAULT_APPEND_RETRY_POLICY
+
+
+def test_branch_chain_mode_links_each_branch_into_its_own_sub_chain() -> None:
+    registry = _build_registry()
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    business_id = uuid.uuid4()
+    branch_a = uuid.uuid4()
+    branch_b = uuid.uuid4()
+    set_chain_mode(business_id, ChainMode.BRANCH)
+
+    for step, branch_id in enumerate([branch_a, branch_b, branch_a, None, branch_b]):
+        event = _build_event(
+            event_id=uuid.uuid4(),
+            business_id=business_id,
+            correlation_id=uuid.uuid4(),
+            created_at=t0 + timedelta(seconds=step),
+            payload={"step": step},
+        )
+        event["branch_id"] = branch_id
+        assert persist_event(
+            event_data=event,
+            context=BusinessContext(business_id=business_id),
+            registry=registry,
+        ).accepted
+
+    for branch_id in (branch_a, branch_b):
+        sub_chain = list(
+            Event.objects.filter(business_id=business_id, chain_branch_id=branch_id)
+            .order_by("stream_seq")
+        )
+        assert [event.stream_seq for event in sub_chain] == [1, 2]
+        assert sub_chain[0].previous_event_hash == branch_genesis_hash(branch_id)
+        assert sub_chain[1].previous_event_hash == sub_chain[0].event_hash
+        head = EventBranchChainHead.objects.get(business_id=business_id, branch_id=branch_id)
+        assert head.head_hash == sub_chain[1].event_hash
+
+    business_event = Event.objects.get(business_id=business_id, chain_branch_id__isnull=True)
+    assert business_event.previous_event_hash == GENESIS_HASH
+    assert EventChainHead.objects.get(business_id=business_id).sequence == 1
+
+    assert len(load_events_for_business(business_id)) == 5
+    assert verify_chain_before_replay(business_id=business_id) is True
+    assert _verify_full_hash_chain(business_id=business_id) is True
+
+
+@pytest.mark.skipif(
+    connection.vendor != "postgresql",
+    reason="the two-statement append path is PostgreSQL only",
+)
+def test_fast_append_picks_the_chain_under_lock_in_two_statements() -> None:
+    registry = _build_registry()
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    business_id = uuid.uuid4()
+    branch_id = uuid.uuid4()
+    set_chain_mode(business_id, ChainMode.BRANCH)
+
+    def append(step: int) -> tuple[Event, list[str]]:
+        event = _build_event(
+            event_id=uuid.uuid4(),
+            business_id=business_id,
+            correlation_id=uuid.uuid4(),
+            created_at=t0 + timedelta(seconds=step),
+            payload={"step": step},
+        )
+        event["branch_id"] = branch_id
+        with CaptureQueriesContext(connection) as captured:
+            assert persist_event(
+                event_data=event,
+                context=BusinessContext(business_id=business_id),
+                registry=registry,
+            ).accepted
+        statements = [
+            query["sql"] for query in captured.captured_queries
+            if query["sql"] not in ("BEGIN", "COMMIT")
+        ]
+        return Event.objects.get(event_id=event["event_id"]), statements
+
+    append(0)
+    stored, statements = append(1)
+    assert stored.chain_branch_id == branch_id
+    assert len(statements) == 2
+    assert "FOR UPDATE" in statements[0]
+    assert "ON CONFLICT (event_id) DO NOTHING" in statements[1]
+
+    # The mode switch is seen under lock: the next branch event goes to
+    # the business chain, then appends take two statements again.
+    set_chain_mode(business_id, ChainMode.BUSINESS)
+    stored, _ = append(2)
+    assert stored.chain_branch_id is None
+    stored, statements = append(3)
+    assert stored.chain_branch_id is None
+    assert stored.stream_seq == 2
+    assert len(statements) == 2
+
+
+@pytest.mark.skipif(
+    connection.vendor != "postgresql",
+    reason="concurrent writers need a server database",
+)
+def test_branch_append_waits_for_a_chain_mode_switch_in_progress() -> None:
+    registry = _build_registry()
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    business_id = uuid.uuid4()
+    branch_id = uuid.uuid4()
+    set_chain_mode(business_id, ChainMode.BRANCH)
+
+    def branch_event(step: int) -> dict:
+        event = _build_event(
+            event_id=uuid.uuid4(),
+            business_id=business_id,
+            correlation_id=uuid.uuid4(),
+            created_at=t0 + timedelta(seconds=step),
+            payload={"step": step},
+        )
+        event["branch_id"] = branch_id
+        return event
+
+    assert persist_event(
+        event_data=branch_event(0),
+        context=BusinessContext(business_id=business_id),
+        registry=registry,
+    ).accepted
+
+    switched = threading.Event()
+    commit = threading.Event()
+    results = []
+    event = branch_event(1)
+
+    def switch_to_business_mode() -> None:
+        try:
+            with transaction.atomic():
+                set_chain_mode(business_id, ChainMode.BUSINESS)
+                switched.set()
+                assert commit.wait(5)
+        finally:
+            connection.close()
+
+    def append() -> None:
+        try:
+            results.append(
+                persist_event(
+                    event_data=event,
+                    context=BusinessContext(business_id=business_id),
+                    registry=registry,
+                )
+            )
+        finally:
+            connection.close()
+
+    switcher = threading.Thread(target=switch_to_business_mode)
+    switcher.start()
+    assert switched.wait(5)
+    appender = threading.Thread(target=append)
+    appender.start()
+    try:
+        appender.join(0.3)
+        assert appender.is_alive()  # waits for the switch to commit
+    finally:
+        commit.set()
+        switcher.join(5)
+        appender.join(5)
+
+    assert results[0].accepted
+    assert Event.objects.get(event_id=event["event_id"]).chain_branch_id is None
+
+
+def test_append_conflicts_are_mapped_by_the_constraint_they_hit() -> None:
+    business_id = uuid.uuid4()
+    chain = _append_chain(business_id, 2)
+    head = EventChainHead.objects.get(business_id=business_id)
+    first_hash = Event.objects.get(event_id=chain[0]["event_id"]).event_hash
+
+    def append() -> tuple[dict, object]:
+        event = _build_event(
+            event_id=uuid.uuid4(),
+            business_id=business_id,
+            correlation_id=uuid.uuid4(),
+            created_at=datetime(2026, 2, 1, tzinfo=timezone.utc),
+        )
+        return event, persist_event(
+            event_data=event,
+            context=BusinessContext(business_id=business_id),
+            registry=_build_registry(),
+            retry_policy=NO_APPEND_RETRY,
+        )
+
+    # A head whose sequence lags behind its chain collides on
+    # uq_evt_biz_stream_seq: neither a duplicate nor a chain conflict.
+    EventChainHead.objects.filter(business_id=business_id).update(sequence=1)
+    event, result = append()
+    assert result.accepted is False
+    assert result.rejection.code == "TRANSACTION_ABORTED"
+    assert "stream_seq" in result.rejection.message
+    assert not Event.objects.filter(event_id=event["event_id"]).exists()
+
+    # A head whose hash lags behind collides on uq_evt_biz_prev_hash,
+    # also when the violation names a partition's index.
+    EventChainHead.objects.filter(business_id=business_id).update(
+        sequence=head.sequence,
+        head_hash=first_hash,
+    )
+    event, result = append()
+    assert result.accepted is False
+    assert result.rejection.code == "HASH_CHAIN_BROKEN"
+    assert not Event.objects.filter(event_id=event["event_id"]).exists()
+
+
+def test_branch_heads_are_anchored_and_anchor_tampering_is_detected() -> None:
+    registry = _build_registry()
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    business_id = uuid.uuid4()
+    branch_id = uuid.uuid4()
+    set_chain_mode(business_id, ChainMode.BRANCH, anchor_interval=2)
+
+    for step in range(4):
+        event = _build_event(
+            event_id=uuid.uuid4(),
+            business_id=business_id,
+            correlation_id=uuid.uuid4(),
+            created_at=t0 + timedelta(seconds=step),
+            payload={"step": step},
+        )
+        event["branch_id"] = branch_id
+        assert persist_event(
+            event_data=event,
+            context=BusinessContext(business_id=business_id),
+            registry=registry,
+        ).accepted
+
+    anchors = list(EventChainAnchor.objects.filter(business_id=business_id).order_by("anchor_seq"))
+    assert [anchor.branch_heads[str(branch_id)]["sequence"] for anchor in anchors] == [2, 4]
+    assert anchors[0].previous_anchor_hash == GENESIS_HASH
+    assert anchors[1].previous_anchor_hash == anchors[0].anchor_hash
+    assert anchor_branch_heads(business_id) is None
+    assert _verify_full_hash_chain(business_id=business_id) is True
+
+    EventChainAnchor.objects.filter(anchor_id=anchors[0].anchor_id).update(
+        branch_heads={str(branch_id): {"head_hash": "f" * 64, "sequence": 2}},
+    )
+    with pytest.raises(ReplayChainBrokenError):
+        _verify_full_hash_chain(business_id=business_id)
+
+
+def test_batch_spanning_branch_sub_chains_is_rejected() -> None:
+    registry = _build_registry()
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    business_id = uuid.uuid4()
+    set_chain_mode(business_id, ChainMode.BRANCH)
+
+    events = []
+    for step in range(2):
+        event = _build_event(
+            event_id=uuid.uuid4(),
+            business_id=business_id,
+            correlation_id=uuid.uuid4(),
+            created_at=t0 + timedelta(seconds=step),
+        )
+        event["branch_id"] = uuid.uuid4()
+        events.append(event)
+
+    result = persist_events_batch(
+        events=events,
+        context=BusinessContext(business_id=business_id),
+        registry=registry,
+    )
+
+    assert result.accepted is False
+    assert result.rejection.code == "INVALID_BATCH"
+    assert Event.objects.filter(business_id=business_id).count() == 0
+
+
+def test_event_table_is_hash_partitioned_by_business_on_postgresql() -> None:
+    report = partition_report()
+
+    if connection.vendor != "postgresql":
+        assert is_event_store_partitioned() is False
+        assert report == []
+        return
+
+    assert is_event_store_partitioned() is True
+    assert [row["bound"].lower() for row in report] == [
+        f"for values with (modulus {EVENT_PARTITION_COUNT}, "
+        f"remainder {remainder})"
+        for remainder in range(EVENT_PARTITION_COUNT)
+    ]
+
+
+def test_ensure_partitions_reattaches_a_detached_partition_with_its_rows() -> None:
+    if connection.vendor != "postgresql":
+        pytest.skip("Table partitioning is PostgreSQL-only.")
+
+    business_id = uuid.uuid4()
+    _append_chain(business_id, 2)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT DISTINCT tableoid::regclass::text FROM bos_event_store "
+            "WHERE business_id = %s",
+            [business_id],
+        )
+        [(detached,)] = cursor.fetchall()
+    dropped = next(
+        partition_name(remainder)
+        for remainder in range(EVENT_PARTITION_COUNT)
+        if partition_name(remainder) != detached
+    )
+
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"ALTER TABLE bos_event_store DETACH PARTITION {detached}"
+            )
+            cursor.execute(f"DROP TABLE {dropped}")
+        assert not Event.objects.filter(business_id=business_id).exists()
+
+        assert sorted(ensure_event_partitions()) == sorted([
+            (detached, "attached"),
+            (dropped, "created"),
+        ])
+    finally:
+        ensure_event_partitions()
+
+    assert len(partition_report()) == EVENT_PARTITION_COUNT
+    assert Event.objects.filter(business_id=business_id).count() == 2
+    assert ensure_event_partitions() == []
+
+
+def test_event_id_is_unique_across_businesses_at_database_level() -> None:
+    registry = _build_registry()
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    first_business_id = uuid.uuid4()
+    other_business_id = uuid.uuid4()
+    event_id = uuid.uuid4()
+
+    first = _build_event(
+        event_id=event_id,
+        business_id=first_business_id,
+        correlation_id=uuid.uuid4(),
+        created_at=t0,
+    )
+    assert persist_event(
+        event_data=first,
+        context=BusinessContext(business_id=first_business_id),
+        registry=registry,
+    ).accepted
+    if is_event_store_partitioned():
+        assert EventIdRegistry.objects.filter(
+            event_id=event_id,
+            business_id=first_business_id,
+        ).exists()
+
+    other = _build_event(
+        event_id=event_id,
+        business_id=other_business_id,
+        correlation_id=uuid.uuid4(),
+        created_at=t0,
+    )
+    result = persist_event(
+        event_data=dict(other),
+        context=BusinessContext(business_id=other_business_id),
+        registry=registry,
+    )
+    assert result.accepted is False
+    assert result.rejection.code == "DUPLICATE_EVENT_ID"
+
+    batch_result = persist_events_batch(
+        events=[dict(other)],
+        context=BusinessContext(business_id=other_business_id),
+        registry=registry,
+    )
+    assert batch_result.accepted is False
+    assert batch_result.rejection.code == "DUPLICATE_EVENT_ID"
+
+    if not supports_fast_append():
+        return
+
+    # Without any idempotency SELECT, the insert itself refuses the
+    # event_id (registry claim on a partitioned table, primary key on
+    # a plain one), so two concurrent appends cannot both commit it.
+    linked = dict(other)
+    linked["payload_canonical"] = canonical_serialize(linked["payload"])
+    linked["previous_event_hash"] = GENESIS_HASH
+    linked["event_hash"] = compute_event_hash(linked["payload"], GENESIS_HASH)
+    linked["stream_seq"] = 1
+    with transaction.atomic():
+        chain_head = lock_chain_head(other_business_id)
+        assert insert_event_advancing_head(linked, chain_head) is None
+
+    assert Event.objects.filter(event_id=event_id).count() == 1
+    assert not Event.objects.filter(business_id=other_business_id).exists()
+
+
+def test_streaming_loader_pages_in_replay_order_with_sql_type_filters() -> None:
+    registry = _build_registry()
+    registry.register("cash.drawer.opened.v1")
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    business_id = uuid.uuid4()
+
+    for step in range(7):
+        event = _build_event(
+            event_id=uuid.uuid4(),
+            business_id=business_id,
+            correlation_id=uuid.uuid4(),
+            created_at=t0 + timedelta(seconds=step),
+            payload={"step": step},
+        )
+        if step % 3 == 0:
+            event["event_type"] = "cash.drawer.opened.v1"
+            event["source_engine"] = "cash"
+        assert persist_event(
+            event_data=event,
+            context=BusinessContext(business_id=business_id),
+            registry=registry,
+        ).accepted
+
+    loaded = load_events_for_business(business_id)
+    streamed = list(iter_events_for_business(business_id, chunk_size=2))
+    assert streamed == list(loaded)
+    assert [item["stream_seq"] for item in streamed] == list(range(1, 8))
+
+    admin_only = list(
+        iter_events_for_business(business_id, event_type_prefix="admin.", chunk_size=2)
+    )
+    assert [item["payload"]["step"] for item in admin_only] == [1, 2, 4, 5]
+
+    cash_only = list(
+        iter_events_for_business(business_id, event_types={"cash.drawer.opened.v1"})
+    )
+    assert [item["payload"]["step"] for item in cash_only] == [0, 3, 6]
+    assert list(iter_events_for_business(business_id, event_types=[])) == []
+
+    with pytest.raises(ValueError):
+        next(iter_events_for_business(business_id, chunk_size=0))
+
+
+def test_streaming_loader_pages_branch_mode_business_in_chain_order() -> None:
+    registry = _build_registry()
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    business_id = uuid.uuid4()
+    branch_a, branch_b = sorted([uuid.uuid4(), uuid.uuid4()])
+    set_chain_mode(business_id, ChainMode.BRANCH)
+
+    for step, branch_id in enumerate([branch_a, None, branch_b, branch_a, branch_b, None]):
+        event = _build_event(
+            event_id=uuid.uuid4(),
+            business_id=business_id,
+            correlation_id=uuid.uuid4(),
+            created_at=t0 + timedelta(seconds=step),
+            payload={"step": step},
+        )
+        event["branch_id"] = branch_id
+        assert persist_event(
+            event_data=event,
+            context=BusinessContext(business_id=business_id),
+            registry=registry,
+        ).accepted
+    # Receive clocks play no part in the order.
+    Event.objects.filter(business_id=business_id).update(received_at=t0)
+
+    streamed = list(iter_events_for_business(business_id, chunk_size=2))
+    assert [item["payload"]["step"] for item in streamed] == [1, 5, 0, 3, 2, 4]
+    assert "received_at" not in streamed[0]
+    assert streamed == list(load_events_for_business(business_id))
+
+    resumed = iter_events_for_business(
+        business_id,
+        chunk_size=2,
+        after_positions={None: 2, branch_a: 1},
+    )
+    assert [item["payload"]["step"] for item in resumed] == [3, 2, 4]
+
+
+def test_canonical_payload_is_stored_once_and_verification_detects_drift() -> None:
+    registry = _build_registry()
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    business_id = uuid.uuid4()
+
+    events = [
+        _build_event(
+            event_id=uuid.uuid4(),
+            business_id=business_id,
+            correlation_id=uuid.uuid4(),
+            created_at=t0 + timedelta(seconds=step),
+            payload={"step": step, "label": "café", "nested": {"b": 1, "a": [step]}},
+        )
+        for step in range(3)
+    ]
+    events[0]["payload_canonical"] = "forged"
+    assert persist_event(
+        event_data=events[0],
+        context=BusinessContext(business_id=business_id),
+        registry=registry,
+    ).accepted
+    assert persist_events_batch(
+        events=events[1:],
+        context=BusinessContext(business_id=business_id),
+        registry=registry,
+    ).accepted
+
+    for stored in Event.objects.filter(business_id=business_id):
+        assert stored.payload_canonical == canonical_serialize(stored.payload)
+        assert stored.event_hash == compute_event_hash(
+            stored.payload,
+            stored.previous_event_hash,
+        )
+    assert _verify_full_hash_chain(business_id=business_id) is True
+
+    Event.objects.filter(event_id=events[1]["event_id"]).update(
+        payload={"step": 99}
+    )
+    with pytest.raises(ReplayIntegrityError) as payload_drift:
+        _verify_full_hash_chain(business_id=business_id)
+    assert payload_drift.value.event_id == events[1]["event_id"]
+
+    Event.objects.filter(event_id=events[1]["event_id"]).update(
+        payload_canonical=canonical_serialize({"step": 99})
+    )
+    with pytest.raises(ReplayIntegrityError) as hash_mismatch:
+        _verify_full_hash_chain(business_id=business_id)
+    assert hash_mismatch.value.event_id == events[1]["event_id"]
+
+
+def test_chain_hash_version_switch_keeps_old_events_verifiable() -> None:
+    registry = _build_registry()
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    business_id = uuid.uuid4()
+    branch_id = uuid.uuid4()
+
+    def append(step: int, branch: uuid.UUID | None = None) -> dict:
+        event = _build_event(
+            event_id=uuid.uuid4(),
+            business_id=business_id,
+            correlation_id=uuid.uuid4(),
+            created_at=t0 + timedelta(seconds=step),
+            payload={"step": step},
+        )
+        event["branch_id"] = branch
+        assert persist_event(
+            event_data=event,
+            context=BusinessContext(business_id=business_id),
+            registry=registry,
+        ).accepted
+        return event
+
+    first = append(0)
+    set_hash_version(business_id, HASH_VERSION_BLAKE2B)
+    second = append(1)
+    set_chain_mode(business_id, ChainMode.BRANCH)
+    branch_event = append(2, branch_id)
+
+    stored = {
+        event.event_id: event for event in Event.objects.filter(business_id=business_id)
+    }
+    assert stored[first["event_id"]].hash_version == HASH_VERSION_SHA256
+    for event in (second, branch_event):
+        row = stored[event["event_id"]]
+        assert row.hash_version == HASH_VERSION_BLAKE2B
+        assert row.event_hash == compute_event_hash(
+            row.payload,
+            row.previous_event_hash,
+            HASH_VERSION_BLAKE2B,
+        )
+        assert row.event_hash != compute_event_hash(row.payload, row.previous_event_hash)
+    assert _verify_full_hash_chain(business_id=business_id) is True
+
+    Event.objects.filter(event_id=first["event_id"]).update(
+        hash_version=HASH_VERSION_BLAKE2B
+    )
+    with pytest.raises(ReplayIntegrityError):
+        _verify_full_hash_chain(business_id=business_id)
+
+    with pytest.raises(ValueError):
+        set_hash_version(business_id, 99)
+    with pytest.raises(ValueError):
+        compute_event_hash({"step": 0}, GENESIS_HASH, 99)
+
+
+def _append_chain(
+    business_id: uuid.UUID,
+    count: int,
+    *,
+    use_outbox: bool = False,
+) -> list[dict]:
+    registry = _build_registry()
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    events = []
+    for step in range(count):
+        event = _build_event(
+            event_id=uuid.uuid4(),
+            business_id=business_id,
+            correlation_id=uuid.uuid4(),
+            created_at=t0 + timedelta(seconds=step),
+            payload={"step": step},
+        )
+        assert persist_event(
+            event_data=event,
+            context=BusinessContext(business_id=business_id),
+            registry=registry,
+            use_outbox=use_outbox,
+        ).accepted
+        events.append(event)
+    return events
+
+
+def test_merkle_checkpoints_prove_single_events_against_segment_roots() -> None:
+    business_id = uuid.uuid4()
+    events = _append_chain(business_id, 10)
+
+    checkpoints = checkpoint_chain_segments(business_id, segment_size=4)
+    assert [(c.first_seq, c.last_seq) for c in checkpoints] == [(1, 4), (5, 8)]
+    assert checkpoint_chain_segments(business_id, segment_size=4) == []
+
+    proof = event_inclusion_proof(business_id, events[5]["event_id"])
+    assert proof.status == "VALID"
+    assert (proof.leaf_index, proof.tree_size, len(proof.proof)) == (1, 4, 2)
+    assert proof.verify()
+    assert not verify_merkle_inclusion(
+        proof.event_hash,
+        proof.leaf_index + 1,
+        proof.tree_size,
+        proof.proof,
+        proof.root_hash,
+    )
+
+    assert event_inclusion_proof(business_id, events[9]["event_id"]).status == "PENDING"
+    assert event_inclusion_proof(business_id, uuid.uuid4()).status == "NOT_FOUND"
+    assert event_inclusion_proof(uuid.uuid4(), events[0]["event_id"]).status == "NOT_FOUND"
+
+    served = get_event_inclusion_proof(
+        EventProofRequest(business_id=business_id, event_id=events[5]["event_id"]),
+        None,
+    )
+    assert served["data"]["proof"] == list(proof.proof)
+    other_branch = get_event_inclusion_proof(
+        EventProofRequest(
+            business_id=business_id,
+            event_id=events[5]["event_id"],
+            branch_id=uuid.uuid4(),
+        ),
+        None,
+    )
+    assert other_branch["data"]["status"] == "NOT_FOUND"
+
+    Event.objects.filter(event_id=events[6]["event_id"]).update(event_hash="f" * 64)
+    assert event_inclusion_proof(business_id, events[5]["event_id"]).status == "TAMPERED"
+    assert event_inclusion_proof(business_id, events[6]["event_id"]).status == "TAMPERED"
+    assert event_inclusion_proof(business_id, events[0]["event_id"]).status == "VALID"
+
+    with pytest.raises(PermissionError):
+        EventMerkleCheckpoint.objects.get(checkpoint_id=checkpoints[0].checkpoint_id).delete()
+
+
+@pytest.mark.parametrize(
+    "workers",
+    [
+        1,
+        pytest.param(2, marks=pytest.mark.skipif(
+            connection.vendor != "postgresql",
+            reason="concurrent writers need PostgreSQL",
+        )),
+    ],
+)
+def test_outbox_delivers_each_business_in_order_and_retries_failures(
+    workers: int,
+) -> None:
+    shop, other_shop = uuid.uuid4(), uuid.uuid4()
+    shop_events = _append_chain(shop, 3, use_outbox=True)
+    _append_chain(other_shop, 1, use_outbox=True)
+    batch = [
+        _build_event(
+            event_id=uuid.uuid4(),
+            business_id=shop,
+            correlation_id=uuid.uuid4(),
+            created_at=datetime(2026, 2, 1, tzinfo=timezone.utc),
+            payload={"step": step},
+        )
+        for step in (3, 4)
+    ]
+    assert persist_events_batch(
+        batch,
+        context=BusinessContext(business_id=shop),
+        registry=_build_registry(),
+        use_outbox=True,
+    ).accepted
+    # Rejected appends queue nothing
+    assert not persist_event(
+        event_data=dict(shop_events[0]),
+        context=BusinessContext(business_id=shop),
+        registry=_build_registry(),
+        use_outbox=True,
+    ).accepted
+    assert EventOutbox.objects.filter(business_id=shop).count() == 5
+    assert EventOutbox.objects.filter(business_id=other_shop).count() == 1
+
+    seen: dict[uuid.UUID, list[int]] = {shop: [], other_shop: []}
+    attempts: list[int] = []
+    lock = threading.Lock()
+
+    def record(event) -> None:
+        with lock:
+            seen[event.business_id].append(event.stream_seq)
+
+    def fail_once_on_third(event) -> None:
+        if event.business_id != shop:
+            return
+        attempts.append(event.stream_seq)
+        if attempts == [1, 2, 3]:
+            raise RuntimeError("projection store unavailable")
+
+    subscribers = SubscriberRegistry()
+    subscribers.register_subscriber(EVENT_TYPE, record, "reporting")
+    subscribers.register_subscriber(EVENT_TYPE, fail_once_on_third, "audit")
+
+    first = drain_event_outbox(subscribers, workers=workers, batch_size=2)
+
+    assert seen == {shop: [1, 2, 3, 4, 5], other_shop: [1]}
+    assert attempts == [1, 2, 3]
+    assert first.events_delivered == 9
+    assert first.delivery_failures == 1
+    assert first.failures[0]["event_id"] == str(shop_events[2]["event_id"])
+    assert first.rows_pruned == 3
+    assert list(
+        EventOutbox.objects.filter(business_id=shop)
+        .order_by("outbox_id").values_list("stream_seq", flat=True)
+    ) == [3, 4, 5]
+    assert EventOutboxDelivery.objects.get(
+        business_id=shop, subscriber__startswith="audit:",
+    ).delivered_seq == 2
+
+    second = drain_event_outbox(subscribers, workers=workers, batch_size=2)
+
+    assert second.failures == []
+    assert attempts == [1, 2, 3, 3, 4, 5]
+    assert seen == {shop: [1, 2, 3, 4, 5], other_shop: [1]}
+    assert second.rows_pruned == 3
+    assert not EventOutbox.objects.exists()
+
+
+@pytest.mark.skipif(
+    connection.vendor != "postgresql",
+    reason="drain locks are PostgreSQL advisory locks",
+)
+def test_outbox_drain_skips_a_business_another_drain_holds() -> None:
+    shop = uuid.uuid4()
+    _append_chain(shop, 2, use_outbox=True)
+    seen: list[int] = []
+
+    def record(event) -> None:
+        seen.append(event.stream_seq)
+
+    subscribers = SubscriberRegistry()
+    subscribers.register_subscriber(EVENT_TYPE, record, "reporting")
+
+    held, release = threading.Event(), threading.Event()
+
+    def other_drain() -> None:
+        try:
+            with outbox._business_drain_lock(shop) as acquired:
+                assert acquired
+                held.set()
+                release.wait(10)
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=other_drain)
+    thread.start()
+    try:
+        assert held.wait(10)
+        skipped = drain_event_outbox(subscribers, workers=1)
+    finally:
+        release.set()
+        thread.join(10)
+
+    assert skipped.businesses_skipped == 1
+    assert skipped.events_delivered == 0
+    assert seen == []
+    assert EventOutbox.objects.filter(business_id=shop).count() == 2
+
+    drained = drain_event_outbox(subscribers, workers=1)
+
+    assert drained.businesses_skipped == 0
+    assert seen == [1, 2]
+    assert not EventOutbox.objects.filter(business_id=shop).exists()
+
+    # A late checkpoint write never rewinds one
+    key = outbox.subscriber_key(record, "reporting")
+    branch_id = uuid.uuid4()
+    outbox._save_delivery(key, shop, None, 1)
+    outbox._save_delivery(key, shop, branch_id, 3)
+    outbox._save_delivery(key, shop, branch_id, 2)
+    assert dict(
+        EventOutboxDelivery.objects.filter(subscriber=key, business_id=shop)
+        .values_list("chain_branch_id", "delivered_seq")
+    ) == {None: 2, branch_id: 3}
+
+
+def test_outbox_is_opt_in_and_exclusive_with_in_process_dispatch() -> None:
+    business_id = uuid.uuid4()
+    dispatched = []
+    subscribers = SubscriberRegistry()
+    subscribers.register_subscriber(
+        EVENT_TYPE, lambda event: dispatched.append(event), "reporting",
+    )
+
+    _append_chain(business_id, 2)
+    event = _build_event(
+        event_id=uuid.uuid4(),
+        business_id=business_id,
+        correlation_id=uuid.uuid4(),
+        created_at=datetime(2026, 2, 1, tzinfo=timezone.utc),
+    )
+    assert persist_event(
+        event_data=event,
+        context=BusinessContext(business_id=business_id),
+        registry=_build_registry(),
+        subscriber_registry=subscribers,
+    ).accepted
+
+    # Plain and in-process appends queue nothing for the drain
+    assert [row.event_id for row in dispatched] == [event["event_id"]]
+    assert not EventOutbox.objects.filter(business_id=business_id).exists()
+
+    both = _build_event(
+        event_id=uuid.uuid4(),
+        business_id=business_id,
+        correlation_id=uuid.uuid4(),
+        created_at=datetime(2026, 2, 2, tzinfo=timezone.utc),
+    )
+    for persist in (
+        persist_event,
+        GroupCommitCoordinator().persist_event,
+    ):
+        with pytest.raises(ValueError):
+            persist(
+                event_data=dict(both),
+                context=BusinessContext(business_id=business_id),
+                registry=_build_registry(),
+                subscriber_registry=subscribers,
+                use_outbox=True,
+            )
+    with pytest.raises(ValueError):
+        persist_events_batch(
+            [dict(both)],
+            context=BusinessContext(business_id=business_id),
+            registry=_build_registry(),
+            subscriber_registry=subscribers,
+            use_outbox=True,
+        )
+    assert not Event.objects.filter(event_id=both["event_id"]).exists()
@@ -0,0 +1,363 @@
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from django.db import connection
+
+from adapters.django_api import wiring
+
+from core.admin.repository import AdminRepository
+from core.context.business_context import BusinessContext
+from core.event_store.persistence import persist_event
+from core.event_store.validators.registry import EventTypeRegistry
+from core.replay import hydration
+from core.replay.follower import EventTailFollower
+from core.replay.snapshots import (
+    ProjectionSnapshot,
+    decode_snapshot,
+    load_projection_snapshot,
+)
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+EVENT_TYPE = "admin.feature_flag.set.v1"
+
+
+def _build_registry() -> EventTypeRegistry:
+    registry = EventTypeRegistry()
+    registry.register(EVENT_TYPE)
+    return registry
+
+
+def _build_event(
+    *,
+    event_id: uuid.UUID,
+    business_id: uuid.UUID,
+    correlation_id: uuid.UUID,
+    created_at: datetime,
+    payload: dict | None = None,
+) -> dict:
+    return {
+        "event_id": event_id,
+        "event_type": EVENT_TYPE,
+        "event_version": 1,
+        "business_id": business_id,
+        "branch_id": None,
+        "source_engine": "admin",
+        "actor_type": "SYSTEM",
+        "actor_id": "test-system",
+        "correlation_id": correlation_id,
+        "causation_id": None,
+        "payload": payload or {"flag_key": "ENABLE_DOCUMENT_DESIGNER", "status": "ENABLED"},
+        "reference": {},
+        "created_at": created_at,
+        "status": "FINAL",
+        "correction_of": None,
+    }
+
+
+def _append_flag_events(business_id: uuid.UUID, flag_keys: list[str]) -> None:
+    registry = _build_registry()
+    for flag_key in flag_keys:
+        assert persist_event(
+            event_data=_build_event(
+                event_id=uuid.uuid4(),
+                business_id=business_id,
+                correlation_id=uuid.uuid4(),
+                created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+                payload={
+                    "business_id": str(business_id),
+                    "branch_id": None,
+                    "flag_key": flag_key,
+                    "status": "ENABLED",
+                },
+            ),
+            context=BusinessContext(business_id=business_id),
+            registry=registry,
+        ).accepted
+
+
+def test_projection_store_starts_from_snapshot_and_replays_only_the_tail(
+    monkeypatch,
+) -> None:
+    business_id = uuid.uuid4()
+    monkeypatch.setattr(hydration, "SNAPSHOT_EVERY_EVENTS", 3)
+    replayed_after: list = []
+    iter_events = hydration.iter_events_for_business
+
+    def counting_iter(*args, after_positions=None, **kwargs):
+        replayed_after.append(after_positions and dict(after_positions))
+        for event_data in iter_events(*args, after_positions=after_positions, **kwargs):
+            replayed_after.append(event_data["payload"]["flag_key"])
+            yield event_data
+
+    monkeypatch.setattr(hydration, "iter_events_for_business", counting_iter)
+
+    _append_flag_events(business_id, ["F0", "F1", "F2", "F3"])
+    wiring._load_admin_projection_store(business_id)
+    snapshot = ProjectionSnapshot.objects.get(
+        projection_name=wiring.ADMIN_PROJECTION_NAME,
+        business_id=business_id,
+    )
+    assert snapshot.events_applied == 4
+    assert snapshot.chain_positions == {"": 4}
+    assert decode_snapshot(snapshot.state)[0] == 1
+
+    _append_flag_events(business_id, ["F4", "F5"])
+    replayed_after.clear()
+    store = wiring._load_admin_projection_store(business_id)
+
+    assert replayed_after == [{None: 4}, "F4", "F5"]
+    assert [flag.flag_key for flag in store.feature_flags.get_feature_flags(business_id)] == [
+        "F0", "F1", "F2", "F3", "F4", "F5",
+    ]
+    # Tail below the threshold: the snapshot is kept as it was
+    assert load_projection_snapshot(
+        wiring.ADMIN_PROJECTION_NAME, business_id, 1,
+    ).events_applied == 4
+
+    # Snapshots saved without chain positions resume after their last
+    # event on a single chain
+    ProjectionSnapshot.objects.filter(pk=snapshot.pk).update(chain_positions=None)
+    replayed_after.clear()
+    wiring._load_admin_projection_store(business_id)
+    assert replayed_after == [{None: 4}, "F4", "F5"]
+
+    # A snapshot of another state layout is ignored: full replay, new snapshot
+    ProjectionSnapshot.objects.filter(pk=snapshot.pk).update(state_version=0)
+    replayed_after.clear()
+    rebuilt = wiring._load_admin_projection_store(business_id)
+
+    assert replayed_after[0] is None
+    assert rebuilt.snapshot() == store.snapshot()
+    assert load_projection_snapshot(
+        wiring.ADMIN_PROJECTION_NAME, business_id, 1,
+    ).events_applied == 6
+
+
+def test_tail_follower_applies_writes_of_other_processes_in_chain_order() -> None:
+    business_id = uuid.uuid4()
+    _append_flag_events(business_id, ["F0", "F1"])
+
+    def flag_keys(store) -> list[str]:
+        return [
+            flag.flag_key
+            for flag in store.feature_flags.get_feature_flags(business_id)
+        ]
+
+    # Two workers, each with its own stores and follower
+    follower_a = EventTailFollower(business_id, poll_seconds=0.01)
+    store_a = wiring._load_admin_projection_store(business_id, follower_a)
+    wiring._load_document_issuance_projection_store(business_id, follower_a)
+    follower_b = EventTailFollower(business_id, poll_seconds=0.01)
+    store_b = wiring._load_admin_projection_store(business_id, follower_b)
+    assert follower_a.position() == follower_b.position() == 2
+
+    # Written through worker B: worker A only sees it once it polls
+    _append_flag_events(business_id, ["F2"])
+    assert flag_keys(store_a) == ["F0", "F1"]
+    assert follower_a.sync() == 1
+    assert flag_keys(store_a) == ["F0", "F1", "F2"]
+    assert follower_a.sync() == 0
+
+    # Worker A's own write is applied once, right after it commits
+    _append_flag_events(business_id, ["F3"])
+    wiring._FollowedProjectionStore(store_a, follower_a).apply({"ignored": True})
+    assert flag_keys(store_a) == ["F0", "F1", "F2", "F3"]
+    assert follower_a.position() == 4
+
+    # Read-your-writes on worker B
+    assert follower_b.wait_for(4, timeout=1.0)
+    assert flag_keys(store_b) == ["F0", "F1", "F2", "F3"]
+    assert not follower_b.wait_for(5, timeout=0.05)
+
+    follower_b.start()
+    try:
+        _append_flag_events(business_id, ["F4"])
+        deadline = time.monotonic() + 5
+        while follower_b.position() < 5 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        follower_b.stop(timeout=5)
+    assert flag_keys(store_b)[-1] == "F4"
+
+
+def test_reads_see_the_published_store_while_a_sync_applies(monkeypatch) -> None:
+    business_id = uuid.uuid4()
+    _append_flag_events(business_id, ["F0"])
+    real_apply = wiring._apply_admin_event
+    blocking: list[bool] = []
+    applying = threading.Event()
+    release = threading.Event()
+
+    def apply_admin_event(projection_store, event_data):
+        real_apply(projection_store, event_data)
+        if blocking:
+            applying.set()
+            assert release.wait(5)
+
+    monkeypatch.setattr(wiring, "_apply_admin_event", apply_admin_event)
+    follower = EventTailFollower(business_id, poll_seconds=0.01)
+    store = wiring._load_admin_projection_store(business_id, follower)
+
+    def flag_keys() -> list[str]:
+        return [
+            flag.flag_key
+            for flag in store.feature_flags.get_feature_flags(business_id)
+        ]
+
+    def sync() -> None:
+        try:
+            follower.sync()
+        finally:
+            connection.close()
+
+    _append_flag_events(business_id, ["F1", "F2"])
+    blocking.append(True)
+    syncing = threading.Thread(target=sync)
+    syncing.start()
+    try:
+        assert applying.wait(5)
+        # F1 is applied, F2 not yet: readers still see the published store
+        published = store.published
+        assert flag_keys() == ["F0"]
+    finally:
+        release.set()
+        syncing.join(5)
+
+    assert flag_keys() == ["F0", "F1", "F2"]
+    assert store.published is not published
+    assert [
+        flag.flag_key for flag in published.feature_flags.get_feature_flags(business_id)
+    ] == ["F0"]
+
+
+def test_projection_stores_hydrate_per_business_and_evict_least_recently_used() -> None:
+    shops = [uuid.uuid4() for _ in range(3)]
+    for position, shop in enumerate(shops):
+        _append_flag_events(shop, [f"S{position}"])
+
+    loaded: list[uuid.UUID] = []
+
+    def load_store(business_id, follower):
+        loaded.append(business_id)
+        return wiring._load_admin_projection_store(business_id, follower)
+
+    projections = wiring._HydratedProjections(
+        wiring.ADMIN_PROJECTION_NAME,
+        load_store,
+        budget=2,
+        poll_seconds=0.01,
+    )
+    repository = AdminRepository(store_for_business=projections.get)
+
+    def flag_keys(business_id) -> list[str]:
+        return [flag.flag_key for flag in repository.get_feature_flags(business_id)]
+
+    assert flag_keys(shops[0]) == ["S0"]
+    assert flag_keys(shops[1]) == ["S1"]
+    assert flag_keys(shops[0]) == ["S0"]
+    assert flag_keys(shops[2]) == ["S2"]  # evicts shops[1], least recently used
+
+    assert loaded == [shops[0], shops[1], shops[2]]
+    assert shops[1] not in projections.cache
+    assert projections.cache.metrics() == {
+        "resident_businesses": 2,
+        "resident_weight": 2,
+        "budget": 2,
+        "pinned": 0,
+        "hits": 1,
+        "misses": 3,
+        "evictions": 1,
+        "load_failures": 0,
+        "hit_rate": 0.25,
+    }
+
+    # Resident stores follow writes of other processes on access
+    _append_flag_events(shops[0], ["S0b"])
+    time.sleep(0.02)
+    assert flag_keys(shops[0]) == ["S0", "S0b"]
+
+    # An evicted business is hydrated again from the event store
+    _append_flag_events(shops[1], ["S1b"])
+    assert flag_keys(shops[1]) == ["S1", "S1b"]
+    assert loaded[-1] == shops[1]
+    assert shops[2] not in projections.cache
+
+    # A store and its follower are one cache entry: found together,
+    # evicted together
+    follower = projections.follower(shops[1])
+    assert follower is projections.follower(shops[1])
+    assert follower.business_id == shops[1]
+    flag_keys(shops[0])
+    flag_keys(shops[2])  # evicts shops[1] with its follower
+    assert shops[1] not in projections.cache
+    assert projections.follower(shops[1]) is not follower
+
+    # Pinned businesses stay resident
+    projections.pin(shops[2])[1].stop()
+    flag_keys(shops[0])
+    flag_keys(shops[1])
+    assert shops[2] in projections.cache
+    assert shops[0] not in projections.cache
+    assert projections.cache.metrics()["pinned"] == 1
+
+
+def test_cache_hits_read_the_published_store_while_another_hit_syncs(
+    monkeypatch,
+) -> None:
+    shop = uuid.uuid4()
+    _append_flag_events(shop, ["S0"])
+    real_apply = wiring._apply_admin_event
+    blocking: list[bool] = []
+    applying = threading.Event()
+    release = threading.Event()
+
+    def apply_admin_event(projection_store, event_data):
+        real_apply(projection_store, event_data)
+        if blocking:
+            applying.set()
+            assert release.wait(5)
+
+    monkeypatch.setattr(wiring, "_apply_admin_event", apply_admin_event)
+    projections = wiring._HydratedProjections(
+        wiring.ADMIN_PROJECTION_NAME,
+        wiring._load_admin_projection_store,
+        budget=2,
+        poll_seconds=0.01,
+    )
+    repository = AdminRepository(store_for_business=projections.get)
+
+    def flag_keys() -> list[str]:
+        return [flag.flag_key for flag in repository.get_feature_flags(shop)]
+
+    def read_in_thread() -> None:
+        try:
+            reads.append(flag_keys())
+        finally:
+            connection.close()
+
+    assert flag_keys() == ["S0"]
+    _append_flag_events(shop, ["S1"])
+    time.sleep(0.02)
+    blocking.append(True)
+    reads: list[list[str]] = []
+    syncing_reader = threading.Thread(target=read_in_thread)
+    syncing_reader.start()
+    try:
+        assert applying.wait(5)
+        # This hit does not wait for, or see, the sync in progress
+        started = time.monotonic()
+        assert flag_keys() == ["S0"]
+        assert time.monotonic() - started < 1
+    finally:
+        release.set()
+        syncing_reader.join(5)
+
+    assert reads == [["S0", "S1"]]
+    assert flag_keys() == ["S0", "S1"]
@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from django.db import connection
+
+from core.context.business_context import BusinessContext
+from core.event_store.models import (
+    ChainMode,
+    Event,
+)
+from core.event_store.persistence import (
+    persist_event,
+    set_chain_mode,
+)
+from core.event_store.validators.registry import EventTypeRegistry
+from core.events.registry import SubscriberRegistry
+from core.replay.event_replayer import replay_events
+from core.replay.checkpoints import (
+    ReplayCheckpoint,
+    load_checkpoint,
+    save_checkpoint,
+)
+from core.replay.parallel import replay_businesses_parallel
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+EVENT_TYPE = "admin.feature_flag.set.v1"
+
+
+def _build_registry() -> EventTypeRegistry:
+    registry = EventTypeRegistry()
+    registry.register(EVENT_TYPE)
+    return registry
+
+
+def _build_event(
+    *,
+    event_id: uuid.UUID,
+    business_id: uuid.UUID,
+    correlation_id: uuid.UUID,
+    created_at: datetime,
+    payload: dict | None = None,
+) -> dict:
+    return {
+        "event_id": event_id,
+        "event_type": EVENT_TYPE,
+        "event_version": 1,
+        "business_id": business_id,
+        "branch_id": None,
+        "source_engine": "admin",
+        "actor_type": "SYSTEM",
+        "actor_id": "test-system",
+        "correlation_id": correlation_id,
+        "causation_id": None,
+        "payload": payload or {"flag_key": "ENABLE_DOCUMENT_DESIGNER", "status": "ENABLED"},
+        "reference": {},
+        "created_at": created_at,
+        "status": "FINAL",
+        "correction_of": None,
+    }
+
+
+def _append_chain(
+    business_id: uuid.UUID,
+    count: int,
+    *,
+    use_outbox: bool = False,
+) -> list[dict]:
+    registry = _build_registry()
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    events = []
+    for step in range(count):
+        event = _build_event(
+            event_id=uuid.uuid4(),
+            business_id=business_id,
+            correlation_id=uuid.uuid4(),
+            created_at=t0 + timedelta(seconds=step),
+            payload={"step": step},
+        )
+        assert persist_event(
+            event_data=event,
+            context=BusinessContext(business_id=business_id),
+            registry=registry,
+            use_outbox=use_outbox,
+        ).accepted
+        events.append(event)
+    return events
+
+
+@pytest.mark.parametrize(
+    "workers",
+    [
+        1,
+        pytest.param(2, marks=pytest.mark.skipif(
+            connection.vendor != "postgresql",
+            reason="concurrent writers need a server database",
+        )),
+    ],
+)
+def test_parallel_replay_keeps_business_order_and_checkpoints_each_business(
+    workers: int,
+) -> None:
+    business_ids = [uuid.uuid4() for _ in range(3)]
+    for count, business_id in enumerate(business_ids, start=2):
+        _append_chain(business_id, count)
+    broken = uuid.uuid4()
+    broken_events = _append_chain(broken, 2)
+    Event.objects.filter(event_id=broken_events[1]["event_id"]).update(
+        previous_event_hash=""
+    )
+
+    seen: dict[uuid.UUID, list[int]] = {}
+    lock = threading.Lock()
+
+    def record(event) -> None:
+        with lock:
+            seen.setdefault(event.business_id, []).append(event.stream_seq)
+
+    subscribers = SubscriberRegistry()
+    subscribers.register_subscriber(EVENT_TYPE, record, "reporting")
+
+    result = replay_businesses_parallel(
+        subscribers,
+        business_ids + [broken],
+        workers=workers,
+        projection_name="parallel_test",
+    )
+
+    assert seen == {
+        business_id: list(range(1, count + 1))
+        for count, business_id in enumerate(business_ids, start=2)
+    }
+    assert result.events_processed == 2 + 3 + 4
+    assert result.events_dispatched == 9
+    assert not result.chain_verified
+    assert [error["business_id"] for error in result.errors] == [str(broken)]
+    for count, business_id in enumerate(business_ids, start=2):
+        checkpoint = load_checkpoint("parallel_test", business_id)
+        assert checkpoint.last_stream_seq == count
+    assert load_checkpoint("parallel_test", broken) is None
+
+
+def test_replay_sends_batch_handlers_chunks_and_reports_failures_per_event() -> None:
+    business_id = uuid.uuid4()
+    events = _append_chain(business_id, 5)
+    poisoned = events[3]["event_id"]
+
+    calls: list[tuple[str, list[int]]] = []
+
+    def apply_one(event) -> None:
+        raise AssertionError("batch subscribers are not called per event")
+
+    def apply_batch(batch) -> None:
+        calls.append(("batch", [event.stream_seq for event in batch]))
+        if any(event.event_id == poisoned for event in batch):
+            raise ValueError("bulk upsert rejected")
+
+    def count(event) -> None:
+        calls.append(("count", [event.stream_seq]))
+
+    def notify(event) -> None:
+        calls.append(("notify", [event.stream_seq]))
+
+    subscribers = SubscriberRegistry()
+    subscribers.register_subscriber(EVENT_TYPE, count, "audit")
+    subscribers.register_subscriber(
+        EVENT_TYPE, apply_one, "reporting", batch_handler=apply_batch,
+    )
+    subscribers.register_subscriber(EVENT_TYPE, notify, "audit")
+
+    result = replay_events(
+        subscribers,
+        business_id=business_id,
+        projection_name="batch_test",
+        batch_size=2,
+    )
+
+    # Per-event subscribers event by event, then the batch handler, per
+    # chunk; a failed batch is not re-sent.
+    assert calls == [
+        ("count", [1]), ("notify", [1]), ("count", [2]), ("notify", [2]),
+        ("batch", [1, 2]),
+        ("count", [3]), ("notify", [3]), ("count", [4]), ("notify", [4]),
+        ("batch", [3, 4]),
+        ("count", [5]), ("notify", [5]), ("batch", [5]),
+    ]
+    assert result.events_processed == 5
+    assert result.events_dispatched == 5
+    assert result.dispatch_failures == 2
+    assert [error["event_id"] for error in result.errors] == [
+        str(events[2]["event_id"]),
+        str(poisoned),
+    ]
+    assert {error["error"] for error in result.errors} == {"bulk upsert rejected"}
+    assert load_checkpoint("batch_test", business_id).last_stream_seq == 5
+
+
+def test_checkpoint_save_upserts_one_row_per_projection_scope() -> None:
+    business_id = uuid.uuid4()
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for step in range(2):
+        for scope in (None, business_id):
+            save_checkpoint(
+                "upsert_test",
+                uuid.uuid4(),
+                t0 + timedelta(seconds=step),
+                business_id=scope,
+                last_stream_seq=step,
+            )
+
+    assert ReplayCheckpoint.objects.filter(projection_name="upsert_test").count() == 2
+    assert load_checkpoint("upsert_test").last_received_at == t0 + timedelta(seconds=1)
+    assert load_checkpoint("upsert_test", business_id).last_stream_seq == 1
+
+class _ReplayCrash(BaseException):
+    """Stands in for a process dying mid-replay."""
+
+
+@pytest.mark.parametrize("transactional", [False, True])
+def test_replay_checkpoints_periodically_and_resumes_after_a_crash(
+    transactional: bool,
+) -> None:
+    business_id = uuid.uuid4()
+    _append_chain(business_id, 7)
+    applied: list[int] = []
+    crash_at = {5}
+
+    def project(event) -> None:
+        applied.append(event.stream_seq)
+        # The projection's own write: last applied position
+        save_checkpoint(
+            "crash_projection_state",
+            event.event_id,
+            event.received_at,
+            business_id=business_id,
+            last_stream_seq=event.stream_seq,
+        )
+        if event.stream_seq in crash_at:
+            crash_at.clear()
+            raise _ReplayCrash()
+
+    subscribers = SubscriberRegistry()
+    subscribers.register_subscriber(EVENT_TYPE, project, "reporting")
+    run = dict(
+        business_id=business_id,
+        projection_name="crash_test",
+        batch_size=1,
+        checkpoint_every=2,
+        transactional_checkpoints=transactional,
+    )
+
+    with pytest.raises(_ReplayCrash):
+        replay_events(subscribers, **run)
+
+    assert load_checkpoint("crash_test", business_id).last_stream_seq == 4
+    state = load_checkpoint("crash_projection_state", business_id)
+    # Without a shared transaction the projection ran ahead of the
+    # checkpoint; with one, the crashed interval rolled back with it
+    assert state.last_stream_seq == (4 if transactional else 5)
+
+    result = replay_events(subscribers, use_checkpoint=True, **run)
+
+    assert result.events_processed == 3
+    assert applied == [1, 2, 3, 4, 5, 5, 6, 7]
+    assert load_checkpoint("crash_test", business_id).last_stream_seq == 7
+
+
+def test_branch_mode_replay_resumes_each_chain_from_its_own_position() -> None:
+    registry = _build_registry()
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    business_id = uuid.uuid4()
+    branch_a, branch_b = sorted([uuid.uuid4(), uuid.uuid4()])
+    set_chain_mode(business_id, ChainMode.BRANCH)
+
+    def append(*branch_ids) -> None:
+        for branch_id in branch_ids:
+            event = _build_event(
+                event_id=uuid.uuid4(),
+                business_id=business_id,
+                correlation_id=uuid.uuid4(),
+                created_at=t0,
+            )
+            event["branch_id"] = branch_id
+            assert persist_event(
+                event_data=event,
+                context=BusinessContext(business_id=business_id),
+                registry=registry,
+            ).accepted
+        Event.objects.filter(business_id=business_id).update(received_at=t0)
+
+    applied: list[tuple] = []
+    subscribers = SubscriberRegistry()
+    subscribers.register_subscriber(
+        EVENT_TYPE,
+        lambda event: applied.append((event.chain_branch_id, event.stream_seq)),
+        "reporting",
+    )
+    run = dict(business_id=business_id, projection_name="chain_resume", use_checkpoint=True)
+
+    append(branch_b, branch_a)
+    replay_events(subscribers, **run)
+    assert applied == [(branch_a, 1), (branch_b, 1)]
+    assert load_checkpoint("chain_resume", business_id).last_chain_positions == {
+        str(branch_a): 1,
+        str(branch_b): 1,
+    }
+
+    # New events on chains that sort before the last replayed one.
+    append(branch_a, None)
+    applied.clear()
+    result = replay_events(subscribers, **run)
+
+    assert result.events_processed == 2
+    assert applied == [(None, 1), (branch_a, 2)]